@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark coordinator resume against a large coordination room.
+
+Fills a room in a throwaway deaddrop local backend with synthetic worker
+progress messages, then times:
+
+- a full rebuild of agent states from the whole room history,
+- a resume that only replays the messages after the saved room cursor,
+- a resume after a further batch of new messages.
+
+Usage:
+    python scripts/benchmark_room_sync.py
+    python scripts/benchmark_room_sync.py --messages 50000 --workers 20
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from deadrop import Deaddrop
+
+from silica.developer.coordination.client import CoordinationContext
+from silica.developer.coordination.protocol import Idle, Progress
+from silica.developer.coordination.session import CoordinationSession
+
+
+def timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<32} {time.perf_counter() - start:8.2f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument("--new-messages", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        deaddrop = Deaddrop.create_local(path=tmp / ".deaddrop", add_to_gitignore=False)
+        history_dir = tmp / "history"
+        session = CoordinationSession.create_session(
+            deaddrop, "Benchmark", history_dir=history_dir
+        )
+
+        workers = []
+        for i in range(args.workers):
+            identity = deaddrop.create_identity(
+                ns=session.namespace_id,
+                display_name=f"Worker {i}",
+                ns_secret=session.namespace_secret,
+            )
+            session.register_agent(f"agent-{i}", identity["id"], f"Worker {i}", "ws")
+            session.add_agent_to_room(f"agent-{i}")
+            workers.append(
+                CoordinationContext(
+                    deaddrop=deaddrop,
+                    namespace_id=session.namespace_id,
+                    namespace_secret=session.namespace_secret,
+                    identity_id=identity["id"],
+                    identity_secret=identity["secret"],
+                    room_id=session.state.room_id,
+                )
+            )
+
+        def send(count: int):
+            for n in range(count):
+                worker = workers[n % len(workers)]
+                if n % 50 == 49:
+                    worker.broadcast(Idle(agent_id=worker.identity_id))
+                else:
+                    worker.broadcast(
+                        Progress(task_id=f"task-{n}", message=f"step {n}", progress=0.5)
+                    )
+
+        timed(f"send {args.messages:,} messages", lambda: send(args.messages))
+
+        results = timed(
+            "full rebuild", lambda: session.sync_agent_states(full_rebuild=True)
+        )
+        print(f"  processed {results['messages_processed']:,} messages")
+
+        def resume():
+            return CoordinationSession.resume_session(
+                deaddrop, session_id=session.session_id, history_dir=history_dir
+            )
+
+        timed("resume, no new messages", resume)
+
+        send(args.new_messages)
+        resumed = timed(f"resume, {args.new_messages:,} new messages", resume)
+        working = sum(1 for a in resumed.list_agents() if a.state.value == "working")
+        print(f"  {working} of {args.workers} agents working")
+
+
+if __name__ == "__main__":
+    main()
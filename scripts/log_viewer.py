@@ -3,10 +3,10 @@
 
 Usage:
     python scripts/log_viewer.py requests.jsonl
+    python scripts/log_viewer.py requests.jsonl.gz  # Compressed logs work too
     # Then open http://localhost:8000
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import List, Dict, Any
@@ -16,6 +16,8 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import uvicorn
 
+from silica.developer.request_log import read_log
+
 # Global storage for logs
 LOGS: List[Dict[str, Any]] = []
 LOG_FILE: Path = None
@@ -65,7 +67,7 @@ async def get_stats():
 
 
 def load_logs():
-    """Load logs from the JSON Lines file."""
+    """Load logs from the log file."""
     global LOGS
     LOGS = []
 
@@ -73,15 +75,8 @@ def load_logs():
         print(f"Log file not found: {LOG_FILE}")
         return
 
-    with open(LOG_FILE) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    LOGS.append(json.loads(line))
-                except json.JSONDecodeError as e:
-                    print(f"Failed to parse line: {e}")
-                    continue
+    # Plain and compressed content-addressed logs (including rotated files)
+    LOGS = list(read_log(LOG_FILE))
 
 
 def main():
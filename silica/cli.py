@@ -1,36 +1,136 @@
+"""Entry point for the ``silica`` command.
+
+Subcommands are registered lazily: only the module for the requested
+subcommand is imported, so ``silica --version`` or ``silica remote status``
+do not pay for importing the agent, the cron app (and its database engine),
+or for constructing a Toolbox.
+
+The names of the developer CLI tools (``silica help``, ``silica list``, ...)
+are only known after building a Toolbox, so they are cached on disk under
+``~/.silica/cache/`` and refreshed when silica is upgraded.
+"""
+
+import importlib
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
 from cyclopts import App
-from dotenv import load_dotenv
 
 from silica import __version__
-from silica.remote.cli.main import app as remote_app
-from silica.developer.hdev import (
-    cyclopts_main as developer_app,
-    attach_tools,
-    view_session,
-    migrate,
-)
-from silica.developer.cli.memory_sync import memory_sync_app
-from silica.developer.cli.history_sync import history_sync_app
-from silica.developer.cli.coordinator import coordinator_app
-from silica.developer.cli.worker import worker_app
-from silica.cron.app import entrypoint as cron_serve
-from silica.cron.cli import cron as cron_commands
-
-app = App(version=__version__)
-app.command(remote_app, name="remote")
-app.command(cron_serve, name="cron-serve")
-app.command(cron_commands, name="cron")
-app.command(memory_sync_app, name="memory-sync")
-app.command(history_sync_app, name="history-sync")
-app.command(coordinator_app, name="coordinator")
-app.command(worker_app, name="worker")
-app.command(view_session, name="view")
-app.command(migrate, name="migrate")
-attach_tools(app)
-app.default(developer_app)
-
-load_dotenv()
+
+# Subcommand name -> (module, attribute), imported only when dispatched
+SUBCOMMANDS: Dict[str, Tuple[str, str]] = {
+    "remote": ("silica.remote.cli.main", "app"),
+    "cron-serve": ("silica.cron.app", "entrypoint"),
+    "cron": ("silica.cron.cli", "cron"),
+    "memory-sync": ("silica.developer.cli.memory_sync", "memory_sync_app"),
+    "history-sync": ("silica.developer.cli.history_sync", "history_sync_app"),
+    "coordinator": ("silica.developer.cli.coordinator", "coordinator_app"),
+    "worker": ("silica.developer.cli.worker", "worker_app"),
+    "view": ("silica.developer.hdev", "view_session"),
+    "migrate": ("silica.developer.hdev", "migrate"),
+}
+
+HELP_FLAGS = {"--help", "-h"}
+VERSION_FLAGS = {"--version"}
+
+TOOL_COMMAND_CACHE = Path.home() / ".silica" / "cache" / "cli_tool_commands.json"
+
+
+def _google_auth_cli_tool_names() -> List[str]:
+    """Names of the optional Google Auth CLI tools the Toolbox registers."""
+    try:
+        from heare.developer.tools.google_auth_cli import GOOGLE_AUTH_CLI_TOOLS
+    except ImportError:
+        return []
+    return sorted(GOOGLE_AUTH_CLI_TOOLS)
+
+
+def _tool_command_cache_key() -> str:
+    """Key that changes whenever the set of CLI tools may have changed."""
+    toolbox_path = Path(__file__).parent / "developer" / "toolbox.py"
+    try:
+        mtime = toolbox_path.stat().st_mtime_ns
+    except OSError:
+        mtime = 0
+    google_tools = ",".join(_google_auth_cli_tool_names())
+    return f"{__version__}:{mtime}:{google_tools}"
+
+
+def load_tool_commands(cache_path: Path = TOOL_COMMAND_CACHE) -> Optional[List[str]]:
+    """Load cached CLI tool command names, or None if missing or stale."""
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != _tool_command_cache_key():
+        return None
+    commands = cached.get("commands")
+    return commands if isinstance(commands, list) else None
+
+
+def save_tool_commands(
+    commands: Sequence[str], cache_path: Path = TOOL_COMMAND_CACHE
+) -> None:
+    """Cache CLI tool command names."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"key": _tool_command_cache_key(), "commands": list(commands)}, f)
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass  # Caching is an optimization only
+
+
+def _register_subcommand(app: App, name: str) -> None:
+    module_name, attr = SUBCOMMANDS[name]
+    app.command(getattr(importlib.import_module(module_name), attr), name=name)
+
+
+def _register_developer(app: App) -> None:
+    """Register the default agent command and the CLI tool commands."""
+    from silica.developer.hdev import attach_tools, cyclopts_main
+
+    cached = load_tool_commands()
+    commands = attach_tools(app, commands=cached)
+    if cached is None:
+        save_tool_commands(commands)
+    app.default(cyclopts_main)
+
+
+def build_app(argv: Sequence[str]) -> App:
+    """Build the CLI app with just the commands needed to dispatch ``argv``.
+
+    Args:
+        argv: Command-line arguments, excluding the program name.
+
+    Returns:
+        The cyclopts App ready to be invoked with ``argv``.
+    """
+    app = App(version=__version__)
+    first = argv[0] if argv else None
+
+    if first in SUBCOMMANDS:
+        _register_subcommand(app, first)
+    elif first in VERSION_FLAGS:
+        pass
+    elif first in HELP_FLAGS:
+        for name in SUBCOMMANDS:
+            _register_subcommand(app, name)
+        _register_developer(app)
+    else:
+        _register_developer(app)
+
+    return app
 
 
 def main():
-    app()
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    argv = sys.argv[1:]
+    build_app(argv)(argv)
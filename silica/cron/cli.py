@@ -104,6 +104,35 @@ def init():
         print("3. Configure AWS credentials in .env for Litestream")
 
 
+@cron.command
+def archive(days: Optional[int] = None):
+    """Archive execution history older than the retention window.
+
+    Args:
+        days: Retention in days (defaults to EXECUTION_RETENTION_DAYS).
+    """
+    settings = get_settings()
+    retention_days = days if days is not None else settings.execution_retention_days
+
+    from .models import SessionLocal, init_database
+    from .retention import archive_old_executions
+
+    init_database()
+    db = SessionLocal()
+    try:
+        result = archive_old_executions(
+            db,
+            retention_days=retention_days,
+            archive_dir=settings.execution_archive_dir,
+        )
+    finally:
+        db.close()
+
+    print(f"Archived {result.archived} executions older than {retention_days} days")
+    for path in result.files:
+        print(f"  {path}")
+
+
 @cron.command
 def test_litestream():
     """Test Litestream configuration and S3 connectivity."""
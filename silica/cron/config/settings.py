@@ -42,6 +42,16 @@ class Settings(BaseSettings):
         description="Litestream configuration file path",
     )
 
+    # Execution history retention
+    execution_retention_days: int = Field(
+        default=90,
+        description="Archive job executions older than this many days (0 disables)",
+    )
+    archive_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory for archived executions (default: <data_dir>/archive)",
+    )
+
     # Application
     host: str = Field(default="127.0.0.1", description="Host to bind to")
     port: int = Field(default=8080, description="Port to bind to")
@@ -65,6 +75,11 @@ class Settings(BaseSettings):
         """Ensure the data directory exists."""
         self.data_dir.mkdir(exist_ok=True, parents=True)
 
+    @property
+    def execution_archive_dir(self) -> Path:
+        """Get the directory archived executions are written to."""
+        return self.archive_dir or self.data_dir / "archive"
+
     @property
     def database_url(self) -> str:
         """Get SQLAlchemy database URL."""
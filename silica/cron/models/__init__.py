@@ -1,7 +1,14 @@
 """Database models for silica-cron."""
 
-from .base import Base, engine, SessionLocal, get_db, init_database
-from .prompt import Prompt, ScheduledJob, JobExecution
+from .base import Base, engine, SessionLocal, get_db, init_database, upgrade_schema
+from .prompt import (
+    Prompt,
+    ScheduledJob,
+    JobExecution,
+    JobExecutionOutput,
+    JOB_EXECUTION_ROWID,
+    OUTPUT_PREVIEW_CHARS,
+)
 
 __all__ = [
     "Base",
@@ -9,7 +16,11 @@ __all__ = [
     "SessionLocal",
     "get_db",
     "init_database",
+    "upgrade_schema",
     "Prompt",
     "ScheduledJob",
     "JobExecution",
+    "JobExecutionOutput",
+    "JOB_EXECUTION_ROWID",
+    "OUTPUT_PREVIEW_CHARS",
 ]
@@ -1,6 +1,8 @@
 """Database configuration and base model."""
 
-from sqlalchemy import create_engine, event
+import sqlite3
+
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
@@ -65,3 +67,52 @@ def init_database():
 
     logger.info(f"Creating database tables at {settings.database_path}")
     Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+
+
+def upgrade_schema(bind: Engine) -> None:
+    """Bring a database created by an older version up to the current schema.
+
+    ``create_all`` only creates missing tables. This adds columns and indexes
+    introduced since, and moves execution output out of ``job_executions``
+    into ``job_execution_outputs``. Safe to run repeatedly.
+    """
+    inspector = inspect(bind)
+    if "job_executions" in inspector.get_table_names():
+        columns = {c["name"] for c in inspector.get_columns("job_executions")}
+        with bind.begin() as conn:
+            if "output_preview" not in columns:
+                conn.execute(
+                    text(
+                        "ALTER TABLE job_executions ADD COLUMN output_preview VARCHAR(200)"
+                    )
+                )
+            if "output_size" not in columns:
+                conn.execute(
+                    text("ALTER TABLE job_executions ADD COLUMN output_size INTEGER")
+                )
+            if "output" in columns:
+                conn.execute(
+                    text(
+                        "INSERT OR IGNORE INTO job_execution_outputs "
+                        "(execution_id, output) "
+                        "SELECT id, output FROM job_executions WHERE output IS NOT NULL"
+                    )
+                )
+                conn.execute(
+                    text(
+                        "UPDATE job_executions SET "
+                        "output_preview = substr(output, 1, 200), "
+                        "output_size = length(output) "
+                        "WHERE output IS NOT NULL"
+                    )
+                )
+                if sqlite3.sqlite_version_info >= (3, 35, 0):
+                    conn.execute(text("ALTER TABLE job_executions DROP COLUMN output"))
+                else:
+                    conn.execute(text("UPDATE job_executions SET output = NULL"))
+
+    # create_all skips indexes on tables that already existed
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind, checkfirst=True)
@@ -1,6 +1,18 @@
 """Models for prompts and scheduled jobs."""
 
-from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey
+from typing import Optional
+
+from sqlalchemy import (
+    Column,
+    String,
+    Text,
+    DateTime,
+    Boolean,
+    ForeignKey,
+    Index,
+    Integer,
+    literal_column,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -39,7 +51,7 @@ class ScheduledJob(Base):
     name = Column(String(255), nullable=False, index=True)
     prompt_id = Column(String(64), ForeignKey("prompts.id"), nullable=False)
     cron_expression = Column(String(100), nullable=False)
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, index=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
@@ -48,8 +60,17 @@ class ScheduledJob(Base):
     executions = relationship("JobExecution", back_populates="scheduled_job")
 
 
+# Characters of output kept on the execution row for list views
+OUTPUT_PREVIEW_CHARS = 200
+
+
 class JobExecution(Base):
-    """Model for tracking job execution history."""
+    """Model for tracking job execution history.
+
+    Full agent output lives in JobExecutionOutput so that listing queries
+    only touch small rows; ``output_preview`` and ``output_size`` are kept
+    here for list views.
+    """
 
     __tablename__ = "job_executions"
 
@@ -65,8 +86,64 @@ class JobExecution(Base):
     status = Column(
         String(50), default="pending"
     )  # pending, running, completed, failed
-    output = Column(Text, nullable=True)
+    output_preview = Column(String(OUTPUT_PREVIEW_CHARS), nullable=True)
+    output_size = Column(Integer, nullable=True)
     error_message = Column(Text, nullable=True)
 
-    # Relationship
+    # Relationships
     scheduled_job = relationship("ScheduledJob", back_populates="executions")
+    output_blob = relationship(
+        "JobExecutionOutput",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    @property
+    def output(self) -> Optional[str]:
+        """Full agent output (loaded from the output table on access)."""
+        return self.output_blob.output if self.output_blob is not None else None
+
+    @output.setter
+    def output(self, value: Optional[str]) -> None:
+        if value is None:
+            self.output_blob = None
+            self.output_preview = None
+            self.output_size = None
+            return
+
+        if self.output_blob is None:
+            self.output_blob = JobExecutionOutput(output=value)
+        else:
+            self.output_blob.output = value
+        self.output_preview = value[:OUTPUT_PREVIEW_CHARS]
+        self.output_size = len(value)
+
+
+class JobExecutionOutput(Base):
+    """Full output of a job execution, stored apart from the hot execution row."""
+
+    __tablename__ = "job_execution_outputs"
+
+    execution_id = Column(
+        String(64),
+        ForeignKey("job_executions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    output = Column(Text, nullable=False)
+
+
+# SQLite's implicit rowid breaks ties between executions started in the same
+# second in insertion order; it is the secondary key for keyset pagination.
+JOB_EXECUTION_ROWID = literal_column("job_executions.rowid")
+
+# Indexes for the listing queries (newest first, per job and overall) and for
+# the retention sweep. Index entries are ordered (key..., rowid ASC), which
+# matches ORDER BY started_at DESC, rowid ASC without a sort step.
+Index(
+    "ix_job_executions_job_started",
+    JobExecution.scheduled_job_id,
+    JobExecution.started_at.desc(),
+)
+Index("ix_job_executions_started", JobExecution.started_at.desc())
+Index("ix_job_executions_status_started", JobExecution.status, JobExecution.started_at)
@@ -0,0 +1,149 @@
+"""Retention policy for job execution history.
+
+Executions accumulate without bound, and every row (plus its output) lives
+in the replicated SQLite database. Executions older than the retention
+window are rolled up into gzip-compressed JSON Lines files, one per month,
+under the archive directory and then deleted from the database.
+
+Archive files are append-only: each sweep appends a new gzip member, which
+standard gzip readers (``gzip.open``, ``zcat``) read as one stream.
+"""
+
+import gzip
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy.orm import Session, selectinload
+
+from .models import JobExecution, JobExecutionOutput
+
+logger = logging.getLogger(__name__)
+
+# Executions still in flight are never archived
+FINISHED_STATUSES = ("completed", "failed")
+
+ARCHIVE_BATCH_SIZE = 500
+
+
+@dataclass
+class ArchiveResult:
+    """Outcome of a retention sweep."""
+
+    archived: int = 0
+    files: List[Path] = field(default_factory=list)
+
+
+def archive_file_for(archive_dir: Path, started_at: Optional[datetime]) -> Path:
+    """Return the monthly archive file an execution belongs in."""
+    month = started_at.strftime("%Y-%m") if started_at else "undated"
+    return archive_dir / f"executions-{month}.jsonl.gz"
+
+
+def _execution_record(execution: JobExecution) -> dict:
+    job = execution.scheduled_job
+    return {
+        "id": execution.id,
+        "scheduled_job_id": execution.scheduled_job_id,
+        "job_name": job.name if job else None,
+        "session_id": execution.session_id,
+        "started_at": (
+            execution.started_at.isoformat() if execution.started_at else None
+        ),
+        "completed_at": (
+            execution.completed_at.isoformat() if execution.completed_at else None
+        ),
+        "status": execution.status,
+        "output": execution.output,
+        "error_message": execution.error_message,
+    }
+
+
+def archive_old_executions(
+    db: Session,
+    retention_days: int,
+    archive_dir: Path,
+    now: Optional[datetime] = None,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+) -> ArchiveResult:
+    """Archive and delete finished executions older than the retention window.
+
+    Each batch is written to its archive file before the rows are deleted,
+    so an interrupted sweep can at worst leave an execution both archived
+    and in the database, never neither.
+
+    Args:
+        db: Database session.
+        retention_days: Executions started more than this many days ago are
+            archived. Zero or negative disables archiving.
+        archive_dir: Directory for the compressed archive files.
+        now: Current time (overridable for tests).
+        batch_size: Number of executions archived per transaction.
+
+    Returns:
+        ArchiveResult with the number archived and the files written.
+    """
+    result = ArchiveResult()
+    if retention_days <= 0:
+        return result
+
+    cutoff = (now or datetime.now()) - timedelta(days=retention_days)
+
+    while True:
+        batch = (
+            db.query(JobExecution)
+            .options(
+                selectinload(JobExecution.output_blob),
+                selectinload(JobExecution.scheduled_job),
+            )
+            .filter(JobExecution.started_at < cutoff)
+            .filter(JobExecution.status.in_(FINISHED_STATUSES))
+            .order_by(JobExecution.started_at)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            break
+
+        by_file: Dict[Path, List[dict]] = {}
+        for execution in batch:
+            path = archive_file_for(archive_dir, execution.started_at)
+            by_file.setdefault(path, []).append(_execution_record(execution))
+
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        for path, records in by_file.items():
+            with gzip.open(path, "at", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+            if path not in result.files:
+                result.files.append(path)
+
+        ids = [execution.id for execution in batch]
+        db.query(JobExecutionOutput).filter(
+            JobExecutionOutput.execution_id.in_(ids)
+        ).delete(synchronize_session=False)
+        db.query(JobExecution).filter(JobExecution.id.in_(ids)).delete(
+            synchronize_session=False
+        )
+        db.commit()
+
+        result.archived += len(batch)
+        if len(batch) < batch_size:
+            break
+
+    if result.archived:
+        logger.info(
+            f"Archived {result.archived} executions older than {retention_days} days"
+        )
+    return result
+
+
+def read_archive(path: Path) -> Iterator[dict]:
+    """Iterate over the execution records in an archive file."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
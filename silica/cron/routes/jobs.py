@@ -1,13 +1,15 @@
 """API routes for managing scheduled jobs."""
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import base64
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import String, and_, or_, type_coerce
+from sqlalchemy.orm import Query as ORMQuery, Session, contains_eager, selectinload
 from pydantic import BaseModel, ConfigDict
 from croniter import croniter
 from datetime import datetime
 
-from ..models import get_db, ScheduledJob, Prompt, JobExecution
+from ..models import get_db, ScheduledJob, Prompt, JobExecution, JOB_EXECUTION_ROWID
 
 router = APIRouter()
 
@@ -40,9 +42,83 @@ class JobExecutionResponse(BaseModel):
     completed_at: Optional[datetime] = None
     status: str
     output: Optional[str] = None
+    output_preview: Optional[str] = None
+    output_size: Optional[int] = None
     error_message: Optional[str] = None
 
 
+# Executions are listed newest first using keyset pagination: the cursor
+# names the last row of the previous page by (started_at, rowid), so each
+# page is an index range scan no matter how deep into history it is.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# started_at compared as stored text, so cursors round-trip exactly
+_STARTED_AT_RAW = type_coerce(JobExecution.started_at, String)
+
+
+def encode_cursor(started_at_raw: str, rowid: int) -> str:
+    """Encode a page position as an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{started_at_raw}|{rowid}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        started_at_raw, rowid = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        )
+        return started_at_raw, int(rowid)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate_executions(
+    query: ORMQuery, limit: int, before: Optional[str]
+) -> Tuple[List[JobExecution], Optional[str]]:
+    """Fetch one page of executions from a JobExecution query.
+
+    Returns:
+        The executions on the page and the cursor for the next page, or
+        None if this is the last page.
+    """
+    query = query.add_columns(_STARTED_AT_RAW, JOB_EXECUTION_ROWID)
+    if before:
+        started_at_raw, rowid = decode_cursor(before)
+        query = query.filter(
+            or_(
+                _STARTED_AT_RAW < started_at_raw,
+                and_(_STARTED_AT_RAW == started_at_raw, JOB_EXECUTION_ROWID > rowid),
+            )
+        )
+
+    rows = (
+        query.order_by(JobExecution.started_at.desc(), JOB_EXECUTION_ROWID.asc())
+        .limit(limit)
+        .all()
+    )
+    next_cursor = None
+    if len(rows) == limit:
+        _, started_at_raw, rowid = rows[-1]
+        next_cursor = encode_cursor(started_at_raw, rowid)
+    return [row[0] for row in rows], next_cursor
+
+
+def execution_fields(execution: JobExecution, include_output: bool) -> dict:
+    """Serialize the fields shared by all execution responses."""
+    return {
+        "id": execution.id,
+        "scheduled_job_id": execution.scheduled_job_id,
+        "session_id": execution.session_id,
+        "started_at": execution.started_at,
+        "completed_at": execution.completed_at,
+        "status": execution.status,
+        "output": execution.output if include_output else None,
+        "output_preview": execution.output_preview,
+        "output_size": execution.output_size,
+        "error_message": execution.error_message,
+    }
+
+
 @router.get("/", response_model=List[ScheduledJobResponse])
 async def list_scheduled_jobs(db: Session = Depends(get_db)):
     """List all scheduled jobs."""
@@ -121,17 +197,35 @@ async def delete_scheduled_job(job_id: str, db: Session = Depends(get_db)):
 
 @router.get("/{job_id}/executions", response_model=List[JobExecutionResponse])
 async def get_job_executions(
-    job_id: str, limit: int = 50, db: Session = Depends(get_db)
+    job_id: str,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    before: Optional[str] = None,
+    include_output: bool = True,
+    db: Session = Depends(get_db),
 ):
-    """Get execution history for a job."""
-    executions = (
-        db.query(JobExecution)
-        .filter(JobExecution.scheduled_job_id == job_id)
-        .order_by(JobExecution.started_at.desc())
-        .limit(limit)
-        .all()
-    )
-    return executions
+    """Get execution history for a job, newest first.
+
+    Pass the ``X-Next-Cursor`` response header back as ``before`` to fetch
+    the next page. ``include_output=false`` skips loading full outputs.
+    """
+    query = db.query(JobExecution).filter(JobExecution.scheduled_job_id == job_id)
+    if include_output:
+        query = query.options(selectinload(JobExecution.output_blob))
+
+    executions, next_cursor = paginate_executions(query, limit, before)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return [execution_fields(e, include_output) for e in executions]
+
+
+@router.get("/executions/{execution_id}", response_model=JobExecutionResponse)
+async def get_execution(execution_id: str, db: Session = Depends(get_db)):
+    """Get a single execution including its full output."""
+    execution = db.query(JobExecution).filter(JobExecution.id == execution_id).first()
+    if not execution:
+        raise HTTPException(status_code=404, detail="Execution not found")
+    return execution_fields(execution, include_output=True)
 
 
 class RecentExecutionResponse(BaseModel):
@@ -146,20 +240,40 @@ class RecentExecutionResponse(BaseModel):
     completed_at: Optional[datetime] = None
     status: str
     output: Optional[str] = None
+    output_preview: Optional[str] = None
+    output_size: Optional[int] = None
     error_message: Optional[str] = None
 
 
 @router.get("/recent-executions", response_model=List[RecentExecutionResponse])
-async def get_recent_executions(limit: int = 50, db: Session = Depends(get_db)):
-    """Get recent execution history across all jobs."""
-    executions = (
+async def get_recent_executions(
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    before: Optional[str] = None,
+    include_output: bool = True,
+    db: Session = Depends(get_db),
+):
+    """Get recent execution history across all jobs, newest first.
+
+    Supports the same ``before`` cursor and ``include_output`` options as
+    the per-job listing.
+    """
+    query = (
         db.query(JobExecution)
         .outerjoin(ScheduledJob, JobExecution.scheduled_job_id == ScheduledJob.id)
         .outerjoin(Prompt, ScheduledJob.prompt_id == Prompt.id)
-        .order_by(JobExecution.started_at.desc())
-        .limit(limit)
-        .all()
+        .options(
+            contains_eager(JobExecution.scheduled_job).contains_eager(
+                ScheduledJob.prompt
+            )
+        )
     )
+    if include_output:
+        query = query.options(selectinload(JobExecution.output_blob))
+
+    executions, next_cursor = paginate_executions(query, limit, before)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
 
     result = []
     for execution in executions:
@@ -172,16 +286,9 @@ async def get_recent_executions(limit: int = 50, db: Session = Depends(get_db)):
 
         result.append(
             {
-                "id": execution.id,
+                **execution_fields(execution, include_output),
                 "job_name": job_name,
                 "prompt_name": prompt_name,
-                "scheduled_job_id": execution.scheduled_job_id,
-                "session_id": execution.session_id,
-                "started_at": execution.started_at,
-                "completed_at": execution.completed_at,
-                "status": execution.status,
-                "output": execution.output,
-                "error_message": execution.error_message,
             }
         )
 
@@ -9,7 +9,9 @@ from typing import Set
 from croniter import croniter
 import logging
 
+from .config import get_settings
 from .models import SessionLocal, ScheduledJob, JobExecution
+from .retention import archive_old_executions
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,8 @@ class PromptScheduler:
         self.running_jobs: Set[int] = set()
         self.scheduler_thread: threading.Thread = None
         self.stop_event = threading.Event()
+        self.retention_interval = 3600  # Seconds between retention sweeps
+        self._next_retention_at = 0.0
 
     def start(self):
         """Start the scheduler in a background thread."""
@@ -57,6 +61,9 @@ class PromptScheduler:
         while not self.stop_event.is_set():
             try:
                 self._check_and_execute_jobs()
+                if time.monotonic() >= self._next_retention_at:
+                    self._next_retention_at = time.monotonic() + self.retention_interval
+                    self._apply_retention()
                 time.sleep(30)  # Check every 30 seconds
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {e}", exc_info=True)
@@ -86,6 +93,25 @@ class PromptScheduler:
         finally:
             db.close()
 
+    def _apply_retention(self):
+        """Archive execution history older than the configured retention."""
+        settings = get_settings()
+        if settings.execution_retention_days <= 0:
+            return
+
+        db = SessionLocal()
+        try:
+            archive_old_executions(
+                db,
+                retention_days=settings.execution_retention_days,
+                archive_dir=settings.execution_archive_dir,
+            )
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error archiving old executions: {e}", exc_info=True)
+        finally:
+            db.close()
+
     def _should_run_job(self, job: ScheduledJob) -> bool:
         """Check if a job should run now based on its cron expression."""
         try:
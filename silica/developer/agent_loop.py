@@ -13,17 +13,21 @@ import httpx
 from anthropic.types import TextBlock, MessageParam
 from dotenv import load_dotenv
 
+from silica.developer.cache_planner import CachePlanner
+from silica.developer.compaction_planner import CompactionPlanner
+from silica.developer.tool_result_offload import offload_stale_tool_results
 from silica.developer.context import AgentContext
 from silica.developer.loop_detection import LoopDetector
 from silica.developer.models import ModelSpec
 from silica.developer.prompt import create_system_message
 from silica.developer.rate_limiter import RateLimiter
+from silica.developer.request_logger import RequestResponseLogger
 from silica.developer.toolbox import Toolbox
 from silica.developer.sandbox import DoSomethingElseError
 
 # MCP imports - optional, only used if MCP servers are configured
 try:
-    from silica.developer.mcp import MCPToolManager, load_mcp_config
+    from silica.developer.mcp import MCPSchemaCache, MCPToolManager, load_mcp_config
 
     MCP_AVAILABLE = True
 except ImportError:
@@ -441,6 +445,10 @@ async def _initialize_mcp(
     Loads MCP configuration from global, persona, and project paths,
     connects to enabled servers, and returns the manager.
 
+    Servers whose tool schemas are in the on-disk schema cache are not
+    spawned here; their cached tools are exposed immediately and the
+    server is started on the first call to one of its tools.
+
     Args:
         agent_context: Agent context with persona/project info
         user_interface: UI for status messages
@@ -485,13 +493,13 @@ async def _initialize_mcp(
             return None, False
 
         # Create and connect manager
-        manager = MCPToolManager()
+        manager = MCPToolManager(schema_cache=MCPSchemaCache())
         user_interface.handle_system_message(
             f"[dim]Connecting to {len(enabled_servers)} MCP server(s)...[/dim]",
             markdown=False,
         )
 
-        results = await manager.connect_servers(config)
+        results = await manager.connect_servers(config, lazy=True)
 
         # Report connection results
         connected = [name for name, err in results.items() if err is None]
@@ -576,7 +584,10 @@ async def _wait_with_coordination(
     immediately when workers send updates, even while the user input
     prompt is displayed.
     """
-    from silica.developer.tools.coordination import poll_messages
+    from silica.developer.tools.coordination import (
+        format_agent_messages,
+        receive_agent_messages,
+    )
 
     # Build subscribe topics: inbox + room
     # Use the context's cursors (same ones used by receive_messages)
@@ -621,51 +632,60 @@ async def _wait_with_coordination(
                 # Connection error — back off and retry
                 await asyncio.sleep(2)
 
-    # Race: user input vs worker messages (vs optional heartbeat timeout)
-    user_task = asyncio.ensure_future(user_interface.get_user_input(prompt))
-    subscribe_task = asyncio.ensure_future(_subscribe_for_messages())
-
-    tasks = {user_task, subscribe_task}
-    timeout = heartbeat_idle_seconds if heartbeat_prompt else None
-
-    try:
-        done, pending = await asyncio.wait(
-            tasks,
-            timeout=timeout,
-            return_when=asyncio.FIRST_COMPLETED,
-        )
-    except asyncio.CancelledError:
-        for t in tasks:
-            t.cancel()
-        raise
-
-    # Cancel whichever didn't finish
-    for t in pending:
-        t.cancel()
+    async def _cancel(task):
+        task.cancel()
         try:
-            await t
+            await task
         except (asyncio.CancelledError, Exception):
             pass
 
-    # Timeout — heartbeat
-    if not done:
-        return _make_heartbeat_message(heartbeat_prompt, user_interface)
-
-    # User typed something — always prefer that
-    if user_task in done:
-        return user_task.result()
+    # Race: user input vs worker messages (vs optional heartbeat timeout).
+    # The input task lives across subscribe rounds so partially typed input
+    # survives messages that turn out not to be for the agent.
+    loop = asyncio.get_running_loop()
+    user_task = asyncio.ensure_future(user_interface.get_user_input(prompt))
+    heartbeat_at = loop.time() + heartbeat_idle_seconds if heartbeat_prompt else None
+    subscribe_task = None
 
-    # Worker message arrived — poll and inject
-    if subscribe_task in done:
-        messages_text = poll_messages(include_room=True)
-        user_interface.handle_system_message(
-            "📨 Worker message received",
-            markdown=False,
-        )
-        return f"[Worker Messages]\n\n{messages_text}"
+    try:
+        while True:
+            subscribe_task = asyncio.ensure_future(_subscribe_for_messages())
+            timeout = None
+            if heartbeat_at is not None:
+                timeout = max(0, heartbeat_at - loop.time())
+            done, _ = await asyncio.wait(
+                {user_task, subscribe_task},
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
 
-    # Shouldn't reach here, but fall back to user input
-    return await user_interface.get_user_input(prompt)
+            # User typed something — always prefer that
+            if user_task in done:
+                await _cancel(subscribe_task)
+                return user_task.result()
+
+            # Timeout — heartbeat
+            if subscribe_task not in done:
+                await _cancel(subscribe_task)
+                await _cancel(user_task)
+                return _make_heartbeat_message(heartbeat_prompt, user_interface)
+
+            # Worker message arrived — poll and inject
+            messages = receive_agent_messages(include_room=True)
+            if not messages:
+                # Only pool readiness announcements (or already consumed)
+                continue
+            await _cancel(user_task)
+            user_interface.handle_system_message(
+                "📨 Worker message received",
+                markdown=False,
+            )
+            return f"[Worker Messages]\n\n{format_agent_messages(messages)}"
+    except asyncio.CancelledError:
+        user_task.cancel()
+        if subscribe_task is not None:
+            subscribe_task.cancel()
+        raise
 
 
 def _make_heartbeat_message(heartbeat_prompt: str, user_interface) -> str:
@@ -695,11 +715,13 @@ async def run(
     heartbeat_idle_seconds: int = 300,
     coordination_session: Any | None = None,
 ) -> list[MessageParam]:
+    """Run the agent loop (see _run).
+
+    Sets up the MCP manager, unless one is passed in, and the request log,
+    and releases both however the loop ends.
+    """
     load_dotenv()
-    user_interface, model = (
-        agent_context.user_interface,
-        agent_context.model_spec,
-    )
+    user_interface = agent_context.user_interface
 
     # Initialize MCP if available and not provided
     mcp_manager_owned = False  # Track if we need to clean up the manager
@@ -708,6 +730,62 @@ async def run(
             agent_context, user_interface
         )
 
+    # Initialize request/response logger if enabled
+    logger = RequestResponseLogger(log_file_path)
+    try:
+        return await _run(
+            agent_context,
+            initial_prompt=initial_prompt,
+            single_response=single_response,
+            tool_names=tool_names,
+            tools=tools,
+            system_prompt=system_prompt,
+            enable_compaction=enable_compaction,
+            logger=logger,
+            mcp_manager=mcp_manager,
+            heartbeat_prompt=heartbeat_prompt,
+            heartbeat_idle_seconds=heartbeat_idle_seconds,
+            coordination_session=coordination_session,
+        )
+    finally:
+        # Clean up MCP connections if we own the manager
+        if mcp_manager_owned and mcp_manager is not None:
+            try:
+                await mcp_manager.disconnect_all()
+                user_interface.handle_system_message(
+                    "[dim]MCP: Disconnected from all servers[/dim]",
+                    markdown=False,
+                )
+            except Exception as e:
+                import logging
+
+                logging.getLogger(__name__).warning(
+                    f"Error disconnecting MCP servers: {e}"
+                )
+
+        logger.close()
+
+
+async def _run(
+    agent_context: AgentContext,
+    *,
+    initial_prompt: str = None,
+    single_response: bool = False,
+    tool_names: list[str] | None = None,
+    tools: list | None = None,
+    system_prompt: dict[str, Any] | None = None,
+    enable_compaction: bool = True,
+    logger: RequestResponseLogger,
+    mcp_manager: "MCPToolManager | None" = None,
+    heartbeat_prompt: str | None = None,
+    heartbeat_idle_seconds: int = 300,
+    coordination_session: Any | None = None,
+) -> list[MessageParam]:
+    user_interface, model = (
+        agent_context.user_interface,
+        agent_context.model_spec,
+    )
+
     # Create toolbox with either tools or tool_names (tools takes precedence)
     toolbox = Toolbox(
         agent_context, tool_names=tool_names, tools=tools, mcp_manager=mcp_manager
@@ -717,11 +795,6 @@ async def run(
     if hasattr(user_interface, "set_toolbox"):
         user_interface.set_toolbox(toolbox)
 
-    # Initialize request/response logger if enabled
-    from silica.developer.request_logger import RequestResponseLogger
-
-    logger = RequestResponseLogger(log_file_path)
-
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
         user_interface.handle_system_message(
@@ -887,6 +960,18 @@ async def run(
                         compact=False,  # Compaction handled explicitly below
                     )
 
+                # Replace stale, large tool results with stubs before deciding
+                # whether the conversation needs summarizing
+                offloaded = offload_stale_tool_results(
+                    agent_context.chat_history, agent_context.session_store
+                )
+                if offloaded.results:
+                    user_interface.handle_system_message(
+                        f"[dim]Offloaded {offloaded.results} old tool results "
+                        f"(~{offloaded.tokens:,} tokens)[/dim]",
+                        markdown=False,
+                    )
+
                 # Check for compaction after tool results are converted to messages
                 # This ensures we have the complete conversation state including tool interactions
                 from silica.developer.compacter import ConversationCompacter
@@ -944,9 +1029,10 @@ async def run(
                                         )
                                     )
 
-                                    # Count tokens for complete conversation
+                                    # Size of the complete conversation, from the
+                                    # last recorded prompt size when available
                                     conversation_size_for_display = (
-                                        compacter.count_tokens(
+                                        compacter.context_tokens(
                                             agent_context, model_name
                                         )
                                     )
@@ -1073,12 +1159,22 @@ async def run(
                                 else:
                                     max_tokens = max(1024, available)
 
+                        # Place the cache breakpoints on prefixes that later
+                        # turns will read again
+                        if agent_context.cache_planner is None:
+                            agent_context.cache_planner = CachePlanner()
+                        request_system, request_tools = (
+                            agent_context.cache_planner.apply(
+                                system_message, toolbox.agent_schema, messages
+                            )
+                        )
+
                         api_kwargs = {
-                            "system": system_message,
+                            "system": request_system,
                             "max_tokens": max_tokens,
                             "messages": messages,
                             "model": model["title"],
-                            "tools": toolbox.agent_schema,
+                            "tools": request_tools,
                         }
 
                         # Add thinking parameter if configured
@@ -1088,10 +1184,10 @@ async def run(
                         # Log the request
                         logger.log_request(
                             messages=messages,
-                            system_message=system_message,
+                            system_message=request_system,
                             model=model["title"],
                             max_tokens=max_tokens,
-                            tools=toolbox.agent_schema,
+                            tools=request_tools,
                             thinking_config=thinking_config,
                         )
 
@@ -1395,6 +1491,12 @@ async def run(
             agent_context.chat_history.append(assistant_msg)
 
             agent_context.report_usage(final_message.usage)
+            if agent_context.compaction_planner is None:
+                agent_context.compaction_planner = CompactionPlanner()
+            # The prompt held every message before the one just appended
+            agent_context.compaction_planner.record_usage(
+                final_message.usage, agent_context.chat_history[:-1]
+            )
             usage_summary = agent_context.usage_summary()
 
             # Display thinking content if present
@@ -1770,17 +1872,4 @@ async def run(
             # Flush without compaction - compaction is handled explicitly in the main loop
             agent_context.flush(agent_context.chat_history, compact=False)
 
-    # Clean up MCP connections if we own the manager
-    if mcp_manager_owned and mcp_manager is not None:
-        try:
-            await mcp_manager.disconnect_all()
-            user_interface.handle_system_message(
-                "[dim]MCP: Disconnected from all servers[/dim]",
-                markdown=False,
-            )
-        except Exception as e:
-            import logging
-
-            logging.getLogger(__name__).warning(f"Error disconnecting MCP servers: {e}")
-
     return agent_context.chat_history
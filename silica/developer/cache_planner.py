@@ -0,0 +1,202 @@
+"""Placement of prompt-cache breakpoints across turns.
+
+The API allows at most four ``cache_control`` breakpoints per request. A
+breakpoint only pays off if a later request sends the same prefix up to a
+point that an earlier request wrote to the cache, so where the markers go
+matters more than how many there are. ``CachePlanner`` keeps enough state
+between requests of one session to place them on prefixes that will be
+read again:
+
+1. **tools** – the last tool schema; tools rarely change within a session.
+2. **system** – the end of the longest run of system blocks that have not
+   changed in the last ``VOLATILE_TURNS`` requests. Volatile trailing
+   blocks (sandbox listing, memory topics) stay outside the cached prefix
+   instead of invalidating it every turn.
+3. **checkpoint** – the latest breakpoint of an earlier request whose
+   message prefix is still unchanged. It was written to the cache by that
+   request, so this turn reads at least that much even when the new turn
+   added more blocks than the API's cache lookback covers (long tool
+   loops, injected plan reminders).
+4. **latest** – the last block of the conversation, written for the next
+   turn to read.
+
+After compaction rewrites the history no earlier prefix matches, so only
+the tools, system and latest breakpoints are placed until the next turn.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+# Breakpoints the API accepts in one request
+MAX_BREAKPOINTS = 4
+
+EPHEMERAL = {"type": "ephemeral"}
+
+# A system block that changed in this many recent requests is volatile
+VOLATILE_TURNS = 5
+
+# Earlier breakpoint positions remembered as checkpoint candidates
+MAX_CHECKPOINTS = 4
+
+# Content blocks that cannot carry cache_control
+_UNMARKABLE_BLOCKS = frozenset({"thinking", "redacted_thinking"})
+
+
+def _block_digest(block: Any) -> bytes:
+    if isinstance(block, dict):
+        block = {k: v for k, v in block.items() if k != "cache_control"}
+    return json.dumps(block, sort_keys=True, default=str).encode()
+
+
+def _content_blocks(message: dict) -> list:
+    content = message.get("content")
+    if isinstance(content, str):
+        return [{"type": "text", "text": content}]
+    return content if isinstance(content, list) else []
+
+
+class CachePlanner:
+    """Chooses the ``cache_control`` breakpoints of one session's requests."""
+
+    def __init__(self):
+        # Labels of the breakpoints placed in the last request
+        self.last_plan: list[str] = []
+        self._turn = 0
+        self._system_digests: list[str] = []
+        # Turn in which each system block last changed
+        self._system_changed: list[int] = []
+        # (flat block position, prefix digest) of earlier breakpoints
+        self._checkpoints: list[tuple[int, str]] = []
+
+    def apply(
+        self,
+        system: list[dict] | str | None,
+        tools: list[dict] | None,
+        messages: list[dict],
+    ) -> tuple[list[dict] | str | None, list[dict] | None]:
+        """Strip existing breakpoints and place this request's.
+
+        ``messages`` is modified in place (pass the per-request copy, not the
+        chat history). ``system`` and ``tools`` are copied where marked, since
+        they are usually shared with other requests.
+
+        Returns:
+            Tuple of (system, tools) to send
+        """
+        self._turn += 1
+        plan: list[str] = []
+
+        if tools:
+            tools = [
+                {k: v for k, v in tool.items() if k != "cache_control"}
+                for tool in tools
+            ]
+            tools[-1]["cache_control"] = EPHEMERAL
+            plan.append("tools")
+
+        if isinstance(system, list) and system:
+            system = [
+                {k: v for k, v in block.items() if k != "cache_control"}
+                for block in system
+            ]
+            stable = self._stable_system_blocks(system)
+            if stable:
+                system[stable - 1]["cache_control"] = EPHEMERAL
+                plan.append("system")
+
+        plan.extend(self._mark_messages(messages))
+        self.last_plan = plan[:MAX_BREAKPOINTS]
+        return system, tools
+
+    def _stable_system_blocks(self, system: list[dict]) -> int:
+        """Return the number of leading system blocks that are not volatile."""
+        digests = [hashlib.sha1(_block_digest(block)).hexdigest() for block in system]
+        changed = []
+        for i, digest in enumerate(digests):
+            if i < len(self._system_digests) and self._system_digests[i] == digest:
+                changed.append(self._system_changed[i])
+            elif self._system_digests:
+                changed.append(self._turn)
+            else:
+                # First request: nothing is known to be volatile yet
+                changed.append(0)
+        self._system_digests = digests
+        self._system_changed = changed
+
+        stable = 0
+        for last_change in changed:
+            if last_change and self._turn - last_change < VOLATILE_TURNS:
+                break
+            stable += 1
+        return stable
+
+    def _mark_messages(self, messages: list[dict]) -> list[str]:
+        # Flatten to (message, block) positions; string content counts as
+        # one text block, which is how the API renders it
+        blocks: list[tuple[int, int]] = []
+        for m, message in enumerate(messages):
+            for b, block in enumerate(_content_blocks(message)):
+                if isinstance(block, dict):
+                    block.pop("cache_control", None)
+                blocks.append((m, b))
+
+        latest = self._latest_position(messages, blocks)
+        if latest is None:
+            self._checkpoints = []
+            return []
+
+        # One pass over the history, keeping the prefix digests of the
+        # earlier breakpoints and of this request's latest block
+        wanted = {position for position, _ in self._checkpoints if position < latest}
+        wanted.add(latest)
+        prefix = hashlib.sha1()
+        digests: dict[int, str] = {}
+        for position in range(latest + 1):
+            m, b = blocks[position]
+            message = messages[m]
+            if b == 0:
+                prefix.update(f"\0{message.get('role')}\0".encode())
+            prefix.update(_block_digest(_content_blocks(message)[b]))
+            if position in wanted:
+                digests[position] = prefix.copy().hexdigest()
+
+        valid = [
+            (position, digest)
+            for position, digest in self._checkpoints
+            if position < latest and digests.get(position) == digest
+        ]
+
+        plan = []
+        if valid:
+            self._mark_block(messages, blocks[max(valid)[0]])
+            plan.append("checkpoint")
+        self._mark_block(messages, blocks[latest])
+        plan.append("latest")
+
+        # Keep still-valid checkpoints as fallbacks for later requests
+        self._checkpoints = sorted(valid + [(latest, digests[latest])])[
+            -MAX_CHECKPOINTS:
+        ]
+        return plan
+
+    @staticmethod
+    def _latest_position(messages, blocks) -> int | None:
+        """Return the last block position that may carry a breakpoint."""
+        for position in range(len(blocks) - 1, -1, -1):
+            m, b = blocks[position]
+            block = _content_blocks(messages[m])[b]
+            if not isinstance(block, dict) or block.get("type") in _UNMARKABLE_BLOCKS:
+                continue
+            if block.get("type") == "text" and not block.get("text"):
+                continue
+            return position
+        return None
+
+    @staticmethod
+    def _mark_block(messages, location: tuple[int, int]) -> None:
+        m, b = location
+        message = messages[m]
+        if isinstance(message.get("content"), str):
+            message["content"] = [{"type": "text", "text": message["content"]}]
+        message["content"][b]["cache_control"] = EPHEMERAL
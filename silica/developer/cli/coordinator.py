@@ -19,7 +19,10 @@ from silica.developer.coordination.session import (
     list_sessions,
     delete_session,
 )
-from silica.developer.tools.coordination import set_current_session
+from silica.developer.tools.coordination import (
+    configure_worker_pool,
+    set_current_session,
+)
 
 console = Console()
 
@@ -386,6 +389,7 @@ def _run_coordinator_agent(
     heartbeat_prompt: str | None = None,
     heartbeat_interval: int = 300,
     model_override: str | None = None,
+    worker_pool: int | None = None,
 ):
     """Run the coordinator agent loop.
 
@@ -520,6 +524,10 @@ def _run_coordinator_agent(
     # Set as current session for tools
     set_current_session(session)
 
+    # Start warming local workers for spawn_agent
+    if configure_worker_pool(size=worker_pool) is not None:
+        console.print("[dim]Warming up the local worker pool...[/dim]")
+
     # Create user interface (CLI-only for coordinator)
     user_interface = CLIUserInterface(console, SandboxMode.ALLOW_ALL)
 
@@ -701,6 +709,14 @@ def coordinator_default(
             help="Override the coordinator model (e.g., sonnet, opus, haiku)",
         ),
     ] = None,
+    worker_pool: Annotated[
+        Optional[int],
+        cyclopts.Parameter(
+            name=["--worker-pool"],
+            help="Local workers to keep warm for spawn_agent "
+            "(default: SILICA_WORKER_POOL_SIZE or 0)",
+        ),
+    ] = None,
 ):
     """Start or resume a coordination session.
 
@@ -764,6 +780,7 @@ def coordinator_default(
                 heartbeat_prompt=heartbeat_prompt,
                 heartbeat_interval=heartbeat_interval,
                 model_override=model,
+                worker_pool=worker_pool,
             )
             return
 
@@ -796,4 +813,5 @@ def coordinator_default(
         heartbeat_prompt=heartbeat_prompt,
         heartbeat_interval=heartbeat_interval,
         model_override=model,
+        worker_pool=worker_pool,
     )
@@ -5,7 +5,13 @@ This module provides commands for syncing conversation history per session.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Annotated, Optional
@@ -33,6 +39,35 @@ from silica.developer.memory.sync_coordinator import sync_with_retry
 from silica.developer.memory.llm_conflict_resolver import LLMConflictResolver
 from silica.developer import personas
 
+logger = logging.getLogger(__name__)
+
+# Sessions synced at the same time when syncing all sessions
+DEFAULT_CONCURRENCY = 8
+
+# Per-persona record of each session's state after its last clean sync
+SYNC_STATE_FILE = ".sync-state-history.json"
+
+
+@contextmanager
+def _session_executor(concurrency: int):
+    """Thread pool for per-session work that drops queued sessions on errors.
+
+    Leaving a ``ThreadPoolExecutor`` block waits for every submitted task,
+    so Ctrl-C or a failure would only take effect once all queued sessions
+    had been processed. Here the queued ones are cancelled and only the
+    sessions already running are waited for.
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="history-sync"
+    )
+    try:
+        yield executor
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown()
+
 
 @dataclass
 class SessionSyncResult:
@@ -45,7 +80,8 @@ class SessionSyncResult:
     skipped: int = 0
     duration: float = 0.0
     error: str | None = None
-    status: str = "pending"  # pending, syncing, done, error
+    status: str = "pending"  # pending, syncing, done, error, unchanged
+    wrote_remote: bool = False
 
 
 # Create the history-sync command group
@@ -269,6 +305,7 @@ def _analyze_session_plan(
     config: MemoryProxyConfig,
     persona_name: str,
     session: str,
+    client: MemoryProxyClient | None = None,
 ) -> SessionPlanResult:
     """Analyze sync plan for a single session without displaying.
 
@@ -276,6 +313,7 @@ def _analyze_session_plan(
         config: Memory proxy configuration
         persona_name: Name of the persona
         session: Session ID
+        client: Proxy client to use (default: create one)
 
     Returns:
         SessionPlanResult with plan summary
@@ -284,7 +322,10 @@ def _analyze_session_plan(
 
     try:
         # Create proxy client
-        client = MemoryProxyClient(base_url=config.remote_url, token=config.auth_token)
+        if client is None:
+            client = MemoryProxyClient(
+                base_url=config.remote_url, token=config.auth_token
+            )
 
         # Create sync configuration for this session
         sync_config = SyncConfig.for_history(persona_name, session)
@@ -313,6 +354,17 @@ def _analyze_session_plan(
         return result
 
 
+def _create_conflict_resolver() -> LLMConflictResolver | None:
+    """Create an LLM conflict resolver if an Anthropic API key is set."""
+    anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not anthropic_key:
+        return None
+
+    from anthropic import Anthropic
+
+    return LLMConflictResolver(client=Anthropic(api_key=anthropic_key))
+
+
 def _sync_single_session(
     console: Console,
     config: MemoryProxyConfig,
@@ -321,6 +373,8 @@ def _sync_single_session(
     session_dir: Path,
     dry_run: bool = False,
     verbose: bool = False,
+    client: MemoryProxyClient | None = None,
+    conflict_resolver: LLMConflictResolver | None = None,
 ) -> SessionSyncResult:
     """Sync a single session.
 
@@ -332,6 +386,9 @@ def _sync_single_session(
         session_dir: Path to the session directory
         dry_run: If True, only analyze without executing
         verbose: If True and dry_run, show detailed plan
+        client: Proxy client to use (default: create one)
+        conflict_resolver: Conflict resolver to use (default: create one if
+            ANTHROPIC_API_KEY is set)
 
     Returns:
         SessionSyncResult with sync outcome
@@ -341,19 +398,15 @@ def _sync_single_session(
     result_info = SessionSyncResult(session_id=session)
 
     try:
-        # Get Anthropic API key for LLM conflict resolution
-        anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
-
         # Create conflict resolver if we have an API key
-        conflict_resolver = None
-        if anthropic_key:
-            from anthropic import Anthropic
-
-            anthropic_client = Anthropic(api_key=anthropic_key)
-            conflict_resolver = LLMConflictResolver(client=anthropic_client)
+        if conflict_resolver is None:
+            conflict_resolver = _create_conflict_resolver()
 
         # Create proxy client
-        client = MemoryProxyClient(base_url=config.remote_url, token=config.auth_token)
+        if client is None:
+            client = MemoryProxyClient(
+                base_url=config.remote_url, token=config.auth_token
+            )
 
         # Create sync configuration for this session
         sync_config = SyncConfig.for_history(persona_name, session)
@@ -386,6 +439,10 @@ def _sync_single_session(
         result_info.skipped = len(result.skipped)
         result_info.duration = result.duration
         result_info.status = "done" if not result.failed else "error"
+        result_info.wrote_remote = bool(result.conflicts) or any(
+            op.type in ("upload", "delete_remote")
+            for op in [*result.succeeded, *result.failed]
+        )
 
         return result_info
 
@@ -395,24 +452,132 @@ def _sync_single_session(
         return result_info
 
 
+def _local_fingerprint(session_dir: Path) -> str:
+    """Fingerprint the files of a session from their sizes and mtimes.
+
+    Cheap enough to compute for every session on every sync; sync metadata
+    files are ignored.
+    """
+    digest = hashlib.md5()
+    try:
+        paths = sorted(p for p in session_dir.rglob("*") if p.is_file())
+    except OSError:
+        return ""
+    for path in paths:
+        if path.name.startswith(".sync-"):
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        relative = path.relative_to(session_dir).as_posix()
+        digest.update(f"{relative}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _load_sync_state(state_file: Path) -> dict:
+    """Load the per-session sync state, or an empty state if unreadable."""
+    try:
+        state = json.loads(state_file.read_text())
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_sync_state(state_file: Path, state: dict) -> None:
+    """Write the per-session sync state atomically."""
+    temp_file = state_file.with_suffix(".tmp")
+    try:
+        temp_file.write_text(json.dumps(state, sort_keys=True))
+        os.replace(temp_file, state_file)
+    except OSError as e:
+        logger.warning(f"Failed to save history sync state: {e}")
+
+
+def _find_changed_sessions(
+    client: MemoryProxyClient,
+    persona_name: str,
+    sessions: list[dict],
+    state: dict,
+) -> tuple[list[dict], list[dict], dict[str, str] | None]:
+    """Split sessions into those that need syncing and those in sync.
+
+    A session is in sync when neither its remote change token nor its local
+    fingerprint changed since its last clean sync, which takes one listing
+    request for all sessions instead of fetching every session's index.
+
+    Returns:
+        Tuple of (sessions to sync, unchanged sessions, remote tokens). The
+        tokens are None if the proxy could not list them, in which case
+        every session is synced.
+    """
+    prefix = f"personas/{persona_name}/history"
+    try:
+        tokens = dict(client.get_sync_tokens(prefix))
+    except Exception as e:
+        # The pre-pass is only an optimisation; fall back to a full sync
+        logger.debug(f"Could not list sync tokens, syncing all sessions: {e}")
+        return sessions, [], None
+
+    changed, unchanged = [], []
+    for session_info in sessions:
+        session_id = session_info["session_id"]
+        recorded = state.get(session_id) or {}
+        token = tokens.get(f"{prefix}/{session_id}")
+        if (
+            token is not None
+            and recorded.get("remote") == token
+            and recorded.get("local") == _local_fingerprint(session_info["path"])
+        ):
+            unchanged.append(session_info)
+        else:
+            changed.append(session_info)
+    return changed, unchanged, tokens
+
+
 def _sync_all_sessions_with_progress(
     console: Console,
     config: MemoryProxyConfig,
     persona_name: str,
     sessions_to_sync: list[dict],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    state_file: Path | None = None,
 ) -> list[SessionSyncResult]:
-    """Sync multiple sessions with a live progress display.
+    """Sync multiple sessions concurrently with a live progress display.
+
+    Up to ``concurrency`` sessions sync at once, sharing one pooled proxy
+    client whose back-off slows every worker down when the proxy throttles.
+    If ``state_file`` is given, sessions unchanged on both sides since
+    their last clean sync are skipped without fetching their indexes.
 
     Args:
         console: Rich console for output
         config: Memory proxy configuration
         persona_name: Name of the persona
         sessions_to_sync: List of session info dicts
+        concurrency: Maximum number of sessions synced at once
+        state_file: Where to keep per-session sync state for the pre-pass
 
     Returns:
-        List of SessionSyncResult for each session
+        List of SessionSyncResult for each session, in input order
     """
-    results: list[SessionSyncResult] = []
+    concurrency = max(1, concurrency)
+    client = MemoryProxyClient(
+        base_url=config.remote_url,
+        token=config.auth_token,
+        max_connections=concurrency,
+    )
+    conflict_resolver = _create_conflict_resolver()
+
+    state = _load_sync_state(state_file) if state_file else {}
+    tokens = None
+    pending, unchanged = sessions_to_sync, []
+    if state_file:
+        pending, unchanged, tokens = _find_changed_sessions(
+            client, persona_name, sessions_to_sync, state
+        )
+
+    results: dict[str, SessionSyncResult] = {}
 
     # Create progress display
     overall_progress = Progress(
@@ -452,9 +617,29 @@ def _sync_all_sessions_with_progress(
         visible=False,
     )
 
-    # Add task for each session
+    def count_in_sync(count: int) -> None:
+        nonlocal skipped_count
+        skipped_count += count
+        session_progress.update(
+            skipped_task,
+            visible=True,
+            status_icon="[dim]─[/dim]",
+            session_id=f"[dim]({skipped_count} session(s) already in sync)[/dim]",
+            status_text="",
+        )
+
+    # Sessions found unchanged by the pre-pass are done already
+    for session_info in unchanged:
+        results[session_info["session_id"]] = SessionSyncResult(
+            session_id=session_info["session_id"], status="unchanged"
+        )
+    if unchanged:
+        count_in_sync(len(unchanged))
+        overall_progress.update(overall_task, advance=len(unchanged))
+
+    # Add task for each session that needs syncing
     session_tasks = {}
-    for session_info in sessions_to_sync:
+    for session_info in pending:
         session_id = session_info["session_id"]
         task_id = session_progress.add_task(
             session_id,
@@ -464,46 +649,55 @@ def _sync_all_sessions_with_progress(
         )
         session_tasks[session_id] = task_id
 
-    with Live(progress_group, console=console, refresh_per_second=10):
-        for session_info in sessions_to_sync:
-            session_id = session_info["session_id"]
-            session_path = session_info["path"]
-            task_id = session_tasks[session_id]
-
-            # Update status to syncing
-            session_progress.update(
-                task_id,
-                status_icon="◐",
-                status_text="[cyan]Syncing...[/cyan]",
-            )
-
-            # Perform sync
-            result = _sync_single_session(
-                console=console,
-                config=config,
-                persona_name=persona_name,
-                session=session_id,
-                session_dir=session_path,
-                dry_run=False,
-            )
-            results.append(result)
+    def sync_session(session_info: dict) -> SessionSyncResult:
+        # Progress updates are thread-safe, so workers can mark their start
+        session_progress.update(
+            session_tasks[session_info["session_id"]],
+            status_icon="◐",
+            status_text="[cyan]Syncing...[/cyan]",
+        )
+        return _sync_single_session(
+            console=console,
+            config=config,
+            persona_name=persona_name,
+            session=session_info["session_id"],
+            session_dir=session_info["path"],
+            dry_run=False,
+            client=client,
+            conflict_resolver=conflict_resolver,
+        )
 
-            # Update status based on result
-            if result.error:
-                # Show a brief status in the progress view; full error shown at end
-                session_progress.update(
-                    task_id,
-                    status_icon="[red]✗[/red]",
-                    status_text="[red]Failed (see details below)[/red]",
-                )
-            elif result.failed > 0:
-                session_progress.update(
-                    task_id,
-                    status_icon="[yellow]⚠[/yellow]",
-                    status_text=f"[yellow]{result.succeeded} ok, {result.failed} failed[/yellow]",
-                )
-            else:
-                if result.succeeded > 0:
+    try:
+        with (
+            Live(progress_group, console=console, refresh_per_second=10),
+            _session_executor(concurrency) as executor,
+        ):
+            futures = {
+                executor.submit(sync_session, session_info): session_info
+                for session_info in pending
+            }
+            for future in as_completed(futures):
+                session_info = futures[future]
+                session_id = session_info["session_id"]
+                task_id = session_tasks[session_id]
+                result = future.result()
+                results[session_id] = result
+
+                # Update status based on result
+                if result.error:
+                    # Show a brief status in the progress view; full error shown at end
+                    session_progress.update(
+                        task_id,
+                        status_icon="[red]✗[/red]",
+                        status_text="[red]Failed (see details below)[/red]",
+                    )
+                elif result.failed > 0:
+                    session_progress.update(
+                        task_id,
+                        status_icon="[yellow]⚠[/yellow]",
+                        status_text=f"[yellow]{result.succeeded} ok, {result.failed} failed[/yellow]",
+                    )
+                elif result.succeeded > 0:
                     # Show sessions that had actual operations
                     session_progress.update(
                         task_id,
@@ -513,19 +707,65 @@ def _sync_all_sessions_with_progress(
                 else:
                     # Hide sessions that were already in sync and update counter
                     session_progress.update(task_id, visible=False)
-                    skipped_count += 1
-                    session_progress.update(
-                        skipped_task,
-                        visible=True,
-                        status_icon="[dim]─[/dim]",
-                        session_id=f"[dim]({skipped_count} session(s) already in sync)[/dim]",
-                        status_text="",
-                    )
+                    count_in_sync(1)
+
+                # Record the session's state after a clean sync; a sync that
+                # wrote to the remote changed its token, so it is only
+                # confirmed by the next sync
+                if result.error or result.failed or result.conflicts:
+                    state.pop(session_id, None)
+                elif tokens is not None:
+                    state[session_id] = {
+                        "remote": None
+                        if result.wrote_remote
+                        else tokens.get(
+                            f"personas/{persona_name}/history/{session_id}"
+                        ),
+                        "local": _local_fingerprint(session_info["path"]),
+                    }
+
+                # Update overall progress
+                overall_progress.update(overall_task, advance=1)
+    finally:
+        if state_file and tokens is not None:
+            _save_sync_state(state_file, state)
+        client.close()
+
+    return [results[s["session_id"]] for s in sessions_to_sync]
+
 
-            # Update overall progress
-            overall_progress.update(overall_task, advance=1)
+def _analyze_all_session_plans(
+    config: MemoryProxyConfig,
+    persona_name: str,
+    sessions: list[dict],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[SessionPlanResult]:
+    """Analyze the sync plans of several sessions concurrently.
 
-    return results
+    Returns:
+        List of SessionPlanResult for each session, in input order
+    """
+    concurrency = max(1, concurrency)
+    client = MemoryProxyClient(
+        base_url=config.remote_url,
+        token=config.auth_token,
+        max_connections=concurrency,
+    )
+    try:
+        with _session_executor(concurrency) as executor:
+            return [
+                *executor.map(
+                    lambda session_info: _analyze_session_plan(
+                        config=config,
+                        persona_name=persona_name,
+                        session=session_info["session_id"],
+                        client=client,
+                    ),
+                    sessions,
+                )
+            ]
+    finally:
+        client.close()
 
 
 def _display_dry_run_summary(
@@ -641,6 +881,10 @@ def sync(
         bool,
         cyclopts.Parameter(help="Show detailed plan for each session (with --dry-run)"),
     ] = False,
+    concurrency: Annotated[
+        int,
+        cyclopts.Parameter(help="Number of sessions to sync at once"),
+    ] = DEFAULT_CONCURRENCY,
 ):
     """Sync conversation history for sessions.
 
@@ -648,13 +892,16 @@ def sync(
     If --session is omitted, syncs ALL sessions for the persona.
 
     Performs bi-directional sync between local session history and remote storage.
-    Uses automatic conflict resolution via LLM when needed.
+    Uses automatic conflict resolution via LLM when needed. When syncing all
+    sessions, up to --concurrency sessions sync at once, and sessions unchanged
+    locally and remotely since their last sync are skipped.
 
     Example:
         silica history-sync sync                              # Sync all sessions
         silica history-sync sync --session session-123        # Sync specific session
         silica history-sync sync --dry-run                    # Preview all sessions (summary)
         silica history-sync sync --dry-run --verbose          # Preview with detailed plans
+        silica history-sync sync --concurrency 16             # Sync 16 sessions at once
         silica history-sync sync --persona autonomous_engineer
     """
     console = _get_console()
@@ -715,14 +962,12 @@ def sync(
                     )
             else:
                 # Summary mode: show table with all sessions
-                plans = []
-                for session_info in sessions_to_sync:
-                    plan = _analyze_session_plan(
-                        config=config,
-                        persona_name=persona_name,
-                        session=session_info["session_id"],
-                    )
-                    plans.append(plan)
+                plans = _analyze_all_session_plans(
+                    config=config,
+                    persona_name=persona_name,
+                    sessions=sessions_to_sync,
+                    concurrency=concurrency,
+                )
 
                 _display_dry_run_summary(console, plans)
             return
@@ -795,18 +1040,22 @@ def sync(
             return
 
         # Handle multiple sessions with live progress display
+        started = time.monotonic()
         all_results = _sync_all_sessions_with_progress(
             console=console,
             config=config,
             persona_name=persona_name,
             sessions_to_sync=sessions_to_sync,
+            concurrency=concurrency,
+            state_file=persona_dir / SYNC_STATE_FILE,
         )
+        # Sessions sync concurrently, so report wall-clock time
+        total_duration = time.monotonic() - started
 
         # Calculate totals
         total_succeeded = sum(r.succeeded for r in all_results)
         total_failed = sum(r.failed for r in all_results)
         total_conflicts = sum(r.conflicts for r in all_results)
-        total_duration = sum(r.duration for r in all_results)
         sessions_succeeded = len([r for r in all_results if not r.error])
         errors = [(r.session_id, r.error) for r in all_results if r.error]
 
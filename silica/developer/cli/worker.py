@@ -119,6 +119,7 @@ def _run_worker_agent(
     from silica.developer.tools import ALL_TOOLS, WORKER_COORDINATION_TOOLS
     from silica.developer.utils import wrap_text_as_content_block
     from silica.developer.coordination import Idle, Progress
+    from silica.developer.coordination.worker_pool import POOLED_WORKER_ENV
     from uuid import uuid4
 
     # Create user interface
@@ -185,8 +186,13 @@ def _run_worker_agent(
             completed_task_id=None,  # No task completed yet - just announcing
         )
 
-        # Use coordination context to broadcast to room
-        coord_context.broadcast(ready_msg)
+        if os.environ.get(POOLED_WORKER_ENV):
+            # Warm pool worker: only the coordinator needs to know it is
+            # ready; it becomes a room participant once spawn_agent binds it
+            coord_context.send_to_coordinator(ready_msg)
+        else:
+            # Use coordination context to broadcast to room
+            coord_context.broadcast(ready_msg)
 
         console.print("[green]✓ Announced to coordinator[/green]")
     except Exception as e:
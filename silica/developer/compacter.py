@@ -9,11 +9,16 @@ and starting a new conversation when they exceed certain token limits.
 import copy
 import os
 import json
-from typing import List
+import threading
+from typing import Callable, List
 from dataclasses import dataclass
 import anthropic
 from anthropic.types import MessageParam
 
+from silica.developer.compaction_planner import (
+    CompactionPlanner,
+    estimate_message_tokens,
+)
 from silica.developer.context import AgentContext, _INTERNAL_MSG_KEYS
 from silica.developer.models import model_names, get_model
 
@@ -23,6 +28,10 @@ DEFAULT_COMPACTION_THRESHOLD_RATIO = 0.80  # Trigger compaction at 80% of contex
 # Default minimum token reduction ratio to achieve during compaction
 DEFAULT_MIN_REDUCTION_RATIO = 0.30  # Compact enough to remove at least 30% of tokens
 
+# Ratio of the context window at which a compaction is summarized in the
+# background ahead of the threshold (None: speculative compaction disabled)
+DEFAULT_SPECULATIVE_THRESHOLD_RATIO = None
+
 
 @dataclass
 class CompactionSummary:
@@ -47,6 +56,62 @@ class CompactionMetadata:
     compaction_ratio: float
 
 
+class SpeculativeCompaction:
+    """A compaction whose summary is generated in a background thread.
+
+    The summary covers ``prefix``, the oldest messages of the conversation
+    when the speculation started. It can only be applied while the
+    conversation still starts with exactly those messages.
+    """
+
+    def __init__(self, prefix: List[MessageParam], turns: int):
+        self.prefix = list(prefix)
+        self.turns = turns
+        self.summary: CompactionSummary | None = None
+        self.error: Exception | None = None
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def start(self, summarize: Callable[[], CompactionSummary]) -> None:
+        """Run ``summarize`` in a daemon thread."""
+
+        def run():
+            try:
+                self.summary = summarize()
+            except Exception as e:
+                self.error = e
+            finally:
+                self._done.set()
+
+        threading.Thread(target=run, name="speculative-compaction", daemon=True).start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+    def matches(self, messages: List[MessageParam]) -> bool:
+        """True if ``messages`` still start with the summarized prefix."""
+        return len(messages) > len(self.prefix) and all(
+            current is summarized for current, summarized in zip(messages, self.prefix)
+        )
+
+
+class _ApiContextSnapshot:
+    """Stands in for an AgentContext whose API context was captured earlier.
+
+    Background summarization must not read the live context while the agent
+    loop keeps appending to it.
+    """
+
+    def __init__(self, context_dict: dict):
+        self._context_dict = context_dict
+
+    def get_api_context(self) -> dict:
+        return self._context_dict
+
+
 class ConversationCompacter:
     """Handles the compaction of long conversations into summaries."""
 
@@ -56,6 +121,7 @@ class ConversationCompacter:
         threshold_ratio: float = DEFAULT_COMPACTION_THRESHOLD_RATIO,
         min_reduction_ratio: float = DEFAULT_MIN_REDUCTION_RATIO,
         logger=None,
+        speculative_threshold_ratio: float | None = DEFAULT_SPECULATIVE_THRESHOLD_RATIO,
     ):
         """Initialize the conversation compacter.
 
@@ -64,6 +130,9 @@ class ConversationCompacter:
             threshold_ratio: Ratio of model's context window to trigger compaction
             min_reduction_ratio: Minimum token reduction to achieve (default 30%)
             logger: RequestResponseLogger instance (optional, for logging API calls)
+            speculative_threshold_ratio: Ratio of model's context window at which
+                to start summarizing in the background (below threshold_ratio;
+                None disables speculative compaction)
         """
         # Allow threshold to be configured via environment variable
         env_threshold = os.getenv("SILICA_COMPACTION_THRESHOLD")
@@ -101,8 +170,30 @@ class ConversationCompacter:
                 )
                 min_reduction_ratio = DEFAULT_MIN_REDUCTION_RATIO
 
+        # Allow speculative compaction to be enabled via environment variable
+        env_speculative = os.getenv("SILICA_COMPACTION_SPECULATIVE_THRESHOLD")
+        if env_speculative:
+            try:
+                speculative_threshold_ratio = float(env_speculative)
+            except ValueError:
+                print(
+                    f"Warning: Invalid SILICA_COMPACTION_SPECULATIVE_THRESHOLD value '{env_speculative}'. "
+                    "Speculative compaction disabled"
+                )
+                speculative_threshold_ratio = None
+        if speculative_threshold_ratio is not None and not (
+            0.0 < speculative_threshold_ratio < threshold_ratio
+        ):
+            print(
+                f"Warning: SILICA_COMPACTION_SPECULATIVE_THRESHOLD must be between 0 and "
+                f"the compaction threshold {threshold_ratio}, got {speculative_threshold_ratio}. "
+                "Speculative compaction disabled"
+            )
+            speculative_threshold_ratio = None
+
         self.threshold_ratio = threshold_ratio
         self.min_reduction_ratio = min_reduction_ratio
+        self.speculative_threshold_ratio = speculative_threshold_ratio
         self.logger = logger
         self.client = client
 
@@ -416,33 +507,35 @@ class ConversationCompacter:
         Returns:
             int: Estimated token count for the message
         """
-        total_chars = 0
+        return estimate_message_tokens(message)
 
-        # Count role overhead (roughly 4 tokens for role markers)
-        total_chars += 15
+    def _planner(self, agent_context) -> CompactionPlanner:
+        """Get the context's CompactionPlanner, synced to its chat history."""
+        planner = agent_context.compaction_planner
+        if planner is None:
+            planner = CompactionPlanner()
+            agent_context.compaction_planner = planner
+        planner.sync(agent_context.chat_history)
+        return planner
 
-        content = message.get("content", "")
-        if isinstance(content, str):
-            total_chars += len(content)
-        elif isinstance(content, list):
-            for item in content:
-                if isinstance(item, dict):
-                    if "text" in item:
-                        total_chars += len(item["text"])
-                    elif item.get("type") == "tool_use":
-                        total_chars += len(item.get("name", ""))
-                        total_chars += len(json.dumps(item.get("input", {})))
-                    elif item.get("type") == "tool_result":
-                        result_content = item.get("content", "")
-                        if isinstance(result_content, str):
-                            total_chars += len(result_content)
-                        elif isinstance(result_content, list):
-                            for block in result_content:
-                                if isinstance(block, dict) and "text" in block:
-                                    total_chars += len(block["text"])
-
-        # Rough estimate: 1 token per 3.5 characters
-        return int(total_chars / 3.5)
+    def context_tokens(self, agent_context, model: str) -> int:
+        """Token count of the current context, without an API call if possible.
+
+        Uses the prompt size reported for the last request plus estimates for
+        the messages added since; falls back to ``count_tokens`` until a
+        request of this context has been recorded.
+
+        Args:
+            agent_context: AgentContext instance to get full API context from
+            model: Model name or alias to use for token counting
+
+        Returns:
+            int: Number of tokens for the complete context
+        """
+        total = self._planner(agent_context).total_tokens()
+        if total is None:
+            total = self.count_tokens(agent_context, model)
+        return total
 
     def _messages_to_string(
         self, messages: List[MessageParam], for_summary: bool = False
@@ -540,8 +633,7 @@ class ConversationCompacter:
         model_spec = get_model(model)
         model = model_spec["title"]
 
-        # Use accurate token counting method
-        token_count = self.count_tokens(agent_context, model)
+        token_count = self.context_tokens(agent_context, model)
 
         # Get context window size for this model, default to 100k if not found
         context_window = self.model_context_windows.get(model, 100000)
@@ -1074,8 +1166,9 @@ Focus on preserving what the guidance identifies as important. Be comprehensive
     ) -> int:
         """Calculate the number of turns to compact to achieve target token reduction.
 
-        This method estimates tokens per turn and finds the minimum number of turns
-        to compact that will achieve at least the target reduction ratio.
+        This method uses the per-message token sizes kept by the context's
+        CompactionPlanner and binary-searches the minimum number of turns to
+        compact that will achieve at least the target reduction ratio.
 
         The goal is to compact enough content to "buy" several turns of headroom,
         rather than compacting just a tiny bit and needing to compact again soon.
@@ -1096,22 +1189,13 @@ Focus on preserving what the guidance identifies as important. Be comprehensive
         if len(messages) < 3:
             return 1  # Can't really compact less than 1 turn
 
-        # Get total token count for context
-        total_tokens = self.count_tokens(agent_context, model)
-
-        # Estimate the "base" tokens (system prompt + tools) that won't be reduced
-        # These stay constant regardless of how many messages we compact
-        context_dict = agent_context.get_api_context()
-        base_tokens = 0
-        if context_dict.get("system"):
-            for block in context_dict["system"]:
-                if isinstance(block, dict) and block.get("type") == "text":
-                    base_tokens += int(len(block.get("text", "")) / 3.5)
-        if context_dict.get("tools"):
-            base_tokens += int(len(json.dumps(context_dict["tools"])) / 3.5)
+        planner = self._planner(agent_context)
+        total_tokens = self.context_tokens(agent_context, model)
 
-        # Estimate message tokens (total - base)
-        message_tokens = total_tokens - base_tokens
+        # The "base" tokens (system prompt + tools) stay constant regardless
+        # of how many messages we compact
+        message_tokens = planner.message_tokens
+        base_tokens = max(total_tokens - message_tokens, 0)
 
         # Calculate tokens to remove for target reduction
         # We want: (total - removed_tokens) / total <= (1 - target_reduction_ratio)
@@ -1126,42 +1210,15 @@ Focus on preserving what the guidance identifies as important. Be comprehensive
             print(f"  Target reduction: {target_reduction_ratio:.0%}")
             print(f"  Tokens to remove: {tokens_to_remove:,}")
 
-        # Estimate tokens per message by sampling
-        # A "turn" is user+assistant, so we estimate pairs
-        cumulative_tokens = 0
-        turns_needed = 0
-        messages_counted = 0
-
-        # Iterate through messages, accumulating token estimates
-        # until we reach our target
-        for i, message in enumerate(messages):
-            msg_tokens = self._estimate_message_tokens(message)
-            cumulative_tokens += msg_tokens
-            messages_counted += 1
-
-            # Check if this completes a turn (user+assistant pair)
-            # We need to keep at least 1 message (the current user query context)
-            if i > 0 and messages_counted >= 2:
-                # Calculate turns: ceil(messages / 2) roughly
-                # Turn 1 = 1 msg (user), Turn 2 = 3 msgs (u,a,u), etc.
-                # So messages_counted maps to turns as: (messages_counted + 1) / 2
-                potential_turns = (messages_counted + 1) // 2
-
-                if debug and i < 10:  # Only print first few for brevity
-                    print(
-                        f"  Message {i}: +{msg_tokens:,} tokens, "
-                        f"cumulative: {cumulative_tokens:,}, turns: {potential_turns}"
-                    )
-
-                # Check if we've accumulated enough tokens
-                if cumulative_tokens >= tokens_to_remove:
-                    turns_needed = potential_turns
-                    break
-
-        # If we went through all messages without hitting target,
-        # compact as much as possible (leave 1 message)
-        if turns_needed == 0:
-            # Calculate max turns we can compact (leave at least 1 message)
+        # Smallest split point (never inside a tool_use/tool_result pair)
+        # whose prefix of messages holds enough tokens. A split after
+        # message count k compacts (k + 1) // 2 turns.
+        split = planner.find_split(tokens_to_remove)
+        if split is not None:
+            turns_needed = (split + 1) // 2
+        else:
+            # Not enough tokens anywhere: compact as much as possible
+            # (leave at least 1 message)
             max_messages_to_compact = len(messages) - 1
             turns_needed = max((max_messages_to_compact + 1) // 2, 1)
 
@@ -1174,8 +1231,10 @@ Focus on preserving what the guidance identifies as important. Be comprehensive
         turns_needed = min(turns_needed, max_turns)
 
         if debug:
+            print(f"  Valid split points: {len(planner.split_points)}")
             print(f"  Final turns to compact: {turns_needed}")
-            expected_reduction = cumulative_tokens / total_tokens if total_tokens else 0
+            compacted = planner.prefix[min(turns_needed * 2 - 1, len(messages))]
+            expected_reduction = compacted / total_tokens if total_tokens else 0
             print(f"  Expected reduction: {expected_reduction:.0%}")
 
         return turns_needed
@@ -1277,9 +1336,15 @@ Focus on preserving what the guidance identifies as important. Be comprehensive
         summary_obj = self._generate_summary_with_context(
             agent_context, messages_to_summarize, model, guidance
         )
-        summary = summary_obj.summary
+        new_messages = self._compacted_history(
+            summary_obj.summary, turns, messages_to_keep
+        )
+        return self._apply_compaction(agent_context, new_messages, summary_obj)
 
-        # Create new message history with summary + kept messages
+    def _compacted_history(
+        self, summary: str, turns: int, messages_to_keep: List[MessageParam]
+    ) -> List[MessageParam]:
+        """Build the compacted history: a summary message + the kept messages."""
         new_messages = [
             {
                 "role": "user",
@@ -1295,8 +1360,15 @@ Focus on preserving what the guidance identifies as important. Be comprehensive
         # This can happen when compaction splits a tool use/result pair
         from silica.developer.compaction_validation import strip_orphaned_tool_blocks
 
-        new_messages = strip_orphaned_tool_blocks(new_messages)
+        return strip_orphaned_tool_blocks(new_messages)
 
+    def _apply_compaction(
+        self,
+        agent_context,
+        new_messages: List[MessageParam],
+        summary_obj: CompactionSummary,
+    ) -> CompactionMetadata:
+        """Replace the context's history with compacted messages and archive it."""
         # Disable thinking mode after stripping thinking blocks
         if agent_context.thinking_mode != "off":
             agent_context.thinking_mode = "off"
@@ -1319,6 +1391,108 @@ Focus on preserving what the guidance identifies as important. Be comprehensive
 
         return metadata
 
+    def _should_speculate(self, agent_context, model: str) -> bool:
+        """True if usage is between the speculative and the compaction threshold."""
+        if self.speculative_threshold_ratio is None:
+            return False
+        model = get_model(model)["title"]
+        context_window = self.model_context_windows.get(model, 100000)
+        token_count = self.context_tokens(agent_context, model)
+        return (
+            context_window * self.speculative_threshold_ratio
+            < token_count
+            <= context_window * self.threshold_ratio
+        )
+
+    def start_speculative_compaction(
+        self, agent_context, model: str
+    ) -> SpeculativeCompaction | None:
+        """Start summarizing the oldest turns in a background thread.
+
+        The API context is captured now, so the summary reflects the
+        conversation as it is at this turn boundary. The result is stored as
+        ``agent_context.speculative_compaction`` and applied by
+        ``check_and_apply_compaction`` at a later turn boundary.
+
+        Args:
+            agent_context: AgentContext to compact
+            model: Model name to use for summarization
+
+        Returns:
+            The started SpeculativeCompaction, or None if there is too little
+            conversation to compact
+        """
+        history = agent_context.chat_history
+        if len(history) <= 2:
+            return None
+
+        turns = self.calculate_turns_for_target_reduction(agent_context, model)
+        messages_to_compact = min((turns * 2) - 1, len(history) - 1)
+        speculative = SpeculativeCompaction(
+            history[:messages_to_compact], (messages_to_compact + 1) // 2
+        )
+        snapshot = _ApiContextSnapshot(agent_context.get_api_context())
+
+        def summarize() -> CompactionSummary:
+            guidance = self.generate_summary_guidance(
+                snapshot, model, messages_to_compact
+            )
+            return self._generate_summary_with_context(
+                snapshot, speculative.prefix, model, guidance
+            )
+
+        speculative.start(summarize)
+        agent_context.speculative_compaction = speculative
+        return speculative
+
+    def _finish_speculative_compaction(
+        self, agent_context, debug: bool = False
+    ) -> CompactionMetadata | None:
+        """Apply the context's speculative compaction if it is still valid.
+
+        Waits for the summary if it is not done yet. The speculation is
+        discarded if it failed, if the summarized prefix has changed since it
+        started, or if the compacted history does not validate.
+
+        Returns:
+            CompactionMetadata if the compaction was applied, None otherwise
+        """
+        speculative = agent_context.speculative_compaction
+        agent_context.speculative_compaction = None
+        speculative.wait()
+
+        history = agent_context.chat_history
+        if speculative.error is not None:
+            if debug:
+                print(f"[Compaction] Speculative summary failed: {speculative.error}")
+            return None
+        if not speculative.matches(history):
+            if debug:
+                print("[Compaction] Speculative summary discarded: history changed")
+            return None
+
+        new_messages = self._compacted_history(
+            speculative.summary.summary,
+            speculative.turns,
+            history[len(speculative.prefix) :],
+        )
+
+        from silica.developer.compaction_validation import (
+            validate_compacted_messages,
+        )
+
+        report = validate_compacted_messages(new_messages, history)
+        if not report.is_valid:
+            if debug:
+                print(f"[Compaction] Speculative summary discarded: {report.summary()}")
+            return None
+
+        if debug:
+            print(
+                f"[Compaction] Applying speculative summary of {speculative.turns} turns"
+            )
+        return self._apply_compaction(agent_context, new_messages, speculative.summary)
+
     def _make_json_serializable(self, obj):
         """Recursively convert objects to JSON-serializable types.
 
@@ -1522,24 +1696,51 @@ Focus on preserving what the guidance identifies as important. Be comprehensive
             return agent_context, False
 
         try:
-            if debug_compaction:
-                if force:
-                    print("[Compaction] Forced (emergency compaction)")
-                else:
-                    print("[Compaction] Checking if compaction needed...")
-                    # Call should_compact with debug flag to see detailed info
-                    should_compact = self.should_compact(
-                        agent_context, model, debug=True
-                    )
-                    if not should_compact:
-                        print("[Compaction] Not needed yet")
-                        return agent_context, False
-
-            # Use the session's own model for compaction so that any thinking
-            # blocks in the conversation are compatible with the compaction model.
-            metadata = self.compact_conversation(
-                agent_context, model, turns=None, force=force
-            )
+            metadata = None
+
+            # A summary started in the background at an earlier turn boundary
+            # is swapped in once done; it is only waited for when compaction
+            # is due now
+            speculative = agent_context.speculative_compaction
+            if speculative is not None:
+                if (
+                    not speculative.done
+                    and not force
+                    and not self.should_compact(agent_context, model)
+                ):
+                    if debug_compaction:
+                        print("[Compaction] Speculative summary still running")
+                    return agent_context, False
+                metadata = self._finish_speculative_compaction(
+                    agent_context, debug=debug_compaction
+                )
+
+            if metadata is None and not force:
+                if self._should_speculate(agent_context, model):
+                    if debug_compaction:
+                        print("[Compaction] Starting speculative summary")
+                    self.start_speculative_compaction(agent_context, model)
+                    return agent_context, False
+
+            if metadata is None:
+                if debug_compaction:
+                    if force:
+                        print("[Compaction] Forced (emergency compaction)")
+                    else:
+                        print("[Compaction] Checking if compaction needed...")
+                        # Call should_compact with debug flag to see detailed info
+                        should_compact = self.should_compact(
+                            agent_context, model, debug=True
+                        )
+                        if not should_compact:
+                            print("[Compaction] Not needed yet")
+                            return agent_context, False
+
+                # Use the session's own model for compaction so that any thinking
+                # blocks in the conversation are compatible with the compaction model.
+                metadata = self.compact_conversation(
+                    agent_context, model, turns=None, force=force
+                )
 
             if metadata:
                 # Calculate actual reduction for user feedback
@@ -0,0 +1,249 @@
+"""Per-message token sizes for compaction decisions.
+
+Deciding whether to compact, and how much, needs the token size of the
+context and of each message in it. Counting the whole context with the
+token counting API on every turn, and re-serializing every message to
+estimate its share, grows with the length of the conversation.
+``CompactionPlanner`` keeps a running prefix sum of per-message token
+sizes for one context instead:
+
+- New messages start out with a character-based estimate, computed once
+  when the message is first seen.
+- Every API response reports how many tokens its prompt had
+  (``input_tokens`` plus the cache read and write tokens). Recording it
+  against the number of messages in that prompt gives an *anchor*; the
+  messages added since the previous anchor are rescaled so that together
+  they account for exactly the difference between the two prompts.
+- Anchors are stored as ``context_messages`` in ``metadata.jsonl`` so a
+  resumed session is seeded from the usage of its earlier turns.
+
+The size of the context is then the last prompt size plus the estimates
+for the messages added after it, and the split point for compacting a
+given number of tokens is a binary search over the prefix sums, restricted
+to precomputed split points that do not separate a ``tool_use`` from its
+``tool_result``.
+"""
+
+import json
+from bisect import bisect_left
+from typing import Any
+
+from silica.developer.utils import usage_value
+
+# Rough characters per token for estimates
+CHARS_PER_TOKEN = 3.5
+
+# Characters counted for the role markers of a message
+ROLE_OVERHEAD_CHARS = 15
+
+
+def prompt_tokens(usage: Any) -> int:
+    """Total prompt size of a request, including cached prefix tokens."""
+    return (
+        usage_value(usage, "input_tokens")
+        + usage_value(usage, "cache_creation_input_tokens")
+        + usage_value(usage, "cache_read_input_tokens")
+    )
+
+
+def estimate_message_tokens(message: dict) -> int:
+    """Estimate the token count of a single message from its characters."""
+    total_chars = ROLE_OVERHEAD_CHARS
+
+    content = message.get("content", "")
+    if isinstance(content, str):
+        total_chars += len(content)
+    elif isinstance(content, list):
+        for item in content:
+            if isinstance(item, dict):
+                if "text" in item:
+                    total_chars += len(item["text"])
+                elif item.get("type") == "tool_use":
+                    total_chars += len(item.get("name", ""))
+                    total_chars += len(json.dumps(item.get("input", {})))
+                elif item.get("type") == "tool_result":
+                    result_content = item.get("content", "")
+                    if isinstance(result_content, str):
+                        total_chars += len(result_content)
+                    elif isinstance(result_content, list):
+                        for block in result_content:
+                            if isinstance(block, dict) and "text" in block:
+                                total_chars += len(block["text"])
+
+    return int(total_chars / CHARS_PER_TOKEN)
+
+
+def _tool_ids(message: dict, block_type: str, key: str) -> set:
+    content = message.get("content")
+    if not isinstance(content, list):
+        return set()
+    return {
+        block.get(key)
+        for block in content
+        if isinstance(block, dict) and block.get("type") == block_type
+    }
+
+
+class CompactionPlanner:
+    """Running per-message token sizes of one context."""
+
+    def __init__(self):
+        # Messages seen so far, held by reference to detect rewrites
+        self._messages: list[dict] = []
+        self._estimates: list[int] = []
+        self._sizes: list[int] = []
+        # _prefix[i] is the size of the first i messages
+        self._prefix: list[int] = [0]
+        # tool_use ids still waiting for a result after each message
+        self._pending: list[frozenset] = []
+        # Message counts at which the history can be split, ascending
+        self._splits: list[int] = []
+        # (message count, prompt tokens) of recorded requests, ascending
+        self._anchors: list[tuple[int, int]] = []
+        # Prompt tokens outside the messages (system prompt and tools)
+        self._base: int | None = None
+
+    @classmethod
+    def from_metadata(
+        cls, entries: list[dict], messages: list[dict]
+    ) -> "CompactionPlanner":
+        """Seed a planner from the usage entries of ``metadata.jsonl``.
+
+        Only the last run of entries with increasing ``context_messages``
+        is used; an earlier, larger count belongs to a context that has
+        since been compacted.
+        """
+        planner = cls()
+        planner.sync(messages)
+        run: list[tuple[int, int]] = []
+        for entry in entries:
+            count = entry.get("context_messages")
+            if not isinstance(count, int):
+                continue
+            tokens = prompt_tokens(entry.get("usage", {}))
+            if run and count <= run[-1][0]:
+                run = []
+            run.append((count, tokens))
+        for count, tokens in run:
+            if 0 < count <= len(messages) and tokens > 0:
+                planner._add_anchor(count, tokens)
+        return planner
+
+    @property
+    def anchored(self) -> bool:
+        """True once a request's actual prompt size has been recorded."""
+        return self._base is not None
+
+    @property
+    def message_tokens(self) -> int:
+        return self._prefix[-1]
+
+    @property
+    def prefix(self) -> list[int]:
+        return self._prefix
+
+    @property
+    def split_points(self) -> list[int]:
+        return self._splits
+
+    def total_tokens(self) -> int | None:
+        """Size of the whole context, or None if no request was recorded."""
+        if self._base is None:
+            return None
+        return self._base + self._prefix[-1]
+
+    def sync(self, messages: list[dict]) -> None:
+        """Bring the planner up to date with the context's messages.
+
+        Messages are compared by identity: everything from the first
+        replaced message on (e.g. after compaction) is dropped and
+        re-estimated, including the anchors that covered it.
+        """
+        common = 0
+        limit = min(len(messages), len(self._messages))
+        while common < limit and messages[common] is self._messages[common]:
+            common += 1
+        if common < len(self._messages):
+            self._truncate(common)
+        for message in messages[common:]:
+            self._append(message)
+
+    def record_usage(self, usage: Any, messages: list[dict]) -> None:
+        """Record the prompt size reported for a request of ``messages``."""
+        self.sync(messages)
+        tokens = prompt_tokens(usage)
+        if messages and tokens > 0:
+            self._add_anchor(len(messages), tokens)
+
+    def find_split(self, tokens: int) -> int | None:
+        """Fewest leading messages covering ``tokens`` at a valid split point.
+
+        Returns None if no split point removes that many tokens.
+        """
+        needed = bisect_left(self._prefix, tokens)
+        i = bisect_left(self._splits, needed)
+        return self._splits[i] if i < len(self._splits) else None
+
+    def _append(self, message: dict) -> None:
+        index = len(self._messages)
+        estimate = estimate_message_tokens(message)
+        self._messages.append(message)
+        self._estimates.append(estimate)
+        self._sizes.append(estimate)
+        self._prefix.append(self._prefix[-1] + estimate)
+
+        pending = self._pending[-1] if self._pending else frozenset()
+        pending = (pending | _tool_ids(message, "tool_use", "id")) - _tool_ids(
+            message, "tool_result", "tool_use_id"
+        )
+        self._pending.append(frozenset(pending))
+
+        # Compacted messages are replaced by a user summary, so a split must
+        # leave a user message last and an assistant message next, with no
+        # tool_use in the compacted part still waiting for its result
+        if (
+            index > 0
+            and message.get("role") == "assistant"
+            and self._messages[index - 1].get("role") == "user"
+            and not self._pending[index - 1]
+        ):
+            self._splits.append(index)
+
+    def _truncate(self, count: int) -> None:
+        del self._messages[count:]
+        del self._estimates[count:]
+        del self._sizes[count:]
+        del self._prefix[count + 1 :]
+        del self._pending[count:]
+        self._splits = [k for k in self._splits if k < count]
+        self._anchors = [a for a in self._anchors if a[0] <= count]
+        if not self._anchors:
+            self._base = None
+
+    def _add_anchor(self, count: int, tokens: int) -> None:
+        if self._anchors and count < self._anchors[-1][0]:
+            return
+        if self._anchors and count > self._anchors[-1][0]:
+            start, previous = self._anchors[-1]
+            self._rescale(start, count, max(tokens - previous, 0))
+        if self._anchors and count == self._anchors[-1][0]:
+            self._anchors[-1] = (count, tokens)
+        else:
+            self._anchors.append((count, tokens))
+        self._base = max(tokens - self._prefix[count], 0)
+
+    def _rescale(self, start: int, end: int, tokens: int) -> None:
+        """Spread ``tokens`` over messages [start, end) by their estimates."""
+        estimated = sum(self._estimates[start:end])
+        assigned = 0
+        for i in range(start, end):
+            if i == end - 1:
+                size = tokens - assigned
+            elif estimated:
+                size = self._estimates[i] * tokens // estimated
+            else:
+                size = tokens // (end - start)
+            self._sizes[i] = size
+            assigned += size
+        for i in range(start, len(self._sizes)):
+            self._prefix[i + 1] = self._prefix[i] + self._sizes[i]
@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 from enum import Enum
 
+from silica.developer.utils import get_block_attr
+
 
 class ValidationLevel(Enum):
     """Severity level of a validation issue."""
@@ -353,15 +355,6 @@ def validate_compacted_messages(
     )
 
 
-def _get_block_attr(block: Any, attr: str, default: Any = None) -> Any:
-    """Get an attribute from a block, handling both dict and SDK object types."""
-    if isinstance(block, dict):
-        return block.get(attr, default)
-    else:
-        # Handle Anthropic SDK objects like ToolUseBlock, TextBlock, etc.
-        return getattr(block, attr, default)
-
-
 def strip_orphaned_tool_blocks(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Remove unpaired tool_use and tool_result blocks.
 
@@ -391,13 +384,13 @@ def strip_orphaned_tool_blocks(messages: List[Dict[str, Any]]) -> List[Dict[str,
         content = message.get("content", [])
         if isinstance(content, list):
             for block in content:
-                block_type = _get_block_attr(block, "type")
+                block_type = get_block_attr(block, "type")
                 if block_type == "tool_use":
-                    tool_id = _get_block_attr(block, "id")
+                    tool_id = get_block_attr(block, "id")
                     if tool_id:
                         tool_use_ids.add(tool_id)
                 elif block_type == "tool_result":
-                    tool_use_id = _get_block_attr(block, "tool_use_id")
+                    tool_use_id = get_block_attr(block, "tool_use_id")
                     if tool_use_id:
                         tool_result_ids.add(tool_use_id)
 
@@ -410,16 +403,16 @@ def strip_orphaned_tool_blocks(messages: List[Dict[str, Any]]) -> List[Dict[str,
         if isinstance(content, list):
             filtered_content = []
             for block in content:
-                block_type = _get_block_attr(block, "type")
+                block_type = get_block_attr(block, "type")
 
                 if block_type == "tool_result":
-                    tool_use_id = _get_block_attr(block, "tool_use_id")
+                    tool_use_id = get_block_attr(block, "tool_use_id")
                     if tool_use_id not in paired_ids:
                         # Orphaned tool_result (no matching tool_use), skip it
                         continue
 
                 elif block_type == "tool_use":
-                    tool_id = _get_block_attr(block, "id")
+                    tool_id = get_block_attr(block, "id")
                     if tool_id not in paired_ids:
                         # Orphaned tool_use (no matching tool_result), skip it
                         continue
@@ -7,10 +7,12 @@ from uuid import uuid4
 
 from anthropic.types import Usage, MessageParam
 
+from silica.developer.compaction_planner import CompactionPlanner
 from silica.developer.models import ModelSpec
 from silica.developer.sandbox import Sandbox, SandboxMode
 from silica.developer.user_interface import UserInterface
 from silica.developer.memory import MemoryManager
+from silica.developer.session_catalog import SessionCatalog, summarize_session
 from silica.developer.session_store import SessionStore
 
 # Keys added by SessionStore or the agent loop that must be stripped before
@@ -48,6 +50,12 @@ class AgentContext:
     history_base_dir: Path | None = None
     active_plan_id: str | None = None
     toolbox: Any = None
+    # CachePlanner placing the prompt-cache breakpoints of this context
+    cache_planner: Any = field(default=None, repr=False)
+    # CompactionPlanner tracking the per-message token sizes of this context
+    compaction_planner: Any = field(default=None, repr=False)
+    # SpeculativeCompaction summarizing this context in the background
+    speculative_compaction: Any = field(default=None, repr=False)
     _chat_history: list[MessageParam] = None
     _tool_result_buffer: list[dict] = None
     # v2 storage tracking
@@ -93,6 +101,10 @@ class AgentContext:
     def tool_result_buffer(self) -> list[dict]:
         return self._tool_result_buffer
 
+    @property
+    def session_store(self) -> SessionStore:
+        return self._get_or_create_store()
+
     @staticmethod
     def create(
         model_spec: ModelSpec,
@@ -204,6 +216,8 @@ class AgentContext:
             "total_cost": 0.0,
             "thinking_cost": 0.0,
             "cached_tokens": 0,
+            "cache_write_tokens": 0,
+            "cache_saved_tokens": 0,
             "model_breakdown": {},
         }
         for usage_entry, model_spec in self.usage:
@@ -231,6 +245,22 @@ class AgentContext:
             usage_summary["total_output_tokens"] += output_tokens
             usage_summary["total_thinking_tokens"] += thinking_tokens
             usage_summary["cached_tokens"] += cache_read_input_tokens
+            usage_summary["cache_write_tokens"] += cache_creation_input_tokens
+
+            # Net input tokens saved by caching: reads are cheaper than
+            # uncached input, writes cost a premium
+            cache_saved_tokens = 0
+            if pricing["input"]:
+                cache_saved_tokens = int(
+                    (
+                        cache_read_input_tokens
+                        * (pricing["input"] - cache_pricing["read"])
+                        - cache_creation_input_tokens
+                        * (cache_pricing["write"] - pricing["input"])
+                    )
+                    / pricing["input"]
+                )
+            usage_summary["cache_saved_tokens"] += cache_saved_tokens
 
             thinking_cost = thinking_tokens * thinking_pricing["thinking"]
             total_cost = (
@@ -391,6 +421,12 @@ class AgentContext:
                 for mid, msg in zip(newly_written_ids, new_messages_for_ids)
                 if msg.get("role") == "assistant"
             ]
+            # The prompt of each call held the messages before its response
+            assistant_positions = [
+                flushed + i
+                for i, msg in enumerate(new_messages_for_ids)
+                if msg.get("role") == "assistant"
+            ]
 
             metadata_entries = []
             for idx, (usage_entry, model_spec_entry) in enumerate(new_usage):
@@ -417,6 +453,8 @@ class AgentContext:
                     entry["msg_id"] = assistant_msg_ids[idx]
                 elif store.last_msg_id:
                     entry["msg_id"] = store.last_msg_id
+                if idx < len(assistant_positions):
+                    entry["context_messages"] = assistant_positions[idx]
                 metadata_entries.append(entry)
             store.append_metadata(metadata_entries)
 
@@ -462,6 +500,14 @@ class AgentContext:
             del self._compaction_metadata
         store.write_session_meta(session_meta)
 
+        # 5. Keep the persona's session catalog current (root agents only;
+        # sub-agents share their parent's session directory)
+        if self.parent_session_id is None:
+            SessionCatalog(history_dir.parent).record(
+                history_dir,
+                summarize_session(session_meta, clean_context, self.session_id),
+            )
+
         # Update flush counters
         self._last_flushed_msg_count = new_msg_count
         self._last_flushed_usage_count = new_usage_count
@@ -645,7 +691,8 @@ def _load_v2_session(
 
         # Read usage from metadata.jsonl — reconstruct (usage, model_spec) tuples
         usage_data = []
-        for entry in store.read_metadata():
+        metadata_entries = store.read_metadata()
+        for entry in metadata_entries:
             usage_dict = entry.get("usage", {})
             model_spec_dict = entry.get("model_spec", base_context.model_spec)
             usage_data.append((usage_dict, model_spec_dict))
@@ -681,6 +728,9 @@ def _load_v2_session(
             thinking_mode=thinking_mode,
             history_base_dir=history_base_dir,
             active_plan_id=active_plan_id,
+            compaction_planner=CompactionPlanner.from_metadata(
+                metadata_entries, clean_history
+            ),
             _chat_history=clean_history,
             _tool_result_buffer=[],
             _session_store=store,
@@ -20,6 +20,7 @@ from .compression import compress_payload, decompress_payload
 from .client import (
     CoordinationContext,
     ReceivedMessage,
+    ReceiveMetrics,
     DeaddropConnectionError,
     with_retry,
     create_coordination_namespace,
@@ -54,6 +55,7 @@ __all__ = [
     # Context
     "CoordinationContext",
     "ReceivedMessage",
+    "ReceiveMetrics",
     "DeaddropConnectionError",
     "with_retry",
     "create_coordination_namespace",
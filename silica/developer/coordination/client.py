@@ -8,13 +8,19 @@ Includes error recovery:
 - Retry with exponential backoff for connection failures
 - Skip and log for message parse errors
 - Graceful degradation for transient failures
+
+Receiving fetches the inbox and the room in one step: concurrently for
+remote backends, and for local backends only once SQLite reports a change
+to the database, instead of re-querying both on a fixed interval.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from functools import wraps
 import json
 import logging
 import random
+import threading
 import time
 from typing import Any, Callable, Optional, TypeVar
 
@@ -100,6 +106,43 @@ class ReceivedMessage:
     raw: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class ReceiveMetrics:
+    """Counters for a CoordinationContext's receive path.
+
+    A wake is a fetch triggered by ``wait_for_messages`` (a subscribe event
+    or a detected database change); its latency is the time from the
+    wake-up until the new messages were parsed.
+    """
+
+    requests: int = 0  # Inbox/room fetches and subscribe calls sent to deaddrop
+    change_checks: int = 0  # Local database change checks
+    wakes: int = 0
+    empty_wakes: int = 0  # Wakes that found no new coordination messages
+    total_wake_latency: float = 0.0
+    last_wake_latency: Optional[float] = None
+
+    @property
+    def average_wake_latency(self) -> Optional[float]:
+        return self.total_wake_latency / self.wakes if self.wakes else None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "change_checks": self.change_checks,
+            "wakes": self.wakes,
+            "empty_wakes": self.empty_wakes,
+            "average_wake_latency": self.average_wake_latency,
+            "last_wake_latency": self.last_wake_latency,
+        }
+
+
+# How often a local wait checks the database for changes
+CHANGE_CHECK_INTERVAL = 0.05
+# Fetch interval when the local backend's changes cannot be observed
+POLL_INTERVAL = 0.5
+
+
 class CoordinationContext:
     """Context for coordination communication via deaddrop.
 
@@ -140,6 +183,25 @@ class CoordinationContext:
         self._last_inbox_mid: Optional[str] = None
         self._last_room_mid: Optional[str] = None
 
+        self.metrics = ReceiveMetrics()
+        self._metrics_lock = threading.Lock()
+        self._fetch_executor: Optional[ThreadPoolExecutor] = None
+
+    def close(self) -> None:
+        """Release the background thread used for concurrent fetches.
+
+        The context stays usable; a later receive starts a new thread.
+        """
+        executor, self._fetch_executor = self._fetch_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def send_message(
         self,
         to_id: str,
@@ -251,9 +313,35 @@ class CoordinationContext:
         Raises:
             DeaddropConnectionError: If all retries fail (when retry=True)
         """
-        messages = []
+        include_room = include_room and bool(self.room_id)
+        inbox_messages, room_messages = self._fetch_new(include_room, retry)
+
+        if inbox_messages:
+            logger.debug(
+                f"receive_messages: {len(inbox_messages)} raw inbox msgs "
+                f"(after_mid={self._last_inbox_mid})"
+            )
+        messages = self._consume(inbox_messages, is_room=False)
+
+        if room_messages:
+            logger.debug(
+                f"receive_messages: {len(room_messages)} raw room msgs "
+                f"(after_mid={self._last_room_mid})"
+            )
+        messages.extend(self._consume(room_messages, is_room=True))
+        return messages
+
+    def _fetch_new(
+        self, include_room: bool, retry: bool
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Fetch raw inbox and room messages after the current cursors.
+
+        Remote backends get both requests concurrently; the local backend
+        runs them back to back on its (single-threaded) connection.
+        """
 
         def _get_inbox() -> list[dict[str, Any]]:
+            self._record(requests=1)
             return self.deaddrop.get_inbox(
                 ns=self.namespace_id,
                 identity_id=self.identity_id,
@@ -261,91 +349,83 @@ class CoordinationContext:
                 after_mid=self._last_inbox_mid,
             )
 
-        # Get inbox messages with optional retry
-        try:
-            if retry:
-                inbox_messages = with_retry()(_get_inbox)()
-            else:
-                inbox_messages = _get_inbox()
-        except DeaddropConnectionError:
-            logger.warning("Failed to get inbox messages, continuing with empty")
-            inbox_messages = []
+        def _get_room() -> list[dict[str, Any]]:
+            self._record(requests=1)
+            return self.deaddrop.get_room_messages(
+                ns=self.namespace_id,
+                room_id=self.room_id,
+                secret=self.identity_secret,
+                after_mid=self._last_room_mid,
+            )
 
-        if inbox_messages:
-            logger.debug(
-                f"receive_messages: {len(inbox_messages)} raw inbox msgs "
-                f"(after_mid={self._last_inbox_mid})"
+        def _fetch(fetch, topic) -> list[dict[str, Any]]:
+            try:
+                if retry:
+                    return with_retry()(fetch)()
+                return fetch()
+            except DeaddropConnectionError:
+                logger.warning(f"Failed to get {topic} messages, continuing with empty")
+                return []
+
+        if not include_room:
+            return _fetch(_get_inbox, "inbox"), []
+        if self._is_local_backend():
+            return _fetch(_get_inbox, "inbox"), _fetch(_get_room, "room")
+
+        if self._fetch_executor is None:
+            self._fetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="coordination-receive"
             )
-        for raw in inbox_messages:
+        room_future = self._fetch_executor.submit(_fetch, _get_room, "room")
+        inbox_messages = _fetch(_get_inbox, "inbox")
+        return inbox_messages, room_future.result()
+
+    def _consume(
+        self, raw_messages: list[dict[str, Any]], is_room: bool
+    ) -> list[ReceivedMessage]:
+        """Parse raw messages and advance the matching cursor past them."""
+        kind = "room" if is_room else "inbox"
+        messages = []
+        for raw in raw_messages:
+            mid = raw.get("mid")
             try:
                 msg = self._parse_message(raw)
                 if msg:
-                    msg.is_room_message = False
+                    msg.is_room_message = is_room
                     messages.append(msg)
-                    self._last_inbox_mid = raw.get("mid")
                 else:
-                    # Update cursor even if we couldn't parse (skip bad messages)
-                    mid = raw.get("mid")
-                    if mid:
-                        self._last_inbox_mid = mid
                     logger.debug(
-                        f"Skipped non-coordination inbox msg mid={mid}, "
+                        f"Skipped non-coordination {kind} msg mid={mid}, "
                         f"ct={raw.get('content_type', '')[:60]}"
                     )
             except Exception as e:
-                logger.warning(f"Failed to parse inbox message: {e}")
-                # Still update cursor to skip this message
-                mid = raw.get("mid")
-                if mid:
+                logger.warning(f"Failed to parse {kind} message: {e}")
+            # Update cursor even if we couldn't parse (skip bad messages)
+            if mid:
+                if is_room:
+                    self._last_room_mid = mid
+                else:
                     self._last_inbox_mid = mid
+        return messages
 
-        # Get room messages if requested and room is set
-        if include_room and self.room_id:
-
-            def _get_room() -> list[dict[str, Any]]:
-                return self.deaddrop.get_room_messages(
-                    ns=self.namespace_id,
-                    room_id=self.room_id,
-                    secret=self.identity_secret,
-                    after_mid=self._last_room_mid,
-                )
-
-            try:
-                if retry:
-                    room_messages = with_retry()(_get_room)()
-                else:
-                    room_messages = _get_room()
-            except DeaddropConnectionError:
-                logger.warning("Failed to get room messages, continuing with empty")
-                room_messages = []
-
-            if room_messages:
-                logger.debug(
-                    f"receive_messages: {len(room_messages)} raw room msgs "
-                    f"(after_mid={self._last_room_mid})"
-                )
-            for raw in room_messages:
-                try:
-                    msg = self._parse_message(raw)
-                    if msg:
-                        msg.is_room_message = True
-                        messages.append(msg)
-                        self._last_room_mid = raw.get("mid")
-                    else:
-                        mid = raw.get("mid")
-                        if mid:
-                            self._last_room_mid = mid
-                        logger.debug(
-                            f"Skipped non-coordination room msg mid={mid}, "
-                            f"ct={raw.get('content_type', '')[:60]}"
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to parse room message: {e}")
-                    mid = raw.get("mid")
-                    if mid:
-                        self._last_room_mid = mid
+    def _record(self, **counts: int) -> None:
+        with self._metrics_lock:
+            for name, count in counts.items():
+                setattr(self.metrics, name, getattr(self.metrics, name) + count)
+
+    def _record_wake(self, started: float, messages: list[ReceivedMessage]) -> None:
+        latency = time.monotonic() - started
+        with self._metrics_lock:
+            self.metrics.wakes += 1
+            if not messages:
+                self.metrics.empty_wakes += 1
+            self.metrics.total_wake_latency += latency
+            self.metrics.last_wake_latency = latency
+
+    def _is_local_backend(self) -> bool:
+        from deadrop.backends import LocalBackend
 
-        return messages
+        return isinstance(getattr(self.deaddrop, "_backend", None), LocalBackend)
 
     def wait_for_messages(
         self,
@@ -356,7 +436,8 @@ class CoordinationContext:
 
         For remote backends, uses deaddrop's subscribe() with server-side
         event notification (wakes instantly when a message is published).
-        For local backends, polls the database with a short interval.
+        For local backends, watches the database for commits and only
+        fetches when something changed.
 
         Args:
             timeout: Max seconds to wait (default 30)
@@ -365,9 +446,7 @@ class CoordinationContext:
         Returns:
             List of received messages (empty if timeout with no messages)
         """
-        from deadrop.backends import LocalBackend
-
-        if isinstance(self.deaddrop._backend, LocalBackend):
+        if self._is_local_backend():
             return self._wait_for_messages_poll(timeout, include_room)
         return self._wait_for_messages_subscribe(timeout, include_room)
 
@@ -385,6 +464,7 @@ class CoordinationContext:
             topics[f"room:{self.room_id}"] = self._last_room_mid
 
         try:
+            self._record(requests=1)
             result = self.deaddrop.subscribe(
                 ns=self.namespace_id,
                 secret=self.identity_secret,
@@ -400,26 +480,63 @@ class CoordinationContext:
             return []
 
         # Events arrived — fetch the actual messages
-        return self.receive_messages(include_room=include_room)
+        woke = time.monotonic()
+        messages = self.receive_messages(include_room=include_room)
+        self._record_wake(woke, messages)
+        return messages
 
     def _wait_for_messages_poll(
         self,
         timeout: float,
         include_room: bool,
     ) -> list[ReceivedMessage]:
-        """Wait using polling — for local backends (no cross-process events)."""
+        """Wait on a local backend (no cross-process events).
+
+        SQLite's ``data_version`` changes whenever another connection
+        commits, and the connection's ``total_changes`` whenever this
+        process writes, so checking both every ``CHANGE_CHECK_INTERVAL``
+        costs one PRAGMA instead of two queries. Backends whose connection
+        cannot be inspected are polled every ``POLL_INTERVAL`` instead.
+        """
         deadline = time.time() + timeout
-        poll_interval = 0.5  # Check every 500ms
 
-        while time.time() < deadline:
+        # Take the token before fetching so a commit in between is noticed
+        token = self._local_change_token()
+        messages = self.receive_messages(include_room=include_room)
+        if messages:
+            return messages
+
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return []
+            interval = POLL_INTERVAL if token is None else CHANGE_CHECK_INTERVAL
+            time.sleep(min(interval, remaining))
+
+            if token is not None:
+                current = self._local_change_token()
+                if current == token:
+                    continue
+                token = current
+
+            woke = time.monotonic()
             messages = self.receive_messages(include_room=include_room)
+            self._record_wake(woke, messages)
             if messages:
                 return messages
-            remaining = deadline - time.time()
-            if remaining > 0:
-                time.sleep(min(poll_interval, remaining))
 
-        return []
+    def _local_change_token(self) -> Optional[tuple[int, int]]:
+        """Return a value that changes whenever the local database changes."""
+        conn = getattr(getattr(self.deaddrop, "_backend", None), "_conn", None)
+        if conn is None:
+            return None
+        try:
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            total_changes = conn.total_changes
+        except Exception:
+            return None
+        self._record(change_checks=1)
+        return data_version, total_changes
 
     def poll(
         self,
@@ -5,14 +5,25 @@ Manages the lifecycle of a coordination session including:
 - Coordination room setup
 - Agent registry tracking
 - State persistence for resumption
+
+State is persisted as a JSON snapshot plus an append-only journal next to
+it (``coordination.json`` / ``coordination.journal``). Each change appends
+the new value of the changed agent, human or permission to the journal
+instead of rewriting the snapshot; ``last_seen`` updates are coalesced and
+written at most every ``LAST_SEEN_FLUSH_INTERVAL`` seconds or at the next
+``flush()``. The journal is folded into the snapshot once it holds
+``SNAPSHOT_EVERY`` records, and whenever ``save_state()`` is called.
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 import json
+import os
+import time
 
 from deadrop import Deaddrop
 
@@ -23,6 +34,19 @@ from .client import (
 )
 
 
+# Seconds a last_seen-only change may stay unwritten
+LAST_SEEN_FLUSH_INTERVAL = 5.0
+
+# Journal records after which the snapshot is rewritten
+SNAPSHOT_EVERY = 500
+
+# Room messages fetched per request when syncing from room history
+ROOM_SYNC_PAGE_SIZE = 500
+
+# SessionState collections that are journaled per entry
+_JOURNALED = ("agents", "humans", "pending_permissions")
+
+
 class AgentState(str, Enum):
     """Possible states for a coordinated agent."""
 
@@ -119,6 +143,10 @@ class SessionState:
     pending_permissions: dict[str, PendingPermission] = field(default_factory=dict)
     created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
     display_name: str = "Coordination Session"
+    # Last room message folded into room_agent_states
+    room_cursor: Optional[str] = None
+    # identity_id -> {"state", "timestamp"} of its latest state message
+    room_agent_states: dict[str, dict[str, str]] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -135,6 +163,8 @@ class SessionState:
             },
             "created_at": self.created_at,
             "display_name": self.display_name,
+            "room_cursor": self.room_cursor,
+            "room_agent_states": self.room_agent_states,
         }
 
     @classmethod
@@ -172,6 +202,45 @@ def get_session_file(session_id: str, history_dir: Path | None = None) -> Path:
     return get_sessions_dir() / f"{session_id}.json"
 
 
+def get_journal_file(session_file: Path) -> Path:
+    """Get the journal file that belongs to a session state file."""
+    return session_file.with_suffix(".journal")
+
+
+def load_session_data(session_file: Path) -> dict[str, Any]:
+    """Load a session state file and replay its journal over it.
+
+    A torn last journal line (from a crash mid-append) is ignored.
+
+    Raises:
+        json.JSONDecodeError, OSError: If the state file cannot be read
+    """
+    with open(session_file, "r") as f:
+        data = json.load(f)
+
+    journal_file = get_journal_file(session_file)
+    try:
+        with open(journal_file, "r") as f:
+            lines = f.readlines()
+    except OSError:
+        return data
+
+    for line in lines:
+        try:
+            record = json.loads(line)
+            kind, key, value = record["kind"], record["key"], record["value"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            continue
+        if kind not in _JOURNALED:
+            continue
+        entries = data.setdefault(kind, {})
+        if value is None:
+            entries.pop(key, None)
+        else:
+            entries[key] = value
+    return data
+
+
 class CoordinationSession:
     """Manages a coordination session.
 
@@ -202,6 +271,13 @@ class CoordinationSession:
         self.state = state
         self.history_dir = history_dir
 
+        # (collection, key) entries changed since the last journal write
+        self._dirty: set[tuple[str, str]] = set()
+        self._durable_pending = False
+        self._last_flush = time.monotonic()
+        self._journal_records = 0
+        self._batch_depth = 0
+
         # Create coordination context for the coordinator
         self._context = CoordinationContext(
             deaddrop=deaddrop,
@@ -327,8 +403,7 @@ class CoordinationSession:
             if not session_file.exists():
                 raise FileNotFoundError(f"Session file not found: {session_file}")
 
-            with open(session_file, "r") as f:
-                data = json.load(f)
+            data = load_session_data(session_file)
 
             state = SessionState.from_dict(data)
             session = cls(deaddrop, state, history_dir=history_dir)
@@ -351,18 +426,83 @@ class CoordinationSession:
         else:
             raise ValueError("Either session_id or namespace_secret must be provided")
 
-    def _sync_from_room_history(self) -> dict[str, Any]:
+    def _sync_from_room_history(self, full_rebuild: bool = False) -> dict[str, Any]:
         """Sync agent states from room history.
 
-        Reads recent messages from the coordination room to update:
+        Reads the coordination room messages after ``state.room_cursor`` to
+        update:
         - Agent states (idle vs working)
         - Last seen timestamps
         - Pending permission requests
 
+        The latest state each sender reported is kept in
+        ``state.room_agent_states`` and the cursor is advanced, so the next
+        sync only reads newer messages. A full rebuild (or a cursor the
+        backend rejects) reads the room from the start.
+
+        Args:
+            full_rebuild: Ignore the cursor and replay the whole room
+
         Returns:
             Dict with sync results (agents_updated, permissions_found)
         """
+        results = {
+            "agents_updated": 0,
+            "permissions_found": 0,
+            "messages_processed": 0,
+        }
+
+        cursor = None if full_rebuild else self.state.room_cursor
+        if cursor is None:
+            self.state.room_agent_states = {}
+        updated: set[str] = set()
+
+        # Apply all updates, then write them out as one snapshot
+        with self.batch():
+            while True:
+                try:
+                    # Get room messages (use coordinator identity secret to read)
+                    room_messages = self.deaddrop.get_room_messages(
+                        ns=self.namespace_id,
+                        room_id=self.state.room_id,
+                        secret=self.state.coordinator_secret,
+                        after_mid=cursor,
+                        limit=ROOM_SYNC_PAGE_SIZE,
+                    )
+                except Exception:
+                    if cursor is not None and not results["messages_processed"]:
+                        # The cursor may be unknown to the backend; rebuild
+                        cursor = None
+                        self.state.room_agent_states = {}
+                        continue
+                    # Room may not exist or we may not have access
+                    break
+
+                if not room_messages:
+                    break
+                updated |= self._apply_room_messages(room_messages, results)
+                last_mid = room_messages[-1].get("mid")
+                if not last_mid or last_mid == cursor:
+                    break
+                cursor = self.state.room_cursor = last_mid
+                if len(room_messages) < ROOM_SYNC_PAGE_SIZE:
+                    break
+
+            self._apply_room_agent_states(updated, results)
+
+        self.save_state()
+        return results
+
+    def _apply_room_messages(
+        self, room_messages: list[dict[str, Any]], results: dict[str, Any]
+    ) -> set[str]:
+        """Fold room messages into ``state.room_agent_states``.
+
+        Returns:
+            Identity IDs whose latest reported state changed
+        """
         from .protocol import (
+            COORDINATION_CONTENT_TYPE,
             Idle,
             Progress,
             Result,
@@ -372,27 +512,8 @@ class CoordinationSession:
         )
         from .compression import decompress_payload
 
-        results = {
-            "agents_updated": 0,
-            "permissions_found": 0,
-            "messages_processed": 0,
-        }
-
-        try:
-            # Get room messages (use coordinator identity secret to read)
-            room_messages = self.deaddrop.get_room_messages(
-                ns=self.namespace_id,
-                room_id=self.state.room_id,
-                secret=self.state.coordinator_secret,
-            )
-        except Exception:
-            # Room may not exist or we may not have access
-            return results
-
-        # Track the most recent state-relevant message per agent
-        agent_latest_state: dict[
-            str, tuple[str, str]
-        ] = {}  # agent_id -> (state, timestamp)
+        updated = set()
+        room_agent_states = self.state.room_agent_states
 
         for raw_msg in room_messages:
             results["messages_processed"] += 1
@@ -411,7 +532,7 @@ class CoordinationSession:
             content = raw_msg.get("body") or raw_msg.get("content", "")
             content_type = raw_msg.get("content_type", "")
 
-            if content_type != "application/vnd.silica.coordination+json":
+            if content_type.split(";")[0].strip() != COORDINATION_CONTENT_TYPE:
                 continue
 
             try:
@@ -467,49 +588,132 @@ class CoordinationSession:
                 continue
 
             # Update if this is newer than what we have
-            current = agent_latest_state.get(agent.agent_id)
-            if not current or timestamp > current[1]:
-                agent_latest_state[agent.agent_id] = (new_state, timestamp)
-
-        # Apply state updates
-        for agent_id, (state_str, timestamp) in agent_latest_state.items():
-            agent = self.get_agent(agent_id)
-            if agent and agent.state != AgentState.TERMINATED:
+            current = room_agent_states.get(sender_id)
+            if not current or timestamp > current["timestamp"]:
+                room_agent_states[sender_id] = {
+                    "state": new_state,
+                    "timestamp": timestamp,
+                }
+                updated.add(sender_id)
+
+        return updated
+
+    def _apply_room_agent_states(
+        self, identity_ids: set[str], results: dict[str, Any]
+    ) -> None:
+        """Apply the room-reported states of the given senders to agents."""
+        for identity_id in identity_ids:
+            agent = self.get_agent_by_identity(identity_id)
+            latest = self.state.room_agent_states.get(identity_id)
+            if agent and latest and agent.state != AgentState.TERMINATED:
                 try:
-                    new_state = AgentState(state_str)
+                    new_state = AgentState(latest["state"])
                     if agent.state != new_state:
-                        self.update_agent_state(agent_id, new_state)
+                        self.update_agent_state(agent.agent_id, new_state)
                         results["agents_updated"] += 1
                     # Always update last_seen
-                    agent.last_seen = timestamp
+                    agent.last_seen = latest["timestamp"]
                 except ValueError:
                     pass
 
-        self.save_state()
-        return results
-
-    def sync_agent_states(self) -> dict[str, Any]:
+    def sync_agent_states(self, full_rebuild: bool = False) -> dict[str, Any]:
         """Manually trigger agent state sync from room history.
 
         Call this to refresh agent states when resuming a session
         or when you suspect state may be stale.
 
+        Args:
+            full_rebuild: Replay the whole room instead of only new messages
+
         Returns:
             Dict with sync results
         """
-        return self._sync_from_room_history()
+        return self._sync_from_room_history(full_rebuild=full_rebuild)
 
     def save_state(self) -> Path:
-        """Persist session state to disk.
+        """Write a full snapshot of the session state and reset the journal.
 
         Returns:
             Path to the saved state file
         """
         session_file = get_session_file(self.session_id, self.history_dir)
-        with open(session_file, "w") as f:
+        tmp_file = session_file.with_name(session_file.name + ".tmp")
+        with open(tmp_file, "w") as f:
             json.dump(self.state.to_dict(), f, indent=2)
+        os.replace(tmp_file, session_file)
+        # The snapshot includes every journaled change
+        get_journal_file(session_file).unlink(missing_ok=True)
+        self._dirty.clear()
+        self._durable_pending = False
+        self._journal_records = 0
+        self._last_flush = time.monotonic()
         return session_file
 
+    def flush(self) -> None:
+        """Write all pending changes to the journal.
+
+        This is the durability barrier for coalesced ``last_seen`` updates;
+        every other change is written before the method making it returns
+        (or when the enclosing ``batch()`` ends).
+        """
+        if not self._dirty:
+            self._durable_pending = False
+            return
+        session_file = get_session_file(self.session_id, self.history_dir)
+        if not session_file.exists():
+            # Nothing to replay the journal onto yet
+            self.save_state()
+            return
+
+        records = []
+        for kind, key in sorted(self._dirty):
+            value = getattr(self.state, kind).get(key)
+            records.append(
+                json.dumps(
+                    {
+                        "kind": kind,
+                        "key": key,
+                        "value": value.to_dict() if value is not None else None,
+                    }
+                )
+            )
+        with open(get_journal_file(session_file), "a") as f:
+            f.write("\n".join(records) + "\n")
+        self._dirty.clear()
+        self._durable_pending = False
+        self._journal_records += len(records)
+        self._last_flush = time.monotonic()
+
+        if self._journal_records >= SNAPSHOT_EVERY:
+            self.save_state()
+
+    @contextmanager
+    def batch(self):
+        """Defer journal writes until the outermost batch ends."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._durable_pending:
+                self.flush()
+
+    def _mark_dirty(self, kind: str, key: str, durable: bool = True) -> None:
+        """Record a changed entry and write it out when it is due.
+
+        Durable changes are written at once (or at the end of the current
+        batch); others wait up to ``LAST_SEEN_FLUSH_INTERVAL`` seconds.
+        """
+        self._dirty.add((kind, key))
+        self._durable_pending = self._durable_pending or durable
+        if self._batch_depth:
+            return
+        if (
+            self._durable_pending
+            or time.monotonic() - self._last_flush >= LAST_SEEN_FLUSH_INTERVAL
+        ):
+            self.flush()
+
     def get_state(self) -> dict[str, Any]:
         """Get current session state as dict."""
         return self.state.to_dict()
@@ -542,7 +746,7 @@ class CoordinationSession:
             state=AgentState.SPAWNING,
         )
         self.state.agents[agent_id] = agent
-        self.save_state()
+        self._mark_dirty("agents", agent_id)
         return agent
 
     def update_agent_state(
@@ -579,12 +783,15 @@ class CoordinationSession:
             agent.tmux_session = tmux_session
         if remote_workspace is not None:
             agent.remote_workspace = remote_workspace
-        self.save_state()
+        self._mark_dirty("agents", agent_id)
         return agent
 
     def update_agent_last_seen(self, agent_id: str) -> AgentInfo:
         """Update an agent's last_seen timestamp.
 
+        The change is coalesced with other pending changes; call ``flush()``
+        to write it out immediately.
+
         Args:
             agent_id: Agent to update
 
@@ -593,7 +800,7 @@ class CoordinationSession:
         """
         agent = self.state.agents[agent_id]
         agent.last_seen = datetime.utcnow().isoformat()
-        self.save_state()
+        self._mark_dirty("agents", agent_id, durable=False)
         return agent
 
     def get_agent(self, agent_id: str) -> Optional[AgentInfo]:
@@ -635,7 +842,7 @@ class CoordinationSession:
         """
         agent = self.state.agents.pop(agent_id, None)
         if agent:
-            self.save_state()
+            self._mark_dirty("agents", agent_id)
         return agent
 
     # --- Human Participants ---
@@ -659,7 +866,7 @@ class CoordinationSession:
             display_name=display_name,
         )
         self.state.humans[identity_id] = human
-        self.save_state()
+        self._mark_dirty("humans", identity_id)
         return human
 
     def get_human(self, identity_id: str) -> Optional[HumanParticipant]:
@@ -746,7 +953,7 @@ class CoordinationSession:
             context=context,
         )
         self.state.pending_permissions[request_id] = pending
-        self.save_state()
+        self._mark_dirty("pending_permissions", request_id)
         return pending
 
     def get_pending_permission(self, request_id: str) -> Optional[PendingPermission]:
@@ -791,7 +998,7 @@ class CoordinationSession:
         pending = self.state.pending_permissions.get(request_id)
         if pending:
             pending.status = status
-            self.save_state()
+            self._mark_dirty("pending_permissions", request_id)
         return pending
 
     def remove_pending_permission(self, request_id: str) -> Optional[PendingPermission]:
@@ -805,7 +1012,7 @@ class CoordinationSession:
         """
         pending = self.state.pending_permissions.pop(request_id, None)
         if pending:
-            self.save_state()
+            self._mark_dirty("pending_permissions", request_id)
         return pending
 
     def clear_expired_permissions(self, max_age_hours: int = 24) -> int:
@@ -830,11 +1037,10 @@ class CoordinationSession:
             except (ValueError, TypeError):
                 continue
 
-        for request_id in to_remove:
-            self.state.pending_permissions[request_id].status = "expired"
-
-        if to_remove:
-            self.save_state()
+        with self.batch():
+            for request_id in to_remove:
+                self.state.pending_permissions[request_id].status = "expired"
+                self._mark_dirty("pending_permissions", request_id)
 
         return len(to_remove)
 
@@ -854,8 +1060,7 @@ def list_sessions(history_base_dir: Path | None = None) -> list[dict[str, Any]]:
     sessions_dir = get_sessions_dir()
     for path in sessions_dir.glob("*.json"):
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            data = load_session_data(path)
             sid = data.get("session_id")
             if sid:
                 seen_ids.add(sid)
@@ -876,8 +1081,7 @@ def list_sessions(history_base_dir: Path | None = None) -> list[dict[str, Any]]:
         if history_dir.exists():
             for coord_file in history_dir.glob("*/coordination.json"):
                 try:
-                    with open(coord_file, "r") as f:
-                        data = json.load(f)
+                    data = load_session_data(coord_file)
                     sid = data.get("session_id")
                     if sid and sid not in seen_ids:
                         seen_ids.add(sid)
@@ -907,5 +1111,6 @@ def delete_session(session_id: str) -> bool:
     session_file = get_session_file(session_id)
     if session_file.exists():
         session_file.unlink()
+        get_journal_file(session_file).unlink(missing_ok=True)
         return True
     return False
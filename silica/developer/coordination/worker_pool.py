@@ -0,0 +1,229 @@
+"""Pool of pre-launched local workers for fast spawn_agent.
+
+Cold-starting a local worker means creating a tmux session, starting
+``uv run silica worker``, claiming the deaddrop invite and importing the
+agent stack before the worker can pick up a task. A ``WorkerPool`` keeps
+``size`` workers launched ahead of time: each already has its own
+identity, agent ID and room membership and is waiting for messages, so
+``spawn_agent`` only has to register it in the session.
+
+Pooled workers announce readiness with a direct Idle message to the
+coordinator (not a room broadcast), which ``mark_ready`` consumes. A warm
+worker that is not used within ``idle_ttl`` seconds is stopped and
+replaced. Taking a worker from the pool replenishes it in the background.
+A failed launch is retried after ``retry_delay`` seconds, doubling with
+each consecutive failure up to ``MAX_RETRY_DELAY``.
+
+The pool is disabled (``size`` 0) unless configured, e.g. through the
+``SILICA_WORKER_POOL_SIZE`` and ``SILICA_WORKER_POOL_IDLE_TTL`` environment
+variables or ``silica coordinator --worker-pool``.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+POOL_SIZE_ENV = "SILICA_WORKER_POOL_SIZE"
+POOL_IDLE_TTL_ENV = "SILICA_WORKER_POOL_IDLE_TTL"
+
+# Set in a pooled worker's environment; it then reports readiness to the
+# coordinator's inbox instead of the room
+POOLED_WORKER_ENV = "COORDINATION_POOLED_WORKER"
+
+DEFAULT_POOL_SIZE = 0
+DEFAULT_IDLE_TTL = 1800.0
+DEFAULT_RETRY_DELAY = 5.0
+MAX_RETRY_DELAY = 300.0
+
+
+@dataclass
+class WarmWorker:
+    """A launched worker that is not yet bound to a registered agent."""
+
+    agent_id: str
+    identity_id: str
+    tmux_session: str
+    cwd: str
+    launched_at: float = field(default_factory=time.monotonic)
+    ready: bool = False
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+class WorkerPool:
+    """Keeps warm local workers ready to be bound by spawn_agent.
+
+    Args:
+        launch: Starts a worker in the given working directory and returns
+            it. May raise; the failure is logged and the slot retried
+            after ``retry_delay`` seconds (with backoff).
+        stop: Stops a warm worker that is being discarded.
+        size: Number of warm workers to keep.
+        idle_ttl: Seconds a warm worker may wait before it is replaced.
+        cwd: Working directory of the warm workers (default: current).
+        retry_delay: Seconds before the first retry of a failed launch.
+    """
+
+    def __init__(
+        self,
+        launch: Callable[[str], WarmWorker],
+        stop: Callable[[WarmWorker], None],
+        size: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        cwd: Optional[str] = None,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ):
+        self.launch = launch
+        self.stop = stop
+        self.size = (
+            size
+            if size is not None
+            else _env_number(POOL_SIZE_ENV, DEFAULT_POOL_SIZE, int)
+        )
+        self.idle_ttl = (
+            idle_ttl
+            if idle_ttl is not None
+            else _env_number(POOL_IDLE_TTL_ENV, DEFAULT_IDLE_TTL, float)
+        )
+        self.cwd = cwd or os.getcwd()
+        self.retry_delay = retry_delay
+        self._failures = 0
+        self._workers: list[WarmWorker] = []
+        self._launching = 0
+        self._lock = threading.Lock()
+        self._maintainer: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._closed = False
+
+    @property
+    def workers(self) -> list[WarmWorker]:
+        with self._lock:
+            return list(self._workers)
+
+    def acquire(self, cwd: Optional[str] = None) -> Optional[WarmWorker]:
+        """Take a warm worker for ``cwd``, preferring ready ones.
+
+        Returns None if none is available; the pool is replenished in the
+        background either way.
+        """
+        cwd = cwd or self.cwd
+        self._expire()
+        with self._lock:
+            candidates = [w for w in self._workers if w.cwd == cwd]
+            candidates.sort(key=lambda w: (not w.ready, w.launched_at))
+            worker = candidates[0] if candidates else None
+            if worker is not None:
+                self._workers.remove(worker)
+        self.replenish_async()
+        return worker
+
+    def is_pooled(self, identity_id: str) -> bool:
+        with self._lock:
+            return any(w.identity_id == identity_id for w in self._workers)
+
+    def mark_ready(self, identity_id: str) -> bool:
+        """Record a readiness announcement; returns False if not pooled."""
+        with self._lock:
+            for worker in self._workers:
+                if worker.identity_id == identity_id:
+                    worker.ready = True
+                    return True
+        return False
+
+    def replenish(self) -> int:
+        """Launch workers until the pool is full; returns how many started."""
+        self._expire()
+        started = 0
+        while True:
+            with self._lock:
+                if self._closed or len(self._workers) + self._launching >= self.size:
+                    return started
+                self._launching += 1
+            try:
+                worker = self.launch(self.cwd)
+            except Exception as e:
+                logger.warning(f"Failed to launch pooled worker: {e}")
+                with self._lock:
+                    self._failures += 1
+                return started
+            finally:
+                with self._lock:
+                    self._launching -= 1
+            with self._lock:
+                self._failures = 0
+                closed = self._closed
+                if not closed:
+                    self._workers.append(worker)
+            if closed:
+                self._stop(worker)
+                return started
+            started += 1
+
+    def replenish_async(self) -> None:
+        """Keep the pool filled from a background thread.
+
+        The thread refills the pool, then sleeps until the next warm worker
+        expires, a failed launch is due for a retry or a worker is taken,
+        until ``shutdown``.
+        """
+        with self._lock:
+            if self._closed or self.size <= 0:
+                return
+            self._wake.set()
+            if self._maintainer is not None and self._maintainer.is_alive():
+                return
+            self._maintainer = threading.Thread(
+                target=self._maintain, name="worker-pool", daemon=True
+            )
+            self._maintainer.start()
+
+    def shutdown(self) -> None:
+        """Stop all warm workers and stop replenishing."""
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, []
+        self._wake.set()
+        for worker in workers:
+            self._stop(worker)
+
+    def _maintain(self) -> None:
+        while not self._closed:
+            self._wake.clear()
+            self.replenish()
+            with self._lock:
+                launched = [w.launched_at for w in self._workers]
+                failures = self._failures
+            if launched:
+                timeout = max(0.0, min(launched) + self.idle_ttl - time.monotonic())
+            else:
+                timeout = self.idle_ttl
+            if failures:
+                backoff = self.retry_delay * 2 ** (failures - 1)
+                timeout = min(timeout, backoff, MAX_RETRY_DELAY)
+            self._wake.wait(timeout)
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            expired = [w for w in self._workers if now - w.launched_at >= self.idle_ttl]
+            for worker in expired:
+                self._workers.remove(worker)
+        for worker in expired:
+            logger.info(f"Stopping idle pooled worker {worker.agent_id}")
+            self._stop(worker)
+
+    def _stop(self, worker: WarmWorker) -> None:
+        try:
+            self.stop(worker)
+        except Exception as e:
+            logger.warning(f"Failed to stop pooled worker {worker.agent_id}: {e}")
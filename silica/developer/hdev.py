@@ -1938,7 +1938,7 @@ def _verify_migrated_sessions(base_dir: Path, preview_dir: Path | None = None):
         shutil.rmtree(wrapper, ignore_errors=True)
 
 
-def attach_tools(app):
+def _build_cli_toolbox() -> Toolbox:
     console = Console()
     sandbox = Sandbox(".", SandboxMode.ALLOW_ALL)
     context = AgentContext.create(
@@ -1951,16 +1951,38 @@ def attach_tools(app):
     # Set dwr_mode for permissions bypass in attach_tools mode
     context.dwr_mode = True
     # Skip user tool auth check during CLI registration to avoid auth warnings
-    toolbox = Toolbox(context, skip_user_tool_auth=True)
+    return Toolbox(context, skip_user_tool_auth=True)
+
+
+def attach_tools(app, commands: Optional[list[str]] = None) -> list[str]:
+    """Register the toolbox CLI tools as top-level commands on ``app``.
+
+    Args:
+        app: cyclopts App to register commands on.
+        commands: Known tool command names (e.g. from a cache). When given,
+            the Toolbox is only constructed if one of the commands is run.
+
+    Returns:
+        The registered command names.
+    """
+    toolbox = None
+    if commands is None:
+        toolbox = _build_cli_toolbox()
+        commands = sorted(toolbox.local.keys())
+
+    def get_toolbox() -> Toolbox:
+        nonlocal toolbox
+        if toolbox is None:
+            toolbox = _build_cli_toolbox()
+        return toolbox
 
-    commands = set(toolbox.local.keys())
     for command in commands:
 
         def make_command_func(cmd_name: str):
             def f(*args: str):
                 tool_args = " ".join(args)  # TODO(2025-03-19): do something with shlex
                 asyncio.run(
-                    toolbox.invoke_cli_tool(
+                    get_toolbox().invoke_cli_tool(
                         cmd_name, arg_str=tool_args, confirm_to_add=False
                     )
                 )
@@ -1969,6 +1991,8 @@ def attach_tools(app):
 
         app.command(make_command_func(command), name=command)
 
+    return list(commands)
+
 
 def cyclopts_main(
     sandbox: Annotated[list[str], cyclopts.Parameter(help="Sandbox contents")] = [],
@@ -2016,7 +2040,7 @@ def cyclopts_main(
     log_requests: Annotated[
         Optional[str],
         cyclopts.Parameter(
-            help="Path to log file for JSON request/response logging. If not specified, logging is disabled."
+            help="Path to log file for JSON request/response logging. Paths ending in .gz or .zst write a compressed log that stores repeated content once. If not specified, logging is disabled."
         ),
     ] = None,
 ):
@@ -8,6 +8,7 @@ When Agent Island is not available, falls back to CLI-only behavior.
 """
 
 import asyncio
+import collections
 import contextlib
 import re
 from pathlib import Path
@@ -151,6 +152,11 @@ class HybridUserInterface(UserInterface):
         # Reference to agent context (set by hdev.py after context creation)
         self._agent_context = None
 
+        # Island notifications awaiting dispatch, delivered in order by a
+        # single task rather than one task per event
+        self._island_outbox: collections.deque = collections.deque()
+        self._island_dispatch_task: Optional[asyncio.Task] = None
+
     @property
     def agent_context(self):
         """Get the agent context."""
@@ -832,13 +838,45 @@ class HybridUserInterface(UserInterface):
 
     # ========== Non-Blocking Events (Show in Both) ==========
 
+    def _notify_island(self, coro) -> None:
+        """Queue an Island notification coroutine for in-order dispatch.
+
+        Like _fire_and_forget, but all notifications share one dispatch task,
+        so a burst of events neither spawns a task per event nor reorders.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            coro.close()
+            return
+
+        self._island_outbox.append(coro)
+        if self._island_dispatch_task is None or self._island_dispatch_task.done():
+            self._island_dispatch_task = asyncio.create_task(
+                self._dispatch_island_notifications()
+            )
+
+    async def _dispatch_island_notifications(self) -> None:
+        """Drain queued Island notifications in order."""
+        while self._island_outbox:
+            coro = self._island_outbox.popleft()
+            try:
+                await coro
+            except asyncio.CancelledError:
+                for pending in self._island_outbox:
+                    pending.close()
+                self._island_outbox.clear()
+                raise
+            except Exception:
+                pass  # Notifications are best-effort
+
     def handle_assistant_message(self, message: str) -> None:
         """Display assistant message in both interfaces."""
         self.cli.handle_assistant_message(message)
 
         if self.hybrid_mode:
             message_id = _generate_message_id()
-            _fire_and_forget(
+            self._notify_island(
                 self._island.notify_assistant_message(
                     content=message,
                     format="markdown",
@@ -853,7 +891,7 @@ class HybridUserInterface(UserInterface):
         if self.hybrid_mode:
             # Strip Rich markup before sending to Island
             clean_message = _strip_rich_markup(message)
-            _fire_and_forget(
+            self._notify_island(
                 self._island.notify_system_message(message=clean_message, style="info")
             )
 
@@ -867,7 +905,7 @@ class HybridUserInterface(UserInterface):
         self.cli.handle_tool_use(tool_name, tool_params)
 
         if self.hybrid_mode and tool_use_id:
-            _fire_and_forget(
+            self._notify_island(
                 self._island.notify_tool_use(
                     tool_use_id=tool_use_id,
                     tool_name=tool_name,
@@ -890,7 +928,7 @@ class HybridUserInterface(UserInterface):
             is_error = result.get("is_error", False)
             content = result.get("content", "")
 
-            _fire_and_forget(
+            self._notify_island(
                 self._island.notify_tool_result(
                     tool_use_id=tool_use_id,
                     tool_name=name,
@@ -913,7 +951,7 @@ class HybridUserInterface(UserInterface):
             message_id = _generate_message_id()
             # Strip Rich markup before sending to Island
             clean_content = _strip_rich_markup(user_input)
-            _fire_and_forget(
+            self._notify_island(
                 self._island.notify_user_message(
                     content=clean_content,
                     message_id=message_id,
@@ -933,7 +971,7 @@ class HybridUserInterface(UserInterface):
 
         if self.hybrid_mode:
             message_id = _generate_message_id()
-            _fire_and_forget(
+            self._notify_island(
                 self._island.notify_thinking(
                     content=content,
                     tokens=tokens,
@@ -983,7 +1021,7 @@ class HybridUserInterface(UserInterface):
         )
 
         if self.hybrid_mode:
-            _fire_and_forget(
+            self._notify_island(
                 self._island.notify_token_usage(
                     prompt_tokens=prompt_tokens,
                     completion_tokens=completion_tokens,
@@ -1015,7 +1053,7 @@ class HybridUserInterface(UserInterface):
         if self.hybrid_mode:
             # Strip Rich markup before sending to Island
             clean_message = _strip_rich_markup(message)
-            _fire_and_forget(
+            self._notify_island(
                 self._island.notify_status(
                     message=clean_message, spinner=spinner is not None
                 )
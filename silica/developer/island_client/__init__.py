@@ -16,6 +16,7 @@ Example usage:
 """
 
 from .client import IslandClient
+from .outbound import NotificationQueue, OutboundStats
 from .protocol import (
     PermissionDecision,
     AlertStyle,
@@ -34,6 +35,8 @@ from .exceptions import (
 __version__ = "1.0.0"
 __all__ = [
     "IslandClient",
+    "NotificationQueue",
+    "OutboundStats",
     "PermissionDecision",
     "AlertStyle",
     "JsonRpcRequest",
@@ -17,7 +17,6 @@ from uuid import uuid4
 from .protocol import (
     JsonRpcRequest,
     JsonRpcResponse,
-    JsonRpcNotification,
     HandshakeParams,
     SessionRegisterParams,
     PermissionRequestParams,
@@ -26,6 +25,7 @@ from .protocol import (
     AlertStyle,
     ErrorCode,
 )
+from .outbound import NotificationQueue, OutboundStats
 from .exceptions import (
     IslandError,
     ConnectionError,
@@ -46,6 +46,11 @@ RECONNECT_MAX_DELAY = 16.0  # Maximum delay cap
 RECONNECT_MAX_ATTEMPTS = 20  # Stop after this many attempts
 HEARTBEAT_INTERVAL = 60.0  # Seconds between heartbeat pings (increased to reduce load)
 
+# Outbound notification batching
+NOTIFICATION_FLUSH_INTERVAL = 0.005  # Seconds to gather notifications per write
+NOTIFICATION_DRAIN_TIMEOUT = 5.0  # Give up on a batch if the Island stops reading
+NOTIFICATION_CLOSE_TIMEOUT = 1.0  # Time allowed to flush pending on disconnect
+
 InputCallback = Any
 ProgressActionCallback = Any
 ReconnectedCallback = Callable[[], None]
@@ -59,6 +64,7 @@ class IslandClient:
     - Session re-registration after reconnection
     - Heartbeat/ping to detect disconnection proactively
     - Silent failure mode for fire-and-forget operations when disconnected
+    - Ordered, batched and bounded delivery of notifications
     """
 
     def __init__(
@@ -68,6 +74,7 @@ class IslandClient:
         app_icon: str = "brain",
         agent_version: str = "1.0.0",
         auto_reconnect: bool = True,
+        max_pending_notifications: int = 1000,
     ):
         self.socket_path = Path(socket_path).expanduser()
         self.app_name = app_name
@@ -93,6 +100,10 @@ class IslandClient:
         # Heartbeat state
         self._heartbeat_task: Optional[asyncio.Task] = None
 
+        # Outbound notification queue, drained by a single writer task
+        self._outbound = NotificationQueue(max_pending=max_pending_notifications)
+        self._flush_task: Optional[asyncio.Task] = None
+
         # Session state for re-registration
         self._session_info: Optional[Dict[str, Any]] = None
 
@@ -111,6 +122,11 @@ class IslandClient:
         """Check if currently attempting to reconnect."""
         return self._reconnecting
 
+    @property
+    def notification_stats(self) -> OutboundStats:
+        """Counters for the outbound notification queue."""
+        return self._outbound.stats
+
     @property
     def island_version(self) -> Optional[str]:
         """Get the connected Island's version."""
@@ -164,6 +180,13 @@ class IslandClient:
         self._intentional_disconnect = True
         self._stop_reconnection()
         self._stop_heartbeat()
+        if self.connected and len(self._outbound):
+            try:
+                await asyncio.wait_for(
+                    self._flush_notifications(), NOTIFICATION_CLOSE_TIMEOUT
+                )
+            except Exception:
+                pass
         await self._close_connection_internal()
         logger.debug("Disconnected from Agent Island")
 
@@ -171,6 +194,8 @@ class IslandClient:
         """Close connection without triggering reconnection."""
         self._connected = False
         self._stop_heartbeat()
+        self._stop_flusher()
+        self._outbound.clear()
 
         if self._read_task:
             self._read_task.cancel()
@@ -432,16 +457,51 @@ class IslandClient:
             raise
 
     async def _send_notification(self, method: str, params: Dict[str, Any]) -> None:
-        """Send a notification (fire-and-forget). Silently fails if not connected."""
+        """Queue a notification (fire-and-forget). Silently drops if not connected.
+
+        Notifications are delivered in order by a single writer task, which
+        batches everything queued within a tick into one socket write. The
+        caller never waits on the socket.
+        """
         if not self.connected:
             return  # Silent fail - no logging
 
+        self._outbound.put(method, params)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    def _stop_flusher(self) -> None:
+        """Stop the notification writer task."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+    async def _flush_loop(self) -> None:
+        """Background task that writes queued notifications in batches."""
         try:
-            notification = JsonRpcNotification(method=method, params=params)
-            self._writer.write(notification.to_bytes())
-            await self._writer.drain()
+            while self.connected and len(self._outbound):
+                # Let notifications emitted in the same tick join this batch
+                await asyncio.sleep(NOTIFICATION_FLUSH_INTERVAL)
+                await self._flush_notifications()
+        except asyncio.CancelledError:
+            pass
+
+    async def _flush_notifications(self) -> None:
+        """Write all pending notifications with a single write and drain."""
+        batch = self._outbound.take_batch()
+        if not batch or self._writer is None:
+            return
+
+        try:
+            self._writer.write(b"".join(n.to_bytes() for n in batch))
+            # Bounded so an Island app that stops reading cannot wedge the
+            # writer; the queue keeps absorbing (and dropping) meanwhile
+            await asyncio.wait_for(self._writer.drain(), NOTIFICATION_DRAIN_TIMEOUT)
+            self._outbound.record_sent(len(batch))
+        except asyncio.CancelledError:
+            raise
         except Exception:
-            pass  # Silent fail - no logging
+            self._outbound.record_write_error(len(batch))  # Silent fail - no logging
 
     async def _handshake(self) -> bool:
         """Perform protocol handshake."""
@@ -0,0 +1,143 @@
+"""Ordered, bounded outbound queue for Agent Island notifications.
+
+Notifications are fire-and-forget, and during heavy streaming or large
+parallel tool batches the agent can emit them far faster than the Island
+app reads them. Writing and draining the socket once per notification
+costs a syscall each and lets a slow reader stall the agent.
+
+NotificationQueue buffers notifications in order, coalesces updates that
+supersede each other (token usage, status), and bounds the buffer with a
+drop-oldest policy. IslandClient drains it with a single writer task that
+sends each tick's worth of notifications in one write.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from .protocol import JsonRpcNotification
+
+__all__ = ["NotificationQueue", "OutboundStats", "COALESCED_METHODS"]
+
+DEFAULT_MAX_PENDING = 1000
+
+# Notifications whose latest value supersedes any earlier pending one.
+# Maps method -> params field that scopes the update (None = one per method).
+COALESCED_METHODS: Dict[str, Optional[str]] = {
+    "event.token_usage": None,
+    "event.status": None,
+}
+
+
+@dataclass
+class OutboundStats:
+    """Counters for the outbound notification queue."""
+
+    enqueued: int = 0
+    sent: int = 0
+    coalesced: int = 0  # Pending updates replaced by a newer one
+    dropped: int = 0  # Discarded because the buffer was full or closed
+    batches: int = 0
+    write_errors: int = 0
+    pending: int = 0
+    high_water: int = 0  # Largest number of pending notifications seen
+
+
+class NotificationQueue:
+    """FIFO buffer of notifications with coalescing and a size bound."""
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING):
+        """Initialize the queue.
+
+        Args:
+            max_pending: Maximum number of buffered notifications. When full,
+                the oldest coalescable notification is dropped, or the
+                oldest notification if none is coalescable.
+        """
+        self.max_pending = max(1, max_pending)
+        self._entries: OrderedDict[Hashable, Tuple[str, Dict[str, Any]]] = OrderedDict()
+        self._seq = 0
+        self._stats = OutboundStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def coalesce_key(method: str, params: Dict[str, Any]) -> Optional[Hashable]:
+        """Return the key under which a notification supersedes older ones."""
+        if method not in COALESCED_METHODS:
+            return None
+        scope = COALESCED_METHODS[method]
+        return (method, params.get(scope) if scope else None)
+
+    def put(self, method: str, params: Dict[str, Any]) -> None:
+        """Append a notification, replacing any pending one it supersedes.
+
+        A coalesced notification moves to the end of the queue so that it
+        is delivered after the events that preceded it.
+        """
+        self._stats.enqueued += 1
+
+        key = self.coalesce_key(method, params)
+        if key is not None and key in self._entries:
+            del self._entries[key]
+            self._stats.coalesced += 1
+        elif key is None:
+            self._seq += 1
+            key = ("seq", self._seq)
+
+        while len(self._entries) >= self.max_pending:
+            self._drop_one()
+
+        self._entries[key] = (method, params)
+        self._stats.high_water = max(self._stats.high_water, len(self._entries))
+
+    def _drop_one(self) -> None:
+        victim = next(
+            (
+                k
+                for k, (method, _) in self._entries.items()
+                if method in COALESCED_METHODS
+            ),
+            next(iter(self._entries)),
+        )
+        del self._entries[victim]
+        self._stats.dropped += 1
+
+    def take_batch(self) -> List[JsonRpcNotification]:
+        """Remove and return all pending notifications in order."""
+        batch = [
+            JsonRpcNotification(method=method, params=params)
+            for method, params in self._entries.values()
+        ]
+        self._entries.clear()
+        return batch
+
+    def clear(self) -> None:
+        """Discard all pending notifications, counting them as dropped."""
+        self._stats.dropped += len(self._entries)
+        self._entries.clear()
+
+    def record_sent(self, count: int) -> None:
+        """Record a successfully written batch."""
+        self._stats.sent += count
+        self._stats.batches += 1
+
+    def record_write_error(self, count: int) -> None:
+        """Record a batch lost to a write error."""
+        self._stats.write_errors += 1
+        self._stats.dropped += count
+
+    @property
+    def stats(self) -> OutboundStats:
+        """Snapshot of the queue counters."""
+        return OutboundStats(
+            enqueued=self._stats.enqueued,
+            sent=self._stats.sent,
+            coalesced=self._stats.coalesced,
+            dropped=self._stats.dropped,
+            batches=self._stats.batches,
+            write_errors=self._stats.write_errors,
+            pending=len(self._entries),
+            high_water=self._stats.high_water,
+        )
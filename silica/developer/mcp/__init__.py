@@ -7,6 +7,8 @@ Key components:
 - MCPClient: Wrapper around the MCP SDK's ClientSession
 - MCPToolManager: Manages multiple MCP server connections
 - MCPConfig: Configuration loading and validation
+- MCPSchemaCache: Persistent on-disk cache of server tool schemas
+- ToolResultCache: Opt-in result cache for read-only tool calls
 - Schema utilities: Convert between MCP and Anthropic tool schemas
 """
 
@@ -20,6 +22,7 @@ from silica.developer.mcp.client import (
 )
 from silica.developer.mcp.config import (
     MCPConfig,
+    MCPResultCacheConfig,
     MCPServerConfig,
     add_mcp_server,
     load_mcp_config,
@@ -27,6 +30,8 @@ from silica.developer.mcp.config import (
     save_mcp_config,
 )
 from silica.developer.mcp.manager import MCPToolManager, ServerStatus
+from silica.developer.mcp.result_cache import ResultCacheStats, ToolResultCache
+from silica.developer.mcp.schema_cache import MCPSchemaCache
 from silica.developer.mcp.schema import (
     anthropic_to_mcp_schema,
     mcp_to_anthropic_schema,
@@ -45,6 +50,7 @@ __all__ = [
     "MCPToolInfo",
     # Config
     "MCPConfig",
+    "MCPResultCacheConfig",
     "MCPServerConfig",
     "add_mcp_server",
     "load_mcp_config",
@@ -53,6 +59,10 @@ __all__ = [
     # Manager
     "MCPToolManager",
     "ServerStatus",
+    # Caches
+    "MCPSchemaCache",
+    "ResultCacheStats",
+    "ToolResultCache",
     # Schema
     "mcp_to_anthropic_schema",
     "anthropic_to_mcp_schema",
@@ -7,11 +7,16 @@ listing tools, and invoking tool calls.
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
-from mcp.types import CallToolResult, TextContent
+from mcp.types import (
+    CallToolResult,
+    ServerNotification,
+    TextContent,
+    ToolListChangedNotification,
+)
 
 from silica.developer.mcp.config import MCPServerConfig
 from silica.developer.mcp.schema import mcp_to_anthropic_schema
@@ -63,6 +68,7 @@ class MCPToolInfo:
     input_schema: dict[str, Any]
     server_name: str  # Which server this tool belongs to
     original_name: str  # Original name before prefixing
+    read_only: bool = False  # Server annotated the tool with readOnlyHint
 
     def to_anthropic_schema(self) -> dict[str, Any]:
         """Convert to Anthropic tool schema format."""
@@ -91,19 +97,29 @@ class MCPClient:
     """
 
     config: MCPServerConfig
+    # Called with the server name when the server announces that its tool
+    # list changed (notifications/tools/list_changed)
+    on_tools_changed: Callable[[str], None] | None = None
     _connected: bool = field(default=False, init=False)
     _tools: list[MCPToolInfo] = field(default_factory=list, init=False)
+    _server_version: str | None = field(default=None, init=False)
+    _tools_stale: bool = field(default=False, init=False)
     _session: ClientSession | None = field(default=None, init=False)
     _read_stream: Any = field(default=None, init=False)
     _write_stream: Any = field(default=None, init=False)
     _stdio_context: Any = field(default=None, init=False)
     _session_context: Any = field(default=None, init=False)
 
-    async def connect(self, timeout: float = DEFAULT_CONNECT_TIMEOUT) -> None:
+    async def connect(
+        self, timeout: float = DEFAULT_CONNECT_TIMEOUT, fetch_tools: bool = True
+    ) -> None:
         """Connect to the MCP server and perform capability negotiation.
 
         Args:
             timeout: Maximum time to wait for connection (in seconds).
+            fetch_tools: If False, skip the initial tool listing even when
+                caching is enabled (used when tools were seeded from the
+                on-disk schema cache and are refreshed in the background).
 
         Raises:
             MCPConnectionError: If connection fails.
@@ -138,7 +154,11 @@ class MCPClient:
 
             # Create session and use it as a context manager
             # The MCP SDK requires ClientSession to be used with async with
-            self._session_context = ClientSession(self._read_stream, self._write_stream)
+            self._session_context = ClientSession(
+                self._read_stream,
+                self._write_stream,
+                message_handler=self._handle_message,
+            )
             try:
                 self._session = await asyncio.wait_for(
                     self._session_context.__aenter__(), timeout=timeout
@@ -166,10 +186,13 @@ class MCPClient:
                 f"server={init_result.serverInfo.name if init_result.serverInfo else 'unknown'}"
             )
 
+            self._server_version = (
+                init_result.serverInfo.version if init_result.serverInfo else None
+            )
             self._connected = True
 
             # Fetch initial tool list if caching is enabled
-            if self.config.cache:
+            if self.config.cache and fetch_tools:
                 await self.list_tools()
 
         except MCPTimeoutError:
@@ -182,6 +205,34 @@ class MCPClient:
                 f"Failed to connect to MCP server '{self.config.name}': {e}"
             ) from e
 
+    async def _handle_message(self, message: Any) -> None:
+        """Handle incoming server messages that are not responses.
+
+        Only tool list change notifications are acted upon; they mark the
+        tool cache stale and notify the owner so it can refresh.
+        """
+        if isinstance(message, ServerNotification) and isinstance(
+            message.root, ToolListChangedNotification
+        ):
+            logger.info(f"MCP server '{self.config.name}' reported tool list change")
+            self._tools_stale = True
+            if self.on_tools_changed:
+                try:
+                    self.on_tools_changed(self.config.name)
+                except Exception as e:
+                    logger.debug(f"on_tools_changed callback failed: {e}")
+
+    def seed_tools(self, tools: list[MCPToolInfo]) -> None:
+        """Pre-populate the tool cache without connecting.
+
+        Used to expose tool schemas loaded from the on-disk schema cache
+        before the server process has been started.
+
+        Args:
+            tools: Tools to expose.
+        """
+        self._tools = list(tools)
+
     async def _cleanup(self) -> None:
         """Clean up connection resources."""
         # Exit session context first
@@ -238,7 +289,12 @@ class MCPClient:
             )
 
         # Return cached tools if available and not forcing refresh
-        if self._tools and not force_refresh and self.config.cache:
+        if (
+            self._tools
+            and not force_refresh
+            and self.config.cache
+            and not self._tools_stale
+        ):
             return self._tools
 
         try:
@@ -264,16 +320,20 @@ class MCPClient:
                     self.config.name,
                 )
 
+                annotations = getattr(mcp_tool, "annotations", None)
                 tool_info = MCPToolInfo(
                     name=anthropic_schema["name"],
                     description=anthropic_schema["description"],
                     input_schema=anthropic_schema["input_schema"],
                     server_name=self.config.name,
                     original_name=mcp_tool.name,
+                    read_only=annotations is not None
+                    and getattr(annotations, "readOnlyHint", None) is True,
                 )
                 tools.append(tool_info)
 
             self._tools = tools
+            self._tools_stale = False
             logger.debug(
                 f"Listed {len(tools)} tools from MCP server '{self.config.name}'"
             )
@@ -426,6 +486,11 @@ class MCPClient:
         """Whether the client is currently connected."""
         return self._connected
 
+    @property
+    def server_version(self) -> str | None:
+        """Version reported by the server during the handshake, if any."""
+        return self._server_version
+
     @property
     def server_name(self) -> str:
         """Name of the server this client connects to."""
@@ -18,6 +18,7 @@ from typing import Any
 
 __all__ = [
     "MCPConfig",
+    "MCPResultCacheConfig",
     "MCPServerConfig",
     "load_mcp_config",
     "save_mcp_config",
@@ -74,6 +75,85 @@ def expand_env_vars_recursive(obj: Any) -> Any:
     return obj
 
 
+@dataclass
+class MCPResultCacheConfig:
+    """Configuration for caching tool call results from a server.
+
+    Result caching is opt-in. Only calls to tools considered read-only are
+    cached: tools listed in ``read_only_tools``, plus tools the server
+    annotates with ``readOnlyHint`` when ``trust_annotations`` is set.
+
+    Attributes:
+        enabled: Whether to cache results for this server.
+        ttl: Seconds a cached result stays valid.
+        max_size: Maximum number of cached results (least recently used
+            entries are evicted first).
+        read_only_tools: Original (unprefixed) names of tools to cache.
+        trust_annotations: Also cache tools the server marks read-only.
+    """
+
+    enabled: bool = False
+    ttl: float = 300.0
+    max_size: int = 256
+    read_only_tools: list[str] = field(default_factory=list)
+    trust_annotations: bool = True
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | bool | None) -> "MCPResultCacheConfig":
+        """Create MCPResultCacheConfig from a dictionary.
+
+        ``true``/``false`` are accepted as shorthand for enabling the cache
+        with default settings.
+
+        Args:
+            data: The ``result_cache`` value from a server definition.
+
+        Returns:
+            MCPResultCacheConfig instance.
+        """
+        if data is None:
+            return cls()
+        if isinstance(data, bool):
+            return cls(enabled=data)
+        return cls(
+            enabled=data.get("enabled", True),
+            ttl=float(data.get("ttl", 300.0)),
+            max_size=int(data.get("max_size", 256)),
+            read_only_tools=data.get("read_only_tools", []),
+            trust_annotations=data.get("trust_annotations", True),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a dictionary for saving."""
+        return {
+            "enabled": self.enabled,
+            "ttl": self.ttl,
+            "max_size": self.max_size,
+            **(
+                {"read_only_tools": self.read_only_tools}
+                if self.read_only_tools
+                else {}
+            ),
+            **({"trust_annotations": False} if not self.trust_annotations else {}),
+        }
+
+    def is_cacheable(self, tool_name: str, read_only_hint: bool = False) -> bool:
+        """Check whether results of a tool may be cached.
+
+        Args:
+            tool_name: Original (unprefixed) tool name.
+            read_only_hint: Whether the server annotated the tool read-only.
+
+        Returns:
+            True if caching is enabled and the tool is considered read-only.
+        """
+        if not self.enabled:
+            return False
+        if tool_name in self.read_only_tools:
+            return True
+        return self.trust_annotations and read_only_hint
+
+
 @dataclass
 class MCPServerConfig:
     """Configuration for a single MCP server.
@@ -87,6 +167,7 @@ class MCPServerConfig:
         cache: Whether to cache tool schemas.
         setup_command: Optional command to run server's auth/setup flow.
         credentials_path: Optional path where server stores credentials.
+        result_cache: Opt-in caching of read-only tool call results.
     """
 
     name: str
@@ -100,6 +181,7 @@ class MCPServerConfig:
     setup_args: list[str] = field(default_factory=list)
     # Optional: path to check if credentials exist
     credentials_path: str | None = None
+    result_cache: MCPResultCacheConfig = field(default_factory=MCPResultCacheConfig)
 
     @classmethod
     def from_dict(cls, name: str, data: dict[str, Any]) -> "MCPServerConfig":
@@ -122,6 +204,7 @@ class MCPServerConfig:
             setup_command=data.get("setup_command"),
             setup_args=data.get("setup_args", []),
             credentials_path=data.get("credentials_path"),
+            result_cache=MCPResultCacheConfig.from_dict(data.get("result_cache")),
         )
 
     def needs_setup(self) -> bool:
@@ -326,6 +409,11 @@ def save_mcp_config(
                     if srv.credentials_path
                     else {}
                 ),
+                **(
+                    {"result_cache": srv.result_cache.to_dict()}
+                    if srv.result_cache.enabled
+                    else {}
+                ),
             }
             for name, srv in config.servers.items()
         }
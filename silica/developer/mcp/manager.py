@@ -7,7 +7,7 @@ interface for tool discovery and invocation across all connected servers.
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from silica.developer.mcp.client import (
     MCPClient,
@@ -18,6 +18,14 @@ from silica.developer.mcp.client import (
     MCPToolInfo,
 )
 from silica.developer.mcp.config import MCPConfig, MCPServerConfig
+from silica.developer.mcp.result_cache import (
+    ResultCacheStats,
+    ToolResultCache,
+    make_cache_key,
+)
+
+if TYPE_CHECKING:
+    from silica.developer.mcp.schema_cache import MCPSchemaCache
 
 __all__ = ["MCPToolManager", "ServerStatus"]
 
@@ -40,6 +48,11 @@ class ServerStatus:
     needs_setup: bool = False  # True if credentials_path is set but doesn't exist
     enabled: bool = True  # Whether server auto-connects at startup
     error: str | None = None
+    # True if tools are served from the schema cache and the server process
+    # will only be started on the first call to one of its tools
+    pending: bool = False
+    # Tool result cache counters (None if result caching is off)
+    result_cache: ResultCacheStats | None = None
 
 
 @dataclass
@@ -62,13 +75,27 @@ class MCPToolManager:
         async with MCPToolManager() as manager:
             await manager.connect_servers(config)
             ...
+
+    With a schema cache, servers whose tool schemas are already cached on
+    disk can be registered lazily: their tools are exposed immediately and
+    the server process is only spawned on the first call_tool:
+        manager = MCPToolManager(schema_cache=MCPSchemaCache())
+        await manager.connect_servers(config, lazy=True)
     """
 
+    schema_cache: "MCPSchemaCache | None" = None
     _clients: dict[str, MCPClient] = field(default_factory=dict, init=False)
     _tool_to_server: dict[str, str] = field(default_factory=dict, init=False)
     _config: MCPConfig | None = field(default=None, init=False)
-
-    async def connect_servers(self, config: MCPConfig) -> dict[str, str | None]:
+    # Servers registered from the schema cache that have not been started yet
+    _pending: set[str] = field(default_factory=set, init=False)
+    _start_locks: dict[str, asyncio.Lock] = field(default_factory=dict, init=False)
+    _background_tasks: set[asyncio.Task] = field(default_factory=set, init=False)
+    _result_caches: dict[str, ToolResultCache] = field(default_factory=dict, init=False)
+
+    async def connect_servers(
+        self, config: MCPConfig, lazy: bool = False
+    ) -> dict[str, str | None]:
         """Connect to all enabled servers in the configuration.
 
         Connections are attempted in parallel. Servers that fail to connect
@@ -76,6 +103,10 @@ class MCPToolManager:
 
         Args:
             config: MCP configuration with server definitions.
+            lazy: If True and a schema cache is configured, servers with
+                cached tool schemas are registered without being started.
+                They are started on the first call to one of their tools.
+                Servers configured with ``cache=False`` always start.
 
         Returns:
             Dictionary mapping server names to error messages (None if successful).
@@ -89,18 +120,43 @@ class MCPToolManager:
 
         results: dict[str, str | None] = {}
 
+        if lazy and self.schema_cache is not None:
+            for name, server_config in list(enabled.items()):
+                if name in self._clients or not server_config.cache:
+                    continue
+                cached_tools = self.schema_cache.get(server_config)
+                if cached_tools is None:
+                    continue
+                client = MCPClient(
+                    config=server_config, on_tools_changed=self._on_tools_changed
+                )
+                client.seed_tools(cached_tools)
+                self._clients[name] = client
+                self._pending.add(name)
+                for tool in cached_tools:
+                    self._tool_to_server[tool.name] = name
+                logger.info(
+                    f"Registered MCP server '{name}' from schema cache "
+                    f"with {len(cached_tools)} tools (deferred start)"
+                )
+                results[name] = None
+                del enabled[name]
+
         # Connect to servers in parallel
         async def connect_one(
             name: str, server_config: MCPServerConfig
         ) -> tuple[str, str | None]:
             try:
-                client = MCPClient(config=server_config)
+                client = MCPClient(
+                    config=server_config, on_tools_changed=self._on_tools_changed
+                )
                 await client.connect()
                 self._clients[name] = client
 
                 # Update tool-to-server mapping
                 for tool in client.tools:
                     self._tool_to_server[tool.name] = name
+                self._store_schemas(client)
 
                 logger.info(
                     f"Connected to MCP server '{name}' with {len(client.tools)} tools"
@@ -155,13 +211,16 @@ class MCPToolManager:
 
         for attempt in range(max_retries):
             try:
-                client = MCPClient(config=server_config)
+                client = MCPClient(
+                    config=server_config, on_tools_changed=self._on_tools_changed
+                )
                 await client.connect()
                 self._clients[server_name] = client
 
                 # Update tool-to-server mapping
                 for tool in client.tools:
                     self._tool_to_server[tool.name] = server_name
+                self._store_schemas(client)
 
                 logger.info(
                     f"Connected to MCP server '{server_name}' with {len(client.tools)} tools"
@@ -193,6 +252,130 @@ class MCPToolManager:
             f"Failed to connect to MCP server '{server_name}' after {max_retries} attempts: {last_error}"
         ) from last_error
 
+    async def _ensure_started(self, server_name: str) -> None:
+        """Start a server that was registered lazily from the schema cache.
+
+        Concurrent callers share a single start. The cached schemas stay in
+        use for the call that triggered the start; a background refresh then
+        reconciles them with the live server.
+
+        Args:
+            server_name: Name of the server to start.
+
+        Raises:
+            MCPConnectionError: If the server fails to start.
+        """
+        if server_name not in self._pending:
+            return
+
+        lock = self._start_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            if server_name not in self._pending:
+                return
+            client = self._clients[server_name]
+            logger.info(f"Starting deferred MCP server '{server_name}'")
+            await client.connect(fetch_tools=False)
+            self._pending.discard(server_name)
+
+        self._schedule_refresh(server_name)
+
+    def _schedule_refresh(self, server_name: str) -> None:
+        """Refresh a server's tool schemas in a background task."""
+        try:
+            task = asyncio.get_running_loop().create_task(
+                self._refresh_server_tools(server_name)
+            )
+        except RuntimeError:
+            return
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _on_tools_changed(self, server_name: str) -> None:
+        """Handle a tools/list_changed notification from a server."""
+        if server_name in self._clients and server_name not in self._pending:
+            self._schedule_refresh(server_name)
+
+    async def _refresh_server_tools(self, server_name: str) -> list[MCPToolInfo]:
+        """Fetch a server's live tool list and reconcile mapping and cache.
+
+        Tools that disappeared from the server are removed from the
+        tool-to-server mapping, and the on-disk schema cache is rewritten
+        if the tool list or server version changed.
+
+        Args:
+            server_name: Name of a connected server.
+
+        Returns:
+            The server's current tool list (empty on failure).
+        """
+        client = self._clients.get(server_name)
+        if client is None:
+            return []
+
+        try:
+            tools = await client.list_tools(force_refresh=True)
+        except Exception as e:
+            logger.warning(f"Failed to refresh tools from '{server_name}': {e}")
+            return []
+
+        current = {tool.name for tool in tools}
+        for tool_name, srv in list(self._tool_to_server.items()):
+            if srv == server_name and tool_name not in current:
+                del self._tool_to_server[tool_name]
+        for tool in tools:
+            self._tool_to_server[tool.name] = server_name
+
+        if self._store_schemas(client):
+            logger.info(
+                f"Tool schemas for MCP server '{server_name}' changed, cache updated"
+            )
+        return tools
+
+    def _store_schemas(self, client: MCPClient) -> bool:
+        """Persist a connected client's tools to the schema cache.
+
+        Servers configured with ``cache=False`` are never written.
+
+        Returns:
+            True if the cached entry changed.
+        """
+        if self.schema_cache is None or not client.config.cache or not client.tools:
+            return False
+        version = client.server_version
+        changed = self.schema_cache.set(
+            client.config,
+            client.tools,
+            server_version=str(version) if version is not None else None,
+        )
+        if changed and client.server_name in self._result_caches:
+            # Results produced by a different tool set may no longer be valid
+            self._result_caches[client.server_name].clear()
+        return changed
+
+    def _get_result_cache(
+        self, server_name: str, tool: MCPToolInfo
+    ) -> ToolResultCache | None:
+        """Get (or create) the result cache to use for a call to a tool.
+
+        Returns:
+            The server's ToolResultCache, or None if result caching is not
+            enabled for the server or the tool is not considered read-only.
+        """
+        server_config = self._config.servers.get(server_name) if self._config else None
+        if server_config is None or not server_config.result_cache.is_cacheable(
+            tool.original_name, tool.read_only
+        ):
+            return None
+
+        cache = self._result_caches.get(server_name)
+        if cache is None:
+            cache = ToolResultCache(
+                ttl=server_config.result_cache.ttl,
+                max_size=server_config.result_cache.max_size,
+            )
+            self._result_caches[server_name] = cache
+        return cache
+
     async def disconnect_server(self, server_name: str) -> None:
         """Disconnect from a specific server.
 
@@ -215,10 +398,16 @@ class MCPToolManager:
 
         await client.disconnect()
         del self._clients[server_name]
+        self._pending.discard(server_name)
+        self._result_caches.pop(server_name, None)
         logger.info(f"Disconnected from MCP server '{server_name}'")
 
     async def disconnect_all(self) -> None:
         """Disconnect from all connected servers."""
+        for task in list(self._background_tasks):
+            task.cancel()
+        self._background_tasks.clear()
+
         server_names = list(self._clients.keys())
         for name in server_names:
             try:
@@ -241,9 +430,14 @@ class MCPToolManager:
 
         for name, client in self._clients.items():
             try:
-                # For servers with cache disabled, always refresh
-                should_refresh = force_refresh or not client.config.cache
-                tools = await client.list_tools(force_refresh=should_refresh)
+                if name in self._pending and not force_refresh:
+                    # Serve cached schemas without starting the server
+                    tools = client.tools
+                else:
+                    await self._ensure_started(name)
+                    # For servers with cache disabled, always refresh
+                    should_refresh = force_refresh or not client.config.cache
+                    tools = await client.list_tools(force_refresh=should_refresh)
 
                 # Update tool-to-server mapping
                 for tool in tools:
@@ -274,6 +468,10 @@ class MCPToolManager:
         Returns:
             Tool execution result.
 
+        Results of tools the server's result_cache config treats as
+        read-only are served from a per-server cache, and concurrent
+        identical calls share a single server round trip.
+
         Raises:
             MCPToolError: If tool not found or invocation fails.
         """
@@ -293,8 +491,34 @@ class MCPToolManager:
                 f"Tool '{prefixed_tool_name}' not found on server '{server_name}'"
             )
 
+        result_cache = self._get_result_cache(server_name, tool)
+        if result_cache is not None:
+            return await result_cache.get_or_call(
+                make_cache_key(tool.original_name, arguments),
+                lambda: self._invoke_tool(
+                    server_name, tool.original_name, arguments, auto_reconnect
+                ),
+            )
+
+        return await self._invoke_tool(
+            server_name, tool.original_name, arguments, auto_reconnect
+        )
+
+    async def _invoke_tool(
+        self,
+        server_name: str,
+        tool_name: str,
+        arguments: dict[str, Any],
+        auto_reconnect: bool,
+    ) -> Any:
+        """Call a tool on a server, restarting the server if it crashed."""
+        client = self._clients[server_name]
+
+        # Spawn the server now if it was registered from the schema cache
+        await self._ensure_started(server_name)
+
         try:
-            return await client.call_tool(tool.original_name, arguments)
+            return await client.call_tool(tool_name, arguments)
         except MCPServerCrashedError as e:
             if auto_reconnect:
                 logger.warning(
@@ -305,7 +529,7 @@ class MCPToolManager:
                     # Retry the tool call after reconnect
                     client = self._clients.get(server_name)
                     if client:
-                        return await client.call_tool(tool.original_name, arguments)
+                        return await client.call_tool(tool_name, arguments)
                 except MCPConnectionError as reconnect_error:
                     raise MCPToolError(
                         f"Server '{server_name}' crashed and reconnection failed: {reconnect_error}"
@@ -332,6 +556,7 @@ class MCPToolManager:
         if not client:
             raise MCPToolError(f"Server '{server_name}' not connected")
 
+        await self._ensure_started(server_name)
         return await client.call_tool(tool_name, arguments)
 
     def get_server_for_tool(self, prefixed_tool_name: str) -> str | None:
@@ -371,10 +596,12 @@ class MCPToolManager:
 
         for name, client in clients:
             try:
+                await self._ensure_started(name)
                 tools = await client.list_tools(force_refresh=True)
                 # Update mapping
                 for tool in tools:
                     self._tool_to_server[tool.name] = name
+                self._store_schemas(client)
                 logger.info(f"Refreshed {len(tools)} tools from server '{name}'")
             except Exception as e:
                 logger.warning(f"Failed to refresh tools from '{name}': {e}")
@@ -437,6 +664,16 @@ class MCPToolManager:
                     needs_setup=server_config.needs_setup(),
                     enabled=server_config.enabled,
                     error=None,
+                    pending=name in self._pending,
+                    result_cache=(
+                        self._result_caches[name].stats
+                        if name in self._result_caches
+                        else (
+                            ResultCacheStats()
+                            if server_config.result_cache.enabled
+                            else None
+                        )
+                    ),
                 )
             )
 
@@ -506,6 +743,7 @@ class MCPToolManager:
         results = {}
         for name, client in self._clients.items():
             try:
+                await self._ensure_started(name)
                 await client.list_tools(force_refresh=True)
                 results[name] = True
             except Exception as e:
@@ -0,0 +1,150 @@
+"""Result caching and request coalescing for read-only MCP tool calls.
+
+Parallel tool_uses in a single turn, and repeated turns, frequently issue
+identical read-only calls (search, fetch, list) against slow remote-backed
+servers. ToolResultCache keeps recent results for a configurable TTL and
+shares a single in-flight server round trip between concurrent identical
+calls.
+
+Errors are never cached: a failed call is propagated to every caller that
+was waiting on it, and the next call goes to the server again.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+__all__ = ["ResultCacheStats", "ToolResultCache", "make_cache_key"]
+
+
+def make_cache_key(tool_name: str, arguments: dict[str, Any]) -> str:
+    """Build a cache key from a tool name and its arguments.
+
+    Arguments are serialized with sorted keys so that equivalent argument
+    dictionaries map to the same key regardless of insertion order.
+    """
+    return f"{tool_name}:{json.dumps(arguments, sort_keys=True, default=str)}"
+
+
+@dataclass
+class ResultCacheStats:
+    """Counters for a server's result cache."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0  # Calls that joined an identical in-flight request
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of calls served without a new server round trip."""
+        total = self.hits + self.coalesced + self.misses
+        if total == 0:
+            return 0.0
+        return (self.hits + self.coalesced) / total
+
+
+class ToolResultCache:
+    """TTL + LRU cache of tool results with in-flight request coalescing."""
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_size: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a cached result stays valid.
+            max_size: Maximum number of cached results.
+            clock: Monotonic time source (overridable for tests).
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._stats = ResultCacheStats()
+
+    async def get_or_call(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a cached result for ``key`` or compute it with ``call``.
+
+        If an identical call is already in flight, wait for its result
+        instead of issuing another request. If that call is cancelled, the
+        waiters are not: one of them makes the call instead.
+
+        Args:
+            key: Cache key (see make_cache_key).
+            call: Coroutine factory performing the actual server call.
+
+        Returns:
+            The tool result.
+        """
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if self._clock() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return value
+                del self._entries[key]
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                break
+            self._stats.coalesced += 1
+            # asyncio.wait neither cancels the shared call when this waiter
+            # is cancelled nor raises when the call's own caller was
+            await asyncio.wait({in_flight})
+            if not in_flight.cancelled():
+                return in_flight.result()
+
+        self._stats.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+                # Mark retrieved so an unobserved failure is not logged
+                future.exception()
+            raise
+        else:
+            self._store(key, value)
+            if not future.done():
+                future.set_result(value)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
+
+    def _store(self, key: str, value: Any) -> None:
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached results (in-flight calls are unaffected)."""
+        self._entries.clear()
+
+    @property
+    def stats(self) -> ResultCacheStats:
+        """Snapshot of the cache counters."""
+        return ResultCacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            coalesced=self._stats.coalesced,
+            evictions=self._stats.evictions,
+            size=len(self._entries),
+        )
@@ -0,0 +1,237 @@
+"""Persistent on-disk cache of MCP server tool schemas.
+
+Spawning every configured MCP server and running ``list_tools`` before the
+first prompt is the dominant startup cost when several servers are
+configured. This cache stores each server's tool list on disk so that tool
+schemas can be exposed to the model immediately, and the server process is
+only started when one of its tools is actually called.
+
+Cache location: ~/.silica/cache/mcp-schemas/
+Cache key: SHA-256 of the server's launch identity (command, args, env)
+Cache value: {"server_name", "server_version", "fingerprint", "tools", ...}
+
+Entries are invalidated implicitly when the launch identity changes (a new
+key is computed) and explicitly when a refresh observes a different tool
+list or server version.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+from silica.developer.mcp.client import MCPToolInfo
+from silica.developer.mcp.config import MCPServerConfig
+
+__all__ = ["MCPSchemaCache", "tools_fingerprint"]
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk entry format changes so stale entries are ignored
+CACHE_FORMAT_VERSION = 1
+
+
+def tools_fingerprint(tools: list[MCPToolInfo]) -> str:
+    """Compute a stable fingerprint for a tool list.
+
+    Args:
+        tools: Tools to fingerprint.
+
+    Returns:
+        Hex digest that changes whenever any tool name, description or
+        input schema changes.
+    """
+    payload = sorted(
+        (
+            {
+                "name": tool.original_name,
+                "description": tool.description,
+                "input_schema": tool.input_schema,
+                "read_only": tool.read_only,
+            }
+            for tool in tools
+        ),
+        key=lambda t: t["name"],
+    )
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+class MCPSchemaCache:
+    """Disk-backed cache of tool schemas, one JSON file per server.
+
+    File structure:
+        ~/.silica/cache/mcp-schemas/<sha256_of_launch_identity>.json
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize the schema cache.
+
+        Args:
+            cache_dir: Optional cache directory. If None, uses default
+                      (~/.silica/cache/mcp-schemas/)
+        """
+        if cache_dir is None:
+            cache_dir = Path.home() / ".silica" / "cache" / "mcp-schemas"
+
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def cache_key(config: MCPServerConfig) -> str:
+        """Compute the cache key for a server configuration.
+
+        The key covers everything that determines which server binary is
+        launched and how, so changing the command, its arguments (which
+        typically pin the package version, e.g. ``pkg@1.2.3``) or its
+        environment yields a fresh entry.
+
+        Args:
+            config: Server configuration.
+
+        Returns:
+            Hex digest used as the cache filename.
+        """
+        identity = {
+            "format": CACHE_FORMAT_VERSION,
+            "name": config.name,
+            "command": config.command,
+            "args": list(config.args),
+            "env": dict(sorted(config.env.items())),
+        }
+        return hashlib.sha256(json.dumps(identity, sort_keys=True).encode()).hexdigest()
+
+    def _get_cache_path(self, config: MCPServerConfig) -> Path:
+        return self.cache_dir / f"{self.cache_key(config)}.json"
+
+    def _read_entry(self, config: MCPServerConfig) -> dict[str, Any] | None:
+        cache_path = self._get_cache_path(config)
+        if not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path) as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if entry.get("format") != CACHE_FORMAT_VERSION:
+            return None
+        if entry.get("server_name") != config.name:
+            return None
+        return entry
+
+    def get(self, config: MCPServerConfig) -> list[MCPToolInfo] | None:
+        """Load cached tools for a server.
+
+        Args:
+            config: Server configuration.
+
+        Returns:
+            List of cached tools, or None if there is no valid entry.
+        """
+        entry = self._read_entry(config)
+        if entry is None:
+            return None
+
+        try:
+            return [
+                MCPToolInfo(
+                    name=tool["name"],
+                    description=tool.get("description", ""),
+                    input_schema=tool.get("input_schema", {"type": "object"}),
+                    server_name=config.name,
+                    original_name=tool["original_name"],
+                    read_only=tool.get("read_only", False),
+                )
+                for tool in entry.get("tools", [])
+            ]
+        except (KeyError, TypeError):
+            return None
+
+    def get_server_version(self, config: MCPServerConfig) -> str | None:
+        """Get the server version recorded alongside the cached tools."""
+        entry = self._read_entry(config)
+        return entry.get("server_version") if entry else None
+
+    def get_fingerprint(self, config: MCPServerConfig) -> str | None:
+        """Get the fingerprint of the cached tool list."""
+        entry = self._read_entry(config)
+        return entry.get("fingerprint") if entry else None
+
+    def set(
+        self,
+        config: MCPServerConfig,
+        tools: list[MCPToolInfo],
+        server_version: str | None = None,
+    ) -> bool:
+        """Store the tool list for a server.
+
+        Args:
+            config: Server configuration.
+            tools: Tools reported by the server.
+            server_version: Version reported in the server's initialize result.
+
+        Returns:
+            True if the stored entry changed (new tools, new server version,
+            or no previous entry), False if it was already up to date.
+        """
+        fingerprint = tools_fingerprint(tools)
+        existing = self._read_entry(config)
+        if (
+            existing is not None
+            and existing.get("fingerprint") == fingerprint
+            and existing.get("server_version") == server_version
+        ):
+            return False
+
+        entry = {
+            "format": CACHE_FORMAT_VERSION,
+            "server_name": config.name,
+            "command": config.command,
+            "args": list(config.args),
+            "server_version": server_version,
+            "fingerprint": fingerprint,
+            "updated_at": time.time(),
+            "tools": [
+                {
+                    "name": tool.name,
+                    "original_name": tool.original_name,
+                    "description": tool.description,
+                    "input_schema": tool.input_schema,
+                    "read_only": tool.read_only,
+                }
+                for tool in tools
+            ],
+        }
+
+        cache_path = self._get_cache_path(config)
+        tmp_path = cache_path.with_suffix(".json.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f)
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            # If cache write fails, just continue without caching
+            logger.debug(f"Failed to write MCP schema cache for '{config.name}': {e}")
+        return True
+
+    def invalidate(self, config: MCPServerConfig) -> None:
+        """Remove the cached entry for a server."""
+        try:
+            self._get_cache_path(config).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        if not self.cache_dir.exists():
+            return
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
@@ -413,7 +413,11 @@ class MemoryManager:
     _REFERENCE_RE = re.compile(r"^\s*@([\w/._-]+)\s*$", re.MULTILINE)
 
     def render_content(
-        self, content: str, max_depth: int = 3, _visited: set | None = None
+        self,
+        content: str,
+        max_depth: int = 3,
+        _visited: set | None = None,
+        dependencies: set | None = None,
     ) -> str:
         """Resolve @path/to/entry references in text content.
 
@@ -426,6 +430,8 @@ class MemoryManager:
             content: Text that may contain @references (one per line).
             max_depth: Maximum nesting depth (default 3).
             _visited: Paths already on the resolution stack (internal).
+            dependencies: If given, every referenced entry path (found or
+                not) is added to it, so callers can tell when to re-render.
 
         Returns:
             Content with references replaced by entry contents.
@@ -442,6 +448,8 @@ class MemoryManager:
             if max_depth <= 0:
                 return f"<!-- @{ref_path}: max depth exceeded -->"
 
+            if dependencies is not None:
+                dependencies.add(ref_path)
             entry = self.read_entry(ref_path)
             if not entry.get("success") or entry.get("type") != "file":
                 return f"<!-- @{ref_path}: not found -->"
@@ -455,6 +463,7 @@ class MemoryManager:
                 entry_content,
                 max_depth=max_depth - 1,
                 _visited=_visited | {ref_path},
+                dependencies=dependencies,
             )
 
         return self._REFERENCE_RE.sub(_replace, content)
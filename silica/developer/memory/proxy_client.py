@@ -6,6 +6,8 @@ memory entries, history files, and persona definitions.
 """
 
 import logging
+import threading
+import time
 from datetime import datetime
 from typing import Tuple
 from urllib.parse import quote
@@ -15,6 +17,16 @@ from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Proxy responses that mean "slow down and try again"
+BACKOFF_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Methods that can be repeated without applying a change twice
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+
+# Headers of conditional writes: once such a write is applied, a repeat of
+# it fails its precondition instead of applying again
+PRECONDITION_HEADERS = ("If-Match-Version", "X-Append-Offset")
+
 
 class FileMetadata(BaseModel):
     """Metadata for a file in the memory proxy."""
@@ -24,6 +36,10 @@ class FileMetadata(BaseModel):
     size: int
     version: int
     is_deleted: bool = False
+    # Client-side only: size and MD5 of the local (uncompressed) file this
+    # entry was last synced from, used to detect appended data
+    local_size: int | None = None
+    local_md5: str | None = None
 
 
 class SyncIndexResponse(BaseModel):
@@ -32,6 +48,8 @@ class SyncIndexResponse(BaseModel):
     files: dict[str, FileMetadata]
     index_last_modified: datetime
     index_version: int
+    # Set when files only holds the entries changed since this index_version
+    since: int | None = None
 
 
 class MemoryProxyError(Exception):
@@ -61,6 +79,119 @@ class NotFoundError(MemoryProxyError):
     """File not found (404)."""
 
 
+class AdaptiveBackoff:
+    """Back-off delay shared by every request of one or more clients.
+
+    Each throttled (429) or failed (5xx) response doubles the delay and
+    pauses all requests sharing this object until it has passed, so a pool
+    of concurrent workers slows down together instead of hammering an
+    overloaded proxy. Each success halves the delay again.
+
+    Args:
+        initial: Delay in seconds after the first failure
+        maximum: Upper bound of the delay in seconds
+    """
+
+    def __init__(self, initial: float = 0.5, maximum: float = 30.0):
+        self.initial = initial
+        self.maximum = maximum
+        self.delay = 0.0
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Sleep until requests may be sent again."""
+        while True:
+            with self._lock:
+                remaining = self._resume_at - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+    def failure(self, retry_after: float | None = None) -> float:
+        """Record a throttled or failed response; returns the pause in seconds."""
+        with self._lock:
+            self.delay = min(self.maximum, max(self.initial, self.delay * 2))
+            pause = self.delay
+            if retry_after is not None:
+                pause = min(self.maximum, max(pause, retry_after))
+            self._resume_at = max(self._resume_at, time.monotonic() + pause)
+            return pause
+
+    def success(self) -> None:
+        """Record a successful response."""
+        with self._lock:
+            self.delay = self.delay / 2 if self.delay > self.initial else 0.0
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header given in seconds."""
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return None
+
+
+def _can_retry(request: httpx.Request, status_code: int) -> bool:
+    """Return True if repeating ``request`` cannot apply a change twice.
+
+    A throttled request was not processed. After a server error a write
+    may have been applied, so it is only repeated if it is conditional.
+    """
+    return (
+        status_code == 429
+        or request.method in IDEMPOTENT_METHODS
+        or any(header in request.headers for header in PRECONDITION_HEADERS)
+    )
+
+
+class BackoffTransport(httpx.BaseTransport):
+    """Transport that retries throttled and failed proxy responses.
+
+    Wraps a pooled ``httpx.HTTPTransport`` (which retries connection
+    errors) and retries responses in ``BACKOFF_STATUSES`` up to
+    ``max_attempts`` times, pausing on the shared ``AdaptiveBackoff``
+    between attempts. Server errors are only retried for requests that
+    are safe to repeat (see ``_can_retry``). Every request also waits out
+    a pause started by another request.
+
+    Args:
+        backoff: Shared back-off state
+        max_attempts: Attempts per request, including the first
+        **kwargs: Passed to ``httpx.HTTPTransport``
+    """
+
+    def __init__(self, backoff: AdaptiveBackoff, max_attempts: int = 5, **kwargs):
+        self.backoff = backoff
+        self.max_attempts = max_attempts
+        self._transport = httpx.HTTPTransport(**kwargs)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 1
+        while True:
+            self.backoff.wait()
+            response = self._transport.handle_request(request)
+            if response.status_code not in BACKOFF_STATUSES:
+                self.backoff.success()
+                return response
+
+            pause = self.backoff.failure(_retry_after(response))
+            if attempt >= self.max_attempts or not _can_retry(
+                request, response.status_code
+            ):
+                return response
+            response.close()
+            logger.warning(
+                f"Memory proxy returned {response.status_code} for "
+                f"{request.method} {request.url.path}; retrying in {pause:.1f}s "
+                f"(attempt {attempt}/{self.max_attempts})"
+            )
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
 class MemoryProxyClient:
     """HTTP client for Memory Proxy service.
 
@@ -78,22 +209,37 @@ class MemoryProxyClient:
         token: str,
         timeout: int = 30,
         max_retries: int = 3,
+        max_connections: int = 10,
+        backoff: AdaptiveBackoff | None = None,
     ):
         """Initialize the memory proxy client.
 
+        The client is thread-safe: concurrent callers share its connection
+        pool and back-off state.
+
         Args:
             base_url: Base URL of the memory proxy service
             token: Authentication token
             timeout: Request timeout in seconds (default: 30)
             max_retries: Maximum number of retries for failed requests (default: 3)
+            max_connections: Size of the connection pool (default: 10)
+            backoff: Back-off state to share with other clients
         """
         self.base_url = base_url.rstrip("/")
         self.token = token
         self.timeout = timeout
         self.max_retries = max_retries
-
-        # Create httpx client with retries
-        transport = httpx.HTTPTransport(retries=max_retries)
+        self.backoff = backoff or AdaptiveBackoff()
+
+        # Create httpx client with retries and back-off on 429/5xx
+        transport = BackoffTransport(
+            self.backoff,
+            retries=max_retries,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
         self.client = httpx.Client(
             transport=transport,
             timeout=timeout,
@@ -183,6 +329,80 @@ class MemoryProxyClient:
             logger.error(f"Request failed: {e}")
             raise ConnectionError(f"Failed to connect to memory proxy: {e}") from e
 
+    def read_blob_after(
+        self, namespace: str, path: str, offset: int, prefix_md5: str
+    ) -> Tuple[bytes, str, datetime, str, int, int]:
+        """Read the part of a blob after a prefix the caller already has.
+
+        Used for append-only files: if the remote blob starts with the
+        caller's ``offset`` bytes hashing to ``prefix_md5``, only the bytes
+        after them are transferred. Otherwise (or with a proxy that does not
+        support this) the whole blob is returned.
+
+        Args:
+            namespace: Namespace (persona name, can include slashes)
+            path: File path within namespace
+            offset: Size of the caller's copy of the blob
+            prefix_md5: MD5 of the caller's copy of the blob
+
+        Returns:
+            Tuple of (content, md5, last_modified, content_type, version,
+            content_offset), where content_offset is ``offset`` if content is
+            only the tail and 0 if it is the whole blob. md5 is always that
+            of the whole blob.
+
+        Raises:
+            NotFoundError: If file doesn't exist
+            ConnectionError: If request fails
+            AuthenticationError: If authentication fails
+        """
+        encoded_namespace = quote(namespace, safe="")
+        encoded_path = quote(path, safe="")
+        url = f"{self.base_url}/{encoded_namespace}/blob/{encoded_path}"
+        headers = {"X-Prefix-Length": str(offset), "X-Prefix-MD5": prefix_md5}
+
+        try:
+            response = self.client.get(url, headers=headers)
+
+            if response.status_code == 200:
+                content = response.content
+                md5 = response.headers.get("ETag", "").strip('"')
+                last_modified = datetime.strptime(
+                    response.headers.get("Last-Modified", ""),
+                    "%a, %d %b %Y %H:%M:%S %Z",
+                )
+                content_type = response.headers.get("Content-Type", "")
+                version = int(response.headers.get("X-Version", "0"))
+                content_offset = int(response.headers.get("X-Content-Offset", "0"))
+
+                logger.debug(
+                    f"Read blob: {namespace}/{path} (version={version}, "
+                    f"offset={content_offset}, size={len(content)})"
+                )
+                return (
+                    content,
+                    md5,
+                    last_modified,
+                    content_type,
+                    version,
+                    content_offset,
+                )
+
+            elif response.status_code == 404:
+                raise NotFoundError(f"File not found: {namespace}/{path}")
+
+            elif response.status_code == 401:
+                raise AuthenticationError("Invalid authentication token")
+
+            else:
+                raise MemoryProxyError(
+                    f"Failed to read blob: {response.status_code} {response.text}"
+                )
+
+        except httpx.RequestError as e:
+            logger.error(f"Request failed: {e}")
+            raise ConnectionError(f"Failed to connect to memory proxy: {e}") from e
+
     def write_blob(
         self,
         namespace: str,
@@ -206,8 +426,7 @@ class MemoryProxyClient:
 
         Returns:
             Tuple of (is_new, md5, version, sync_index)
-            The sync_index contains the full manifest after the write,
-            allowing immediate staleness detection without an extra round-trip.
+            The sync_index holds the written file's entry.
 
         Raises:
             VersionConflictError: If version doesn't match (412)
@@ -273,6 +492,91 @@ class MemoryProxyClient:
             logger.error(f"Request failed: {e}")
             raise ConnectionError(f"Failed to connect to memory proxy: {e}") from e
 
+    def append_blob(
+        self,
+        namespace: str,
+        path: str,
+        segment: bytes,
+        offset: int,
+        prefix_md5: str,
+        expected_version: int | None = None,
+        content_md5: str | None = None,
+    ) -> Tuple[str, int, SyncIndexResponse]:
+        """Append a segment to a blob.
+
+        The proxy only applies the segment if the blob is exactly the prefix
+        it was built on (``offset`` bytes with MD5 ``prefix_md5``), so callers
+        can fall back to write_blob on any error.
+
+        Args:
+            namespace: Namespace (persona name, can include slashes)
+            path: File path within namespace
+            segment: Bytes to append
+            offset: Size of the blob the segment follows
+            prefix_md5: MD5 of the blob the segment follows
+            expected_version: Optional expected version of the blob
+            content_md5: Optional MD5 of the segment for validation
+
+        Returns:
+            Tuple of (md5, version, sync_index)
+            The sync_index holds the blob's new entry.
+
+        Raises:
+            VersionConflictError: If the blob is not the expected prefix (412)
+            ConnectionError: If request fails
+            AuthenticationError: If authentication fails
+        """
+        encoded_namespace = quote(namespace, safe="")
+        encoded_path = quote(path, safe="")
+        url = f"{self.base_url}/{encoded_namespace}/blob/{encoded_path}"
+
+        headers = {"X-Append-Offset": str(offset), "X-Prefix-MD5": prefix_md5}
+        if expected_version is not None:
+            headers["If-Match-Version"] = str(expected_version)
+        if content_md5:
+            headers["Content-MD5"] = content_md5
+
+        try:
+            response = self.client.patch(url, content=segment, headers=headers)
+
+            if response.status_code == 200:
+                md5 = response.headers.get("ETag", "").strip('"')
+                version = int(response.headers.get("X-Version", "0"))
+                sync_index = SyncIndexResponse(**response.json())
+
+                logger.info(
+                    f"Appended to blob: {namespace}/{path} (version={version}, "
+                    f"segment={response.headers.get('X-Segment', '?')}, "
+                    f"size={len(segment)})"
+                )
+                return md5, version, sync_index
+
+            elif response.status_code == 412:
+                error_data = response.json()
+                context = error_data.get("context", {})
+                current_version_str = context.get("current_version", "unknown")
+                current_version = (
+                    int(current_version_str) if current_version_str.isdigit() else None
+                )
+
+                raise VersionConflictError(
+                    error_data.get("detail", "Version conflict"),
+                    current_version=current_version,
+                    provided_version=expected_version or 0,
+                )
+
+            elif response.status_code == 401:
+                raise AuthenticationError("Invalid authentication token")
+
+            else:
+                raise MemoryProxyError(
+                    f"Failed to append to blob: {response.status_code} {response.text}"
+                )
+
+        except httpx.RequestError as e:
+            logger.error(f"Request failed: {e}")
+            raise ConnectionError(f"Failed to connect to memory proxy: {e}") from e
+
     def delete_blob(
         self, namespace: str, path: str, expected_version: int | None = None
     ) -> Tuple[int, SyncIndexResponse]:
@@ -285,8 +589,7 @@ class MemoryProxyClient:
 
         Returns:
             Tuple of (new_version, sync_index)
-            The sync_index contains the full manifest after the delete,
-            allowing immediate staleness detection without an extra round-trip.
+            The sync_index holds the deleted file's tombstone entry.
 
         Raises:
             NotFoundError: If file doesn't exist
@@ -350,7 +653,9 @@ class MemoryProxyClient:
             logger.error(f"Request failed: {e}")
             raise ConnectionError(f"Failed to connect to memory proxy: {e}") from e
 
-    def get_sync_index(self, namespace: str) -> SyncIndexResponse:
+    def get_sync_index(
+        self, namespace: str, since: int | None = None
+    ) -> SyncIndexResponse:
         """Get the sync index for a namespace.
 
         The sync index contains metadata for all files in the namespace,
@@ -358,6 +663,9 @@ class MemoryProxyClient:
 
         Args:
             namespace: Namespace (persona name, can include slashes)
+            since: index_version of an earlier response; if given, the proxy
+                may return only the entries changed after it. Check
+                ``response.since`` to tell a delta from a full index.
 
         Returns:
             SyncIndexResponse with file metadata
@@ -371,7 +679,10 @@ class MemoryProxyClient:
         url = f"{self.base_url}/sync/{encoded_namespace}"
 
         try:
-            response = self.client.get(url)
+            if since is None:
+                response = self.client.get(url)
+            else:
+                response = self.client.get(url, params={"since": since})
 
             if response.status_code == 200:
                 data = response.json()
@@ -391,3 +702,45 @@ class MemoryProxyClient:
         except httpx.RequestError as e:
             logger.error(f"Request failed: {e}")
             raise ConnectionError(f"Failed to connect to memory proxy: {e}") from e
+
+    def get_sync_tokens(self, prefix: str) -> dict[str, str]:
+        """Get a change token for every namespace under a prefix.
+
+        A namespace's token changes whenever its sync index changes, so a
+        caller that remembers the tokens of its last sync can skip the
+        unchanged namespaces without fetching their indexes.
+
+        Args:
+            prefix: Namespace prefix (e.g. "personas/default/history")
+
+        Returns:
+            Dictionary mapping namespaces to change tokens
+
+        Raises:
+            ConnectionError: If request fails
+            AuthenticationError: If authentication fails
+            NotFoundError: If the proxy does not support change tokens
+        """
+        encoded_prefix = quote(prefix, safe="/")
+        url = f"{self.base_url}/sync-tokens/{encoded_prefix}"
+
+        try:
+            response = self.client.get(url)
+
+            if response.status_code == 200:
+                return dict(response.json().get("tokens", {}))
+
+            elif response.status_code == 401:
+                raise AuthenticationError("Invalid authentication token")
+
+            elif response.status_code == 404:
+                raise NotFoundError("Sync tokens not supported by memory proxy")
+
+            else:
+                raise MemoryProxyError(
+                    f"Failed to get sync tokens: {response.status_code} {response.text}"
+                )
+
+        except httpx.RequestError as e:
+            logger.error(f"Request failed: {e}")
+            raise ConnectionError(f"Failed to connect to memory proxy: {e}") from e
@@ -14,6 +14,7 @@ import gzip
 import hashlib
 import json
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -128,6 +129,28 @@ class SyncStatus:
         )
 
 
+def _metadata_to_dict(metadata: FileMetadata) -> dict:
+    data = {
+        "md5": metadata.md5,
+        "last_modified": metadata.last_modified.isoformat(),
+        "size": metadata.size,
+        "version": metadata.version,
+        "is_deleted": metadata.is_deleted,
+    }
+    if metadata.local_size is not None:
+        data["local_size"] = metadata.local_size
+        data["local_md5"] = metadata.local_md5
+    return data
+
+
+def _metadata_from_dict(metadata_dict: dict) -> FileMetadata:
+    metadata_dict = dict(metadata_dict)
+    metadata_dict["last_modified"] = datetime.fromisoformat(
+        metadata_dict["last_modified"]
+    )
+    return FileMetadata(**metadata_dict)
+
+
 class LocalIndex:
     """Track local filesystem state vs remote state for sync.
 
@@ -135,8 +158,19 @@ class LocalIndex:
     allowing us to detect changes and conflicts.
 
     Index file location is now configurable per namespace.
+
+    The index is stored as a JSON snapshot plus a journal next to it
+    (``<index_file>.journal``, one JSON record per line). ``save`` appends
+    only the entries changed since the last save and folds the journal back
+    into the snapshot once it outgrows the index, so a sync that touches a
+    few files does not rewrite the whole index. Entries added, replaced or
+    removed without ``update_entry``/``remove_entry`` are found by comparing
+    against the entries last written.
     """
 
+    # Journal records allowed before compaction, at least
+    MIN_COMPACT_RECORDS = 256
+
     def __init__(self, index_file: Path):
         """Initialize local index.
 
@@ -144,8 +178,17 @@ class LocalIndex:
             index_file: Path to the index file (e.g., ~/.silica/personas/default/.sync-index-memory.json)
         """
         self.index_file = Path(index_file)
+        self.journal_file = self.index_file.with_name(self.index_file.name + ".journal")
         self._index: dict[str, FileMetadata] = {}
         self._loaded = False
+        # Remote index_version this index was last brought up to date with
+        self.remote_index_version: int | None = None
+        self._saved_remote_index_version: int | None = None
+        self._dirty: set[str] = set()
+        # Entries as of the last load or save
+        self._saved: dict[str, FileMetadata] = {}
+        self._journal_records = 0
+        self._rewrite = False
 
     def load(self) -> dict[str, FileMetadata]:
         """Load index from disk.
@@ -153,63 +196,84 @@ class LocalIndex:
         Returns:
             Dictionary mapping file paths to metadata
         """
-        if not self.index_file.exists():
+        self._index = {}
+        self.remote_index_version = None
+        self._dirty = set()
+        self._saved = {}
+        self._journal_records = 0
+        self._rewrite = False
+        self._loaded = True
+
+        if not self.index_file.exists() and not self.journal_file.exists():
             logger.debug(f"No local index found at {self.index_file}")
-            self._index = {}
-            self._loaded = True
             return self._index
 
         try:
-            with open(self.index_file, "r") as f:
-                data = json.load(f)
+            if self.index_file.exists():
+                with open(self.index_file, "r") as f:
+                    data = json.load(f)
 
-            # Convert dict to FileMetadata objects
-            self._index = {}
-            for path, metadata_dict in data.get("files", {}).items():
-                # Parse datetime string
-                metadata_dict["last_modified"] = datetime.fromisoformat(
-                    metadata_dict["last_modified"]
-                )
-                self._index[path] = FileMetadata(**metadata_dict)
-
-            self._loaded = True
-            logger.debug(f"Loaded local index with {len(self._index)} entries")
-            return self._index
+                # Convert dict to FileMetadata objects
+                for path, metadata_dict in data.get("files", {}).items():
+                    self._index[path] = _metadata_from_dict(metadata_dict)
+                self.remote_index_version = data.get("remote_index_version")
 
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.error(f"Failed to load local index: {e}")
             self._index = {}
-            self._loaded = True
+            self._rewrite = True
             return self._index
 
-    def save(self) -> None:
-        """Save index to disk."""
-        # Ensure directory exists
-        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        self._replay_journal()
+        self._saved = dict(self._index)
+        self._saved_remote_index_version = self.remote_index_version
+        logger.debug(f"Loaded local index with {len(self._index)} entries")
+        return self._index
 
-        # Convert FileMetadata objects to dicts
-        data = {
-            "files": {
-                path: {
-                    "md5": metadata.md5,
-                    "last_modified": metadata.last_modified.isoformat(),
-                    "size": metadata.size,
-                    "version": metadata.version,
-                    "is_deleted": metadata.is_deleted,
-                }
-                for path, metadata in self._index.items()
-            },
-            "index_version": int(datetime.now(timezone.utc).timestamp() * 1000),
-            "index_last_modified": datetime.now(timezone.utc).isoformat(),
+    def save(self) -> None:
+        """Save changes to disk, compacting the journal when it grows large."""
+        if not self._loaded or self._rewrite or not self.index_file.exists():
+            self._write_snapshot()
+            return
+        changed = self._dirty | {
+            path
+            for path in self._saved.keys() | self._index.keys()
+            if self._saved.get(path) is not self._index.get(path)
         }
+        if not changed and (
+            self.remote_index_version == self._saved_remote_index_version
+        ):
+            return
+
+        records = len(changed)
+        if self._journal_records + records + 1 > max(
+            self.MIN_COMPACT_RECORDS, len(self._index)
+        ):
+            self._write_snapshot()
+            return
+
+        lines = []
+        for path in sorted(changed):
+            metadata = self._index.get(path)
+            if metadata is None:
+                lines.append(json.dumps({"path": path, "removed": True}))
+            else:
+                lines.append(
+                    json.dumps({"path": path, "entry": _metadata_to_dict(metadata)})
+                )
+        lines.append(json.dumps({"remote_index_version": self.remote_index_version}))
 
         try:
-            with open(self.index_file, "w") as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"Saved local index with {len(self._index)} entries")
+            with open(self.journal_file, "a") as f:
+                f.write("\n".join(lines) + "\n")
         except OSError as e:
             logger.error(f"Failed to save local index: {e}")
             raise
+        self._journal_records += records + 1
+        self._dirty = set()
+        self._saved = dict(self._index)
+        self._saved_remote_index_version = self.remote_index_version
+        logger.debug(f"Journaled {records} local index entries")
 
     def update_entry(self, path: str, metadata: FileMetadata) -> None:
         """Update a single entry in the index.
@@ -221,7 +285,11 @@ class LocalIndex:
         if not self._loaded:
             self.load()
 
+        existing = self._index.get(path)
+        if existing is not None and existing is not metadata and existing == metadata:
+            return  # Unchanged; keep it out of the journal
         self._index[path] = metadata
+        self._dirty.add(path)
         logger.debug(f"Updated index entry: {path} (v{metadata.version})")
 
     def remove_entry(self, path: str) -> None:
@@ -235,6 +303,7 @@ class LocalIndex:
 
         if path in self._index:
             del self._index[path]
+            self._dirty.add(path)
             logger.debug(f"Removed index entry: {path}")
 
     def get_entry(self, path: str) -> FileMetadata | None:
@@ -266,8 +335,66 @@ class LocalIndex:
         """Clear all entries from the index."""
         self._index = {}
         self._loaded = True
+        self.remote_index_version = None
+        self._dirty = set()
+        self._rewrite = True
         logger.debug("Cleared local index")
 
+    def _replay_journal(self) -> None:
+        if not self.journal_file.exists():
+            return
+        try:
+            with open(self.journal_file, "r") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        if "remote_index_version" in record:
+                            self.remote_index_version = record["remote_index_version"]
+                        elif record.get("removed"):
+                            self._index.pop(record["path"], None)
+                        else:
+                            self._index[record["path"]] = _metadata_from_dict(
+                                record["entry"]
+                            )
+                        self._journal_records += 1
+                    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                        # A torn last line from an interrupted save
+                        continue
+        except OSError as e:
+            logger.error(f"Failed to read local index journal: {e}")
+
+    def _write_snapshot(self) -> None:
+        """Rewrite the snapshot with the full index and drop the journal."""
+        # Ensure directory exists
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Convert FileMetadata objects to dicts
+        data = {
+            "files": {
+                path: _metadata_to_dict(metadata)
+                for path, metadata in self._index.items()
+            },
+            "index_version": int(datetime.now(timezone.utc).timestamp() * 1000),
+            "index_last_modified": datetime.now(timezone.utc).isoformat(),
+            "remote_index_version": self.remote_index_version,
+        }
+
+        tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_file, self.index_file)
+            self.journal_file.unlink(missing_ok=True)
+            logger.debug(f"Saved local index with {len(self._index)} entries")
+        except OSError as e:
+            logger.error(f"Failed to save local index: {e}")
+            raise
+        self._dirty = set()
+        self._saved = dict(self._index)
+        self._saved_remote_index_version = self.remote_index_version
+        self._journal_records = 0
+        self._rewrite = False
+
 
 @dataclass
 class FileInfo:
@@ -308,6 +435,11 @@ class SyncEngine:
         self.conflict_resolver = conflict_resolver
 
         self.local_index = LocalIndex(config.index_file)
+        # Last known remote manifest, kept current from the proxy's change feed
+        index_file = Path(config.index_file)
+        self.remote_index = LocalIndex(
+            index_file.with_name(f"{index_file.stem}.remote{index_file.suffix}")
+        )
         self.md5_cache = MD5Cache()
 
         # Base directory for file operations (where files are read from/written to)
@@ -339,16 +471,12 @@ class SyncEngine:
 
         # Get remote index
         try:
-            remote_index_response = self.client.get_sync_index(self.config.namespace)
+            remote_files = self._fetch_remote_index()
         except Exception as e:
             logger.error(f"Failed to get remote index: {e}")
             # If we can't get remote index, we can't sync
             raise
 
-        # Convert remote index (SyncIndexResponse) to dict for easier lookup
-        # remote_index_response.files is a dict[str, FileMetadata]
-        remote_files = remote_index_response.files
-
         # Build path mappings for compression support
         # When compression is enabled, local "foo.json" maps to remote "foo.json.gz"
         local_to_remote: dict[str, str] = {}
@@ -594,7 +722,23 @@ class SyncEngine:
             # Files match - in sync
             if local_file.md5 == remote_entry.md5:
                 # Update index to track current state (use remote path for index)
-                self.local_index.update_entry(effective_remote_path, remote_entry)
+                self.local_index.update_entry(
+                    effective_remote_path,
+                    remote_entry.model_copy(
+                        update={
+                            "local_size": local_file.size,
+                            "local_md5": local_file.md5,
+                        }
+                    ),
+                )
+                return None  # In sync
+
+            # Compressed remote: unchanged on both sides since the last sync
+            if (
+                index_entry
+                and index_entry.local_md5 == local_file.md5
+                and index_entry.md5 == remote_entry.md5
+            ):
                 return None  # In sync
 
             # Files differ - determine sync direction
@@ -611,7 +755,9 @@ class SyncEngine:
                 )
 
             # We have history - determine what changed
-            local_changed = local_file.md5 != index_entry.md5
+            # For compressed remotes, compare against the local file the
+            # index entry was synced from
+            local_changed = local_file.md5 != (index_entry.local_md5 or index_entry.md5)
             remote_changed = remote_entry.version > index_entry.version
 
             if local_changed and remote_changed:
@@ -860,6 +1006,7 @@ class SyncEngine:
 
             # Save updated index
             self.local_index.save()
+            self.remote_index.save()
 
             return result
         finally:
@@ -894,7 +1041,7 @@ class SyncEngine:
 
         try:
             # Calculate MD5 using cache (of original uncompressed content)
-            self.md5_cache.calculate_md5(full_path)
+            local_md5 = self.md5_cache.calculate_md5(full_path)
 
             # Read file content
             with open(full_path, "rb") as f:
@@ -902,6 +1049,10 @@ class SyncEngine:
 
             original_size = len(content)
 
+            # Append-only files (session history) only send what was added
+            if self._upload_appended(path, content, local_md5, remote_version):
+                return True
+
             # Determine remote path and content type
             remote_path = path
             content_type = "application/octet-stream"
@@ -922,7 +1073,8 @@ class SyncEngine:
                     # NOTE: We intentionally do NOT delete the old uncompressed file.
                     # Both versions may coexist until explicit cleanup is requested.
                     # This preserves data integrity and avoids accidental data loss.
-                    effective_version = 0
+                    if self.remote_index.get_entry(remote_path) is None:
+                        effective_version = 0
                     logger.debug(
                         f"Compressed {path}: {original_size} -> {len(content)} bytes "
                         f"({100 - len(content) * 100 // original_size}% reduction)"
@@ -938,10 +1090,20 @@ class SyncEngine:
                 content_type=content_type,
             )
 
-            # Update local index with the entire manifest from response
-            # This keeps us in sync with remote state after write
-            for file_path, metadata in sync_index.files.items():
-                self.local_index.update_entry(file_path, metadata)
+            # The response carries just the written entry
+            metadata = sync_index.files.get(remote_path) or FileMetadata(
+                md5=returned_md5,
+                last_modified=datetime.now(timezone.utc),
+                size=len(content),
+                version=new_version,
+                is_deleted=False,
+            )
+            self._record_remote_entry(
+                remote_path,
+                metadata.model_copy(
+                    update={"local_size": original_size, "local_md5": local_md5}
+                ),
+            )
 
             # Log success
             compression_note = ""
@@ -960,6 +1122,109 @@ class SyncEngine:
             logger.error(f"Failed to upload {path}: {e}")
             return False
 
+    def _upload_appended(
+        self, path: str, content: bytes, local_md5: str, remote_version: int
+    ) -> bool:
+        """Upload only the bytes appended to a file since its last sync.
+
+        Applies when the file still starts with exactly what was last synced
+        and the remote is unchanged since then. The new bytes are sent as one
+        segment (gzipped on its own for compressed remotes, which keeps the
+        remote a valid multi-member gzip file), with the remote size and MD5
+        as the proxy-side precondition.
+
+        Args:
+            path: Local file path
+            content: Current file content
+            local_md5: MD5 of content
+            remote_version: Remote version the sync plan saw
+
+        Returns:
+            True if the segment was appended; False if the file must be
+            uploaded whole
+        """
+        for remote_path in (f"{path}.gz", path):
+            entry = self.local_index.get_entry(remote_path)
+            if entry is None or entry.is_deleted or entry.version != remote_version:
+                continue
+            synced = self._synced_local_state(remote_path, entry)
+            if synced is None:
+                return False
+            synced_size, synced_md5 = synced
+            if not 0 < synced_size < len(content):
+                return False
+            if hashlib.md5(content[:synced_size]).hexdigest() != synced_md5:
+                return False
+
+            segment = content[synced_size:]
+            if remote_path.endswith(".gz"):
+                segment = gzip.compress(segment, compresslevel=6)
+
+            try:
+                new_md5, new_version, sync_index = self.client.append_blob(
+                    namespace=self.config.namespace,
+                    path=remote_path,
+                    segment=segment,
+                    offset=entry.size,
+                    prefix_md5=entry.md5,
+                    expected_version=entry.version,
+                )
+            except Exception as e:
+                logger.info(f"Append to {remote_path} refused, uploading whole: {e}")
+                return False
+
+            metadata = sync_index.files.get(remote_path) or FileMetadata(
+                md5=new_md5,
+                last_modified=datetime.now(timezone.utc),
+                size=entry.size + len(segment),
+                version=new_version,
+                is_deleted=False,
+            )
+            self._record_remote_entry(
+                remote_path,
+                metadata.model_copy(
+                    update={"local_size": len(content), "local_md5": local_md5}
+                ),
+            )
+            logger.info(
+                f"Appended {len(content) - synced_size} bytes to {remote_path} "
+                f"(v{new_version}, sent {len(segment)} bytes)"
+            )
+            return True
+        return False
+
+    def _synced_local_state(
+        self, remote_path: str, entry: FileMetadata
+    ) -> tuple[int, str] | None:
+        """Return (size, md5) of the local file an index entry was synced from."""
+        if entry.local_size is not None and entry.local_md5:
+            return entry.local_size, entry.local_md5
+        if not remote_path.endswith(".gz"):
+            # Uncompressed remotes are byte-for-byte the local file
+            return entry.size, entry.md5
+        return None
+
+    def _synced_prefix(self, path: str, full_path: Path) -> FileMetadata | None:
+        """Return the index entry of a remote file if the local copy is intact.
+
+        The local file must still be exactly what was last synced for the
+        remote file, so that only data appended remotely needs fetching.
+        """
+        entry = self.local_index.get_entry(path)
+        if entry is None or entry.is_deleted:
+            return None
+        synced = self._synced_local_state(path, entry)
+        if synced is None:
+            return None
+        try:
+            if full_path.stat().st_size != synced[0]:
+                return None
+            if self.md5_cache.calculate_md5(full_path) != synced[1]:
+                return None
+        except OSError:
+            return None
+        return entry
+
     def download_file(self, path: str) -> bool:
         """Download file from remote.
 
@@ -1005,20 +1270,35 @@ class SyncEngine:
                 full_path = self._base_dir / local_path
 
         try:
-            # Download from remote
+            # Download from remote; if the local copy is still what was last
+            # synced, only fetch what was appended remotely since then
             # read_blob returns (content, md5, last_modified, content_type, version)
-            content, md5, last_modified, content_type, version = self.client.read_blob(
-                namespace=self.config.namespace, path=path
-            )
+            synced = self._synced_prefix(path, full_path)
+            if synced is not None:
+                content, md5, last_modified, content_type, version, offset = (
+                    self.client.read_blob_after(
+                        namespace=self.config.namespace,
+                        path=path,
+                        offset=synced.size,
+                        prefix_md5=synced.md5,
+                    )
+                )
+            else:
+                content, md5, last_modified, content_type, version = (
+                    self.client.read_blob(namespace=self.config.namespace, path=path)
+                )
+                offset = 0
 
-            remote_size = len(content)
+            fetched_size = len(content)
+            remote_size = offset + fetched_size
 
-            # Decompress if needed (check both extension and content type)
-            if is_compressed or content_type == "application/gzip":
+            # Decompress if needed (check both extension and content type).
+            # A tail of a compressed file is whole gzip members.
+            if (is_compressed or content_type == "application/gzip") and content:
                 try:
                     content = gzip.decompress(content)
                     logger.debug(
-                        f"Decompressed {path}: {remote_size} -> {len(content)} bytes"
+                        f"Decompressed {path}: {fetched_size} -> {len(content)} bytes"
                     )
                 except gzip.BadGzipFile:
                     # Not actually gzipped, use as-is
@@ -1029,13 +1309,16 @@ class SyncEngine:
             # Ensure directory exists
             full_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write file (decompressed)
-            with open(full_path, "wb") as f:
+            # Write file (decompressed), or append the new tail
+            with open(full_path, "ab" if offset else "wb") as f:
                 f.write(content)
 
             # Update MD5 cache for the downloaded file (hash of decompressed content)
-            local_md5 = hashlib.md5(content).hexdigest()
-            self.md5_cache.set(full_path, local_md5)
+            if offset:
+                local_md5 = self.md5_cache.calculate_md5(full_path)
+            else:
+                local_md5 = hashlib.md5(content).hexdigest()
+                self.md5_cache.set(full_path, local_md5)
 
             # Create metadata object for the REMOTE file (compressed)
             # We track the remote state in the index
@@ -1045,6 +1328,8 @@ class SyncEngine:
                 size=remote_size,  # Size on remote (compressed)
                 version=version,
                 is_deleted=False,
+                local_size=full_path.stat().st_size,
+                local_md5=local_md5,
             )
 
             # Update local index with the remote path (including .gz)
@@ -1054,8 +1339,10 @@ class SyncEngine:
             compression_note = ""
             if is_compressed or content_type == "application/gzip":
                 compression_note = (
-                    f" (decompressed: {remote_size} -> {len(content)} bytes)"
+                    f" (decompressed: {fetched_size} -> {len(content)} bytes)"
                 )
+            if offset:
+                compression_note += f" (appended after {offset} bytes)"
 
             logger.info(
                 f"Downloaded {path} -> {local_path} (v{version}){compression_note}"
@@ -1124,10 +1411,18 @@ class SyncEngine:
                 expected_version=remote_version,
             )
 
-            # Update local index with the entire manifest from response
-            # This keeps us in sync with remote state after delete
-            for file_path, metadata in sync_index.files.items():
-                self.local_index.update_entry(file_path, metadata)
+            # The response carries just the tombstone
+            metadata = sync_index.files.get(path)
+            if metadata is None:
+                previous = self.remote_index.get_entry(path)
+                metadata = FileMetadata(
+                    md5=previous.md5 if previous else "",
+                    last_modified=datetime.now(timezone.utc),
+                    size=0,
+                    version=new_version,
+                    is_deleted=True,
+                )
+            self._record_remote_entry(path, metadata)
 
             # Log success
 
@@ -1141,6 +1436,38 @@ class SyncEngine:
             logger.error(f"Failed to delete remote {path}: {e}")
             return False
 
+    def _fetch_remote_index(self) -> dict[str, FileMetadata]:
+        """Return the remote manifest, transferring only what changed.
+
+        The manifest from the previous sync is cached next to the local
+        index together with its index_version; the proxy is asked only for
+        entries changed since then. A full response (first sync, or a proxy
+        without change-feed support) replaces the cache.
+
+        Returns:
+            Dictionary mapping remote paths to metadata
+        """
+        self.remote_index.load()
+        response = self.client.get_sync_index(
+            self.config.namespace, since=self.remote_index.remote_index_version
+        )
+        if response.since is None:
+            self.remote_index.clear()
+        for path, metadata in response.files.items():
+            self.remote_index.update_entry(path, metadata)
+        self.remote_index.remote_index_version = response.index_version
+        self.remote_index.save()
+        logger.debug(
+            f"Fetched {len(response.files)} remote index entries "
+            f"({'delta' if response.since is not None else 'full'})"
+        )
+        return self.remote_index.get_all_entries()
+
+    def _record_remote_entry(self, path: str, metadata: FileMetadata) -> None:
+        """Record a remote entry this client just wrote."""
+        self.local_index.update_entry(path, metadata)
+        self.remote_index.update_entry(path, metadata)
+
     def get_sync_status(self) -> SyncStatus:
         """Get detailed sync status.
 
@@ -1206,15 +1533,9 @@ class SyncEngine:
                     if not file_path.is_file():
                         continue
 
-                    # Skip sync metadata files
-                    if file_path.name in [
-                        ".sync-index.json",
-                        ".sync-index-memory.json",
-                        ".sync-index-history.json",
-                        ".sync-log.jsonl",
-                        ".sync-log-memory.jsonl",
-                        ".sync-log-history.jsonl",
-                    ]:
+                    # Skip sync metadata files (indexes, their journals
+                    # and remote caches, and operation logs)
+                    if file_path.name.startswith((".sync-index", ".sync-log")):
                         continue
 
                     # Get path relative to scan_path (not base_dir!)
@@ -1,13 +1,71 @@
-from typing import Any
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable
 
 from silica.developer.context import AgentContext
+from silica.developer.memory import MemoryManager
 from silica.developer.sandbox import Sandbox
 
+# System prompt sections are rebuilt for every request. Sections whose inputs
+# can be fingerprinted cheaply (file and directory stats, the cached sandbox
+# listing) are kept here as key -> (fingerprint, section) and reused while
+# the fingerprint is unchanged, which also keeps their text byte-stable for
+# prompt caching.
+MAX_CACHED_SECTIONS = 32
+_SECTION_CACHE: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+
+def _cached_section(key: Hashable, fingerprint: Hashable) -> tuple[bool, Any]:
+    """Return (hit, section) for ``key`` if it was stored with ``fingerprint``."""
+    cached = _SECTION_CACHE.get(key)
+    if cached is None or cached[0] != fingerprint:
+        return False, None
+    _SECTION_CACHE.move_to_end(key)
+    return True, cached[1]
+
+
+def _store_section(key: Hashable, fingerprint: Hashable, section) -> None:
+    _SECTION_CACHE[key] = (fingerprint, section)
+    _SECTION_CACHE.move_to_end(key)
+    while len(_SECTION_CACHE) > MAX_CACHED_SECTIONS:
+        _SECTION_CACHE.popitem(last=False)
+
+
+def _copy_section(section: dict[str, Any] | None) -> dict[str, Any] | None:
+    # Callers add cache_control to the last section, so hand out copies
+    return dict(section) if section is not None else None
+
+
+def _memoized_section(
+    key: Hashable,
+    fingerprint: Hashable,
+    build: Callable[[], dict[str, Any] | None],
+) -> dict[str, Any] | None:
+    """Return ``build()``, reusing the cached result while ``fingerprint`` matches."""
+    hit, section = _cached_section(key, fingerprint)
+    if not hit:
+        section = build()
+        _store_section(key, fingerprint, section)
+    return _copy_section(section)
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
 
 def build_tree(sandbox: Sandbox, limit=1000):
+    return _build_tree_from_listing(sandbox.get_directory_listing(limit=limit))
+
+
+def _build_tree_from_listing(listing):
     root = {"is_leaf": False}
 
-    for path in sandbox.get_directory_listing(limit=limit):
+    for path in listing:
         parts = path.split("/")
         current = root
 
@@ -42,8 +100,10 @@ def render_tree(tree, indent=""):
     return result
 
 
-def render_sandbox_content(sandbox, summarize, limit=1000):
-    tree = build_tree(sandbox, limit=limit)
+def render_sandbox_content(sandbox, summarize, limit=1000, listing=None):
+    if listing is None:
+        listing = sandbox.get_directory_listing(limit=limit)
+    tree = _build_tree_from_listing(listing)
     result = "<sandbox_contents>\n"
     result += render_tree(tree)
     result += "</sandbox_contents>\n"
@@ -52,8 +112,6 @@ def render_sandbox_content(sandbox, summarize, limit=1000):
 
 def _create_default_system_section(agent_context: AgentContext):
     """Create the default system section with sandbox path information."""
-    import os
-
     sandbox_path_info = f"""
 ## Sandbox Environment Configuration
 
@@ -104,8 +162,9 @@ Use the `sandbox_debug` tool to diagnose sandbox configuration issues if file op
 def _load_persona_from_disk(agent_context: AgentContext) -> dict[str, Any] | None:
     """Load persona content from disk and wrap it in persona tags.
 
-    This function always reads from disk to ensure the latest persona content
-    is used, allowing runtime updates to take effect immediately.
+    persona.md is checked on every call so runtime updates take effect
+    immediately, but the rendered section is only rebuilt when persona.md or
+    one of the memory entries it references has changed (by mtime and size).
 
     Priority:
     1. If persona.md exists on disk, use it (takes precedence)
@@ -117,29 +176,60 @@ def _load_persona_from_disk(agent_context: AgentContext) -> dict[str, Any] | Non
     Returns:
         A content block with the persona wrapped in tags, or None if no persona file exists
     """
-    from pathlib import Path
-
     if agent_context.history_base_dir is None or not isinstance(
         agent_context.history_base_dir, Path
     ):
         return None
 
     persona_file = agent_context.history_base_dir / "persona.md"
+    memory_manager = agent_context.memory_manager
 
-    if not persona_file.exists():
+    if not isinstance(memory_manager, MemoryManager):
+        if not persona_file.exists():
+            return None
+        return _render_persona(agent_context, persona_file)[0]
+
+    stamp = _file_stamp(persona_file)
+    if stamp is None:
         return None
 
+    def dependency_stamps(dependencies):
+        return tuple(
+            (dep, _file_stamp((memory_manager.base_dir / dep).with_suffix(".md")))
+            for dep in sorted(dependencies)
+        )
+
+    # The references are only known after rendering, so compare against
+    # the current stamps of the entries the cached rendering depended on
+    key = ("persona", str(persona_file), str(memory_manager.base_dir))
+    cached = _SECTION_CACHE.get(key)
+    if cached is not None:
+        previous = [dep for dep, _ in cached[0][1]]
+        hit, section = _cached_section(key, (stamp, dependency_stamps(previous)))
+        if hit:
+            return _copy_section(section)
+
+    section, dependencies = _render_persona(agent_context, persona_file)
+    _store_section(key, (stamp, dependency_stamps(dependencies)), section)
+    return _copy_section(section)
+
+
+def _render_persona(
+    agent_context: AgentContext, persona_file: Path
+) -> tuple[dict[str, Any] | None, set]:
+    """Render persona.md; returns the section and the referenced entry paths."""
+    dependencies: set = set()
     try:
         with open(persona_file, "r") as f:
             persona_content = f.read().strip()
 
         if not persona_content:
-            return None
+            return None, dependencies
 
         # Resolve @path/to/entry references against memory
         if agent_context.memory_manager:
             persona_content = agent_context.memory_manager.render_content(
-                persona_content
+                persona_content, dependencies=dependencies
             )
 
         # Get persona name from directory
@@ -150,10 +240,10 @@ def _load_persona_from_disk(agent_context: AgentContext) -> dict[str, Any] | Non
             f'<persona name="{persona_name}">\n{persona_content}\n</persona>'
         )
 
-        return {"type": "text", "text": wrapped_content}
+        return {"type": "text", "text": wrapped_content}, dependencies
     except (IOError, OSError):
         # If we can't read the file, return None
-        return None
+        return None, dependencies
 
 
 def _wrap_system_section_with_persona_tags(
@@ -233,27 +323,68 @@ def create_system_message(
     }
     sections.append(loop_prevention_section)
 
+    # The sandbox listing changes most often, so it goes last: a change to
+    # the tree leaves the sections before it byte-identical
+    if include_memory:
+        memory_section = _memory_topics_section(agent_context)
+        if memory_section:
+            sections.append(memory_section)
     if include_sandbox:
-        system_message = "The current contents of the sandbox are:\n"
-        sandbox_content = render_sandbox_content(agent_context.sandbox, False)
-        if estimate_token_count(sandbox_content) > max_estimated_tokens:
-            sandbox_content = render_sandbox_content(agent_context.sandbox, True)
+        sections.append(_sandbox_section(agent_context, max_estimated_tokens))
 
-        system_message += sandbox_content
-        system_message += "\nYou can read, write, and list files/directories, as well as execute some bash commands."
-        sections.append({"type": "text", "text": system_message})
-    if include_memory and agent_context.memory_manager.get_tree(depth=1):
+    # add cache_control
+    sections[-1]["cache_control"] = {"type": "ephemeral"}
+
+    return sections
+
+
+def _memory_topics_section(agent_context: AgentContext) -> dict[str, Any] | None:
+    memory_manager = agent_context.memory_manager
+
+    def build():
+        tree = memory_manager.get_tree(depth=1)
+        if not tree:
+            return None
         system_message = "\n\nYou have a memory system with which you can interact. Here are the current top-level topics\n\n"
         system_message += "<memory_topics>\n"
-        for topic in agent_context.memory_manager.get_tree(depth=1)["items"]:
+        for topic in tree["items"]:
             system_message += topic + "\n"
         system_message += "</memory_topics>\n"
-        sections.append({"type": "text", "text": system_message})
+        return {"type": "text", "text": system_message}
 
-    # add cache_control
-    sections[-1]["cache_control"] = {"type": "ephemeral"}
+    if not isinstance(memory_manager, MemoryManager):
+        return build()
+    # Adding or removing a top-level topic changes the base directory's mtime
+    base_dir = memory_manager.base_dir
+    return _memoized_section(
+        ("memory_topics", str(base_dir)), _file_stamp(base_dir), build
+    )
 
-    return sections
+
+def _sandbox_section(
+    agent_context: AgentContext, max_estimated_tokens: int
+) -> dict[str, Any]:
+    sandbox = agent_context.sandbox
+    listing = sandbox.get_directory_listing(limit=1000)
+
+    def build():
+        system_message = "The current contents of the sandbox are:\n"
+        sandbox_content = render_sandbox_content(sandbox, False, listing=listing)
+        if estimate_token_count(sandbox_content) > max_estimated_tokens:
+            sandbox_content = render_sandbox_content(sandbox, True, listing=listing)
+
+        system_message += sandbox_content
+        system_message += "\nYou can read, write, and list files/directories, as well as execute some bash commands."
+        return {"type": "text", "text": system_message}
+
+    if not isinstance(sandbox, Sandbox):
+        return build()
+    # The listing itself comes from the sandbox's stat-validated cache
+    return _memoized_section(
+        ("sandbox", str(sandbox.root_directory)),
+        (tuple(listing), max_estimated_tokens),
+        build,
+    )
 
 
 def estimate_token_count(text):
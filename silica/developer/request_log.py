@@ -0,0 +1,440 @@
+"""Compact storage for request/response logs.
+
+A plain request log repeats the whole conversation, system prompt and tool
+schemas on every API call, so a long session's log grows quadratically.
+The content-addressed format stores each unique content block, system block
+and tool schema once, keyed by its hash, and logs requests and responses as
+lists of hash references:
+
+    {"type": "log_format", "format": "content_addressed", "version": 1}
+    {"type": "block", "hash": "3f1a...", "data": {"type": "text", "text": "Hi"}}
+    {"type": "request", ..., "messages": [{"role": "user", "content": ["3f1a..."]}]}
+
+A block record is always written before the first entry that references it,
+and every log file starts its own block table, so each file (including
+rotated ones) can be read on its own in a single pass. Files are compressed
+as they are written: gzip for ``.gz`` paths, zstd for ``.zst`` paths (which
+requires the optional ``zstandard`` package).
+
+Use ``read_log`` to iterate over fully reconstructed entries from either a
+plain or a content-addressed log, or from the command line::
+
+    python -m silica.developer.request_log requests.jsonl.gz --type request
+"""
+
+import argparse
+import codecs
+import contextlib
+import gzip
+import hashlib
+import io
+import json
+import sys
+import threading
+import zlib
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+LOG_FORMAT = "content_addressed"
+LOG_FORMAT_VERSION = 1
+
+COMPRESSED_SUFFIXES = (".gz", ".zst")
+
+# Start of a gzip member header (magic bytes and the deflate method)
+GZIP_MAGIC = b"\x1f\x8b\x08"
+
+_READ_CHUNK = 64 * 1024
+_MEMBER_PREFIX = b'{"type": "log_format"'
+
+# Rotate once the compressed file reaches this size
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+
+
+def is_content_addressed_path(path: Path) -> bool:
+    """Return True if ``path`` selects the compressed content-addressed format."""
+    return Path(path).suffix in COMPRESSED_SUFFIXES
+
+
+def block_hash(data: Any) -> str:
+    """Return the content hash of a JSON-serializable block."""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+def rotated_path(path: Path, index: int) -> Path:
+    """Return the name of the ``index``-th rotated file for ``path``.
+
+    The index goes before the suffixes so the compression stays detectable:
+    ``requests.jsonl.gz`` rotates to ``requests.1.jsonl.gz``.
+    """
+    path = Path(path)
+    stem, dot, suffixes = path.name.partition(".")
+    return path.with_name(f"{stem}.{index}{dot}{suffixes}")
+
+
+def log_files(path: Path, backup_count: int = DEFAULT_BACKUP_COUNT) -> List[Path]:
+    """Return the existing files of a rotated log, oldest first."""
+    path = Path(path)
+    files = [rotated_path(path, i) for i in range(backup_count, 0, -1)]
+    files.append(path)
+    return [f for f in files if f.exists()]
+
+
+def _open_zstd_writer(raw: IO[bytes]) -> IO[bytes]:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "Writing .zst request logs requires the 'zstandard' package; "
+            "use a .gz path instead."
+        )
+    return zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+
+
+def _find(raw: IO[bytes], pattern: bytes, start: int) -> Optional[int]:
+    """Return the offset of the first ``pattern`` at or after ``start``."""
+    raw.seek(start)
+    offset = start
+    carry = b""
+    while True:
+        chunk = raw.read(_READ_CHUNK)
+        if not chunk:
+            return None
+        data = carry + chunk
+        index = data.find(pattern)
+        if index >= 0:
+            return offset - len(carry) + index
+        carry = data[-(len(pattern) - 1) :]
+        offset += len(chunk)
+
+
+def _is_log_member(raw: IO[bytes], offset: int) -> bool:
+    """Return True if a gzip member written by a log writer starts at ``offset``.
+
+    Every writer starts its member with the ``log_format`` header, which
+    tells a real member apart from magic bytes inside compressed data.
+    """
+    raw.seek(offset)
+    decompressor = zlib.decompressobj(31)
+    out = b""
+    try:
+        while len(out) < len(_MEMBER_PREFIX):
+            piece = raw.read(64)
+            if not piece:
+                break
+            out += decompressor.decompress(piece)
+    except zlib.error:
+        return False
+    return out.startswith(_MEMBER_PREFIX)
+
+
+def _decompressed_range(
+    raw: IO[bytes], start: int, end: int, skip: int
+) -> Iterator[bytes]:
+    """Decompress the member bytes ``[start, end)``, dropping ``skip`` bytes."""
+    raw.seek(start)
+    decompressor = zlib.decompressobj(31)
+    remaining = end - start
+    try:
+        while remaining > 0:
+            chunk = raw.read(min(_READ_CHUNK, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            out = decompressor.decompress(chunk)
+            if skip:
+                dropped = min(skip, len(out))
+                out = out[dropped:]
+                skip -= dropped
+            if out:
+                yield out
+    except zlib.error:
+        pass
+
+
+def _read_gzip_members(raw: IO[bytes]) -> Iterator[bytes]:
+    """Decompress a file of concatenated gzip members.
+
+    A process that died without closing its writer leaves an unterminated
+    member, and the next run appends a new member after it. Decompressing
+    straight through then fails at the boundary, so on a decompression error
+    the reader searches for the next member header and carries on from
+    there, keeping everything the torn member had flushed.
+    """
+    start = 0
+    while True:
+        raw.seek(start)
+        decompressor = zlib.decompressobj(31)
+        position = start
+        emitted = 0
+        chunk = b""
+        try:
+            while not decompressor.eof:
+                chunk = raw.read(_READ_CHUNK)
+                if not chunk:
+                    return  # Cut off mid-member
+                position += len(chunk)
+                out = decompressor.decompress(chunk)
+                emitted += len(out)
+                if out:
+                    yield out
+        except zlib.error:
+            # The error is in the last chunk fed, so the next member
+            # starts there at the earliest
+            candidate = max(start + 1, position - len(chunk))
+            while True:
+                candidate = _find(raw, GZIP_MAGIC, candidate)
+                if candidate is None or _is_log_member(raw, candidate):
+                    break
+                candidate += 1
+            if candidate is None:
+                return
+            yield from _decompressed_range(raw, start, candidate, emitted)
+            # The torn member may end mid-line
+            yield b"\n"
+            start = candidate
+            continue
+        start = position - len(decompressor.unused_data)
+        raw.seek(start)
+        if not raw.read(1):
+            return
+
+
+def _iter_lines(chunks: Iterator[bytes]) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    for chunk in chunks:
+        lines = (pending + decoder.decode(chunk)).split("\n")
+        pending = lines.pop()
+        yield from lines
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def _open_reader(path: Path) -> IO[str]:
+    """Open a plain or zstd log file for reading text."""
+    if path.suffix == ".zst":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "Reading .zst request logs requires the 'zstandard' package."
+            )
+        raw = open(path, "rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            raw, read_across_frames=True, closefd=True
+        )
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+class ContentAddressedLogWriter:
+    """Streams log entries into a compressed, deduplicated, rotating log.
+
+    Args:
+        path: Log file path; the suffix (``.gz`` or ``.zst``) picks the codec.
+        max_bytes: Rotate once the compressed file reaches this size.
+            Zero disables rotation.
+        backup_count: Number of rotated files to keep.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+        self._raw: Optional[IO[bytes]] = None
+        self._stream: Optional[IO[bytes]] = None
+        self._seen: set[str] = set()
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        """Write an entry in the plain log format, deduplicating its blocks."""
+        with self._lock:
+            if self._stream is None:
+                self._open()
+            lines: List[str] = []
+            compact = self._compact(entry, lines)
+            lines.append(json.dumps(compact, default=str))
+            self._stream.write(("\n".join(lines) + "\n").encode("utf-8"))
+            # Sync-flush so the log stays readable if the process dies
+            self._stream.flush()
+            if self.max_bytes and self._raw.tell() >= self.max_bytes:
+                self._rotate()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Appending starts a new gzip member / zstd frame, which readers
+        # treat as a continuation of the same stream.
+        self._raw = open(self.path, "ab")
+        if self.path.suffix == ".zst":
+            self._stream = _open_zstd_writer(self._raw)
+        else:
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="ab")
+        self._seen = set()
+        header = {
+            "type": "log_format",
+            "format": LOG_FORMAT,
+            "version": LOG_FORMAT_VERSION,
+        }
+        self._stream.write((json.dumps(header) + "\n").encode("utf-8"))
+
+    def _close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._raw.close()
+        self._stream = None
+        self._raw = None
+
+    def _rotate(self) -> None:
+        self._close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = rotated_path(self.path, i)
+                if source.exists():
+                    source.replace(rotated_path(self.path, i + 1))
+            self.path.replace(rotated_path(self.path, 1))
+        else:
+            self.path.unlink(missing_ok=True)
+
+    def _ref(self, data: Any, lines: List[str]) -> str:
+        """Return the hash for ``data``, emitting its block record if new."""
+        h = block_hash(data)
+        if h not in self._seen:
+            self._seen.add(h)
+            block = {"type": "block", "hash": h, "data": data}
+            lines.append(json.dumps(block, default=str))
+        return h
+
+    def _refs(self, value: Any, lines: List[str]) -> Any:
+        """Replace a string or a list of blocks with hash references."""
+        if isinstance(value, list):
+            return [self._ref(block, lines) for block in value]
+        if value is None:
+            return None
+        return self._ref(value, lines)
+
+    def _compact(self, entry: Dict[str, Any], lines: List[str]) -> Dict[str, Any]:
+        compact = dict(entry)
+        if entry.get("type") == "request":
+            compact["system"] = self._refs(entry.get("system"), lines)
+            compact["tools"] = self._refs(entry.get("tools"), lines)
+            compact["messages"] = [
+                {**msg, "content": self._refs(msg.get("content"), lines)}
+                for msg in entry.get("messages") or []
+            ]
+        elif entry.get("type") == "response":
+            compact["content"] = self._refs(entry.get("content"), lines)
+        return compact
+
+
+def _resolve(value: Any, blocks: Dict[str, Any]) -> Any:
+    if isinstance(value, list):
+        return [blocks[h] for h in value]
+    if value is None:
+        return None
+    return blocks[value]
+
+
+def _expand(entry: Dict[str, Any], blocks: Dict[str, Any]) -> Dict[str, Any]:
+    expanded = dict(entry)
+    if entry.get("type") == "request":
+        expanded["system"] = _resolve(entry.get("system"), blocks)
+        expanded["tools"] = _resolve(entry.get("tools"), blocks)
+        expanded["messages"] = [
+            {**msg, "content": _resolve(msg.get("content"), blocks)}
+            for msg in entry.get("messages") or []
+        ]
+    elif entry.get("type") == "response":
+        expanded["content"] = _resolve(entry.get("content"), blocks)
+    return expanded
+
+
+def read_log_file(path: Path) -> Iterator[Dict[str, Any]]:
+    """Iterate over the entries of one log file, in the plain log format.
+
+    Handles plain JSONL logs as well as compressed content-addressed logs,
+    whose references are resolved back into full requests and responses.
+    A truncated final line (from a crash mid-write) is ignored.
+    """
+    path = Path(path)
+    blocks: Dict[str, Any] = {}
+    content_addressed = False
+    with contextlib.ExitStack() as stack:
+        if path.suffix == ".gz":
+            raw = stack.enter_context(open(path, "rb"))
+            f = _iter_lines(_read_gzip_members(raw))
+        else:
+            f = stack.enter_context(_open_reader(path))
+        try:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                record_type = record.get("type")
+                if record_type == "log_format":
+                    content_addressed = record.get("format") == LOG_FORMAT
+                elif record_type == "block":
+                    blocks[record["hash"]] = record["data"]
+                elif content_addressed:
+                    yield _expand(record, blocks)
+                else:
+                    yield record
+        except (EOFError, zlib.error):
+            pass  # Compressed stream cut off mid-member
+
+
+def read_log(
+    path: Path, backup_count: int = DEFAULT_BACKUP_COUNT
+) -> Iterator[Dict[str, Any]]:
+    """Iterate over all entries of a (possibly rotated) log, oldest first."""
+    for log_file in log_files(path, backup_count):
+        yield from read_log_file(log_file)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Print request/response log entries as reconstructed JSONL."
+    )
+    parser.add_argument("path", type=Path, help="Log file (.jsonl, .gz or .zst)")
+    parser.add_argument("--type", help="Only print entries of this type")
+    parser.add_argument(
+        "--index",
+        type=int,
+        help="Only print the N-th matching entry (0-based; negative from the end)",
+    )
+    args = parser.parse_args(argv)
+
+    entries = (
+        entry
+        for entry in read_log(args.path)
+        if args.type is None or entry.get("type") == args.type
+    )
+    if args.index is not None:
+        selected = list(entries)
+        try:
+            entries = [selected[args.index]]
+        except IndexError:
+            print(f"No entry at index {args.index}", file=sys.stderr)
+            return 1
+    for entry in entries:
+        print(json.dumps(entry))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
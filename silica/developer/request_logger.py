@@ -2,34 +2,62 @@
 
 This module provides functionality to log all API requests and responses
 to a JSON log file for debugging and analysis purposes.
+
+Paths ending in ``.gz`` or ``.zst`` select the compressed, content-addressed
+format from ``silica.developer.request_log``, which stores each repeated
+message block and tool schema only once. Other paths get plain JSON Lines.
 """
 
 import json
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 from anthropic.types import Message, MessageParam
 
+from silica.developer.request_log import (
+    DEFAULT_BACKUP_COUNT,
+    DEFAULT_MAX_BYTES,
+    ContentAddressedLogWriter,
+    is_content_addressed_path,
+)
+
 
 class RequestResponseLogger:
     """Logger for API requests and responses."""
 
-    def __init__(self, log_file_path: Optional[str] = None):
+    def __init__(
+        self,
+        log_file_path: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+    ):
         """Initialize the logger.
 
         Args:
             log_file_path: Path to the log file. If None, logging is disabled.
+            max_bytes: Rotation size for compressed (.gz/.zst) logs.
+            backup_count: Number of rotated compressed logs to keep.
         """
         self.log_file_path = Path(log_file_path) if log_file_path else None
         self.enabled = log_file_path is not None
+        self._compact_writer: Optional[ContentAddressedLogWriter] = None
+        self._file = None
+        self._lock = threading.Lock()
 
         if self.enabled:
             # Create parent directory if it doesn't exist
             self.log_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Create or append to log file
-            if not self.log_file_path.exists():
+            if is_content_addressed_path(self.log_file_path):
+                self._compact_writer = ContentAddressedLogWriter(
+                    self.log_file_path,
+                    max_bytes=max_bytes,
+                    backup_count=backup_count,
+                )
+            elif not self.log_file_path.exists():
+                # Create or append to log file
                 self.log_file_path.write_text("")
 
     def log_request(
@@ -257,15 +285,33 @@ class RequestResponseLogger:
 
         return serialized
 
+    def close(self) -> None:
+        """Close the underlying log file, finishing any compressed stream."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if self._compact_writer is not None:
+            self._compact_writer.close()
+
     def _write_log_entry(self, entry: dict) -> None:
         """Write a log entry to the file.
 
+        The file is kept open between entries; plain logs are line-buffered
+        so every entry is on disk as soon as it is written.
+
         Args:
             entry: Log entry dictionary
         """
         try:
-            with open(self.log_file_path, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+            if self._compact_writer is not None:
+                self._compact_writer.write(entry)
+                return
+            line = json.dumps(entry) + "\n"
+            with self._lock:
+                if self._file is None:
+                    self._file = open(self.log_file_path, "a", buffering=1)
+                self._file.write(line)
         except Exception:
             # Silently fail to avoid disrupting the main application
             # In a production system, we might want to log this somewhere
@@ -1,6 +1,7 @@
 import os
 import tempfile
 import subprocess
+import time
 from enum import Enum, auto
 from typing import Dict, Callable, Optional, Set, Tuple, Union
 
@@ -149,6 +150,11 @@ def _default_permission_check_rendering_callback(
     pass
 
 
+# Directories modified this recently (ns) may still change within the same
+# mtime tick, so listings that include them are not trusted from the cache
+_RACY_MTIME_NS = 1_000_000_000
+
+
 class Sandbox:
     def __init__(
         self,
@@ -168,6 +174,8 @@ class Sandbox:
         )
         self.permissions_cache = self._initialize_cache()
         self.gitignore_spec = self._load_gitignore()
+        # (path, recursive, limit) -> (directory mtimes, racy, listing)
+        self._listing_cache: Dict[tuple, tuple] = {}
 
         # Enhanced permission tracking
         self.allowed_tools: Set[str] = set()  # Permanently allowed tools
@@ -194,16 +202,62 @@ class Sandbox:
         return PathSpec.from_lines(GitWildMatchPattern, patterns)
 
     def get_directory_listing(self, path="", recursive=True, limit=1000):
-        listing = []
+        """List the files under ``path``, relative to it.
+
+        Listings are cached until a walked directory's mtime changes (any
+        file added, removed or renamed below it) or the sandbox writes a
+        file, so repeated listings of an unchanged tree only stat its
+        directories. Returns an empty list if there are ``limit`` or more
+        files.
+        """
         target_dir = os.path.join(self.root_directory, path)
 
         if not self._is_path_in_sandbox(target_dir):
             raise ValueError(f"Path {path} is outside the sandbox")
 
+        key = (path, recursive, limit)
+        cached = self._listing_cache.get(key)
+        if cached is not None:
+            directory_mtimes, racy, listing = cached
+            if not racy and all(
+                self._directory_mtime(directory) == mtime
+                for directory, mtime in directory_mtimes.items()
+            ):
+                return list(listing)
+
+        started = time.time_ns()
+        directory_mtimes = {}
+        listing = self._walk_directory(
+            path, target_dir, recursive, limit, directory_mtimes
+        )
+        racy = any(
+            mtime is None or mtime >= started - _RACY_MTIME_NS
+            for mtime in directory_mtimes.values()
+        )
+        self._listing_cache[key] = (directory_mtimes, racy, listing)
+        return list(listing)
+
+    def invalidate_directory_listing(self) -> None:
+        """Drop cached directory listings."""
+        self._listing_cache.clear()
+
+    @staticmethod
+    def _directory_mtime(directory: str) -> Optional[int]:
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def _walk_directory(self, path, target_dir, recursive, limit, directory_mtimes):
+        # A tree over the limit stops the walk early; only the directories
+        # walked so far are watched for changes
+        directory_mtimes[target_dir] = self._directory_mtime(target_dir)
         if not os.path.exists(target_dir):
             return []
 
+        listing = []
         for root, dirs, files in os.walk(target_dir, followlinks=True):
+            directory_mtimes[root] = self._directory_mtime(root)
             # Remove ignored directories to prevent further traversal
             dirs[:] = [
                 d
@@ -525,6 +579,7 @@ class Sandbox:
             os.makedirs(os.path.dirname(full_path), exist_ok=True)
             with open(full_path, "w") as file:
                 file.write(content)
+            self.invalidate_directory_listing()
 
     def create_file(self, file_path, content=""):
         """
@@ -544,3 +599,4 @@ class Sandbox:
         os.makedirs(os.path.dirname(full_path), exist_ok=True)
         with open(full_path, "w") as file:
             file.write(content)
+        self.invalidate_directory_listing()
@@ -0,0 +1,276 @@
+"""Persona-level catalog of session summaries.
+
+Listing or resuming sessions used to open every session directory and parse
+its full ``root.context.jsonl`` just to count messages and find the first
+user message, which gets slow with thousands of sessions. The catalog keeps
+one summary record per session in ``history/.catalog.jsonl`` so that listing
+only reads that file.
+
+The catalog is an append-only JSON Lines manifest: ``AgentContext.flush``
+appends a fresh record for its session and the last record for a session
+wins. Each record carries the size and mtime of the session's metadata file
+(``session.json`` or legacy ``root.json``). When loading, the history
+directory is scanned and sessions whose metadata file is missing from the
+catalog or has changed (e.g. written by history sync or an older silica)
+are re-read from disk, so a missing or stale catalog rebuilds itself. The
+file is rewritten in compacted form once superseded records pile up.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = ".catalog.jsonl"
+
+# Rewrite the catalog once it holds this many more lines than live sessions
+COMPACT_SLACK = 64
+
+# Summary fields exposed to callers; the rest of a record is bookkeeping
+SUMMARY_FIELDS = (
+    "session_id",
+    "created_at",
+    "last_updated",
+    "root_dir",
+    "message_count",
+    "model",
+    "first_message",
+)
+
+
+def extract_first_user_message(messages: List[Dict]) -> Optional[str]:
+    """Extract the text content of the first user message.
+
+    Args:
+        messages: List of message dictionaries
+
+    Returns:
+        The text content of the first user message, or None if not found
+    """
+    for message in messages:
+        if message.get("role") == "user":
+            content = message.get("content")
+            if isinstance(content, str):
+                return content
+            elif isinstance(content, list):
+                # Handle structured content (list of content blocks)
+                for block in content:
+                    if isinstance(block, dict) and block.get("type") == "text":
+                        return block.get("text", "")
+            break
+    return None
+
+
+def read_session_summary(session_dir: Path) -> Optional[Dict]:
+    """Read session summary from v2 format or legacy root.json.
+
+    This parses the session's context, so it is the slow path that the
+    catalog avoids.
+
+    Returns:
+        Session info dict, or None if the session can't be read.
+    """
+    session_json = session_dir / "session.json"
+
+    # Try v2 format first
+    if session_json.exists():
+        try:
+            meta = json.loads(session_json.read_text())
+            if meta.get("version", 0) >= 2:
+                # Read context for message count and first message
+                from silica.developer.session_store import SessionStore
+
+                store = SessionStore(session_dir, agent_name="root")
+                context_msgs = store.read_context()
+                return summarize_session(meta, context_msgs, session_dir.name)
+        except (json.JSONDecodeError, IOError):
+            pass
+
+    # Fall back to legacy root.json
+    root_file = session_dir / "root.json"
+    if not root_file.exists():
+        return None
+
+    with open(root_file, "r") as f:
+        session_data = json.load(f)
+
+    if "metadata" not in session_data:
+        return None
+
+    metadata = session_data["metadata"]
+    messages = session_data.get("messages", [])
+
+    return {
+        "session_id": session_data.get("session_id", session_dir.name),
+        "created_at": metadata.get("created_at"),
+        "last_updated": metadata.get("last_updated"),
+        "root_dir": metadata.get("root_dir"),
+        "message_count": len(messages),
+        "model": session_data.get("model_spec", {}).get("title", "Unknown"),
+        "first_message": extract_first_user_message(messages),
+    }
+
+
+def summarize_session(
+    meta: Dict[str, Any], context_msgs: List[Dict], default_id: str
+) -> Dict:
+    """Build a session summary from session.json contents and its context."""
+    model_spec = meta.get("model_spec") or {}
+    return {
+        "session_id": meta.get("session_id", default_id),
+        "created_at": meta.get("created_at"),
+        "last_updated": meta.get("last_updated"),
+        "root_dir": meta.get("root_dir"),
+        "message_count": len(context_msgs),
+        "model": model_spec.get("title", "Unknown"),
+        "first_message": extract_first_user_message(context_msgs),
+    }
+
+
+def _meta_signature(session_dir: Path) -> Optional[List[int]]:
+    """Return [size, mtime_ns] of the session's metadata file, if any."""
+    for name in ("session.json", "root.json"):
+        try:
+            st = (session_dir / name).stat()
+        except OSError:
+            continue
+        return [st.st_size, st.st_mtime_ns]
+    return None
+
+
+class SessionCatalog:
+    """Summary index over the sessions in a persona's history directory.
+
+    Args:
+        history_dir: The persona's ``history`` directory.
+    """
+
+    def __init__(self, history_dir: Path) -> None:
+        self.history_dir = Path(history_dir)
+
+    @property
+    def path(self) -> Path:
+        return self.history_dir / CATALOG_FILENAME
+
+    def record(self, session_dir: Path, summary: Dict) -> None:
+        """Append the summary for a session that was just written.
+
+        Failures are logged rather than raised: the catalog is only an
+        index and will be repaired from disk on the next load.
+        """
+        entry = {
+            **{key: summary.get(key) for key in SUMMARY_FIELDS},
+            "dir": Path(session_dir).name,
+            "signature": _meta_signature(Path(session_dir)),
+        }
+        try:
+            self._append([entry])
+        except OSError as e:
+            logger.warning("Could not update session catalog %s: %s", self.path, e)
+
+    def sessions(self) -> List[Dict]:
+        """Return the summaries of all readable sessions.
+
+        Only sessions whose metadata changed since they were catalogued are
+        read from disk; everything else comes from the catalog file.
+        """
+        if not self.history_dir.exists():
+            return []
+
+        entries, line_count = self._load()
+        live: Dict[str, Dict] = {}
+        updates: List[Dict] = []
+
+        for session_dir in self._session_dirs():
+            signature = _meta_signature(session_dir)
+            if signature is None:
+                continue
+            entry = entries.get(session_dir.name)
+            if entry is None or entry.get("signature") != signature:
+                entry = self._read_entry(session_dir, signature)
+                updates.append(entry)
+            live[session_dir.name] = entry
+
+        try:
+            if line_count + len(updates) > len(live) + COMPACT_SLACK:
+                self._rewrite(list(live.values()))
+            elif updates:
+                self._append(updates)
+        except OSError as e:
+            logger.warning("Could not update session catalog %s: %s", self.path, e)
+
+        return [
+            {key: entry.get(key) for key in SUMMARY_FIELDS}
+            for entry in live.values()
+            if entry.get("session_id") is not None
+        ]
+
+    def rebuild(self) -> List[Dict]:
+        """Discard the catalog and rebuild it from the session directories."""
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return self.sessions()
+
+    def _session_dirs(self) -> List[Path]:
+        with os.scandir(self.history_dir) as it:
+            return [
+                Path(entry.path)
+                for entry in it
+                if entry.is_dir() and not entry.name.startswith(".")
+            ]
+
+    @staticmethod
+    def _read_entry(session_dir: Path, signature: List[int]) -> Dict:
+        try:
+            summary = read_session_summary(session_dir)
+        except (json.JSONDecodeError, IOError, KeyError):
+            summary = None
+        # Unreadable sessions are catalogued too, so they are not re-read
+        # on every listing until their metadata changes.
+        entry = {key: (summary or {}).get(key) for key in SUMMARY_FIELDS}
+        entry["dir"] = session_dir.name
+        entry["signature"] = signature
+        return entry
+
+    def _load(self) -> tuple[Dict[str, Dict], int]:
+        """Return ({session dir: latest entry}, number of lines)."""
+        entries: Dict[str, Dict] = {}
+        line_count = 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line_count += 1
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn write; the session gets re-read
+                    if isinstance(entry, dict) and "dir" in entry:
+                        entries[entry["dir"]] = entry
+        except OSError:
+            pass
+        return entries, line_count
+
+    def _append(self, entries: List[Dict]) -> None:
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        data = "".join(json.dumps(entry, default=str) + "\n" for entry in entries)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(data)
+
+    def _rewrite(self, entries: List[Dict]) -> None:
+        tmp_path = self.path.with_suffix(".jsonl.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, default=str) + "\n")
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            raise
@@ -5,10 +5,12 @@ Provides read/write primitives for the v2 session file layout:
   <agent>.history.jsonl  — append-only complete message log
   <agent>.metadata.jsonl — per-turn usage/model metadata
   <agent>.context.jsonl  — current context window (rewritten on compaction)
+  <agent>.tool-results/  — offloaded tool result payloads, by content hash
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
@@ -84,6 +86,10 @@ class SessionStore:
     def context_path(self) -> Path:
         return self.session_dir / f"{self.agent_name}.context.jsonl"
 
+    @property
+    def tool_results_dir(self) -> Path:
+        return self.session_dir / f"{self.agent_name}.tool-results"
+
     # For root agent, use friendlier names without the "root." prefix.
     # Actually — keep consistent naming. The file is "root.history.jsonl".
     # Consumers look for "<agent_name>.history.jsonl".
@@ -253,6 +259,34 @@ class SessionStore:
         """Read the current context window."""
         return self._read_jsonl(self.context_path)
 
+    # ------------------------------------------------------------------
+    # <agent>.tool-results/ — content-addressed tool result payloads
+    # ------------------------------------------------------------------
+
+    _CONTENT_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+
+    def write_tool_result(self, content: Any) -> str:
+        """Store a tool result's content; returns its SHA-256 content hash."""
+        data = json.dumps(content, cls=PydanticJSONEncoder, sort_keys=True)
+        content_hash = hashlib.sha256(data.encode("utf-8")).hexdigest()
+        path = self.tool_results_dir / f"{content_hash}.json"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".json.tmp")
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, path)
+        return content_hash
+
+    def read_tool_result(self, content_hash: str) -> Any | None:
+        """Read stored tool result content, or None if unknown."""
+        if not self._CONTENT_HASH_RE.match(content_hash or ""):
+            return None
+        path = self.tool_results_dir / f"{content_hash}.json"
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
     # ------------------------------------------------------------------
     # Legacy detection
     # ------------------------------------------------------------------
@@ -0,0 +1,204 @@
+"""Offloading of stale, large tool results from the conversation.
+
+Old tool results (file reads, shell output, web pages) often make up most
+of the context, long after the agent has acted on them. Instead of
+summarizing them with a model, ``offload_stale_tool_results`` replaces a
+tool result that is older than ``after_turns`` assistant responses and
+larger than ``min_tokens`` with a short stub naming the content hash of
+its payload. The payload is kept in the session's content-addressed store
+(``SessionStore.write_tool_result``) and the ``rehydrate_tool_result``
+tool returns it on demand.
+
+Rewriting an old message invalidates the prompt cache from that message
+on, so results are only offloaded once at least ``batch_tokens`` can be
+removed at once rather than one result per turn.
+
+The stage is configured with the ``SILICA_TOOL_RESULT_OFFLOAD_TURNS``
+(0 disables it) and ``SILICA_TOOL_RESULT_OFFLOAD_MIN_TOKENS`` environment
+variables.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any
+
+from silica.developer.tool_result_limit import get_result_content_size
+from silica.developer.utils import get_block_attr
+
+# Tool results are offloaded once this many assistant responses followed them
+DEFAULT_OFFLOAD_AFTER_TURNS = 8
+
+# Smallest tool result worth offloading
+DEFAULT_OFFLOAD_MIN_TOKENS = 2000
+
+# Tokens that must be removable before any result is offloaded
+DEFAULT_OFFLOAD_BATCH_TOKENS = 20000
+
+# Characters of the original result kept in the stub
+PREVIEW_CHARS = 300
+
+STUB_PREFIX = "[Tool result offloaded"
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    env_value = os.getenv(name)
+    if env_value:
+        try:
+            value = int(env_value)
+            if value >= minimum:
+                return value
+            print(
+                f"Warning: {name}={value} is below minimum {minimum}, "
+                f"using default {default}"
+            )
+        except ValueError:
+            print(
+                f"Warning: Invalid {name} value '{env_value}', using default {default}"
+            )
+    return default
+
+
+def get_offload_after_turns() -> int:
+    """Assistant responses after which a tool result may be offloaded (0: never)."""
+    return _env_int("SILICA_TOOL_RESULT_OFFLOAD_TURNS", DEFAULT_OFFLOAD_AFTER_TURNS, 0)
+
+
+def get_offload_min_tokens() -> int:
+    """Smallest estimated size of a tool result that is offloaded."""
+    return _env_int(
+        "SILICA_TOOL_RESULT_OFFLOAD_MIN_TOKENS", DEFAULT_OFFLOAD_MIN_TOKENS, 100
+    )
+
+
+def is_offloaded(block: dict) -> bool:
+    content = block.get("content")
+    return isinstance(content, str) and content.startswith(STUB_PREFIX)
+
+
+def _preview(content: Any) -> str:
+    if isinstance(content, list):
+        content = " ".join(
+            item.get("text", "")
+            for item in content
+            if isinstance(item, dict) and item.get("type") == "text"
+        )
+    if not isinstance(content, str):
+        return ""
+    text = " ".join(content[: PREVIEW_CHARS * 2].split())
+    if len(text) > PREVIEW_CHARS:
+        text = text[:PREVIEW_CHARS] + "..."
+    return text
+
+
+def create_offload_stub(
+    tool_name: str, tokens: int, content_hash: str, preview: str
+) -> str:
+    """Create the text that replaces an offloaded tool result."""
+    stub = (
+        f"{STUB_PREFIX}: ~{tokens:,} tokens from '{tool_name}' were removed "
+        f"from the conversation to save context. Call "
+        f'rehydrate_tool_result(content_hash="{content_hash}") if you need '
+        f"the full result again.]"
+    )
+    if preview:
+        stub += f"\nPreview: {preview}"
+    return stub
+
+
+@dataclass
+class OffloadResult:
+    """What one offload pass removed from the conversation."""
+
+    results: int = 0
+    tokens: int = 0
+
+
+def offload_stale_tool_results(
+    messages: list[dict],
+    store,
+    after_turns: int | None = None,
+    min_tokens: int | None = None,
+    batch_tokens: int = DEFAULT_OFFLOAD_BATCH_TOKENS,
+) -> OffloadResult:
+    """Replace stale, large tool results in ``messages`` with stubs.
+
+    Messages holding offloaded results are replaced by new message dicts
+    (the list is modified in place; the original dicts are not).
+
+    Args:
+        messages: Conversation history, e.g. ``AgentContext.chat_history``
+        store: SessionStore keeping the offloaded payloads
+        after_turns: Assistant responses after which a result is stale
+        min_tokens: Smallest estimated size of a result to offload
+        batch_tokens: Tokens that must be removable before offloading any
+
+    Returns:
+        OffloadResult with the number of results and tokens removed
+    """
+    if after_turns is None:
+        after_turns = get_offload_after_turns()
+    if min_tokens is None:
+        min_tokens = get_offload_min_tokens()
+    if after_turns <= 0:
+        return OffloadResult()
+
+    # Only messages followed by at least after_turns assistant responses
+    cutoff = 0
+    responses = 0
+    for index in range(len(messages) - 1, -1, -1):
+        if messages[index].get("role") == "assistant":
+            responses += 1
+            if responses >= after_turns:
+                cutoff = index
+                break
+
+    candidates: dict[int, list[tuple[int, int]]] = {}
+    removable = 0
+    for index in range(cutoff):
+        message = messages[index]
+        content = message.get("content")
+        if message.get("role") != "user" or not isinstance(content, list):
+            continue
+        for position, block in enumerate(content):
+            if not isinstance(block, dict) or block.get("type") != "tool_result":
+                continue
+            if is_offloaded(block):
+                continue
+            tokens, _ = get_result_content_size(block)
+            if tokens >= min_tokens:
+                candidates.setdefault(index, []).append((position, tokens))
+                removable += tokens
+    if removable < max(batch_tokens, 1):
+        return OffloadResult()
+
+    tool_names = {}
+    for message in messages[:cutoff]:
+        content = message.get("content")
+        if message.get("role") != "assistant" or not isinstance(content, list):
+            continue
+        for block in content:
+            if get_block_attr(block, "type") == "tool_use":
+                tool_names[get_block_attr(block, "id")] = get_block_attr(
+                    block, "name", "tool"
+                )
+
+    result = OffloadResult()
+    for index, blocks in candidates.items():
+        content = list(messages[index]["content"])
+        for position, tokens in blocks:
+            block = content[position]
+            content_hash = store.write_tool_result(block.get("content"))
+            stub = {
+                k: v for k, v in block.items() if k not in ("content", "cache_control")
+            }
+            stub["content"] = create_offload_stub(
+                tool_names.get(block.get("tool_use_id"), "tool"),
+                tokens,
+                content_hash,
+                _preview(block.get("content")),
+            )
+            content[position] = stub
+            result.results += 1
+            result.tokens += tokens
+        messages[index] = {**messages[index], "content": content}
+    return result
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Callable, List, Dict
 
 from anthropic.types import MessageParam
 
+from .cache_planner import CachePlanner
 from .context import AgentContext
 import subprocess
 import inspect
@@ -1464,6 +1465,20 @@ class Toolbox:
         total_tokens = total_input_tokens + total_output_tokens + total_thinking_tokens
         info += f"**Total Tokens:** {total_tokens:,}\n\n"
 
+        # Prompt caching
+        cache_write_tokens = usage.get("cache_write_tokens", 0)
+        prompt_tokens = total_input_tokens + cached_tokens + cache_write_tokens
+        if prompt_tokens > 0:
+            info += "## Prompt Caching\n\n"
+            hit_ratio = cached_tokens / prompt_tokens * 100
+            info += f"**Cache Hit Ratio:** {hit_ratio:.1f}% of {prompt_tokens:,} prompt tokens\n\n"
+            info += f"**Cache Reads:** {cached_tokens:,}\n\n"
+            info += f"**Cache Writes:** {cache_write_tokens:,}\n\n"
+            info += f"**Tokens Saved:** {usage.get('cache_saved_tokens', 0):,} (net of cache-write cost)\n\n"
+            planner = self.context.cache_planner
+            if isinstance(planner, CachePlanner) and planner.last_plan:
+                info += f"**Cache Breakpoints:** {', '.join(planner.last_plan)}\n\n"
+
         # Cost information
         info += "## Cost Information\n\n"
         info += f"**Session Cost:** ${total_cost:.4f}\n\n"
@@ -4024,11 +4039,18 @@ Let's collaborate on creating a solid plan before implementation."""
         lines = ["[bold]MCP Servers:[/bold]"]
         for status in statuses:
             # Build status line
-            conn_icon = "✓" if status.connected else "✗"
-            conn_color = "green" if status.connected else "red"
-            conn_text = "connected" if status.connected else "disconnected"
-
-            tool_text = f"{status.tool_count:2d} tools" if status.connected else ""
+            if status.pending:
+                conn_icon, conn_color, conn_text = "◌", "cyan", "deferred"
+            else:
+                conn_icon = "✓" if status.connected else "✗"
+                conn_color = "green" if status.connected else "red"
+                conn_text = "connected" if status.connected else "disconnected"
+
+            tool_text = (
+                f"{status.tool_count:2d} tools"
+                if status.connected or status.pending
+                else ""
+            )
             cache_text = f"cache: {'on' if status.cache_enabled else 'off'}"
 
             # Extra status indicators
@@ -4043,6 +4065,13 @@ Let's collaborate on creating a solid plan before implementation."""
                 f"  {status.name:16} [{conn_color}]{conn_icon} {conn_text:12}[/{conn_color}]"
                 f"  {tool_text:10}  {cache_text}{extra_text}"
             )
+            if status.result_cache is not None:
+                rc = status.result_cache
+                lines.append(
+                    f"  {'':16} [dim]results: {rc.hits} hits, {rc.misses} misses, "
+                    f"{rc.coalesced} coalesced ({rc.hit_ratio:.0%}), "
+                    f"{rc.size} cached[/dim]"
+                )
 
         _print("\n".join(lines))
         return ("", False)
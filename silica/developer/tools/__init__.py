@@ -1,7 +1,8 @@
 from .subagent import agent
 from .files import read_file, write_file, list_directory, edit_file
 from .sandbox_debug import sandbox_debug
-from .repl import python_repl
+from .tool_results import rehydrate_tool_result
+from .repl import python_repl, python_repl_reset
 
 # Worker coordination tools (for agents spawned by a coordinator)
 from .worker_coordination import (
@@ -21,6 +22,7 @@ from .worker_coordination import (
 )
 from .shell import (
     shell_execute,
+    shell_output_read,
     shell_session_create,
     shell_session_execute,
     shell_session_list,
@@ -129,10 +131,12 @@ ALL_TOOLS = (
         list_directory,
         edit_file,
         sandbox_debug,
+        rehydrate_tool_result,
         web_search,
         agent,
         safe_curl,
         python_repl,
+        python_repl_reset,
         # Browser tools
         get_browser_capabilities,
         # Browser session tools
@@ -146,6 +150,7 @@ ALL_TOOLS = (
         browser_session_get_info,
         # Shell tools (dual architecture)
         shell_execute,
+        shell_output_read,
         shell_session_create,
         shell_session_execute,
         shell_session_list,
@@ -6,28 +6,253 @@ multiple tool invocations, enabling complex workflows like:
 - Interact with elements
 - Inspect the resulting DOM
 - Continue interacting based on results
+
+All sessions of the process share one headless Chromium (``SharedBrowser``);
+each session gets its own ``BrowserContext``, so cookies and storage stay
+isolated while opening a session costs a context instead of a browser
+launch. A few contexts are created ahead of time so the next session can
+start immediately. Sessions idle for longer than the manager's
+``idle_timeout`` are closed.
 """
 
+import asyncio
 import atexit
+import os
 import re
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+import signal
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_VIEWPORT = {"width": 1920, "height": 1080}
+
+# Contexts (with an open page) kept ready for new sessions
+DEFAULT_CONTEXT_POOL_SIZE = 1
+
+# Sessions without activity for this long are closed
+DEFAULT_IDLE_TIMEOUT = timedelta(minutes=30)
+
+# Playwright resource types a session may block, e.g. for text-only scraping
+BLOCKABLE_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+def parse_blocked_resources(value: Optional[str]) -> Tuple[str, ...]:
+    """Parse a comma-separated list of resource types to block.
+
+    Raises:
+        ValueError: If a type is not in BLOCKABLE_RESOURCE_TYPES
+    """
+    if not value:
+        return ()
+    types = tuple(dict.fromkeys(t.strip().lower() for t in value.split(",")))
+    unknown = [t for t in types if t and t not in BLOCKABLE_RESOURCE_TYPES]
+    if unknown:
+        raise ValueError(
+            f"Cannot block resource type(s) {', '.join(unknown)}. "
+            f"Choose from: {', '.join(sorted(BLOCKABLE_RESOURCE_TYPES))}"
+        )
+    return tuple(t for t in types if t)
+
+
+class SharedBrowser:
+    """One headless Chromium shared by all browser sessions of the process.
+
+    The browser is launched on first use and relaunched if it disconnects
+    or the event loop changes (Playwright objects belong to the loop that
+    created them).
+
+    Args:
+        pool_size: Number of ready contexts to keep for new sessions
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_CONTEXT_POOL_SIZE):
+        self.pool_size = pool_size
+        self.playwright = None
+        self.browser = None
+        self._loop = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._pool: List[Tuple[object, object]] = []
+        self._refill_task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the browser is up in the current event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return self.browser is not None and self._loop is loop
+
+    async def get_browser(self):
+        """Return the shared browser, launching it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Objects from another (likely closed) loop cannot be used here
+            self._forget()
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self.browser is None or not self.browser.is_connected():
+                await self._stop_playwright()
+                from playwright.async_api import async_playwright
+
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(headless=True)
+                self._pool = []
+            return self.browser
+
+    async def new_context(
+        self,
+        viewport: Optional[Dict[str, int]] = None,
+        blocked_resources: Iterable[str] = (),
+    ):
+        """Create an isolated context with one open page.
+
+        Uses a pre-created context when one is ready and schedules the pool
+        to be refilled.
+
+        Returns:
+            Tuple of (context, page)
+        """
+        viewport = viewport or DEFAULT_VIEWPORT
+        await self.get_browser()
+        if self._pool:
+            context, page = self._pool.pop()
+            if viewport != DEFAULT_VIEWPORT:
+                await page.set_viewport_size(viewport)
+        else:
+            context, page = await self._create_context(viewport)
+        await self._block_resources(context, blocked_resources)
+        self._schedule_refill()
+        return context, page
+
+    async def fill_pool(self) -> None:
+        """Create contexts until ``pool_size`` are ready."""
+        browser = await self.get_browser()
+        while len(self._pool) < self.pool_size and browser.is_connected():
+            self._pool.append(await self._create_context(DEFAULT_VIEWPORT))
+
+    async def close(self) -> None:
+        """Close the pooled contexts, the browser and the Playwright driver."""
+        await self._close_handles(*self._detach())
+
+    async def _create_context(self, viewport: Dict[str, int]):
+        context = await self.browser.new_context(viewport=viewport)
+        page = await context.new_page()
+        return context, page
+
+    @staticmethod
+    async def _block_resources(context, blocked_resources: Iterable[str]) -> None:
+        blocked = frozenset(blocked_resources)
+        if not blocked:
+            return
+
+        async def handle(route):
+            if route.request.resource_type in blocked:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", handle)
+
+    def _schedule_refill(self) -> None:
+        if self.pool_size <= 0:
+            return
+        if self._refill_task is not None and not self._refill_task.done():
+            return
+        self._refill_task = asyncio.ensure_future(self._refill())
+
+    async def _refill(self) -> None:
+        try:
+            await self.fill_pool()
+        except Exception:
+            # Sessions fall back to creating their context on demand
+            pass
+
+    async def _stop_playwright(self) -> None:
+        playwright, self.playwright = self.playwright, None
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception:
+                pass
+
+    def _detach(self):
+        """Clear the Playwright handles and return them for closing."""
+        handles = (self._refill_task, self._pool, self.browser, self.playwright)
+        self._refill_task = None
+        self._pool = []
+        self.browser = None
+        self.playwright = None
+        return handles
+
+    @staticmethod
+    async def _close_handles(refill_task, pool, browser, playwright) -> None:
+        if refill_task is not None and not refill_task.done():
+            refill_task.cancel()
+        for context, _ in pool:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        try:
+            if browser is not None:
+                await browser.close()
+        except Exception:
+            pass
+        try:
+            if playwright is not None:
+                await playwright.stop()
+        except Exception:
+            pass
+
+    def _forget(self) -> None:
+        """Drop the handles of the previous event loop, closing them if possible.
+
+        Playwright objects can only be driven from the loop that created them.
+        If that loop is still running (in another thread) they are closed
+        there; otherwise the driver process is terminated, which makes it
+        close its browser.
+        """
+        loop = self._loop
+        handles = self._detach()
+        if handles[2] is None and handles[3] is None:
+            return
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._close_handles(*handles), loop)
+        else:
+            _terminate_driver(handles[3])
+
+
+def _terminate_driver(playwright) -> None:
+    """Best-effort SIGTERM to the driver process behind ``playwright``."""
+    try:
+        # Playwright exposes no public handle on its driver process
+        proc = playwright._impl_obj._connection._transport._proc
+        if proc.returncode is None:
+            os.kill(proc.pid, signal.SIGTERM)
+    except Exception:
+        pass
 
 
 class BrowserSession:
     """Represents a single persistent browser session."""
 
     def __init__(
-        self, name: str, viewport_width: int = 1920, viewport_height: int = 1080
+        self,
+        name: str,
+        viewport_width: int = 1920,
+        viewport_height: int = 1080,
+        blocked_resources: Iterable[str] = (),
     ):
         self.name = name
         self.created_at = datetime.now()
         self.last_activity = datetime.now()
         self.viewport_width = viewport_width
         self.viewport_height = viewport_height
+        self.blocked_resources = tuple(blocked_resources)
         self.status = "active"  # active, error
 
-        # Playwright objects (initialized on first use)
+        # Playwright objects (initialized on first use); the browser is shared
         self.playwright = None
         self.browser = None
         self.context = None  # Browser context for cookies/state
@@ -37,29 +262,24 @@ class BrowserSession:
         self.current_url = None
         self.actions_performed = []
 
-    async def initialize(self):
-        """Initialize browser and page."""
-        from playwright.async_api import async_playwright
-
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=True)
-        self.context = await self.browser.new_context(
-            viewport={"width": self.viewport_width, "height": self.viewport_height}
+    async def initialize(self, shared_browser: Optional[SharedBrowser] = None):
+        """Open this session's context and page in the shared browser."""
+        shared_browser = shared_browser or get_shared_browser()
+        self.context, self.page = await shared_browser.new_context(
+            viewport={"width": self.viewport_width, "height": self.viewport_height},
+            blocked_resources=self.blocked_resources,
         )
-        self.page = await self.context.new_page()
+        self.playwright = shared_browser.playwright
+        self.browser = shared_browser.browser
         self.last_activity = datetime.now()
 
     async def close(self):
-        """Close browser and cleanup."""
+        """Close this session's page and context (the browser stays up)."""
         try:
             if self.page:
                 await self.page.close()
             if self.context:
                 await self.context.close()
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
         except Exception as e:
             # Best effort cleanup
             print(f"Warning: Error during browser session cleanup: {e}")
@@ -86,6 +306,7 @@ class BrowserSession:
             "last_activity": self.last_activity.isoformat(),
             "current_url": self.current_url,
             "viewport": f"{self.viewport_width}x{self.viewport_height}",
+            "blocked_resources": list(self.blocked_resources),
             "actions_count": len(self.actions_performed),
         }
 
@@ -102,13 +323,18 @@ class BrowserSessionManager:
             cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self, max_sessions: int = 5):
+    def __init__(
+        self,
+        max_sessions: int = 5,
+        idle_timeout: Optional[timedelta] = DEFAULT_IDLE_TIMEOUT,
+    ):
         """Initialize the session manager."""
         if self._initialized:
             return
 
         self.sessions: Dict[str, BrowserSession] = {}
         self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
         self.cleanup_registered = False
 
         # Register cleanup handler
@@ -123,7 +349,11 @@ class BrowserSessionManager:
         return bool(re.match(r"^[a-zA-Z0-9_-]+$", name))
 
     async def create_session(
-        self, name: str, viewport_width: int = 1920, viewport_height: int = 1080
+        self,
+        name: str,
+        viewport_width: int = 1920,
+        viewport_height: int = 1080,
+        blocked_resources: Iterable[str] = (),
     ) -> Tuple[bool, str]:
         """Create and initialize a new browser session.
 
@@ -131,10 +361,13 @@ class BrowserSessionManager:
             name: Name for the session (alphanumeric, underscore, dash only)
             viewport_width: Width of the browser viewport in pixels
             viewport_height: Height of the browser viewport in pixels
+            blocked_resources: Resource types the session does not load
 
         Returns:
             Tuple of (success: bool, message: str)
         """
+        await self.reap_idle_sessions()
+
         # Validate session name
         if not name or not self._validate_session_name(name):
             return (
@@ -155,7 +388,9 @@ class BrowserSessionManager:
 
         try:
             # Create and initialize session
-            session = BrowserSession(name, viewport_width, viewport_height)
+            session = BrowserSession(
+                name, viewport_width, viewport_height, blocked_resources
+            )
             await session.initialize()
             self.sessions[name] = session
 
@@ -196,6 +431,30 @@ class BrowserSessionManager:
                 del self.sessions[name]
             return False, f"Error destroying session (removed anyway): {str(e)}"
 
+    async def reap_idle_sessions(self) -> List[str]:
+        """Close sessions without activity for longer than ``idle_timeout``.
+
+        Returns:
+            Names of the closed sessions
+        """
+        if self.idle_timeout is None:
+            return []
+        cutoff = datetime.now() - self.idle_timeout
+        idle = [
+            name
+            for name, session in self.sessions.items()
+            if session.last_activity < cutoff
+        ]
+        for name in idle:
+            await self.destroy_session(name)
+        return idle
+
+    async def shutdown(self) -> None:
+        """Close all sessions and the shared browser."""
+        for name in list(self.sessions):
+            await self.destroy_session(name)
+        await get_shared_browser().close()
+
     def get_session(self, name: str) -> Optional[BrowserSession]:
         """Get a session by name.
 
@@ -208,10 +467,8 @@ class BrowserSessionManager:
         return self.sessions.get(name)
 
     def cleanup_all_sessions(self):
-        """Cleanup all sessions (called on exit)."""
-        import asyncio
-
-        if not self.sessions:
+        """Cleanup all sessions and the shared browser (called on exit)."""
+        if not self.sessions and get_shared_browser().browser is None:
             return
 
         # Always create a fresh event loop for cleanup
@@ -236,14 +493,19 @@ class BrowserSessionManager:
                     pass
 
             self.sessions.clear()
+            try:
+                loop.run_until_complete(get_shared_browser().close())
+            except Exception:
+                pass
         except Exception:
             # Last resort - just clear the sessions dict
             # The browser process will be cleaned up by the OS
             self.sessions.clear()
 
 
-# Global session manager instance
+# Global session manager and shared browser instances
 _session_manager = None
+_shared_browser = None
 
 
 def get_browser_session_manager() -> BrowserSessionManager:
@@ -252,3 +514,11 @@ def get_browser_session_manager() -> BrowserSessionManager:
     if _session_manager is None:
         _session_manager = BrowserSessionManager()
     return _session_manager
+
+
+def get_shared_browser() -> SharedBrowser:
+    """Get the browser shared by all sessions of this process."""
+    global _shared_browser
+    if _shared_browser is None:
+        _shared_browser = SharedBrowser()
+    return _shared_browser
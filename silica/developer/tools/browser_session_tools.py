@@ -13,7 +13,11 @@ from typing import Optional
 
 from silica.developer.context import AgentContext
 
-from .browser_session import get_browser_session_manager
+from .browser_session import (
+    get_browser_session_manager,
+    get_shared_browser,
+    parse_blocked_resources,
+)
 from .framework import tool
 
 
@@ -25,22 +29,23 @@ def _ensure_scratchpad() -> Path:
 
 
 async def _check_playwright_available() -> tuple[bool, Optional[str]]:
-    """Check if Playwright is available and installed."""
-    try:
-        from playwright.async_api import async_playwright
+    """Check if Playwright is available and installed.
 
-        async with async_playwright() as p:
-            try:
-                browser = await p.chromium.launch(headless=True)
-                await browser.close()
-                return True, None
-            except Exception as e:
-                if "Executable doesn't exist" in str(e):
-                    return False, (
-                        "Playwright is installed but browser binaries are missing.\n"
-                        "Install with: playwright install chromium"
-                    )
-                return False, f"Playwright browser error: {str(e)}"
+    Starts the shared browser, so a following session does not launch again.
+    """
+    try:
+        import playwright.async_api  # noqa: F401
+
+        try:
+            await get_shared_browser().get_browser()
+            return True, None
+        except Exception as e:
+            if "Executable doesn't exist" in str(e):
+                return False, (
+                    "Playwright is installed but browser binaries are missing.\n"
+                    "Install with: playwright install chromium"
+                )
+            return False, f"Playwright browser error: {str(e)}"
     except ImportError:
         return False, (
             "Playwright is not installed.\n"
@@ -106,6 +111,7 @@ async def browser_session_create(
     session_name: str,
     viewport_width: int = 1920,
     viewport_height: int = 1080,
+    block_resources: Optional[str] = None,
 ) -> str:
     """Create a new persistent browser session.
 
@@ -117,19 +123,28 @@ async def browser_session_create(
         session_name: Name for the session (alphanumeric, underscore, dash only)
         viewport_width: Width of the browser viewport in pixels (default: 1920)
         viewport_height: Height of the browser viewport in pixels (default: 1080)
+        block_resources: Comma-separated resource types not to load, from
+            image, font, media and stylesheet (e.g. "image,font" for
+            text-only scraping)
 
     Returns:
         Success or error message
     """
-    # Check if Playwright is available
-    playwright_available, error_msg = await _check_playwright_available()
-    if not playwright_available:
-        return f"Browser tools not available:\n{error_msg}"
+    try:
+        blocked = parse_blocked_resources(block_resources)
+    except ValueError as e:
+        return f"Error: {e}"
+
+    # Check if Playwright is available (a running shared browser proves it)
+    if not get_shared_browser().running:
+        playwright_available, error_msg = await _check_playwright_available()
+        if not playwright_available:
+            return f"Browser tools not available:\n{error_msg}"
 
     # Create the session
     manager = get_browser_session_manager()
     success, message = await manager.create_session(
-        session_name, viewport_width, viewport_height
+        session_name, viewport_width, viewport_height, blocked
     )
 
     return message
@@ -4,8 +4,11 @@ These tools are available to the coordinator agent for managing
 worker agents via deaddrop messaging.
 """
 
+import threading
 from typing import Optional
 
+from deadrop import Deaddrop
+
 from silica.developer.coordination import (
     TaskAssign,
     Progress,
@@ -16,11 +19,25 @@ from silica.developer.coordination.session import (
     CoordinationSession,
     AgentState,
 )
+from silica.developer.coordination.worker_pool import (
+    POOLED_WORKER_ENV,
+    WarmWorker,
+    WorkerPool,
+)
 
 
 # Global session reference - set by coordinator initialization
 _current_session: Optional[CoordinationSession] = None
 
+# Warm local workers of the current session (see get_worker_pool)
+_worker_pool: Optional[WorkerPool] = None
+
+# The pool's deaddrop client (see _open_pool_deaddrop). It is used from the
+# pool's maintainer thread and from callers of acquire/shutdown, so its
+# calls are serialized
+_pool_deaddrop: Optional[Deaddrop] = None
+_pool_deaddrop_lock = threading.Lock()
+
 
 def set_current_session(session: CoordinationSession) -> None:
     """Set the current coordination session.
@@ -29,6 +46,8 @@ def set_current_session(session: CoordinationSession) -> None:
     available to coordinator tools.
     """
     global _current_session
+    if session is not _current_session:
+        _shutdown_worker_pool()
     _current_session = session
 
 
@@ -43,6 +62,73 @@ def get_current_session() -> CoordinationSession:
     return _current_session
 
 
+def configure_worker_pool(
+    size: Optional[int] = None, idle_ttl: Optional[float] = None
+) -> Optional[WorkerPool]:
+    """Set up the warm worker pool of the current session and start filling it.
+
+    Args:
+        size: Number of warm local workers to keep (default:
+            ``SILICA_WORKER_POOL_SIZE``, 0 disables the pool)
+        idle_ttl: Seconds before an unused warm worker is replaced (default:
+            ``SILICA_WORKER_POOL_IDLE_TTL``)
+
+    Returns:
+        The pool, or None if it is disabled
+    """
+    global _worker_pool, _pool_deaddrop
+    import atexit
+
+    session = get_current_session()
+    _shutdown_worker_pool()
+
+    pool = WorkerPool(
+        launch=lambda cwd: _launch_pooled_worker(session, cwd, deaddrop),
+        stop=lambda worker: _stop_pooled_worker(session, worker, deaddrop),
+        size=size,
+        idle_ttl=idle_ttl,
+    )
+    if pool.size <= 0:
+        return None
+    deaddrop = _open_pool_deaddrop(session)
+    _worker_pool, _pool_deaddrop = pool, deaddrop
+    atexit.register(pool.shutdown)
+    pool.replenish_async()
+    return pool
+
+
+def get_worker_pool() -> Optional[WorkerPool]:
+    """Get the warm worker pool of the current session, if enabled."""
+    return _worker_pool
+
+
+def _open_pool_deaddrop(session: CoordinationSession) -> Deaddrop:
+    """Open a deaddrop client for the warm pool's background thread.
+
+    The local backend keeps one SQLite connection per client, so sharing the
+    session's client would interleave the pool's writes with the
+    coordinator's transactions. An in-memory backend cannot be reopened and
+    is shared.
+    """
+    options = getattr(session.deaddrop, "_options", None)
+    if options is None or options.is_in_memory():
+        return session.deaddrop
+    return Deaddrop(options)
+
+
+def _shutdown_worker_pool() -> None:
+    """Stop the warm pool and close its deaddrop client."""
+    global _worker_pool, _pool_deaddrop
+    pool, _worker_pool = _worker_pool, None
+    deaddrop, _pool_deaddrop = _pool_deaddrop, None
+    if pool is not None:
+        pool.shutdown()
+    if deaddrop is not None and (
+        _current_session is None or deaddrop is not _current_session.deaddrop
+    ):
+        deaddrop.close()
+
+
 # === Messaging Tools ===
 
 
@@ -149,14 +235,45 @@ def poll_messages(
     Returns:
         Formatted list of received messages
     """
+    messages = receive_agent_messages(include_room=include_room)
+    if not messages:
+        return "No new messages"
+    return format_agent_messages(messages)
+
+
+def receive_agent_messages(include_room: bool = True) -> list:
+    """Receive new messages meant for the agent.
+
+    Readiness announcements of warm pool workers are consumed here and
+    left out of the result.
+
+    Args:
+        include_room: Whether to also check room messages
+
+    Returns:
+        List of received messages
+    """
     session = get_current_session()
     messages = session.context.receive_messages(
         include_room=include_room,
     )
 
-    if not messages:
-        return "No new messages"
+    pool = get_worker_pool()
+    if pool is not None:
+        messages = [m for m in messages if not pool.mark_ready(m.from_id)]
+    return messages
+
+
+def format_agent_messages(messages: list) -> str:
+    """Format received messages for the agent, updating senders' last_seen.
 
+    Args:
+        messages: Messages from receive_agent_messages
+
+    Returns:
+        Formatted list of the messages
+    """
+    session = get_current_session()
     lines = [f"**{len(messages)} new message(s):**\n"]
 
     for recv in messages:
@@ -164,7 +281,7 @@ def poll_messages(
         agent = session.get_agent_by_identity(recv.from_id)
         sender = agent.display_name if agent else recv.from_id[:8]
 
-        # Update last_seen for known agents
+        # Update last_seen for known agents (written once, below)
         if agent:
             session.update_agent_last_seen(agent.agent_id)
 
@@ -210,6 +327,8 @@ def poll_messages(
 
         lines.append("")
 
+    # One journal write for all the last_seen updates above
+    session.flush()
     return "\n".join(lines)
 
 
@@ -772,6 +891,231 @@ def _spawn_remote_worker(
     return "\n".join(lines)
 
 
+def _create_worker_invite_url(
+    session: CoordinationSession,
+    worker_identity: dict,
+    display_name: str,
+    deaddrop: Optional[Deaddrop] = None,
+) -> str:
+    """Create a worker's deaddrop invite URL with coordination metadata."""
+    from urllib.parse import urlencode, urlparse, urlunparse
+
+    invite = (deaddrop or session.deaddrop).create_invite(
+        ns=session.namespace_id,
+        identity_id=worker_identity["id"],
+        identity_secret=worker_identity["secret"],
+        ns_secret=session.namespace_secret,
+        display_name=f"Worker: {display_name}",
+    )
+
+    # Add coordination metadata as query parameters
+    parsed = urlparse(invite["invite_url"])
+    coord_params = urlencode(
+        {
+            "room": session.state.room_id,
+            "coordinator": session.state.coordinator_id,
+        }
+    )
+    new_query = f"{parsed.query}&{coord_params}" if parsed.query else coord_params
+    return urlunparse(
+        (
+            parsed.scheme,
+            parsed.netloc,
+            parsed.path,
+            parsed.params,
+            new_query,
+            parsed.fragment,
+        )
+    )
+
+
+def _launch_tmux_worker(tmux_session: str, worker_dir: str, env_vars: dict) -> None:
+    """Start ``silica worker`` in a new tmux session.
+
+    Raises:
+        subprocess.CalledProcessError: If a tmux command fails
+        FileNotFoundError: If tmux is not installed
+    """
+    import os
+    import subprocess
+    import time
+
+    # Build environment propagation
+    # Copy important env vars from coordinator to worker
+    from silica.remote.utils.github_auth import get_github_token
+
+    propagate_vars = [
+        "ANTHROPIC_API_KEY",
+        "BRAVE_SEARCH_API_KEY",
+        "MEMORY_PROXY_URL",
+        "MEMORY_PROXY_TOKEN",
+    ]
+
+    env_setup = []
+
+    # Add coordination-specific env vars
+    for key, value in env_vars.items():
+        # Escape single quotes in value for shell
+        escaped_value = value.replace("'", "'\\''")
+        env_setup.append(f"export {key}='{escaped_value}'")
+
+    # Add GitHub token
+    github_token = get_github_token()
+    if github_token:
+        env_setup.append(f"export GH_TOKEN='{github_token}'")
+        env_setup.append(f"export GITHUB_TOKEN='{github_token}'")
+
+    # Propagate other important env vars
+    for var in propagate_vars:
+        value = os.environ.get(var)
+        if value:
+            escaped_value = value.replace("'", "'\\''")
+            env_setup.append(f"export {var}='{escaped_value}'")
+
+    env_setup_str = " && ".join(env_setup)
+    worker_command = f"cd '{worker_dir}' && {env_setup_str} && uv run silica worker"
+
+    # Create tmux session
+    subprocess.run(
+        ["tmux", "new-session", "-d", "-s", tmux_session],
+        check=True,
+        capture_output=True,
+    )
+
+    # Give session a moment to initialize
+    time.sleep(0.5)
+
+    # Send the worker command to the session
+    subprocess.run(
+        ["tmux", "send-keys", "-t", tmux_session, worker_command, "C-m"],
+        check=True,
+        capture_output=True,
+    )
+
+
+def _launch_pooled_worker(
+    session: CoordinationSession, cwd: str, deaddrop: Optional[Deaddrop] = None
+) -> WarmWorker:
+    """Launch a worker for the warm pool.
+
+    The worker gets its identity, agent ID and room membership now, but is
+    only registered in the session when spawn_agent binds it. Deaddrop calls
+    go through ``deaddrop`` (default: the session's client).
+    """
+    import uuid
+
+    deaddrop = deaddrop or session.deaddrop
+    agent_id = f"agent-{uuid.uuid4().hex[:8]}"
+    display_name = f"Pooled {agent_id}"
+    with _pool_deaddrop_lock:
+        worker_identity = deaddrop.create_identity(
+            ns=session.namespace_id,
+            display_name=display_name,
+            ns_secret=session.namespace_secret,
+        )
+        deaddrop.add_room_member(
+            ns=session.namespace_id,
+            room_id=session.state.room_id,
+            identity_id=worker_identity["id"],
+            secret=session.state.coordinator_secret,
+        )
+        invite_url = _create_worker_invite_url(
+            session, worker_identity, display_name, deaddrop
+        )
+
+    tmux_session = f"worker-{agent_id}"
+    _launch_tmux_worker(
+        tmux_session,
+        cwd,
+        {
+            "DEADDROP_INVITE_URL": invite_url,
+            "COORDINATION_AGENT_ID": agent_id,
+            POOLED_WORKER_ENV: "1",
+        },
+    )
+    return WarmWorker(
+        agent_id=agent_id,
+        identity_id=worker_identity["id"],
+        tmux_session=tmux_session,
+        cwd=cwd,
+    )
+
+
+def _stop_pooled_worker(
+    session: CoordinationSession,
+    worker: WarmWorker,
+    deaddrop: Optional[Deaddrop] = None,
+) -> None:
+    """Stop a warm worker that was not used and release its identity.
+
+    Kills its tmux session, removes it from the room and deletes its
+    deaddrop identity, so replacing expired workers does not leave stale
+    room members behind.
+    """
+    import subprocess
+
+    try:
+        subprocess.run(
+            ["tmux", "kill-session", "-t", worker.tmux_session],
+            capture_output=True,
+        )
+    except FileNotFoundError:
+        pass  # No tmux, so nothing is running
+    deaddrop = deaddrop or session.deaddrop
+    with _pool_deaddrop_lock:
+        deaddrop.remove_room_member(
+            ns=session.namespace_id,
+            room_id=session.state.room_id,
+            identity_id=worker.identity_id,
+            secret=session.state.coordinator_secret,
+        )
+        deaddrop.delete_identity(
+            ns=session.namespace_id,
+            identity_id=worker.identity_id,
+            ns_secret=session.namespace_secret,
+        )
+
+
+def _bind_warm_worker(
+    session: CoordinationSession,
+    worker: WarmWorker,
+    display_name: str,
+    workspace_name: str,
+) -> str:
+    """Register a warm pool worker as a newly spawned agent."""
+    session.register_agent(
+        agent_id=worker.agent_id,
+        identity_id=worker.identity_id,
+        display_name=display_name,
+        workspace_name=workspace_name,
+    )
+    state = AgentState.IDLE if worker.ready else AgentState.SPAWNING
+    session.update_agent_state(
+        worker.agent_id,
+        state,
+        tmux_session=worker.tmux_session,
+    )
+
+    if worker.ready:
+        status = "- State: IDLE → ready for a task"
+    else:
+        status = "- State: SPAWNING → waiting for worker to connect"
+    return "\n".join(
+        [
+            f"**Agent Created: {display_name}**",
+            f"- Agent ID: {worker.agent_id}",
+            f"- Workspace: {workspace_name}",
+            "- Mode: LOCAL (warm pool)",
+            f"- tmux session: `{worker.tmux_session}`",
+            status,
+            "",
+            "**Worker taken from the warm pool!**",
+            "",
+            f"View worker: `tmux attach -t {worker.tmux_session}`",
+        ]
+    )
+
+
 def spawn_agent(
     workspace_name: str = None,
     display_name: str = None,
@@ -785,6 +1129,9 @@ def spawn_agent(
     2. Registers the agent in the session
     3. Launches the worker in a tmux session (local mode) or via silica remote (remote mode)
 
+    In local mode an already running worker is taken from the warm pool
+    when the pool is enabled and has one for the working directory.
+
     Args:
         workspace_name: Name for the worker's workspace (auto-generated if not provided)
         display_name: Human-readable name for the agent
@@ -806,6 +1153,13 @@ def spawn_agent(
     if not display_name:
         display_name = workspace_name.replace("-", " ").title()
 
+    # Local workers come from the warm pool when one is available
+    pool = None if remote else get_worker_pool()
+    if pool is not None:
+        warm_worker = pool.acquire(cwd or os.getcwd())
+        if warm_worker is not None:
+            return _bind_warm_worker(session, warm_worker, display_name, workspace_name)
+
     # Create identity for the worker
     worker_identity = session.deaddrop.create_identity(
         ns=session.namespace_id,
@@ -828,37 +1182,7 @@ def spawn_agent(
     session.add_agent_to_room(agent_id)
 
     # Create a proper deaddrop invite URL for the worker
-    invite = session.deaddrop.create_invite(
-        ns=session.namespace_id,
-        identity_id=worker_identity["id"],
-        identity_secret=worker_identity["secret"],
-        ns_secret=session.namespace_secret,
-        display_name=f"Worker: {display_name}",
-    )
-
-    invite_url = invite["invite_url"]
-
-    # Add coordination metadata as query parameters
-    from urllib.parse import urlencode, urlparse, urlunparse
-
-    parsed = urlparse(invite_url)
-    coord_params = urlencode(
-        {
-            "room": session.state.room_id,
-            "coordinator": session.state.coordinator_id,
-        }
-    )
-    new_query = f"{parsed.query}&{coord_params}" if parsed.query else coord_params
-    invite_url = urlunparse(
-        (
-            parsed.scheme,
-            parsed.netloc,
-            parsed.path,
-            parsed.params,
-            new_query,
-            parsed.fragment,
-        )
-    )
+    invite_url = _create_worker_invite_url(session, worker_identity, display_name)
 
     # Environment variables for the worker
     env_vars = {
@@ -894,40 +1218,6 @@ def spawn_agent(
         tmux_session=tmux_session,
     )
 
-    # Build environment propagation
-    # Copy important env vars from coordinator to worker
-    from silica.remote.utils.github_auth import get_github_token
-
-    propagate_vars = [
-        "ANTHROPIC_API_KEY",
-        "BRAVE_SEARCH_API_KEY",
-        "MEMORY_PROXY_URL",
-        "MEMORY_PROXY_TOKEN",
-    ]
-
-    env_setup = []
-
-    # Add coordination-specific env vars
-    for key, value in env_vars.items():
-        # Escape single quotes in value for shell
-        escaped_value = value.replace("'", "'\\''")
-        env_setup.append(f"export {key}='{escaped_value}'")
-
-    # Add GitHub token
-    github_token = get_github_token()
-    if github_token:
-        env_setup.append(f"export GH_TOKEN='{github_token}'")
-        env_setup.append(f"export GITHUB_TOKEN='{github_token}'")
-
-    # Propagate other important env vars
-    for var in propagate_vars:
-        value = os.environ.get(var)
-        if value:
-            escaped_value = value.replace("'", "'\\''")
-            env_setup.append(f"export {var}='{escaped_value}'")
-
-    env_setup_str = " && ".join(env_setup)
-
     # Build the worker launch command
     worker_dir = cwd if cwd else os.getcwd()
 
@@ -942,27 +1232,8 @@ def spawn_agent(
             f"Coordinator cwd is: `{os.getcwd()}`"
         )
 
-    worker_command = f"cd '{worker_dir}' && {env_setup_str} && uv run silica worker"
-
     try:
-        # Create tmux session
-        subprocess.run(
-            ["tmux", "new-session", "-d", "-s", tmux_session],
-            check=True,
-            capture_output=True,
-        )
-
-        # Give session a moment to initialize
-        import time
-
-        time.sleep(0.5)
-
-        # Send the worker command to the session
-        subprocess.run(
-            ["tmux", "send-keys", "-t", tmux_session, worker_command, "C-m"],
-            check=True,
-            capture_output=True,
-        )
+        _launch_tmux_worker(tmux_session, worker_dir, env_vars)
 
         lines.extend(
             [
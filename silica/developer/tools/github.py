@@ -4,6 +4,7 @@ from typing import Optional, Dict, Any, List, Union
 
 from silica.developer.context import AgentContext
 from .framework import tool
+from .github_data import api_get, api_get_many, resolve_endpoint
 
 
 def _run_gh_command(args: List[str]) -> Dict[str, Any]:
@@ -164,22 +165,13 @@ def github_view_pr(
 
         if comments:
             # Get comments including review comments and file-specific comments
-            pr_comments_result = _run_gh_command(
+            pr_comments_result, issue_comments_result = api_get_many(
                 [
-                    "api",
                     f"repos/:owner/:repo/pulls/{pr['number']}/comments",
-                    "--jq",
-                    ".",
-                ]
-            )
-
-            issue_comments_result = _run_gh_command(
-                [
-                    "api",
                     f"repos/:owner/:repo/issues/{pr['number']}/comments",
-                    "--jq",
-                    ".",
-                ]
+                ],
+                repo=repo,
+                run=_run_gh_command,
             )
 
             output += "## Review Comments\n\n"
@@ -344,13 +336,10 @@ def github_view_issue(
         output += f"## Description\n\n{issue['body']}\n\n"
 
         if comments:
-            comments_result = _run_gh_command(
-                [
-                    "api",
-                    f"repos/:owner/:repo/issues/{issue['number']}/comments",
-                    "--jq",
-                    ".",
-                ]
+            comments_result = api_get(
+                f"repos/:owner/:repo/issues/{issue['number']}/comments",
+                repo=repo,
+                run=_run_gh_command,
             )
 
             if comments_result["success"]:
@@ -392,16 +381,28 @@ def github_api(
     # Process the endpoint
     if endpoint.startswith("/"):
         endpoint = endpoint[1:]
-    cmd.append(endpoint)
+
+    # Plain GETs go through the revalidating response cache
+    if (not method or method.upper() == "GET") and not fields and not jq_filter:
+        result = api_get(endpoint, repo=repo, run=_run_gh_command)
+        if not result["success"]:
+            return result["error"]
+        try:
+            data = json.loads(result["data"])
+            return _format_as_markdown(data, title=f"GitHub API: {endpoint}")
+        except json.JSONDecodeError:
+            return result["data"]
+
+    # gh api has no --repo option; write the repository into the endpoint
+    resolved, hostname = resolve_endpoint(endpoint, repo)
+    cmd.append(resolved)
+    if hostname:
+        cmd.extend(["--hostname", hostname])
 
     # Add method if specified
     if method:
         cmd.extend(["--method", method])
 
-    # Add repository if specified
-    if repo:
-        cmd.extend(["--repo", repo])
-
     # Add JQ filter if specified
     if jq_filter:
         cmd.extend(["--jq", jq_filter])
@@ -473,33 +474,19 @@ def github_pr_comments(
         pr = json.loads(pr_result["data"])
         pr_number = pr["number"]
 
-        # Get comments from three sources:
+        # Get comments from three sources, concurrently:
         # 1. PR review comments (inline code comments)
-        inline_cmd = [
-            "api",
-            f"repos/:owner/:repo/pulls/{pr_number}/comments",
-            "--jq",
-            ".",
-        ] + repo_arg
-        inline_result = _run_gh_command(inline_cmd)
-
         # 2. Issue comments (top-level PR comments)
-        issue_cmd = [
-            "api",
-            f"repos/:owner/:repo/issues/{pr_number}/comments",
-            "--jq",
-            ".",
-        ] + repo_arg
-        issue_result = _run_gh_command(issue_cmd)
-
         # 3. PR reviews (overall review comments)
-        reviews_cmd = [
-            "api",
-            f"repos/:owner/:repo/pulls/{pr_number}/reviews",
-            "--jq",
-            ".",
-        ] + repo_arg
-        reviews_result = _run_gh_command(reviews_cmd)
+        inline_result, issue_result, reviews_result = api_get_many(
+            [
+                f"repos/:owner/:repo/pulls/{pr_number}/comments",
+                f"repos/:owner/:repo/issues/{pr_number}/comments",
+                f"repos/:owner/:repo/pulls/{pr_number}/reviews",
+            ],
+            repo=repo,
+            run=_run_gh_command,
+        )
 
         output = f"# Comments on PR #{pr_number}\n\n"
 
@@ -586,7 +573,7 @@ def github_workflow_runs(
         limit: Maximum number of runs to list
         repo: Repository in format [HOST/]OWNER/REPO (current repo used if not specified)
     """
-    cmd = ["api", "repos/:owner/:repo/actions/runs"]
+    endpoint = "repos/:owner/:repo/actions/runs"
     query_params = []
 
     if workflow:
@@ -602,12 +589,9 @@ def github_workflow_runs(
         query_params.append(f"per_page={limit}")
 
     if query_params:
-        cmd.append("?" + "&".join(query_params))
+        endpoint += "?" + "&".join(query_params)
 
-    if repo:
-        cmd.extend(["--repo", repo])
-
-    result = _run_gh_command(cmd)
+    result = api_get(endpoint, repo=repo, run=_run_gh_command)
 
     if not result["success"]:
         return result["error"]
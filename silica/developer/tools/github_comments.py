@@ -12,6 +12,7 @@ from datetime import datetime
 
 from silica.developer.context import AgentContext
 from .framework import tool
+from .github_data import api_get, api_get_many, run_concurrently
 
 
 def _run_gh_command(args: List[str]) -> Dict[str, Any]:
@@ -40,6 +41,29 @@ def _run_gh_command(args: List[str]) -> Dict[str, Any]:
         }
 
 
+def _fetch_pr_endpoints(
+    pr_number: Union[int, str], endpoints: List[str], repo: Optional[str]
+) -> tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Verify a PR exists while fetching API endpoints about it.
+
+    The verification and the (cached) GETs are independent, so they run
+    concurrently.
+
+    Returns:
+        Tuple of (PR verification result, endpoint results in order)
+    """
+    repo_arg = ["--repo", repo] if repo else []
+    pr_verify_cmd = ["pr", "view", str(pr_number), "--json", "number"] + repo_arg
+    return tuple(
+        run_concurrently(
+            [
+                lambda: _run_gh_command(pr_verify_cmd),
+                lambda: api_get_many(endpoints, repo=repo, run=_run_gh_command),
+            ]
+        )
+    )
+
+
 def _format_markdown_comments(
     comments: List[Dict[str, Any]], comment_type: str, show_details: bool = True
 ) -> str:
@@ -118,14 +142,16 @@ def github_list_pr_comments(
     if comment_type not in valid_types:
         return f"Error: 'type' must be one of {valid_types}"
 
-    # Build repo argument
-    repo_arg = []
-    if repo:
-        repo_arg = ["--repo", repo]
-
-    # Verify the PR exists
-    pr_verify_cmd = ["pr", "view", str(pr_number), "--json", "number"] + repo_arg
-    pr_result = _run_gh_command(pr_verify_cmd)
+    # Fetch the requested comment sources while verifying the PR exists
+    endpoints = {}
+    if comment_type in ["all", "inline"]:
+        endpoints["inline"] = f"repos/:owner/:repo/pulls/{pr_number}/comments"
+    if comment_type in ["all", "conversation"]:
+        endpoints["issue"] = f"repos/:owner/:repo/issues/{pr_number}/comments"
+    if comment_type in ["all", "review"]:
+        endpoints["review"] = f"repos/:owner/:repo/pulls/{pr_number}/reviews"
+    pr_result, fetched = _fetch_pr_endpoints(pr_number, list(endpoints.values()), repo)
+    results = dict(zip(endpoints, fetched))
 
     if not pr_result["success"]:
         return pr_result["error"]
@@ -135,13 +161,7 @@ def github_list_pr_comments(
     # Get inline code comments (review comments)
     inline_comments = []
     if comment_type in ["all", "inline"]:
-        inline_cmd = [
-            "api",
-            f"repos/:owner/:repo/pulls/{pr_number}/comments",
-            "--jq",
-            ".",
-        ] + repo_arg
-        inline_result = _run_gh_command(inline_cmd)
+        inline_result = results["inline"]
 
         if inline_result["success"]:
             try:
@@ -155,13 +175,7 @@ def github_list_pr_comments(
     # Get PR conversation comments (issue comments)
     issue_comments = []
     if comment_type in ["all", "conversation"]:
-        issue_cmd = [
-            "api",
-            f"repos/:owner/:repo/issues/{pr_number}/comments",
-            "--jq",
-            ".",
-        ] + repo_arg
-        issue_result = _run_gh_command(issue_cmd)
+        issue_result = results["issue"]
 
         if issue_result["success"]:
             try:
@@ -175,13 +189,7 @@ def github_list_pr_comments(
     # Get review comments
     review_comments = []
     if comment_type in ["all", "review"]:
-        review_cmd = [
-            "api",
-            f"repos/:owner/:repo/pulls/{pr_number}/reviews",
-            "--jq",
-            ".",
-        ] + repo_arg
-        review_result = _run_gh_command(review_cmd)
+        review_result = results["review"]
 
         if review_result["success"]:
             try:
@@ -224,11 +232,6 @@ def github_get_comment(
         comment_type: Type of comment: "pr" (pull request), "issue", or "review"
         repo: Repository in format [HOST/]OWNER/REPO (current repo used if not specified)
     """
-    # Build repo argument
-    repo_arg = []
-    if repo:
-        repo_arg = ["--repo", repo]
-
     # Determine the API endpoint based on comment type
     if comment_type == "pr":
         endpoint = f"repos/:owner/:repo/pulls/comments/{comment_id}"
@@ -243,8 +246,7 @@ def github_get_comment(
         return "Error: comment_type must be one of: pr, issue, review"
 
     # Get the comment data
-    cmd = ["api", endpoint, "--jq", "."] + repo_arg
-    result = _run_gh_command(cmd)
+    result = api_get(endpoint, repo=repo, run=_run_gh_command)
 
     if not result["success"]:
         return result["error"]
@@ -446,18 +448,6 @@ def github_list_new_comments(
         since: ISO 8601 format date (e.g., "2023-04-01T00:00:00Z") to filter comments
         repo: Repository in format [HOST/]OWNER/REPO
     """
-    # Build repo argument
-    repo_arg = []
-    if repo:
-        repo_arg = ["--repo", repo]
-
-    # Verify the PR exists
-    pr_verify_cmd = ["pr", "view", str(pr_number), "--json", "number"] + repo_arg
-    pr_result = _run_gh_command(pr_verify_cmd)
-
-    if not pr_result["success"]:
-        return pr_result["error"]
-
     # If no 'since' date is provided, use the last 24 hours
     since_param = ""
     if since:
@@ -468,6 +458,20 @@ def github_list_new_comments(
         except ValueError:
             return "Error: 'since' must be in ISO 8601 format (e.g., '2023-04-01T00:00:00Z')"
 
+    # Fetch all comment sources while verifying the PR exists
+    pr_result, (inline_result, issue_result, review_result) = _fetch_pr_endpoints(
+        pr_number,
+        [
+            f"repos/:owner/:repo/pulls/{pr_number}/comments{since_param}",
+            f"repos/:owner/:repo/issues/{pr_number}/comments{since_param}",
+            f"repos/:owner/:repo/pulls/{pr_number}/reviews{since_param}",
+        ],
+        repo,
+    )
+
+    if not pr_result["success"]:
+        return pr_result["error"]
+
     # Get all types of comments
     output = f"# New Comments on PR #{pr_number} "
     if since:
@@ -479,14 +483,6 @@ def github_list_new_comments(
     total_comments = 0
 
     # Get inline code comments
-    inline_cmd = [
-        "api",
-        f"repos/:owner/:repo/pulls/{pr_number}/comments{since_param}",
-        "--jq",
-        ".",
-    ] + repo_arg
-    inline_result = _run_gh_command(inline_cmd)
-
     if inline_result["success"]:
         try:
             inline_comments = json.loads(inline_result["data"])
@@ -496,14 +492,6 @@ def github_list_new_comments(
             output += "Error parsing inline comments data\n\n"
 
     # Get PR conversation comments
-    issue_cmd = [
-        "api",
-        f"repos/:owner/:repo/issues/{pr_number}/comments{since_param}",
-        "--jq",
-        ".",
-    ] + repo_arg
-    issue_result = _run_gh_command(issue_cmd)
-
     if issue_result["success"]:
         try:
             issue_comments = json.loads(issue_result["data"])
@@ -513,14 +501,6 @@ def github_list_new_comments(
             output += "Error parsing conversation comments data\n\n"
 
     # Get review comments
-    review_cmd = [
-        "api",
-        f"repos/:owner/:repo/pulls/{pr_number}/reviews{since_param}",
-        "--jq",
-        ".",
-    ] + repo_arg
-    review_result = _run_gh_command(review_cmd)
-
     if review_result["success"]:
         try:
             reviews = json.loads(review_result["data"])
@@ -0,0 +1,243 @@
+"""Cached, concurrent GET requests to the GitHub REST API through ``gh``.
+
+The GitHub tools poll the same pull request endpoints over and over while
+the agent waits for reviews. ``api_get_many`` issues the independent
+requests of one tool call concurrently, and every GET goes through an
+on-disk cache that revalidates with ``If-None-Match``: GitHub answers an
+unchanged resource with ``304 Not Modified`` (which does not count
+against the rate limit) and the cached body is returned.
+
+Requests are made with ``gh api --include`` so the status line and the
+``ETag`` header can be read; output without a status line (e.g. from a
+stubbed runner) is treated as an uncacheable body.
+
+Cache location: ~/.silica/cache/github/
+Cache key: SHA-256 of the endpoint, host and (for endpoints relative to
+the current repository) the working directory
+Cache value: {"format", "endpoint", "etag", "body", "updated_at"}
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk entry format changes so stale entries are ignored
+CACHE_FORMAT_VERSION = 1
+
+# gh processes run at once by api_get_many
+MAX_CONCURRENT_REQUESTS = 4
+
+_STATUS_LINE = re.compile(r"^HTTP/[\d.]+ (\d{3})")
+_HEADER_END = re.compile(r"\r?\n\r?\n")
+
+GhRunner = Callable[[List[str]], Dict[str, Any]]
+
+
+class GitHubResponseCache:
+    """Disk-backed cache of GitHub API responses, one JSON file per URL.
+
+    File structure:
+        ~/.silica/cache/github/<sha256_of_request_identity>.json
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        if cache_dir is None:
+            cache_dir = Path.home() / ".silica" / "cache" / "github"
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def cache_key(endpoint: str, hostname: Optional[str] = None) -> str:
+        identity = {
+            "format": CACHE_FORMAT_VERSION,
+            "endpoint": endpoint,
+            "hostname": hostname or os.environ.get("GH_HOST", "github.com"),
+        }
+        if ":owner" in endpoint or "{owner}" in endpoint:
+            # Relative to the repository of the working directory
+            identity["cwd"] = os.getcwd()
+            identity["gh_repo"] = os.environ.get("GH_REPO", "")
+        return hashlib.sha256(json.dumps(identity, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a key, or None."""
+        try:
+            with open(self.cache_dir / f"{key}.json") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if entry.get("format") != CACHE_FORMAT_VERSION or not entry.get("etag"):
+            return None
+        return entry
+
+    def put(self, key: str, endpoint: str, etag: str, body: str) -> None:
+        """Store a response body with its ETag."""
+        entry = {
+            "format": CACHE_FORMAT_VERSION,
+            "endpoint": endpoint,
+            "etag": etag,
+            "body": body,
+            "updated_at": time.time(),
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Unique temp file: concurrent requests may store the same key
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                json.dump(entry, f)
+            Path(f.name).replace(self.cache_dir / f"{key}.json")
+        except OSError as e:
+            logger.debug(f"Failed to write GitHub cache for '{endpoint}': {e}")
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        if not self.cache_dir.exists():
+            return
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+
+
+_cache: Optional[GitHubResponseCache] = None
+
+
+def get_github_cache() -> GitHubResponseCache:
+    """Get the global GitHub response cache."""
+    global _cache
+    if _cache is None:
+        _cache = GitHubResponseCache()
+    return _cache
+
+
+def resolve_endpoint(
+    endpoint: str, repo: Optional[str] = None
+) -> Tuple[str, Optional[str]]:
+    """Substitute an explicit repository into an endpoint.
+
+    ``gh api`` resolves ``:owner/:repo`` (and ``{owner}/{repo}``) from the
+    working directory and has no ``--repo`` option, so a repository given as
+    ``[HOST/]OWNER/REPO`` is written into the endpoint instead.
+
+    Returns:
+        Tuple of (endpoint, hostname or None)
+    """
+    endpoint = endpoint.lstrip("/")
+    if not repo:
+        return endpoint, None
+    parts = repo.strip("/").split("/")
+    if len(parts) < 2:
+        return endpoint, None
+    hostname = parts[-3] if len(parts) >= 3 else None
+    owner, name = parts[-2], parts[-1]
+    for placeholder in (":owner/:repo", "{owner}/{repo}"):
+        endpoint = endpoint.replace(placeholder, f"{owner}/{name}")
+    return endpoint, hostname
+
+
+def _parse_included(output: str) -> Tuple[Optional[int], Dict[str, str], str]:
+    """Split ``gh api --include`` output into (status, headers, body)."""
+    match = _STATUS_LINE.match(output)
+    if not match:
+        return None, {}, output
+    end = _HEADER_END.search(output)
+    head, body = (output[: end.start()], output[end.end() :]) if end else (output, "")
+    headers = {}
+    for line in head.splitlines()[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return int(match.group(1)), headers, body
+
+
+def api_get(
+    endpoint: str,
+    repo: Optional[str] = None,
+    run: Optional[GhRunner] = None,
+    cache: Optional[GitHubResponseCache] = None,
+) -> Dict[str, Any]:
+    """GET a REST endpoint, revalidating a cached copy with its ETag.
+
+    Args:
+        endpoint: API path, may use ``:owner/:repo`` placeholders
+        repo: Repository in format [HOST/]OWNER/REPO
+        run: Runs ``gh`` with a list of arguments (default: the GitHub
+            tools' ``_run_gh_command``)
+        cache: Response cache (default: the global one)
+
+    Returns:
+        Dict with 'success', 'data' (the response body), optional 'error'
+        and 'cached' (True when served from the cache after a 304)
+    """
+    if run is None:
+        # Imported here because the GitHub tools import this module
+        from .github import _run_gh_command as run
+    cache = cache or get_github_cache()
+    endpoint, hostname = resolve_endpoint(endpoint, repo)
+    key = cache.cache_key(endpoint, hostname)
+    entry = cache.get(key)
+
+    args = ["api", "--include", endpoint]
+    if hostname:
+        args.extend(["--hostname", hostname])
+    if entry:
+        args.extend(["-H", f"If-None-Match: {entry['etag']}"])
+
+    result = run(args)
+    # gh exits non-zero for a 304 but still prints the included headers
+    status, headers, body = _parse_included(result.get("data") or "")
+
+    if status == 304 and entry:
+        return {"success": True, "data": entry["body"], "cached": True}
+    if not result.get("success"):
+        return {
+            "success": False,
+            "error": result.get("error", "Error: gh api request failed"),
+            "data": body,
+            "cached": False,
+        }
+
+    etag = headers.get("etag")
+    if etag and status is not None and 200 <= status < 300:
+        cache.put(key, endpoint, etag, body)
+    return {"success": True, "data": body, "cached": False}
+
+
+def api_get_many(
+    endpoints: List[str],
+    repo: Optional[str] = None,
+    run: Optional[GhRunner] = None,
+    cache: Optional[GitHubResponseCache] = None,
+) -> List[Dict[str, Any]]:
+    """GET several endpoints concurrently; results are in input order."""
+    if len(endpoints) <= 1:
+        return [api_get(e, repo=repo, run=run, cache=cache) for e in endpoints]
+    with ThreadPoolExecutor(
+        max_workers=min(len(endpoints), MAX_CONCURRENT_REQUESTS)
+    ) as executor:
+        return list(
+            executor.map(
+                lambda e: api_get(e, repo=repo, run=run, cache=cache), endpoints
+            )
+        )
+
+
+def run_concurrently(calls: List[Callable[[], Any]]) -> List[Any]:
+    """Run independent blocking calls (e.g. ``gh pr view``) concurrently."""
+    if len(calls) <= 1:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(
+        max_workers=min(len(calls), MAX_CONCURRENT_REQUESTS)
+    ) as executor:
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
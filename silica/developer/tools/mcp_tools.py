@@ -13,7 +13,7 @@ async def mcp_list_servers(context: AgentContext) -> str:
     """List all configured MCP servers and their status.
 
     Returns information about each server including:
-    - Connection status (connected/disconnected)
+    - Connection status (connected/deferred/disconnected)
     - Number of tools available
     - Cache setting (on/off)
     - Setup status (if credentials path is configured)
@@ -30,8 +30,13 @@ async def mcp_list_servers(context: AgentContext) -> str:
 
     lines = ["MCP Servers:"]
     for status in statuses:
-        conn_status = "connected" if status.connected else "disconnected"
-        tool_count = f"{status.tool_count} tools" if status.connected else "-"
+        if status.pending:
+            conn_status = "deferred (starts on first tool call)"
+        else:
+            conn_status = "connected" if status.connected else "disconnected"
+        tool_count = (
+            f"{status.tool_count} tools" if status.connected or status.pending else "-"
+        )
         cache_status = "cache: on" if status.cache_enabled else "cache: off"
 
         extra = []
@@ -0,0 +1,444 @@
+"""Persistent, resource-limited Python workers for python_repl.
+
+``python_repl`` used to ``exec`` each snippet in the agent process with
+fresh globals: nothing carried over between calls, nothing bounded its run
+time, and it blocked the event loop while it ran. Each session now gets its
+own worker subprocess (``python_worker_main.py``) that keeps one namespace
+for the whole session.
+
+The worker runs with an address-space limit, a per-request CPU budget and
+no permission to create files, in its own process group and with a
+minimal environment (so API keys are not visible to the code). The agent
+side enforces a wall-clock timeout: on timeout or cancellation the worker
+gets SIGINT, which interrupts the running code but keeps its variables; a
+worker that does not respond within ``INTERRUPT_GRACE`` seconds is killed
+and restarted with a fresh namespace.
+
+Printed output is streamed back as it is produced and handed to the
+``on_output`` callback of ``PythonWorker.execute``. The worker's pipes are
+read by threads that hand each message to the waiting coroutine, so a
+worker is not tied to one event loop (``python_repl`` runs in whichever
+loop its caller uses) and nothing polls.
+"""
+
+import asyncio
+import atexit
+import collections
+import itertools
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+WORKER_SCRIPT = Path(__file__).with_name("python_worker_main.py")
+
+DEFAULT_MEMORY_MB = 1024
+DEFAULT_CPU_SECONDS = 60
+DEFAULT_TIMEOUT = 60
+
+# Seconds to wait for a worker to start, or to stop after SIGINT
+START_TIMEOUT = 10.0
+INTERRUPT_GRACE = 2.0
+
+# Sessions with a live worker; the least recently used idle one is stopped
+MAX_WORKERS = 8
+
+
+class WorkerError(Exception):
+    """Raised when a worker process cannot be started."""
+
+
+@dataclass
+class ExecutionResult:
+    """Outcome of running one snippet in a worker.
+
+    Attributes:
+        ok: The code ran to completion without raising.
+        error: Traceback or explanation when ``ok`` is False.
+        timed_out: The wall-clock timeout was hit.
+        state_lost: The worker was restarted, losing its variables.
+    """
+
+    ok: bool
+    error: Optional[str] = None
+    timed_out: bool = False
+    state_lost: bool = False
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _Mailbox:
+    """Messages from a worker's reader thread, awaited from any event loop."""
+
+    def __init__(self):
+        self._messages: collections.deque = collections.deque()
+        self._lock = threading.Lock()
+        self._waiter: Optional[tuple] = None
+
+    def put(self, message: Dict) -> None:
+        """Add a message and wake the coroutine waiting for one, if any."""
+        with self._lock:
+            self._messages.append(message)
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            loop, future = waiter
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                pass  # The waiting loop has closed
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        """Return the next message, or None if none arrives within ``timeout``."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._messages:
+                return self._messages.popleft()
+            future = loop.create_future()
+            self._waiter = (loop, future)
+        try:
+            await asyncio.wait_for(future, None if timeout is None else max(timeout, 0))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                if self._waiter is not None and self._waiter[1] is future:
+                    self._waiter = None
+        with self._lock:
+            return self._messages.popleft() if self._messages else None
+
+
+def _reap(process: subprocess.Popen) -> None:
+    """Wait for a terminated worker, killing it if it ignores SIGTERM."""
+    try:
+        process.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+class PythonWorker:
+    """A python_repl worker subprocess with a persistent namespace.
+
+    Args:
+        memory_mb: Address-space limit of the worker.
+        cpu_seconds: CPU time each request may use.
+    """
+
+    def __init__(
+        self,
+        memory_mb: int = DEFAULT_MEMORY_MB,
+        cpu_seconds: int = DEFAULT_CPU_SECONDS,
+    ):
+        self.memory_mb = memory_mb
+        self.cpu_seconds = cpu_seconds
+        self._process: Optional[subprocess.Popen] = None
+        self._messages = _Mailbox()
+        # Serializes execute(); recreated for each event loop that uses it
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stderr_tail: collections.deque = collections.deque(maxlen=20)
+        self._ids = itertools.count(1)
+        # (request id, time) of a request abandoned by a cancelled call
+        self._abandoned: Optional[tuple] = None
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def busy(self) -> bool:
+        return self._lock is not None and self._lock.locked()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+    async def execute(
+        self,
+        code: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        on_output: Optional[Callable[[str, str], None]] = None,
+    ) -> ExecutionResult:
+        """Run ``code`` in the worker's namespace.
+
+        Args:
+            code: Python source to execute.
+            timeout: Wall-clock seconds before the code is interrupted.
+            on_output: Called with ("stdout" | "stderr", text) as the code
+                prints.
+        """
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        async with self._lock:
+            state_lost = await self._settle()
+            if not self.alive:
+                await self._start()
+
+            request_id = next(self._ids)
+            self._send({"id": request_id, "code": code})
+            try:
+                result = await self._collect(request_id, timeout, on_output)
+            except asyncio.CancelledError:
+                # Stop the code but keep the namespace; the next call waits
+                # for the interrupted request to finish.
+                self.interrupt()
+                self._abandoned = (request_id, time.monotonic())
+                raise
+            result.state_lost = result.state_lost or state_lost
+            return result
+
+    def interrupt(self) -> None:
+        """Interrupt the code currently running in the worker."""
+        if self.alive:
+            try:
+                os.kill(self._process.pid, signal.SIGINT)
+            except OSError:
+                pass
+
+    def shutdown(self) -> None:
+        """Stop the worker; its namespace is discarded.
+
+        Does not block: the process is terminated and reaped by a
+        background thread.
+        """
+        process, self._process = self._process, None
+        self._abandoned = None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        if process.poll() is None:
+            process.terminate()
+        threading.Thread(target=_reap, args=(process,), daemon=True).start()
+
+    async def _start(self) -> None:
+        self._messages = _Mailbox()
+        self._stderr_tail.clear()
+        env = {
+            "PATH": os.environ.get("PATH", ""),
+            "PYTHONIOENCODING": "utf-8",
+            "SILICA_REPL_MEMORY_MB": str(self.memory_mb or 0),
+            "SILICA_REPL_CPU_SECONDS": str(self.cpu_seconds or 0),
+        }
+        self._process = subprocess.Popen(
+            [sys.executable, "-I", "-B", "-u", str(WORKER_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            env=env,
+            # Keep terminal Ctrl-C away from the worker; interrupts go
+            # through interrupt()
+            start_new_session=True,
+        )
+        threading.Thread(
+            target=self._read_messages,
+            args=(self._process.stdout, self._messages),
+            daemon=True,
+        ).start()
+        threading.Thread(
+            target=self._read_stderr, args=(self._process.stderr,), daemon=True
+        ).start()
+
+        deadline = time.monotonic() + START_TIMEOUT
+        while True:
+            message = await self._messages.get(deadline - time.monotonic())
+            if message is None or message.get("type") == "exit":
+                break
+            if message.get("type") == "ready":
+                return
+        self.shutdown()
+        raise WorkerError(f"Python worker failed to start. {self._stderr_summary()}")
+
+    async def _settle(self) -> bool:
+        """Wait for an abandoned request; returns True if the worker had to go."""
+        if self._abandoned is None:
+            return False
+        request_id, since = self._abandoned
+        while self.alive:
+            message = await self._messages.get(
+                since + INTERRUPT_GRACE - time.monotonic()
+            )
+            if message is None or message.get("type") == "exit":
+                break
+            if message.get("type") == "result" and message.get("id") == request_id:
+                self._abandoned = None
+                return False
+        self.shutdown()
+        return True
+
+    async def _collect(self, request_id, timeout, on_output) -> ExecutionResult:
+        deadline = time.monotonic() + timeout
+        interrupted_at = None
+        while True:
+            if interrupted_at is None:
+                wait = deadline - time.monotonic()
+            else:
+                wait = interrupted_at + INTERRUPT_GRACE - time.monotonic()
+            message = await self._messages.get(wait)
+            if message is None:
+                if interrupted_at is None:
+                    self.interrupt()
+                    interrupted_at = time.monotonic()
+                    continue
+                self.shutdown()
+                return ExecutionResult(
+                    ok=False,
+                    error="The worker did not respond to the interrupt.",
+                    timed_out=True,
+                    state_lost=True,
+                )
+
+            kind = message.get("type")
+            if kind == "exit":
+                returncode = await self._wait_for_exit()
+                self.shutdown()
+                return ExecutionResult(
+                    ok=False,
+                    error=(
+                        f"Python worker exited unexpectedly (exit code {returncode}), "
+                        "possibly after exceeding its memory or CPU limit. "
+                        f"{self._stderr_summary()}"
+                    ).strip(),
+                    state_lost=True,
+                )
+            if message.get("id") != request_id:
+                continue  # Left over from an interrupted request
+            if kind in ("stdout", "stderr"):
+                if on_output is not None:
+                    on_output(kind, message.get("data", ""))
+            elif kind == "result":
+                return ExecutionResult(
+                    ok=bool(message.get("ok")),
+                    error=message.get("error"),
+                    timed_out=interrupted_at is not None,
+                )
+
+    def _send(self, message: Dict) -> None:
+        try:
+            self._process.stdin.write(json.dumps(message) + "\n")
+            self._process.stdin.flush()
+        except (OSError, ValueError):
+            # The worker died; _collect reports it through the exit message
+            pass
+
+    async def _wait_for_exit(self) -> Optional[int]:
+        """Return the exit code of a worker whose output has ended."""
+        process = self._process
+        if process is None:
+            return None
+        try:
+            return await asyncio.to_thread(process.wait, INTERRUPT_GRACE)
+        except subprocess.TimeoutExpired:
+            return None
+
+    @staticmethod
+    def _read_messages(pipe, messages: _Mailbox) -> None:
+        try:
+            for line in pipe:
+                try:
+                    messages.put(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        except (OSError, ValueError):
+            pass
+        messages.put({"type": "exit"})
+
+    def _read_stderr(self, pipe) -> None:
+        try:
+            for line in pipe:
+                self._stderr_tail.append(line.rstrip("\n"))
+        except (OSError, ValueError):
+            pass
+
+    def _stderr_summary(self) -> str:
+        if not self._stderr_tail:
+            return ""
+        return "Worker stderr:\n" + "\n".join(self._stderr_tail)
+
+
+class PythonWorkerManager:
+    """Keeps one PythonWorker per session.
+
+    Args:
+        max_workers: Number of live workers; starting another stops the
+            least recently used idle one.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self.max_workers = max_workers
+        self.workers: "collections.OrderedDict[str, PythonWorker]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown_all)
+
+    def get_worker(self, session_id: str) -> PythonWorker:
+        """Return the worker of a session, creating it if needed."""
+        with self._lock:
+            worker = self.workers.get(session_id)
+            if worker is None:
+                worker = PythonWorker()
+                self.workers[session_id] = worker
+                self._evict()
+            self.workers.move_to_end(session_id)
+            return worker
+
+    def reset(self, session_id: str) -> bool:
+        """Stop a session's worker; returns False if it had none."""
+        with self._lock:
+            worker = self.workers.pop(session_id, None)
+        if worker is None:
+            return False
+        worker.interrupt()
+        worker.shutdown()
+        return True
+
+    def shutdown_all(self) -> None:
+        with self._lock:
+            workers = list(self.workers.values())
+            self.workers.clear()
+        for worker in workers:
+            worker.shutdown()
+
+    def _evict(self) -> None:
+        excess = len(self.workers) - self.max_workers
+        for session_id in list(self.workers):
+            if excess <= 0:
+                break
+            worker = self.workers[session_id]
+            if not worker.busy:
+                del self.workers[session_id]
+                worker.shutdown()
+                excess -= 1
+
+
+_worker_manager = None
+
+
+def get_python_worker_manager() -> PythonWorkerManager:
+    """Get the global python_repl worker manager."""
+    global _worker_manager
+    if _worker_manager is None:
+        _worker_manager = PythonWorkerManager()
+    return _worker_manager
+
+
+def release_python_worker(session_id: str) -> None:
+    """Stop a session's worker, e.g. when a sub-agent finishes."""
+    if _worker_manager is not None:
+        _worker_manager.reset(session_id)
@@ -0,0 +1,257 @@
+"""Entry point of the python_repl worker subprocess.
+
+Run as a standalone script (``python -I -B -u python_worker_main.py``), so
+it must only use the standard library. The worker reads one JSON request
+per line from stdin::
+
+    {"id": 1, "code": "x = 1\\nprint(x)"}
+
+and answers on the original stdout with JSON lines. Output printed by the
+code is streamed as it is produced, followed by a single result message::
+
+    {"id": 1, "type": "stdout", "data": "1\\n"}
+    {"id": 1, "type": "result", "ok": true, "error": null}
+
+All requests run in one namespace, so variables, functions and imports
+persist between calls. Only the modules in ``ALLOWED_IMPORTS`` can be
+imported. SIGINT interrupts the running request (raising
+KeyboardInterrupt in the user's code) without losing that namespace.
+Exceeding the per-request CPU budget raises ``CPUTimeExceeded`` the same
+way.
+"""
+
+import builtins
+import datetime
+import json
+import math
+import os
+import random
+import re
+import signal
+import sys
+import threading
+import time
+import traceback
+
+# Flush a stream message once this much output is buffered
+STREAM_FLUSH_CHARS = 4096
+# ...or at a newline, at most this often
+STREAM_FLUSH_INTERVAL = 0.1
+
+RESTRICTED_BUILTINS = ("open", "exec", "eval", "__import__", "compile", "input")
+
+# Modules the code may import; anything else raises ImportError
+ALLOWED_IMPORTS = frozenset(
+    {
+        "bisect",
+        "collections",
+        "datetime",
+        "decimal",
+        "fractions",
+        "functools",
+        "heapq",
+        "itertools",
+        "json",
+        "math",
+        "operator",
+        "random",
+        "re",
+        "statistics",
+        "string",
+        "textwrap",
+        "time",
+    }
+)
+
+_protocol = None
+_protocol_lock = threading.Lock()
+_executing = False
+
+
+class CPUTimeExceeded(Exception):
+    """Raised in the user's code when a request exceeds its CPU budget."""
+
+
+def send(message):
+    with _protocol_lock:
+        _protocol.write(json.dumps(message) + "\n")
+        _protocol.flush()
+
+
+class StreamWriter:
+    """File-like object that streams writes as protocol messages."""
+
+    def __init__(self, name):
+        self.name = name
+        self.request_id = None
+        self._buffer = []
+        self._size = 0
+        self._last_flush = 0.0
+
+    def write(self, text):
+        if not isinstance(text, str):
+            raise TypeError(f"write() argument must be str, not {type(text).__name__}")
+        if not text:
+            return 0
+        self._buffer.append(text)
+        self._size += len(text)
+        if self._size >= STREAM_FLUSH_CHARS or (
+            "\n" in text
+            and time.monotonic() - self._last_flush >= STREAM_FLUSH_INTERVAL
+        ):
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if self._buffer and self.request_id is not None:
+            data = "".join(self._buffer)
+            self._buffer = []
+            self._size = 0
+            self._last_flush = time.monotonic()
+            send({"id": self.request_id, "type": self.name, "data": data})
+
+    def isatty(self):
+        return False
+
+
+def apply_limits(memory_mb, cpu_seconds):
+    """Apply the worker's resource limits; returns the per-request CPU budget."""
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return None
+
+    def limit(name, value):
+        kind = getattr(resource, name, None)
+        if kind is None:
+            return
+        try:
+            resource.setrlimit(kind, (value, value))
+        except (ValueError, OSError):
+            pass
+
+    if memory_mb:
+        limit("RLIMIT_AS", memory_mb * 1024 * 1024)
+    limit("RLIMIT_CORE", 0)
+    # The sandboxed code may not create files; writes fail with EFBIG
+    signal.signal(signal.SIGXFSZ, signal.SIG_IGN)
+    limit("RLIMIT_FSIZE", 0)
+    return cpu_seconds or None
+
+
+def set_cpu_budget(cpu_seconds):
+    """Allow the next request ``cpu_seconds`` of CPU time from now."""
+    import resource
+
+    used = resource.getrusage(resource.RUSAGE_SELF)
+    spent = int(used.ru_utime + used.ru_stime)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = spent + cpu_seconds
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def on_sigint(signum, frame):
+    if _executing:
+        raise KeyboardInterrupt
+
+
+def on_sigxcpu(signum, frame):
+    if _executing:
+        raise CPUTimeExceeded("CPU time limit exceeded")
+
+
+def make_namespace(stdout):
+    restricted = set(RESTRICTED_BUILTINS)
+    safe_builtins = {
+        name: getattr(builtins, name)
+        for name in dir(builtins)
+        if name not in restricted
+    }
+
+    def safe_print(*args, **kwargs):
+        # Ignore file= so everything goes to the streamed stdout
+        kwargs.pop("file", None)
+        print(*args, file=stdout, **kwargs)
+
+    def safe_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name.split(".")[0] not in ALLOWED_IMPORTS:
+            raise ImportError(f"Import of '{name}' is not allowed in python_repl")
+        return builtins.__import__(name, globals, locals, fromlist, level)
+
+    safe_builtins["print"] = safe_print
+    safe_builtins["__import__"] = safe_import
+    return {
+        "__name__": "__repl__",
+        "__builtins__": safe_builtins,
+        "math": math,
+        "random": random,
+        "datetime": datetime,
+        "json": json,
+        "re": re,
+        "print": safe_print,
+    }
+
+
+def main():
+    global _protocol, _executing
+
+    memory_mb = int(os.environ.get("SILICA_REPL_MEMORY_MB", "0") or 0)
+    cpu_seconds = apply_limits(
+        memory_mb, int(os.environ.get("SILICA_REPL_CPU_SECONDS", "0") or 0)
+    )
+
+    # Keep the real stdout for the protocol; anything else that writes to
+    # fd 1 (e.g. C extensions) ends up on stderr instead.
+    _protocol = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    stdout = StreamWriter("stdout")
+    stderr = StreamWriter("stderr")
+    sys.stdout = stdout
+    sys.stderr = stderr
+
+    signal.signal(signal.SIGINT, on_sigint)
+    if cpu_seconds and hasattr(signal, "SIGXCPU"):
+        signal.signal(signal.SIGXCPU, on_sigxcpu)
+
+    namespace = make_namespace(stdout)
+    send({"id": None, "type": "ready", "pid": os.getpid()})
+
+    for line in sys.stdin:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        request_id = request.get("id")
+        stdout.request_id = stderr.request_id = request_id
+
+        error = None
+        try:
+            code = compile(request.get("code", ""), "<python_repl>", "exec")
+            if cpu_seconds:
+                set_cpu_budget(cpu_seconds)
+            _executing = True
+            try:
+                exec(code, namespace)
+            finally:
+                _executing = False
+        except KeyboardInterrupt:
+            error = "KeyboardInterrupt: execution interrupted\n"
+        except BaseException:
+            # Drop this module's frame so the traceback starts in the code
+            etype, value, tb = sys.exc_info()
+            error = "".join(
+                traceback.format_exception(etype, value, tb.tb_next if tb else None)
+            )
+
+        stdout.flush()
+        stderr.flush()
+        send({"id": request_id, "type": "result", "ok": error is None, "error": error})
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,15 @@
+import ast
 import subprocess
+import time
 from queue import Empty
+from typing import Optional
 
 from silica.developer.context import AgentContext
 from silica.developer.sandbox import DoSomethingElseError
 from .framework import tool
+from .python_worker import DEFAULT_TIMEOUT, WorkerError, get_python_worker_manager
+from .shell import _output_session_id
+from .shell_output import CommandOutput
 
 
 def create_bash_live_display():
@@ -43,19 +49,27 @@ def create_bash_live_display():
 
 
 @tool(group="Python")
-def python_repl(context: "AgentContext", code: str):
-    """Run Python code in a sandboxed environment and return the output.
-    This tool allows execution of Python code in a secure, isolated environment.
+async def python_repl(
+    context: "AgentContext", code: str, timeout: Optional[int] = None
+):
+    """Run Python code in a sandboxed worker process and return the output.
+
+    The code runs in a persistent Python worker for this session: variables,
+    functions and imports defined by earlier calls stay available, so data
+    can be loaded once and analyzed over several calls. Use python_repl_reset
+    to start over with a fresh namespace.
 
     For security reasons, the following limitations apply:
-    1. No imports of potentially dangerous modules (os, sys, subprocess, etc.)
+    1. Only safe modules can be imported (math, random, datetime, json, re,
+       statistics, itertools, functools, collections, decimal, fractions, ...)
     2. No file operations (open, read, write)
     3. No use of eval, exec, or other dynamic code execution
-    4. No use of __import__ or other import mechanisms
+    4. The worker has limited memory and CPU time, and each call is
+       interrupted after the timeout (variables are kept)
 
     Available modules and functions:
-    - math, random, datetime, json, re
-    - Basic built-ins like range, len, str, int, float, etc.
+    - math, random, datetime, json, re (pre-imported)
+    - Built-ins like range, len, str, int, float, isinstance, etc.
     - Collection operations: list, dict, set, tuple, sum, min, max, etc.
     - Other safe functions: all, any, enumerate, zip, sorted, reversed, etc.
 
@@ -71,17 +85,79 @@ def python_repl(context: "AgentContext", code: str):
     print(f"Average: {sum(numbers)/len(numbers)}")
 
     # Using available modules
-    import math
-    print(f"Square root of 16: {math.sqrt(16)}")
+    import statistics
+    print(f"Median: {statistics.median(numbers)}")
     ```
 
     Args:
         code: The Python code to execute
+        timeout: Optional timeout in seconds (default: 60)
     """
-    import io
-    import ast
-    from contextlib import redirect_stdout, redirect_stderr
+    error = _check_code_safety(code)
+    if error:
+        return error
+
+    output = CommandOutput(_output_session_id(context))
+    stream = _OutputStreamer(context)
 
+    def on_output(name: str, text: str):
+        getattr(output, name).write(text)
+        stream.write(text)
+
+    worker = get_python_worker_manager().get_worker(_worker_session_id(context))
+    try:
+        result = await worker.execute(
+            code, timeout=timeout or DEFAULT_TIMEOUT, on_output=on_output
+        )
+    except WorkerError as e:
+        return f"Error executing code: {e}"
+    finally:
+        output.close()
+
+    printed = output.format().strip()
+    if result.timed_out:
+        status = (
+            f"Execution timed out after {timeout or DEFAULT_TIMEOUT} seconds "
+            "and was interrupted."
+        )
+    elif not result.ok:
+        status = f"Error executing code:\n{result.error}"
+    else:
+        status = ""
+    if result.state_lost:
+        status += (
+            "\nThe Python worker was restarted; variables from earlier calls were lost."
+        )
+
+    result_text = "\n\n".join(part for part in (printed, status.strip()) if part)
+    return result_text or "Code executed successfully with no output."
+
+
+@tool(group="Python")
+def python_repl_reset(context: "AgentContext"):
+    """Reset the python_repl worker of this session.
+
+    Stops any running code and discards all variables, functions and imports
+    defined by earlier python_repl calls.
+    """
+    if get_python_worker_manager().reset(_worker_session_id(context)):
+        return "Python worker reset; all variables were cleared."
+    return "No Python worker was running for this session."
+
+
+def _worker_session_id(context: "AgentContext") -> str:
+    """Key of the python_repl worker of a context.
+
+    Each session, including a sub-agent's, has its own namespace; run_agent
+    releases a sub-agent's worker when it finishes. Captured output still
+    goes to the top-level session's directory, where shell_output_read
+    looks for it.
+    """
+    return context.session_id
+
+
+def _check_code_safety(code: str) -> Optional[str]:
+    """Return an error message if ``code`` uses a restricted operation."""
     # Security check - prevent potentially harmful operations
     try:
         parsed = ast.parse(code)
@@ -101,6 +177,8 @@ def python_repl(context: "AgentContext", code: str):
                         "ctypes",
                         "pty",
                         "posix",
+                        "resource",
+                        "signal",
                     ]
                     if module in dangerous_modules:
                         return f"Error: Import of '{module}' is restricted for security reasons."
@@ -125,97 +203,38 @@ def python_repl(context: "AgentContext", code: str):
                     return f"Error: Method '{node.func.attr}' is restricted for security reasons."
     except SyntaxError as e:
         return f"Syntax Error: {str(e)}"
+    return None
 
-    # Capture stdout and stderr
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
-
-    # Execute the code
-    try:
-        # Import modules we want to make available
-        import math
-        import random
-        import datetime
-        import json
-        import re
 
-        # Set up a controlled globals dictionary with allowed built-ins
-        restricted_builtins = ["open", "exec", "eval", "__import__", "compile", "input"]
-
-        # Create a safe namespace with built-in functions and our imported modules
-        safe_globals = {
-            "math": math,
-            "random": random,
-            "datetime": datetime,
-            "json": json,
-            "re": re,
-            "range": range,  # Explicitly add range
-            "len": len,  # Explicitly add len
-            "str": str,  # Explicitly add str
-            "int": int,  # Explicitly add int
-            "float": float,  # Explicitly add float
-            "bool": bool,  # Explicitly add bool
-            "list": list,  # Explicitly add list
-            "dict": dict,  # Explicitly add dict
-            "set": set,  # Explicitly add set
-            "tuple": tuple,  # Explicitly add tuple
-            "sum": sum,  # Explicitly add sum
-            "min": min,  # Explicitly add min
-            "max": max,  # Explicitly add max
-            "abs": abs,  # Explicitly add abs
-            "all": all,  # Explicitly add all
-            "any": any,  # Explicitly add any
-            "enumerate": enumerate,  # Explicitly add enumerate
-            "zip": zip,  # Explicitly add zip
-            "sorted": sorted,  # Explicitly add sorted
-            "reversed": reversed,  # Explicitly add reversed
-            "round": round,  # Explicitly add round
-            "divmod": divmod,  # Explicitly add divmod
-            "chr": chr,  # Explicitly add chr
-            "ord": ord,  # Explicitly add ord
-            "__builtins__": {
-                name: getattr(__builtins__, name)
-                for name in dir(__builtins__)
-                if name not in restricted_builtins
-            },
-        }
-
-        # Add our own safe print function that writes to our buffer
-        def safe_print(*args, **kwargs):
-            # Remove file if it's in kwargs to ensure it prints to our buffer
-            kwargs.pop("file", None)
-            # Convert all arguments to strings
-            print(*args, file=stdout_buffer, **kwargs)
-
-        safe_globals["print"] = safe_print
-
-        # Execute with redirected stdout/stderr
-        with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
-            exec(code, safe_globals, {})
-
-        # Get the output
-        stdout = stdout_buffer.getvalue()
-        stderr = stderr_buffer.getvalue()
-
-        # Format the response
-        result = ""
-        if stdout:
-            result += f"STDOUT:\n{stdout}\n"
-        if stderr:
-            result += f"STDERR:\n{stderr}\n"
-
-        return (
-            result.strip()
-            if result.strip()
-            else "Code executed successfully with no output."
-        )
+class _OutputStreamer:
+    """Shows the output of a long-running python_repl call as it arrives.
 
-    except Exception:
-        # Get exception and traceback info
-        import traceback
+    Quick calls stay quiet (their output is in the tool result); once a call
+    has run for ``STREAM_AFTER`` seconds, new output is shown at most once
+    per ``STREAM_INTERVAL``.
+    """
 
-        tb = traceback.format_exc()
-        return f"Error executing code:\n{tb}"
+    STREAM_AFTER = 1.0
+    STREAM_INTERVAL = 1.0
+
+    def __init__(self, context: "AgentContext"):
+        self.context = context
+        self.start = time.monotonic()
+        self.last = self.start
+        self.pending = []
+
+    def write(self, text: str):
+        self.pending.append(text)
+        now = time.monotonic()
+        if (
+            now - self.start >= self.STREAM_AFTER
+            and now - self.last >= self.STREAM_INTERVAL
+        ):
+            self.last = now
+            chunk, self.pending = "".join(self.pending), []
+            self.context.user_interface.handle_system_message(
+                chunk.rstrip("\n")[-2000:], markdown=False
+            )
 
 
 @tool(group="Python")
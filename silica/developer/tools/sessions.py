@@ -14,6 +14,13 @@ from rich.console import Console
 from rich.table import Table
 from rich import box
 
+from silica.developer.session_catalog import SessionCatalog
+
+# Kept importable from here for existing callers
+from silica.developer.session_catalog import (  # noqa: F401
+    extract_first_user_message as _extract_first_user_message,
+)
+
 # Default history base directory location
 DEFAULT_HISTORY_BASE_DIR = Path.home() / ".silica" / "personas" / "default"
 
@@ -31,29 +38,6 @@ def get_history_dir(history_base_dir: Optional[Path] = None) -> Path:
     return base / "history"
 
 
-def _extract_first_user_message(messages: List[Dict]) -> Optional[str]:
-    """Extract the text content of the first user message.
-
-    Args:
-        messages: List of message dictionaries
-
-    Returns:
-        The text content of the first user message, or None if not found
-    """
-    for message in messages:
-        if message.get("role") == "user":
-            content = message.get("content")
-            if isinstance(content, str):
-                return content
-            elif isinstance(content, list):
-                # Handle structured content (list of content blocks)
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        return block.get("text", "")
-            break
-    return None
-
-
 def _truncate_message(message: Optional[str], max_length: int = 60) -> str:
     """Truncate a message to a maximum length with ellipsis.
 
@@ -76,64 +60,6 @@ def _truncate_message(message: Optional[str], max_length: int = 60) -> str:
     return message[: max_length - 3] + "..."
 
 
-def _read_session_info(session_dir: Path) -> Optional[Dict]:
-    """Read session info from v2 format or legacy root.json.
-
-    Returns:
-        Session info dict, or None if the session can't be read.
-    """
-    session_json = session_dir / "session.json"
-
-    # Try v2 format first
-    if session_json.exists():
-        try:
-            meta = json.loads(session_json.read_text())
-            if meta.get("version", 0) >= 2:
-                # Read context for message count and first message
-                from silica.developer.session_store import SessionStore
-
-                store = SessionStore(session_dir, agent_name="root")
-                context_msgs = store.read_context()
-                first_message = _extract_first_user_message(context_msgs)
-
-                return {
-                    "session_id": meta.get("session_id", session_dir.name),
-                    "created_at": meta.get("created_at"),
-                    "last_updated": meta.get("last_updated"),
-                    "root_dir": meta.get("root_dir"),
-                    "message_count": len(context_msgs),
-                    "model": meta.get("model_spec", {}).get("title", "Unknown"),
-                    "first_message": first_message,
-                }
-        except (json.JSONDecodeError, IOError):
-            pass
-
-    # Fall back to legacy root.json
-    root_file = session_dir / "root.json"
-    if not root_file.exists():
-        return None
-
-    with open(root_file, "r") as f:
-        session_data = json.load(f)
-
-    if "metadata" not in session_data:
-        return None
-
-    metadata = session_data["metadata"]
-    messages = session_data.get("messages", [])
-    first_message = _extract_first_user_message(messages)
-
-    return {
-        "session_id": session_data.get("session_id", session_dir.name),
-        "created_at": metadata.get("created_at"),
-        "last_updated": metadata.get("last_updated"),
-        "root_dir": metadata.get("root_dir"),
-        "message_count": len(messages),
-        "model": session_data.get("model_spec", {}).get("title", "Unknown"),
-        "first_message": first_message,
-    }
-
-
 def list_sessions(
     workdir: Optional[str] = None, history_base_dir: Optional[Path] = None
 ) -> List[Dict]:
@@ -150,35 +76,21 @@ def list_sessions(
     """
     history_dir = get_history_dir(history_base_dir)
 
-    if not history_dir.exists():
-        return []
-
-    sessions = []
-
-    for session_dir in history_dir.iterdir():
-        if not session_dir.is_dir():
-            continue
-
-        try:
-            session_info = _read_session_info(session_dir)
-            if session_info is None:
-                continue
-
-            # Filter by root directory if workdir is specified
-            if workdir:
-                session_root = os.path.normpath(session_info.get("root_dir", ""))
-                workdir_norm = os.path.normpath(workdir)
-                if session_root != workdir_norm:
-                    continue
-
-            sessions.append(session_info)
+    # Summaries come from the persona's session catalog rather than from
+    # parsing every session's context.
+    sessions = SessionCatalog(history_dir).sessions()
 
-        except (json.JSONDecodeError, IOError, KeyError):
-            # Skip invalid files
-            continue
+    # Filter by root directory if workdir is specified
+    if workdir:
+        workdir_norm = os.path.normpath(workdir)
+        sessions = [
+            session
+            for session in sessions
+            if os.path.normpath(session.get("root_dir") or "") == workdir_norm
+        ]
 
     # Sort by last_updated (newest first)
-    sessions.sort(key=lambda x: x.get("last_updated", ""), reverse=True)
+    sessions.sort(key=lambda x: x.get("last_updated") or "", reverse=True)
 
     return sessions
 
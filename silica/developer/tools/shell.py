@@ -2,31 +2,35 @@
 Shell tools providing dual architecture for command execution.
 
 This module provides two complementary approaches for shell operations:
-1. shell_execute - Quick command execution with unlimited output capture
+1. shell_execute - Quick command execution with bounded, spill-to-disk output capture
 2. shell_session_* - Persistent session management for complex workflows
 """
 
 import asyncio
-import io
+import codecs
 import re
-import subprocess
 import sys
-import threading
 import time
-from queue import Empty, Queue
 from typing import Optional
 
 from silica.developer.context import AgentContext
 from silica.developer.sandbox import DoSomethingElseError
 
 from .framework import tool
+from .shell_output import CommandOutput, OutputCapture, read_spilled_output
+
+PIPE_READ_CHUNK = 64 * 1024
+EXIT_POLL_INTERVAL = 0.05
+
+# Reader tasks of backgrounded commands, kept alive until their pipes close
+_background_readers = set()
 
 
 @tool(group="Shell")
 async def shell_execute(
     context: "AgentContext", command: str, timeout: Optional[int] = None
 ):
-    """Execute a shell command quickly with unlimited output capture.
+    """Execute a shell command quickly, capturing its output.
 
     Best for:
     - File operations (cat, ls, grep, etc.)
@@ -35,7 +39,8 @@ async def shell_execute(
     - Any command with large output
 
     Features:
-    - Unlimited output capture (no buffer constraints)
+    - Large output is saved in full: the result shows its beginning and end
+      plus an output handle to page or grep with shell_output_read
     - No session overhead
     - Direct process execution
     - Enhanced timeout handling
@@ -77,6 +82,10 @@ async def _run_shell_command_with_interactive_timeout(
 ):
     """Run a shell command with interactive timeout handling.
 
+    Output is read from asyncio pipes into bounded head/tail captures; once
+    a stream outgrows them it is spilled to a session-scoped file that
+    ``shell_output_read`` can page through.
+
     Args:
         context: The agent context
         command: The shell command to execute
@@ -84,122 +93,45 @@ async def _run_shell_command_with_interactive_timeout(
         live: Optional Rich Live instance for real-time output streaming
     """
     # Start the process
-    process = subprocess.Popen(
+    process = await asyncio.create_subprocess_shell(
         command,
-        shell=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        stdin=subprocess.DEVNULL,  # Prevent stdin capture conflicts with CLI
-        text=True,
-        bufsize=0,  # Unbuffered for real-time output
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        stdin=asyncio.subprocess.DEVNULL,  # Prevent stdin capture conflicts with CLI
     )
 
-    # Queues to collect output from threads
-    stdout_queue = Queue()
-    stderr_queue = Queue()
-
-    def read_output(pipe, queue):
-        """Thread function to read from pipe and put in queue."""
-        try:
-            while True:
-                line = pipe.readline()
-                if not line:
-                    break
-                queue.put(line)
-        except Exception as e:
-            queue.put(f"Error reading output: {str(e)}\n")
-        finally:
-            pipe.close()
-
-    # Start threads to read stdout and stderr
-    stdout_thread = threading.Thread(
-        target=read_output, args=(process.stdout, stdout_queue)
-    )
-    stderr_thread = threading.Thread(
-        target=read_output, args=(process.stderr, stderr_queue)
-    )
-    stdout_thread.daemon = True
-    stderr_thread.daemon = True
-    stdout_thread.start()
-    stderr_thread.start()
-
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
+    output = CommandOutput(_output_session_id(context))
+    readers = [
+        asyncio.create_task(_pump_stream(process.stdout, output.stdout)),
+        asyncio.create_task(_pump_stream(process.stderr, output.stderr)),
+    ]
     start_time = time.time()
     current_timeout = initial_timeout
 
     while True:
         # Check if process has completed
-        returncode = process.poll()
-        if returncode is not None:
+        if process.returncode is not None:
             # Process completed, collect remaining output
-            _collect_remaining_output(
-                stdout_queue, stderr_queue, stdout_buffer, stderr_buffer
-            )
-
-            # Wait for threads to finish
-            stdout_thread.join(timeout=1)
-            stderr_thread.join(timeout=1)
-
-            # Prepare final output
-            output = f"Exit code: {returncode}\n"
-            stdout_content = stdout_buffer.getvalue()
-            stderr_content = stderr_buffer.getvalue()
-
-            if stdout_content:
-                output += f"STDOUT:\n{stdout_content}\n"
-            if stderr_content:
-                output += f"STDERR:\n{stderr_content}\n"
-
-            return output
-
-        # Collect any new output
-        _collect_output_batch(stdout_queue, stderr_queue, stdout_buffer, stderr_buffer)
+            await _finish_readers(process, readers, output)
+            return f"Exit code: {process.returncode}\n" + output.format()
 
         # If we have live streaming, update the display with current output
         if live:
-            current_stdout = stdout_buffer.getvalue()
-            current_stderr = stderr_buffer.getvalue()
-
-            if current_stdout or current_stderr:
-                from rich.console import Group
-                from rich.text import Text
-
-                output_parts = []
-                if current_stdout:
-                    output_parts.extend(
-                        [Text("STDOUT:", style="bold green"), Text(current_stdout)]
-                    )
-                if current_stderr:
-                    if output_parts:
-                        output_parts.append(Text(""))  # Empty line separator
-                    output_parts.extend(
-                        [Text("STDERR:", style="bold red"), Text(current_stderr)]
-                    )
-
-                live_content = Group(*output_parts)
-                live.update(live_content)
+            _update_live(live, output)
 
         # Check if we've exceeded the timeout
         elapsed = time.time() - start_time
         if elapsed >= current_timeout:
             # Show current output to user
-            current_stdout = stdout_buffer.getvalue()
-            current_stderr = stderr_buffer.getvalue()
-
             status_msg = f"Command has been running for {elapsed:.1f} seconds.\n"
-            if current_stdout:
-                status_msg += (
-                    f"Current STDOUT:\n{current_stdout[-500:]}...\n"
-                    if len(current_stdout) > 500
-                    else f"Current STDOUT:\n{current_stdout}\n"
-                )
-            if current_stderr:
-                status_msg += (
-                    f"Current STDERR:\n{current_stderr[-500:]}...\n"
-                    if len(current_stderr) > 500
-                    else f"Current STDERR:\n{current_stderr}\n"
-                )
+            for label, capture in (
+                ("STDOUT", output.stdout),
+                ("STDERR", output.stderr),
+            ):
+                if capture.total_chars > 500:
+                    status_msg += f"Current {label}:\n{capture.tail(500)}...\n"
+                elif capture.total_chars:
+                    status_msg += f"Current {label}:\n{capture.tail(500)}\n"
 
             # In non-interactive mode (daemon/coordinator with piped stdin),
             # skip the interactive prompt and auto-kill immediately.
@@ -211,64 +143,25 @@ async def _run_shell_command_with_interactive_timeout(
                     f"(non-interactive mode)[/bold yellow]",
                     markdown=False,
                 )
-                try:
-                    process.terminate()
-                    await asyncio.sleep(1)
-                    if process.poll() is None:
-                        process.kill()
-                except Exception:
-                    pass
-
-                _collect_remaining_output(
-                    stdout_queue, stderr_queue, stdout_buffer, stderr_buffer
-                )
+                await _terminate(process)
+                await _finish_readers(process, readers, output)
 
-                output = f"Command timed out after {elapsed:.1f} seconds (non-interactive mode).\n"
-                stdout_content = stdout_buffer.getvalue()
-                stderr_content = stderr_buffer.getvalue()
-                if stdout_content:
-                    output += f"STDOUT:\n{stdout_content}\n"
-                if stderr_content:
-                    output += f"STDERR:\n{stderr_content}\n"
-                return output
+                result = f"Command timed out after {elapsed:.1f} seconds (non-interactive mode).\n"
+                return result + output.format()
 
             # Display status message - use live if available, otherwise normal system message
             if live:
-                from rich.console import Group
                 from rich.text import Text
 
-                # Create a combined display with current output and status
-                display_parts = []
-
-                # Add current output
-                current_stdout = stdout_buffer.getvalue()
-                current_stderr = stderr_buffer.getvalue()
-
-                if current_stdout:
-                    display_parts.extend(
-                        [Text("STDOUT:", style="bold green"), Text(current_stdout)]
-                    )
-                if current_stderr:
-                    if display_parts:
-                        display_parts.append(Text(""))  # Empty line separator
-                    display_parts.extend(
-                        [Text("STDERR:", style="bold red"), Text(current_stderr)]
-                    )
-
-                # Add timeout status
-                display_parts.extend(
-                    [
-                        Text(""),  # Empty line
-                        Text(
-                            f"Command has been running for {elapsed:.1f} seconds.",
-                            style="bold yellow",
-                        ),
-                        Text("Waiting for user input...", style="yellow"),
-                    ]
+                _update_live(
+                    live,
+                    output,
+                    Text(
+                        f"Command has been running for {elapsed:.1f} seconds.",
+                        style="bold yellow",
+                    ),
+                    Text("Waiting for user input...", style="yellow"),
                 )
-
-                live_display = Group(*display_parts)
-                live.update(live_display)
             else:
                 context.user_interface.handle_system_message(status_msg, markdown=False)
 
@@ -289,8 +182,7 @@ async def _run_shell_command_with_interactive_timeout(
 
             async def monitor_process_completion():
                 """Monitor for process completion during user input."""
-                while process.poll() is None:
-                    await asyncio.sleep(0.1)
+                await _wait_for_exit(process)
                 return "PROCESS_COMPLETED"
 
             async def auto_kill_timer():
@@ -338,128 +230,188 @@ async def _run_shell_command_with_interactive_timeout(
                 user_input_task.cancel()
                 process_monitor_task.cancel()
                 auto_kill_task.cancel()
+                await _terminate(process)
+                await _finish_readers(process, readers, output)
                 raise
 
             if choice == "K":
                 # Kill the process
                 try:
-                    process.terminate()
-                    # Give it a moment to terminate gracefully
-                    await asyncio.sleep(1)
-                    if process.poll() is None:
-                        process.kill()
+                    await _terminate(process)
 
                     # Collect any final output
-                    _collect_remaining_output(
-                        stdout_queue, stderr_queue, stdout_buffer, stderr_buffer
-                    )
+                    await _finish_readers(process, readers, output)
 
-                    output = "Command was killed by user.\n"
-                    output += f"Execution time: {elapsed:.1f} seconds\n"
-
-                    stdout_content = stdout_buffer.getvalue()
-                    stderr_content = stderr_buffer.getvalue()
-
-                    if stdout_content:
-                        output += f"STDOUT (before kill):\n{stdout_content}\n"
-                    if stderr_content:
-                        output += f"STDERR (before kill):\n{stderr_content}\n"
-
-                    return output
+                    result = "Command was killed by user.\n"
+                    result += f"Execution time: {elapsed:.1f} seconds\n"
+                    return result + output.format(" (before kill)")
 
                 except Exception as e:
                     return f"Error killing process: {str(e)}"
 
             elif choice == "B":
-                # Background the process - return current output
-                output = f"Command backgrounded after {elapsed:.1f} seconds (PID: {process.pid}).\n"
-                output += (
-                    "Note: Process continues running but output capture has stopped.\n"
+                # Background the process - return current output. The readers
+                # keep draining its pipes into the spill files so it never
+                # blocks on a full pipe, and the rest of its output stays
+                # readable through the handle.
+                output.spill()
+                result = f"Command backgrounded after {elapsed:.1f} seconds (PID: {process.pid}).\n"
+                result += (
+                    "Note: Process continues running; further output is saved "
+                    f"under handle {output.handle} "
+                    "(read it with shell_output_read).\n"
                 )
-
-                stdout_content = stdout_buffer.getvalue()
-                stderr_content = stderr_buffer.getvalue()
-
-                if stdout_content:
-                    output += f"STDOUT (so far):\n{stdout_content}\n"
-                if stderr_content:
-                    output += f"STDERR (so far):\n{stderr_content}\n"
-
-                return output
+                _close_when_done(readers, output)
+                return result + output.format(" (so far)")
 
             else:  # Default to 'C' - continue
                 current_timeout += initial_timeout  # Add the same interval again
                 if live:
                     # Update live display to show we're continuing
-                    from rich.console import Group
                     from rich.text import Text
 
-                    display_parts = []
-
-                    # Add current output
-                    current_stdout = stdout_buffer.getvalue()
-                    current_stderr = stderr_buffer.getvalue()
-
-                    if current_stdout:
-                        display_parts.extend(
-                            [Text("STDOUT:", style="bold green"), Text(current_stdout)]
-                        )
-                    if current_stderr:
-                        if display_parts:
-                            display_parts.append(Text(""))  # Empty line separator
-                        display_parts.extend(
-                            [Text("STDERR:", style="bold red"), Text(current_stderr)]
-                        )
-
-                    # Add continuation status
-                    display_parts.extend(
-                        [
-                            Text(""),  # Empty line
-                            Text(
-                                f"Continuing to wait for {initial_timeout} more seconds...",
-                                style="bold cyan",
-                            ),
-                        ]
+                    _update_live(
+                        live,
+                        output,
+                        Text(
+                            f"Continuing to wait for {initial_timeout} more seconds...",
+                            style="bold cyan",
+                        ),
                     )
-
-                    live_display = Group(*display_parts)
-                    live.update(live_display)
                 else:
                     context.user_interface.handle_system_message(
                         f"Continuing to wait for {initial_timeout} more seconds...",
                         markdown=False,
                     )
 
-        # Sleep briefly before next check
-        await asyncio.sleep(0.5)
+        # Wait briefly before next check, waking early if the process exits
+        await _wait_for_exit(process, timeout=0.5)
 
 
-def _collect_output_batch(stdout_queue, stderr_queue, stdout_buffer, stderr_buffer):
-    """Collect a batch of output from the queues."""
-    # Collect stdout
-    while True:
-        try:
-            line = stdout_queue.get_nowait()
-            stdout_buffer.write(line)
-        except Empty:
-            break
+def _output_session_id(context: "AgentContext") -> str:
+    """Spilled outputs are shared by a root session and its sub-agents."""
+    return context.parent_session_id or context.session_id
+
+
+async def _pump_stream(stream: asyncio.StreamReader, capture: OutputCapture):
+    """Read a subprocess pipe in chunks into ``capture`` until EOF."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    try:
+        while True:
+            data = await stream.read(PIPE_READ_CHUNK)
+            if not data:
+                break
+            capture.write(decoder.decode(data))
+        capture.write(decoder.decode(b"", final=True))
+    except Exception as e:
+        capture.write(f"Error reading output: {str(e)}\n")
 
-    # Collect stderr
-    while True:
-        try:
-            line = stderr_queue.get_nowait()
-            stderr_buffer.write(line)
-        except Empty:
-            break
 
+async def _finish_readers(
+    process, readers, output: CommandOutput, timeout: float = 1.0
+):
+    """Drain the pipes of an exited process and close the captures.
 
-def _collect_remaining_output(stdout_queue, stderr_queue, stdout_buffer, stderr_buffer):
-    """Collect any remaining output from the queues."""
-    # Give threads a moment to finish
-    time.sleep(0.1)
+    A background child (``cmd &``) inherits the pipes and can keep them open
+    long after the shell exits, so the readers only get ``timeout`` seconds
+    to reach EOF. After that they are left draining in the background:
+    closing the pipes would kill the child with SIGPIPE on its next write.
+    """
+    done, pending = await asyncio.wait(readers, timeout=timeout)
+    if pending:
+        _close_when_done(readers, output)
+        return
+    # Both pipes are closed, so this returns at once and releases the
+    # subprocess transport
+    await process.wait()
+    output.close()
+
+
+def _close_when_done(readers, output: CommandOutput):
+    """Close a backgrounded command's captures once its pipes reach EOF."""
+    task = asyncio.ensure_future(asyncio.gather(*readers, return_exceptions=True))
+    task.add_done_callback(lambda _: output.close())
+    _background_readers.add(task)
+    task.add_done_callback(_background_readers.discard)
+
+
+async def _wait_for_exit(process, timeout: Optional[float] = None) -> bool:
+    """Wait until the process exits or ``timeout`` passes.
+
+    ``process.wait()`` also waits for the pipes to close, which a
+    backgrounded grandchild can hold open indefinitely, so this polls the
+    exit status instead.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while process.returncode is None:
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(EXIT_POLL_INTERVAL)
+    return True
 
-    # Collect any remaining output
-    _collect_output_batch(stdout_queue, stderr_queue, stdout_buffer, stderr_buffer)
+
+async def _terminate(process, grace: float = 1.0):
+    """Terminate a process, killing it if it outlives the grace period."""
+    try:
+        process.terminate()
+        if not await _wait_for_exit(process, timeout=grace):
+            process.kill()
+            await _wait_for_exit(process, timeout=grace)
+    except ProcessLookupError:
+        pass
+
+
+def _update_live(live, output: CommandOutput, *status):
+    """Show the bounded captured output, plus optional status lines, in ``live``."""
+    from rich.console import Group
+    from rich.text import Text
+
+    parts = []
+    stdout = output.stdout.text(output.handle, "stdout")
+    stderr = output.stderr.text(output.handle, "stderr")
+    if stdout:
+        parts.extend([Text("STDOUT:", style="bold green"), Text(stdout)])
+    if stderr:
+        if parts:
+            parts.append(Text(""))  # Empty line separator
+        parts.extend([Text("STDERR:", style="bold red"), Text(stderr)])
+    if status:
+        parts.append(Text(""))
+        parts.extend(status)
+    if parts:
+        live.update(Group(*parts))
+
+
+@tool(group="Shell")
+def shell_output_read(
+    context: "AgentContext",
+    handle: str,
+    stream: Optional[str] = None,
+    start_line: Optional[int] = None,
+    lines: Optional[int] = None,
+    pattern: Optional[str] = None,
+):
+    """Page through or search the full output of a shell_execute command.
+
+    When a command's output is too large, shell_execute shows only its
+    beginning and end, saves the full output, and reports an output handle.
+    Use this tool to read any part of it.
+
+    Args:
+        handle: Output handle reported by shell_execute (e.g. sh-1a2b3c4d)
+        stream: Which stream to read: 'stdout' (default) or 'stderr'
+        start_line: First line to return (1-based); negative counts from the end, e.g. -50 for the last 50 lines
+        lines: Maximum number of lines or matches to return (default: 200)
+        pattern: Optional regular expression; only matching lines are returned
+    """
+    return read_spilled_output(
+        _output_session_id(context),
+        handle,
+        stream=stream or "stdout",
+        start_line=start_line,
+        lines=lines,
+        pattern=pattern,
+    )
 
 
 # Session-based shell tools (using tmux implementation)
@@ -511,9 +463,15 @@ async def shell_session_execute(
         timeout_action: Optional timeout action ('interrupt' or 'kill')
     """
     # Import tmux tool function
-    from .tmux_tool import tmux_execute_command
+    from .tmux_tool import tmux_execute_command_async
 
-    return tmux_execute_command(context, session_name, command, timeout, timeout_action)
+    return await tmux_execute_command_async(
+        context,
+        session_name,
+        command,
+        timeout=timeout,
+        timeout_action=timeout_action or "interrupt",
+    )
 
 
 @tool(group="Shell")
@@ -0,0 +1,316 @@
+"""Bounded capture of shell command output with spill-to-disk.
+
+``shell_execute`` used to accumulate everything a command printed in memory
+and only truncate it once the tool result was built, so a chatty build or a
+``find /`` could hold hundreds of MB while the agent still only saw the
+head. ``OutputCapture`` keeps a fixed-size head and a tail ring in memory
+instead; as soon as a stream outgrows them the whole stream is written to a
+session-scoped spill file. The tool result shows the head and tail around an
+omission marker naming the output handle, and ``read_spilled_output`` pages
+or greps the spilled file on demand.
+
+Spill files live under the temp directory, keyed by session ID::
+
+    <tmp>/silica-shell-output/<session_id>/sh-1a2b3c4d.stdout
+    <tmp>/silica-shell-output/<session_id>/sh-1a2b3c4d.stderr
+
+Only the most recent ``MAX_SPILLED_OUTPUTS`` handles of a session are kept.
+"""
+
+import collections
+import re
+import secrets
+import tempfile
+from pathlib import Path
+from typing import IO, Deque, Dict, List, Optional
+
+# Characters of each stream kept in memory at the start and end of the output
+HEAD_CHARS = 24 * 1024
+TAIL_CHARS = 24 * 1024
+
+# Spilled outputs kept per session; older handles are deleted
+MAX_SPILLED_OUTPUTS = 20
+
+# Defaults and limits for paging through a spilled output
+DEFAULT_PAGE_LINES = 200
+MAX_PAGE_LINES = 2000
+MAX_LINE_CHARS = 2000
+
+STREAMS = ("stdout", "stderr")
+
+_HANDLE_RE = re.compile(r"^sh-[0-9a-f]{8}$")
+
+
+def output_dir(session_id: str) -> Path:
+    """Return the spill directory for a session."""
+    return Path(tempfile.gettempdir()) / "silica-shell-output" / session_id
+
+
+def new_handle() -> str:
+    return f"sh-{secrets.token_hex(4)}"
+
+
+def is_valid_handle(handle: str) -> bool:
+    return bool(_HANDLE_RE.match(handle or ""))
+
+
+def prune_outputs(directory: Path, keep: int = MAX_SPILLED_OUTPUTS) -> None:
+    """Delete all but the ``keep`` most recently written handles."""
+    try:
+        files = [p for p in directory.iterdir() if is_valid_handle(p.stem)]
+    except OSError:
+        return
+    latest: Dict[str, float] = {}
+    for path in files:
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            continue
+        latest[path.stem] = max(mtime, latest.get(path.stem, 0.0))
+    stale = sorted(latest, key=latest.get, reverse=True)[keep:]
+    for path in files:
+        if path.stem in stale:
+            path.unlink(missing_ok=True)
+
+
+class OutputCapture:
+    """Head/tail capture of one output stream that spills to a file.
+
+    Args:
+        path: Spill file, created only once the stream outgrows memory or
+            ``spill`` is called.
+        head_chars: Characters kept from the start of the stream.
+        tail_chars: Characters kept from the end of the stream.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        head_chars: int = HEAD_CHARS,
+        tail_chars: int = TAIL_CHARS,
+    ):
+        self.path = Path(path)
+        self.head_chars = head_chars
+        self.tail_chars = tail_chars
+        self.total_chars = 0
+        self.total_lines = 0
+        self._head: List[str] = []
+        self._head_len = 0
+        self._tail: Deque[str] = collections.deque()
+        self._tail_len = 0
+        self._file: Optional[IO[str]] = None
+        self.spilled = False
+
+    @property
+    def truncated(self) -> bool:
+        """True once output has been dropped from memory."""
+        return self.total_chars > self._head_len + self._tail_len
+
+    def write(self, text: str) -> None:
+        if not text:
+            return
+        if (
+            not self.spilled
+            and self.total_chars + len(text) > self.head_chars + self.tail_chars
+        ):
+            self.spill()
+        if self._file is not None:
+            self._file.write(text)
+            # Keep the file readable while a backgrounded command is running
+            self._file.flush()
+
+        self.total_chars += len(text)
+        self.total_lines += text.count("\n")
+
+        room = self.head_chars - self._head_len
+        if room > 0:
+            self._head.append(text[:room])
+            self._head_len += min(room, len(text))
+            text = text[room:]
+        if text:
+            self._push_tail(text)
+
+    def spill(self) -> None:
+        """Start writing the stream to its spill file.
+
+        Nothing has been dropped yet when this runs, so the file starts with
+        the head and tail held in memory.
+        """
+        if self.spilled:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write("".join(self._head) + "".join(self._tail))
+        self._file.flush()
+        self.spilled = True
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def tail(self, chars: int) -> str:
+        """Return up to ``chars`` characters from the end of the stream."""
+        tail = "".join(self._tail)
+        if len(tail) < chars and not self.truncated:
+            tail = "".join(self._head) + tail
+        return tail[-chars:]
+
+    def text(self, handle: str, stream: str) -> str:
+        """Return the captured output, with an omission marker if truncated."""
+        head = "".join(self._head)
+        tail = "".join(self._tail)
+        if not self.truncated:
+            return head + tail
+
+        # Cut on line boundaries where possible so the marker sits cleanly
+        if "\n" in head:
+            head = head[: head.rindex("\n") + 1]
+        if "\n" in tail[:-1]:
+            tail = tail[tail.index("\n") + 1 :]
+        omitted = self.total_chars - len(head) - len(tail)
+        omitted_lines = self.total_lines - head.count("\n") - tail.count("\n")
+        marker = (
+            f"[... {omitted:,} characters ({omitted_lines:,} lines) omitted; "
+            f"the full {stream} has {self.total_lines:,} lines. Use "
+            f'shell_output_read(handle="{handle}", stream="{stream}") '
+            "to page or grep it ...]"
+        )
+        if head and not head.endswith("\n"):
+            head += "\n"
+        return f"{head}{marker}\n{tail}"
+
+    def _push_tail(self, text: str) -> None:
+        if len(text) >= self.tail_chars:
+            self._tail.clear()
+            text = text[-self.tail_chars :]
+            self._tail_len = 0
+        self._tail.append(text)
+        self._tail_len += len(text)
+        while self._tail_len > self.tail_chars:
+            excess = self._tail_len - self.tail_chars
+            first = self._tail[0]
+            if len(first) <= excess:
+                self._tail.popleft()
+                self._tail_len -= len(first)
+            else:
+                self._tail[0] = first[excess:]
+                self._tail_len -= excess
+
+
+class CommandOutput:
+    """The stdout and stderr captures of one command, under one handle."""
+
+    def __init__(self, session_id: str, handle: Optional[str] = None):
+        self.directory = output_dir(session_id)
+        self.handle = handle or new_handle()
+        self.stdout = OutputCapture(self.directory / f"{self.handle}.stdout")
+        self.stderr = OutputCapture(self.directory / f"{self.handle}.stderr")
+
+    @property
+    def spilled(self) -> bool:
+        return self.stdout.spilled or self.stderr.spilled
+
+    def spill(self) -> None:
+        """Spill both streams, e.g. so a backgrounded command keeps logging."""
+        self.stdout.spill()
+        self.stderr.spill()
+
+    def close(self) -> None:
+        self.stdout.close()
+        self.stderr.close()
+        if self.spilled:
+            prune_outputs(self.directory)
+
+    def format(self, label_suffix: str = "") -> str:
+        """Render the STDOUT/STDERR sections of a shell_execute result."""
+        output = ""
+        stdout = self.stdout.text(self.handle, "stdout")
+        stderr = self.stderr.text(self.handle, "stderr")
+        if stdout:
+            output += f"STDOUT{label_suffix}:\n{stdout}\n"
+        if stderr:
+            output += f"STDERR{label_suffix}:\n{stderr}\n"
+        if self.spilled:
+            output += f"Output handle: {self.handle}\n"
+        return output
+
+
+def read_spilled_output(
+    session_id: str,
+    handle: str,
+    stream: str = "stdout",
+    start_line: Optional[int] = None,
+    lines: Optional[int] = None,
+    pattern: Optional[str] = None,
+) -> str:
+    """Page through or grep a spilled output.
+
+    Args:
+        session_id: Session that produced the output.
+        handle: Output handle from a shell_execute result.
+        stream: ``stdout`` or ``stderr``.
+        start_line: First line to return (1-based); negative values count
+            from the end. Defaults to 1.
+        lines: Maximum number of lines (or matches) to return.
+        pattern: If given, return only lines matching this regular
+            expression, starting at ``start_line``.
+    """
+    if not is_valid_handle(handle):
+        return f"Error: Invalid output handle '{handle}'."
+    if stream not in STREAMS:
+        return "Error: stream must be 'stdout' or 'stderr'."
+    path = output_dir(session_id) / f"{handle}.{stream}"
+    if not path.exists():
+        if any((path.parent / f"{handle}.{s}").exists() for s in STREAMS):
+            return f"No {stream} was captured for {handle}."
+        return (
+            f"Error: No spilled output found for handle '{handle}' "
+            "(it may have expired)."
+        )
+
+    limit = max(1, min(lines or DEFAULT_PAGE_LINES, MAX_PAGE_LINES))
+    regex = None
+    if pattern:
+        try:
+            regex = re.compile(pattern)
+        except re.error as e:
+            return f"Error: Invalid pattern: {e}"
+
+    start = start_line or 1
+    if start < 0:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            total = sum(1 for _ in f)
+        start = max(1, total + start + 1)
+
+    selected: List[str] = []
+    matches = 0
+    total = 0
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for number, line in enumerate(f, start=1):
+            total = number
+            if number < start:
+                continue
+            if regex is not None:
+                if not regex.search(line):
+                    continue
+                matches += 1
+            if len(selected) < limit:
+                line = line.rstrip("\n")
+                if len(line) > MAX_LINE_CHARS:
+                    line = line[:MAX_LINE_CHARS] + " [line truncated]"
+                selected.append(f"{number}: {line}")
+
+    if regex is not None:
+        header = (
+            f"{handle} {stream}: {matches} line(s) matching {pattern!r} "
+            f"from line {start} of {total}"
+        )
+        if matches > len(selected):
+            header += f" (showing first {len(selected)})"
+    elif selected:
+        last = start + len(selected) - 1
+        header = f"{handle} {stream}: lines {start}-{last} of {total}"
+    else:
+        header = f"{handle} {stream}: no lines at {start} (total {total})"
+    return header + "\n" + "\n".join(selected)
@@ -8,6 +8,7 @@ from rich.status import Status
 from silica.developer.context import AgentContext
 from silica.developer.models import MODEL_MAP
 from .framework import tool
+from .python_worker import release_python_worker
 from silica.developer.user_interface import UserInterface
 from ..utils import wrap_text_as_content_block
 
@@ -194,6 +195,8 @@ async def run_agent(
             # Re-raise the exception
             raise
         finally:
+            # Stop the sub-agent's python_repl worker so it isn't orphaned
+            release_python_worker(sub_agent_context.session_id)
             # Clean up MCP connections if we created them
             if mcp_manager is not None:
                 await mcp_manager.disconnect_all()
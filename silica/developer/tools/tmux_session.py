@@ -3,20 +3,185 @@ Tmux session management classes for the TmuxTool.
 
 This module provides the core session management functionality for persistent
 shell sessions using tmux.
+
+Each session's pane output is streamed with ``tmux pipe-pane`` into a log file
+that is read incrementally from a byte offset, so fetching output only reads
+what is new instead of spawning ``tmux capture-pane`` for a full screen.
+Commands run with a timeout are followed by a sentinel ``printf`` that prints
+a unique marker and the exit status, which marks completion without relying
+on prompt heuristics. Sessions whose stream is unavailable fall back to
+``capture-pane`` polling.
 """
 
+import asyncio
+import codecs
 import subprocess
+import tempfile
 import time
 import uuid
 import signal
 import os
+import shutil
 from collections import deque
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import atexit
 import re
 import shlex
 
+# Interval between checks of a pane's output stream (no subprocess involved)
+STREAM_POLL_INTERVAL = 0.05
+
+# How long to wait for tmux to start piping a new session's output
+STREAM_START_TIMEOUT = 1.0
+
+# Once this much output has been consumed, the stream file is truncated
+STREAM_MAX_BYTES = 64 * 1024 * 1024
+
+# Shells known to understand the sentinel's ``printf`` and ``$?``
+SENTINEL_SHELLS = {"bash", "zsh", "sh", "dash", "ksh"}
+
+SENTINEL_COMMAND = "printf '\\n__SILICA_DONE_%s:%s__\\n' {token} \"$?\""
+_SENTINEL_ECHO_RE = re.compile(
+    r"\s*[;&]?\s*printf '\\n__SILICA_DONE_%s:%s__\\n' [0-9a-f]{8} \"\$\?\""
+)
+_SENTINEL_LINE_RE = re.compile(r"^__SILICA_DONE_[0-9a-f]{8}:\d+__$")
+_ANSI_RE = re.compile(
+    r"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-Z\\-_]"
+)
+
+
+def clean_terminal_output(text: str) -> str:
+    """Strip escape sequences, carriage-return overwrites and sentinels."""
+    text = _ANSI_RE.sub("", text)
+    lines = []
+    for line in text.replace("\r\n", "\n").split("\n"):
+        # A bare carriage return redraws the line (progress bars, spinners)
+        segments = [segment for segment in line.split("\r") if segment]
+        line = segments[-1] if segments else ""
+        if _SENTINEL_LINE_RE.match(line.strip()):
+            # Also drop the blank line the sentinel starts with
+            if lines and not lines[-1]:
+                lines.pop()
+            continue
+        lines.append(_SENTINEL_ECHO_RE.sub("", line))
+    return "\n".join(lines)
+
+
+class PaneOutputStream:
+    """Incremental reader for a pane's output piped to a file by tmux.
+
+    Args:
+        path: File that ``tmux pipe-pane`` appends the pane output to.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.offset = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._live = False
+        self._waited = False
+
+    def is_live(self, wait: float = 0) -> bool:
+        """Return True once tmux has started piping output to the file.
+
+        tmux starts the pipe asynchronously, so callers about to depend on
+        the stream may ``wait`` for it once; later calls do not wait again.
+        """
+        deadline = self._live_deadline(wait)
+        while not self._check_live():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(STREAM_POLL_INTERVAL)
+        return True
+
+    async def wait_live(self, wait: float = 0) -> bool:
+        """Like ``is_live``, but waits without blocking the event loop."""
+        deadline = self._live_deadline(wait)
+        while not self._check_live():
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(STREAM_POLL_INTERVAL)
+        return True
+
+    def _live_deadline(self, wait: float) -> float:
+        deadline = time.monotonic() + (0 if self._waited or self._live else wait)
+        self._waited = self._waited or wait > 0
+        return deadline
+
+    def _check_live(self) -> bool:
+        if not self._live and self.path.exists():
+            self._live = True
+        return self._live
+
+    def size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return 0
+
+    def read_bytes(self, start: int) -> bytes:
+        """Return the raw bytes written since ``start``."""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(start)
+                return f.read()
+        except OSError:
+            return b""
+
+    def read_new(self) -> str:
+        """Return the cleaned output written since the previous call."""
+        if self.size() < self.offset:
+            self.offset = 0  # Truncated
+        data = self.read_bytes(self.offset)
+        self.offset += len(data)
+        text = self._decoder.decode(data)
+        if self.offset >= STREAM_MAX_BYTES:
+            # Output written between the read and the truncation is lost;
+            # acceptable for a cap that only bounds runaway output.
+            try:
+                os.truncate(self.path, 0)
+                self.offset = 0
+            except OSError:
+                pass
+        return clean_terminal_output(text)
+
+    def tail(self, max_bytes: int = 4096) -> str:
+        """Return the cleaned last ``max_bytes`` of output (e.g. the prompt)."""
+        data = self.read_bytes(max(0, self.size() - max_bytes))
+        return clean_terminal_output(data.decode("utf-8", errors="replace"))
+
+    def remove(self) -> None:
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+class SentinelWaiter:
+    """Scans new pane output for a command's completion sentinel."""
+
+    def __init__(self, stream: PaneOutputStream, token: str, start: int):
+        self.stream = stream
+        self.position = start
+        self._pattern = re.compile(rb"__SILICA_DONE_" + token.encode() + rb":(\d+)__")
+        self._carry = b""
+
+    def poll(self) -> Optional[int]:
+        """Return the command's exit status if it has finished, else None."""
+        if self.stream.size() < self.position:
+            self.position = 0  # Truncated
+        data = self.stream.read_bytes(self.position)
+        self.position += len(data)
+        window = self._carry + data
+        match = self._pattern.search(window)
+        if match:
+            return int(match.group(1))
+        # Keep enough bytes to match a sentinel split across reads
+        self._carry = window[-64:]
+        return None
+
 
 class TmuxSession:
     """Represents a single tmux session with output buffering and state tracking."""
@@ -47,6 +212,13 @@ class TmuxSession:
         self._output_thread = None
         self._stop_output_capture = False
 
+        # Streamed pane output (None when falling back to capture-pane)
+        self.output_stream: Optional[PaneOutputStream] = None
+        # Exit status of the last command whose sentinel was seen
+        self.last_exit_status: Optional[int] = None
+        # Whether the most recent command is known to have finished
+        self.last_command_finished = False
+
     def add_command(self, command: str, timeout: Optional[int] = None):
         """Record a command execution."""
         self.commands_executed.append(
@@ -133,6 +305,8 @@ class TmuxSessionManager:
         self.cleanup_registered = False
         self.global_default_timeout = global_default_timeout  # Global default timeout
 
+        self._stream_dir: Optional[Path] = None
+
         # Register cleanup handler
         if not self.cleanup_registered:
             atexit.register(self.cleanup_all_sessions)
@@ -191,6 +365,183 @@ class TmuxSessionManager:
         except Exception as e:
             return -1, "", str(e)
 
+    def _stream_path(self, tmux_session_name: str) -> Path:
+        """Return the file a session's pane output is piped to."""
+        if self._stream_dir is None:
+            self._stream_dir = Path(tempfile.mkdtemp(prefix="silica-tmux-"))
+        return self._stream_dir / f"{tmux_session_name}.log"
+
+    def _session_by_tmux_name(self, tmux_session_name: str) -> Optional[TmuxSession]:
+        for session in self.sessions.values():
+            if session.tmux_session_name == tmux_session_name:
+                return session
+        return None
+
+    @staticmethod
+    def _supports_sentinel(command: str) -> bool:
+        """Return True if a sentinel can safely be appended to ``command``.
+
+        Multi-line commands, heredocs, continuations and comments could
+        swallow the sentinel, so those fall back to prompt detection.
+        """
+        stripped = command.strip()
+        return bool(stripped) and not (
+            "\n" in stripped
+            or "#" in stripped
+            or "<<" in stripped
+            or stripped.endswith("\\")
+        )
+
+    def _pane_runs_sentinel_shell(self, tmux_session_name: str) -> bool:
+        """Return True if the pane's foreground program understands the sentinel.
+
+        This is the program running in the pane (a shell, or e.g. a REPL
+        started in it), not the shell of this process.
+        """
+        exit_code, stdout, stderr = self._run_tmux_command(
+            [
+                "tmux",
+                "display-message",
+                "-t",
+                tmux_session_name,
+                "-p",
+                "#{pane_current_command}",
+            ]
+        )
+        # Login shells are reported as e.g. "-bash"
+        command = os.path.basename(stdout.strip().lstrip("-"))
+        return exit_code == 0 and command in SENTINEL_SHELLS
+
+    def _streaming_session(
+        self, tmux_session_name: str, command: str
+    ) -> Optional[TmuxSession]:
+        """Return the session if ``command`` can use sentinel completion."""
+        session = self._sentinel_candidate(tmux_session_name, command)
+        if (
+            session is None
+            or not session.output_stream.is_live(wait=STREAM_START_TIMEOUT)
+            or not self._pane_runs_sentinel_shell(tmux_session_name)
+        ):
+            return None
+        return session
+
+    async def _streaming_session_async(
+        self, tmux_session_name: str, command: str
+    ) -> Optional[TmuxSession]:
+        """Like ``_streaming_session``, without blocking the event loop."""
+        session = self._sentinel_candidate(tmux_session_name, command)
+        if (
+            session is None
+            or not await session.output_stream.wait_live(wait=STREAM_START_TIMEOUT)
+            or not await asyncio.to_thread(
+                self._pane_runs_sentinel_shell, tmux_session_name
+            )
+        ):
+            return None
+        return session
+
+    def _sentinel_candidate(
+        self, tmux_session_name: str, command: str
+    ) -> Optional[TmuxSession]:
+        session = self._session_by_tmux_name(tmux_session_name)
+        if (
+            session is None
+            or session.output_stream is None
+            or not self._supports_sentinel(command)
+        ):
+            return None
+        return session
+
+    def _start_sentinel_command(
+        self, session: TmuxSession, command: str
+    ) -> Tuple[Optional[SentinelWaiter], str]:
+        """Send ``command`` followed by a completion sentinel."""
+        token = uuid.uuid4().hex[:8]
+        stream = session.output_stream
+        start = stream.size()
+        # A trailing '&' already separates commands; '&;' is a syntax error
+        separator = " " if command.rstrip().endswith("&") else "; "
+        full_command = (
+            command.rstrip() + separator + SENTINEL_COMMAND.format(token=token)
+        )
+        exit_code, stdout, stderr = self._run_tmux_command(
+            [
+                "tmux",
+                "send-keys",
+                "-t",
+                session.tmux_session_name,
+                full_command,
+                "Enter",
+            ]
+        )
+        if exit_code != 0:
+            return None, f"Failed to send command: {stderr}"
+        return SentinelWaiter(stream, token, start), ""
+
+    def _finish_sentinel_command(
+        self,
+        session: TmuxSession,
+        status: Optional[int],
+        timeout: int,
+        timeout_action: str,
+    ) -> Tuple[bool, str]:
+        if status is not None:
+            session.last_exit_status = status
+            session.last_command_finished = True
+            if status == 0:
+                return True, "Command completed successfully"
+            return True, f"Command completed with exit status {status}"
+
+        success, message = self._handle_command_timeout(
+            session.tmux_session_name, timeout_action, timeout
+        )
+        return success, f"Command timed out after {timeout}s. {message}"
+
+    def _execute_with_sentinel(
+        self,
+        session: TmuxSession,
+        command: str,
+        timeout: int,
+        timeout_action: str,
+    ) -> Tuple[bool, str]:
+        waiter, error = self._start_sentinel_command(session, command)
+        if waiter is None:
+            return False, error
+        deadline = time.monotonic() + timeout
+        status = waiter.poll()
+        while status is None and time.monotonic() < deadline:
+            time.sleep(STREAM_POLL_INTERVAL)
+            status = waiter.poll()
+        return self._finish_sentinel_command(session, status, timeout, timeout_action)
+
+    async def _execute_with_sentinel_async(
+        self,
+        session: TmuxSession,
+        command: str,
+        timeout: int,
+        timeout_action: str,
+    ) -> Tuple[bool, str]:
+        waiter, error = self._start_sentinel_command(session, command)
+        if waiter is None:
+            return False, error
+        deadline = time.monotonic() + timeout
+        status = waiter.poll()
+        while status is None and time.monotonic() < deadline:
+            await asyncio.sleep(STREAM_POLL_INTERVAL)
+            status = waiter.poll()
+        return self._finish_sentinel_command(session, status, timeout, timeout_action)
+
+    def _capture_pane_state(self, tmux_session_name: str) -> Optional[str]:
+        """Return the current end of the pane's output, for prompt checks."""
+        session = self._session_by_tmux_name(tmux_session_name)
+        if session is not None and session.output_stream is not None:
+            if session.output_stream.is_live():
+                return session.output_stream.tail()
+        exit_code, stdout, stderr = self._run_tmux_command(
+            ["tmux", "capture-pane", "-t", tmux_session_name, "-p"]
+        )
+        return stdout if exit_code == 0 else None
+
     def create_session(
         self, session_name: str, initial_command: Optional[str] = None
     ) -> Tuple[bool, str]:
@@ -230,6 +581,18 @@ class TmuxSessionManager:
             if value is not None:
                 command.extend(["-e", f"{key}={value}"])
 
+        # Stream pane output to a file from the start, in the same tmux call
+        stream_path = self._stream_path(tmux_session_name)
+        command.extend(
+            [
+                ";",
+                "pipe-pane",
+                "-t",
+                tmux_session_name,
+                f"cat >> {shlex.quote(str(stream_path))}",
+            ]
+        )
+
         exit_code, stdout, stderr = self._run_tmux_command(command)
 
         if exit_code != 0:
@@ -237,6 +600,7 @@ class TmuxSessionManager:
 
         # Create session object
         session = TmuxSession(session_name, tmux_session_name)
+        session.output_stream = PaneOutputStream(stream_path)
         self.sessions[session_name] = session
 
         # Execute initial command if provided
@@ -299,6 +663,8 @@ class TmuxSessionManager:
 
         # Remove from our tracking (even if tmux command failed)
         del self.sessions[session_name]
+        if session.output_stream is not None:
+            session.output_stream.remove()
 
         if exit_code != 0:
             return (
@@ -332,6 +698,7 @@ class TmuxSessionManager:
             return False, f"Session '{session_name}' not found."
 
         session = self.sessions[session_name]
+        session.last_command_finished = False
 
         # Optionally refresh environment variables before command execution
         if refresh_env:
@@ -352,20 +719,113 @@ class TmuxSessionManager:
                 session.tmux_session_name, command
             )
 
-        if success:
-            session.add_command(command, effective_timeout)
-            if effective_timeout is not None:
-                env_note = " (env refreshed)" if refresh_env else ""
-                return (
-                    True,
-                    f"Command executed in session '{session_name}' (timeout: {effective_timeout}s){env_note}",
-                )
-            else:
-                env_note = " (env refreshed)" if refresh_env else ""
-                return True, f"Command executed in session '{session_name}'{env_note}"
-        else:
+        return self._command_result(
+            session_name, command, effective_timeout, refresh_env, success, message
+        )
+
+    async def execute_command_async(
+        self,
+        session_name: str,
+        command: str,
+        timeout: Optional[int] = None,
+        timeout_action: str = "interrupt",
+        refresh_env: bool = False,
+    ) -> Tuple[bool, str]:
+        """Execute a command like ``execute_command`` without blocking the loop.
+
+        Waiting for a streamed session's completion sentinel is done with
+        ``asyncio.sleep``; everything else runs in a worker thread.
+        """
+        session = self.sessions.get(session_name)
+        effective_timeout = self._determine_effective_timeout(session_name, timeout)
+        if (
+            session is None
+            or effective_timeout is None
+            or await self._streaming_session_async(session.tmux_session_name, command)
+            is None
+        ):
+            return await asyncio.to_thread(
+                self.execute_command,
+                session_name,
+                command,
+                timeout=timeout,
+                timeout_action=timeout_action,
+                refresh_env=refresh_env,
+            )
+
+        session.last_command_finished = False
+        if refresh_env:
+            env_success, env_message = await asyncio.to_thread(
+                self.update_session_environment, session_name
+            )
+            if not env_success:
+                return False, f"Failed to refresh environment: {env_message}"
+
+        success, message = await self._execute_with_sentinel_async(
+            session, command, effective_timeout, timeout_action
+        )
+        return self._command_result(
+            session_name, command, effective_timeout, refresh_env, success, message
+        )
+
+    def _command_result(
+        self,
+        session_name: str,
+        command: str,
+        effective_timeout: Optional[int],
+        refresh_env: bool,
+        success: bool,
+        message: str,
+    ) -> Tuple[bool, str]:
+        if not success:
             return False, message
 
+        session = self.sessions.get(session_name)
+        if session is not None:
+            session.add_command(command, effective_timeout)
+        env_note = " (env refreshed)" if refresh_env else ""
+        if effective_timeout is None:
+            return True, f"Command executed in session '{session_name}'{env_note}"
+
+        status_note = ""
+        if message.startswith("Command completed with exit status"):
+            status_note = f" ({message[len('Command completed with ') :]})"
+        elif message.startswith("Command timed out"):
+            status_note = f" ({message})"
+        return (
+            True,
+            f"Command executed in session '{session_name}' (timeout: {effective_timeout}s){env_note}{status_note}",
+        )
+
+    def wait_for_output(self, session_name: str, max_wait: float = 0.5) -> None:
+        """Give a just-sent command a moment to produce output.
+
+        Streamed sessions return as soon as the last command's sentinel was
+        seen or the output has been quiet briefly; others sleep ``max_wait``.
+        """
+        session = self.sessions.get(session_name)
+        stream = session.output_stream if session else None
+        if stream is None or not stream.is_live():
+            time.sleep(max_wait)
+            return
+        if session.last_command_finished:
+            return
+
+        deadline = time.monotonic() + max_wait
+        size = stream.size()
+        quiet_since = None
+        while time.monotonic() < deadline:
+            time.sleep(STREAM_POLL_INTERVAL)
+            new_size = stream.size()
+            if new_size != size:
+                size = new_size
+                quiet_since = time.monotonic()
+            elif (
+                quiet_since is not None
+                and time.monotonic() - quiet_since >= 2 * STREAM_POLL_INTERVAL
+            ):
+                return
+
     def _validate_and_sanitize_command(self, command: str) -> Tuple[bool, str]:
         """Validate and sanitize a command for safe shell execution.
 
@@ -589,6 +1049,13 @@ class TmuxSessionManager:
                 tmux_session_name, command
             )
 
+        session = self._streaming_session(tmux_session_name, command)
+        if session is not None:
+            return self._execute_with_sentinel(
+                session, command, timeout, timeout_action
+            )
+
+        # Fall back to polling the pane for a prompt
         # Send the command
         exit_code, stdout, stderr = self._run_tmux_command(
             ["tmux", "send-keys", "-t", tmux_session_name, command, "Enter"]
@@ -812,11 +1279,9 @@ class TmuxSessionManager:
         time.sleep(0.1)  # Brief pause to let command execute
 
         # Capture current shell state
-        capture_exit_code, capture_output, capture_stderr = self._run_tmux_command(
-            ["tmux", "capture-pane", "-t", tmux_session_name, "-p"]
-        )
+        capture_output = self._capture_pane_state(tmux_session_name)
 
-        if capture_exit_code == 0:
+        if capture_output is not None:
             stuck_state = self._detect_shell_stuck_state(capture_output)
             if stuck_state:
                 # Attempt recovery
@@ -857,11 +1322,9 @@ class TmuxSessionManager:
         time.sleep(0.1)  # Brief pause to let command execute
 
         # Capture current shell state
-        capture_exit_code, capture_output, capture_stderr = self._run_tmux_command(
-            ["tmux", "capture-pane", "-t", tmux_session_name, "-p"]
-        )
+        capture_output = self._capture_pane_state(tmux_session_name)
 
-        if capture_exit_code == 0:
+        if capture_output is not None:
             stuck_state = self._detect_shell_stuck_state(capture_output)
             if stuck_state:
                 # Attempt recovery
@@ -890,6 +1353,13 @@ class TmuxSessionManager:
 
         session = self.sessions[session_name]
 
+        # Only read what the pane has written since the last capture
+        if session.output_stream is not None and session.output_stream.is_live():
+            new_output = session.output_stream.read_new()
+            if new_output.strip():
+                session.add_output(new_output)
+            return True, session.get_recent_output(lines)
+
         # Capture output from tmux
         exit_code, stdout, stderr = self._run_tmux_command(
             ["tmux", "capture-pane", "-t", session.tmux_session_name, "-p"]
@@ -937,6 +1407,9 @@ class TmuxSessionManager:
                 self.destroy_session(session_name)
             except Exception as e:
                 print(f"Error cleaning up session {session_name}: {e}")
+        if self._stream_dir is not None:
+            shutil.rmtree(self._stream_dir, ignore_errors=True)
+            self._stream_dir = None
 
 
 # Global session manager instance
@@ -5,6 +5,7 @@ This module provides tools for creating, managing, and interacting with
 persistent shell sessions that survive across tool invocations.
 """
 
+import asyncio
 import re
 from typing import Optional
 
@@ -153,6 +154,71 @@ def tmux_execute_command(
         timeout_action: Action to take on timeout ('interrupt', 'kill', 'terminate')
         refresh_env: Whether to refresh environment variables before executing command
     """
+    error = _validate_execute_request(context, command, timeout, timeout_action)
+    if error:
+        return error
+
+    # Execute command with timeout support
+    session_manager = get_session_manager()
+    success, message = session_manager.execute_command(
+        session_name,
+        command,
+        timeout=timeout,
+        timeout_action=timeout_action,
+        refresh_env=refresh_env,
+    )
+
+    if not success:
+        return message
+
+    # Capture output if requested
+    if capture_output:
+        return _with_recent_output(session_manager, session_name, message, timeout)
+
+    return message
+
+
+async def tmux_execute_command_async(
+    context: "AgentContext",
+    session_name: str,
+    command: str,
+    capture_output: bool = True,
+    timeout: Optional[int] = None,
+    timeout_action: str = "interrupt",
+    refresh_env: bool = False,
+) -> str:
+    """Async variant of ``tmux_execute_command`` that does not block the loop."""
+    error = _validate_execute_request(context, command, timeout, timeout_action)
+    if error:
+        return error
+
+    session_manager = get_session_manager()
+    success, message = await session_manager.execute_command_async(
+        session_name,
+        command,
+        timeout=timeout,
+        timeout_action=timeout_action,
+        refresh_env=refresh_env,
+    )
+
+    if not success:
+        return message
+
+    if capture_output:
+        return await asyncio.to_thread(
+            _with_recent_output, session_manager, session_name, message, timeout
+        )
+
+    return message
+
+
+def _validate_execute_request(
+    context: "AgentContext",
+    command: str,
+    timeout: Optional[int],
+    timeout_action: str,
+) -> Optional[str]:
+    """Return an error message if the command may not be executed."""
     # Check if tmux is available
     if not _check_tmux_available():
         return "Error: tmux is not available on this system."
@@ -175,36 +241,23 @@ def tmux_execute_command(
     if timeout_action not in ["interrupt", "kill", "terminate"]:
         return "Error: timeout_action must be one of: 'interrupt', 'kill', 'terminate'."
 
-    # Execute command with timeout support
-    session_manager = get_session_manager()
-    success, message = session_manager.execute_command(
-        session_name,
-        command,
-        timeout=timeout,
-        timeout_action=timeout_action,
-        refresh_env=refresh_env,
-    )
-
-    if not success:
-        return message
+    return None
 
-    # Capture output if requested
-    if capture_output:
-        # Give command a moment to execute (shorter if we have timeout info)
-        import time
-
-        if timeout is not None and timeout < 2:
-            time.sleep(0.2)  # Shorter wait for quick timeouts
-        else:
-            time.sleep(0.5)
 
-        output_success, output = session_manager.capture_session_output(session_name)
-        if output_success:
-            return f"{message}\n\nRecent output:\n{output}"
-        else:
-            return f"{message}\n\nWarning: Could not capture output: {output}"
-
-    return message
+def _with_recent_output(
+    session_manager, session_name: str, message: str, timeout: Optional[int]
+) -> str:
+    """Append the session's recent output to an execution message."""
+    # Give command a moment to execute (shorter if we have timeout info);
+    # streamed sessions return early once the output is complete
+    max_wait = 0.2 if timeout is not None and timeout < 2 else 0.5
+    session_manager.wait_for_output(session_name, max_wait)
+
+    output_success, output = session_manager.capture_session_output(session_name)
+    if output_success:
+        return f"{message}\n\nRecent output:\n{output}"
+    else:
+        return f"{message}\n\nWarning: Could not capture output: {output}"
 
 
 @tool
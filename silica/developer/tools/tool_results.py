@@ -0,0 +1,21 @@
+"""Access to tool results offloaded from the conversation."""
+
+from silica.developer.context import AgentContext
+from .framework import tool
+
+
+@tool(group="Agent")
+def rehydrate_tool_result(context: "AgentContext", content_hash: str):
+    """Get back the full content of an offloaded tool result.
+
+    Large tool results from earlier in the conversation are replaced by a
+    short stub with a content hash to save context. Use this tool when you
+    need the details of such a result again.
+
+    Args:
+        content_hash: Content hash from the offload stub (64 hex characters)
+    """
+    content = context.session_store.read_tool_result(content_hash.strip())
+    if content is None:
+        return f"Error: No offloaded tool result with content hash '{content_hash}'"
+    return content
@@ -160,6 +160,27 @@ def wrap_text_as_content_block(text: str) -> dict[str, Any]:
     }
 
 
+def get_block_attr(block: Any, attr: str, default: Any = None) -> Any:
+    """Get an attribute from a block, handling both dict and SDK object types."""
+    if isinstance(block, dict):
+        return block.get(attr, default)
+    else:
+        # Handle Anthropic SDK objects like ToolUseBlock, TextBlock, etc.
+        return getattr(block, attr, default)
+
+
+def usage_value(usage: Any, name: str) -> int:
+    """Return a token count from API usage given as a dict or SDK object.
+
+    Missing or non-integer counts are 0.
+    """
+    if isinstance(usage, dict):
+        value = usage.get(name)
+    else:
+        value = getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
 def render_tree(
     lines: list[str],
     node: dict[str, Any],
@@ -3,7 +3,16 @@
 import logging
 from typing import Dict
 
-from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response, status
+from fastapi import (
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from fastapi.responses import JSONResponse
 
 from .auth import verify_token
@@ -13,6 +22,7 @@ from .models import (
     HealthResponse,
     PreconditionFailedResponse,
     SyncIndexResponse,
+    SyncTokensResponse,
 )
 from .storage import (
     FileNotFoundError,
@@ -86,6 +96,8 @@ async def read_blob(
     namespace: str,
     path: str,
     user_info: Dict = Depends(verify_token),
+    prefix_length: int | None = Header(default=None, alias="X-Prefix-Length"),
+    prefix_md5: str | None = Header(default=None, alias="X-Prefix-MD5"),
 ):
     """
     Read a file from blob storage within a namespace.
@@ -94,13 +106,29 @@ async def read_blob(
         namespace: Persona/namespace identifier (can include slashes, e.g., "default/memory")
         path: File path within namespace
 
-    Returns file contents with ETag, Last-Modified, X-Version, and Content-Type headers.
+    Headers (optional):
+    - X-Prefix-Length, X-Prefix-MD5: Size and MD5 of a copy the client
+      already has. If the file starts with exactly that copy (e.g. an
+      append-only log), only the bytes after it are returned.
+
+    Returns file contents with ETag, Last-Modified, X-Version, X-Content-Offset
+    and Content-Type headers. X-Content-Offset is where the returned bytes
+    start in the file (0 for the whole file); ETag is always the MD5 of the
+    whole file.
     Returns 404 if file doesn't exist or is tombstoned.
     """
     try:
-        content, md5, last_modified, content_type, version = get_storage().read_file(
-            namespace, path
-        )
+        if prefix_length is not None and prefix_md5 is not None:
+            content, md5, last_modified, content_type, version, offset = (
+                get_storage().read_file_after(
+                    namespace, path, prefix_length, prefix_md5
+                )
+            )
+        else:
+            content, md5, last_modified, content_type, version = (
+                get_storage().read_file(namespace, path)
+            )
+            offset = 0
 
         return Response(
             content=content,
@@ -109,6 +137,7 @@ async def read_blob(
                 "ETag": f'"{md5}"',
                 "Last-Modified": last_modified.strftime("%a, %d %b %Y %H:%M:%S GMT"),
                 "X-Version": str(version),
+                "X-Content-Offset": str(offset),
             },
         )
 
@@ -196,6 +225,83 @@ async def write_blob(
         )
 
 
+@app.patch(
+    "/{namespace:path}/blob/{path:path}",
+    tags=["blob"],
+    response_model=SyncIndexResponse,
+)
+async def append_blob(
+    namespace: str,
+    path: str,
+    request: Request,
+    user_info: Dict = Depends(verify_token),
+    append_offset: int = Header(..., alias="X-Append-Offset"),
+    prefix_md5: str = Header(..., alias="X-Prefix-MD5"),
+    if_match_version: int | None = Header(default=None, alias="If-Match-Version"),
+    content_md5: str | None = Header(default=None, alias="Content-MD5"),
+):
+    """
+    Append a segment to an existing file within a namespace.
+
+    The request body is the segment. Used by clients syncing append-only
+    files (session history) so that only new bytes are uploaded.
+
+    Headers (required):
+    - X-Append-Offset: Size of the file the segment follows
+    - X-Prefix-MD5: MD5 of the file the segment follows
+
+    Headers (optional):
+    - If-Match-Version: Expected version number
+    - Content-MD5: MD5 hash of the segment for integrity validation
+
+    Returns 200 with the file's sync index entry, 412 if the file is not the
+    expected prefix (the client should fall back to a full write).
+    Returns ETag, X-Version and X-Segment (segment number) headers.
+    """
+    try:
+        segment = await request.body()
+
+        new_md5, version, segment_number, sync_index = get_storage().append_file(
+            namespace=namespace,
+            path=path,
+            segment=segment,
+            offset=append_offset,
+            prefix_md5=prefix_md5,
+            expected_version=if_match_version,
+            content_md5=content_md5,
+        )
+
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            headers={
+                "ETag": f'"{new_md5}"',
+                "X-Version": str(version),
+                "X-Segment": str(segment_number),
+            },
+            content=sync_index.model_dump(mode="json"),
+        )
+
+    except PreconditionFailedError as e:
+        logger.warning(f"Precondition failed for append {namespace}/{path}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=PreconditionFailedResponse(
+                detail=str(e),
+                context={
+                    "current_version": e.current_version,
+                    "provided_version": e.provided_version,
+                },
+            ).model_dump(),
+        )
+
+    except StorageError as e:
+        logger.error(f"Storage error appending to {namespace}/{path}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Storage error",
+        )
+
+
 @app.delete(
     "/{namespace:path}/blob/{path:path}",
     tags=["blob"],
@@ -254,18 +360,27 @@ async def delete_blob(
 
 
 @app.get("/sync/{namespace:path}", response_model=SyncIndexResponse, tags=["sync"])
-async def get_sync_index(namespace: str, user_info: Dict = Depends(verify_token)):
+async def get_sync_index(
+    namespace: str,
+    since: int | None = Query(
+        default=None, description="Only return entries changed after this index_version"
+    ),
+    user_info: Dict = Depends(verify_token),
+):
     """
     Get the sync index with metadata for all files within a namespace.
 
     Args:
         namespace: Persona/namespace identifier (can include slashes for hierarchy)
+        since: index_version from a previous response; only entries changed
+            after it are returned
 
     Returns a map of file paths to metadata (MD5, last modified, size, version, deleted flag).
-    Clients use this to determine which files need syncing.
+    Clients use this to determine which files need syncing. When ``since`` is
+    echoed back the map only holds changes; otherwise it is the full index.
     """
     try:
-        sync_index = get_storage().get_sync_index(namespace)
+        sync_index = get_storage().get_sync_index(namespace, since=since)
         return sync_index
 
     except StorageError as e:
@@ -276,6 +391,29 @@ async def get_sync_index(namespace: str, user_info: Dict = Depends(verify_token)
         )
 
 
+@app.get("/sync-tokens/{prefix:path}", response_model=SyncTokensResponse, tags=["sync"])
+async def get_sync_tokens(prefix: str, user_info: Dict = Depends(verify_token)):
+    """
+    Get a change token for every namespace under a prefix.
+
+    A namespace's token changes whenever its sync index changes, so clients
+    syncing many namespaces can skip the ones whose token they have already
+    seen without fetching their indexes.
+
+    Args:
+        prefix: Namespace prefix (e.g. "personas/default/history")
+    """
+    try:
+        return SyncTokensResponse(tokens=get_storage().list_sync_tokens(prefix))
+
+    except StorageError as e:
+        logger.error(f"Storage error listing sync tokens for {prefix}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Storage error",
+        )
+
+
 # Exception handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
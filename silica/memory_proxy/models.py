@@ -17,7 +17,11 @@ class FileMetadata(BaseModel):
 
 
 class SyncIndexResponse(BaseModel):
-    """Response model for GET /sync/{namespace} endpoint."""
+    """Response model for GET /sync/{namespace} endpoint.
+
+    Writes and deletes return the same model holding only the entry they
+    changed.
+    """
 
     files: Dict[str, FileMetadata] = Field(
         default_factory=dict, description="Map of file paths to metadata"
@@ -28,6 +32,25 @@ class SyncIndexResponse(BaseModel):
     index_version: int = Field(
         ..., description="Index version (milliseconds since epoch)"
     )
+    since: int | None = Field(
+        default=None,
+        description=(
+            "Set on change-feed responses: files only holds the entries changed "
+            "after this index_version. None means files is the full index."
+        ),
+    )
+
+
+class SyncTokensResponse(BaseModel):
+    """Response model for GET /sync-tokens/{prefix} endpoint."""
+
+    tokens: Dict[str, str] = Field(
+        default_factory=dict,
+        description=(
+            "Map of namespaces under the prefix to an opaque token that changes "
+            "whenever the namespace's sync index changes"
+        ),
+    )
 
 
 class HealthResponse(BaseModel):
@@ -1,5 +1,6 @@
 """S3 storage operations for Memory Proxy service."""
 
+import gzip
 import hashlib
 import json
 import logging
@@ -39,6 +40,8 @@ class S3Storage:
     """Handles all S3 operations for the Memory Proxy service."""
 
     SENTINEL_NEW_FILE = "new"
+    # Appended segments after which a gzip file is recompressed as one member
+    MAX_GZIP_SEGMENTS = 64
 
     def __init__(self, settings: Settings = None):
         """Initialize S3 client."""
@@ -125,6 +128,43 @@ class S3Storage:
             logger.error(f"Error reading file {namespace}/{path}: {e}")
             raise StorageError(f"Failed to read file: {e}")
 
+    def read_file_after(
+        self, namespace: str, path: str, offset: int, prefix_md5: str
+    ) -> Tuple[bytes, str, datetime, str, int, int]:
+        """
+        Read the part of a file after a prefix the caller already has.
+
+        If the first ``offset`` bytes of the stored file hash to
+        ``prefix_md5`` (the caller's copy is a prefix of it, e.g. an
+        append-only log synced earlier), only the remaining bytes are
+        returned. Otherwise the whole file is returned.
+
+        Args:
+            namespace: Namespace identifier
+            path: File path
+            offset: Length of the caller's copy
+            prefix_md5: MD5 of the caller's copy
+
+        Returns:
+            Tuple of (content, md5, last_modified, content_type, version,
+            content_offset). ``content_offset`` is where ``content`` starts
+            in the file: ``offset`` for a tail, 0 for the whole file. ``md5``
+            is always that of the whole file.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist or is tombstoned
+            StorageError: For other S3 errors
+        """
+        content, md5, last_modified, content_type, version = self.read_file(
+            namespace, path
+        )
+        if (
+            0 < offset <= len(content)
+            and self._calculate_md5(content[:offset]) == prefix_md5
+        ):
+            return content[offset:], md5, last_modified, content_type, version, offset
+        return content, md5, last_modified, content_type, version, 0
+
     def write_file(
         self,
         namespace: str,
@@ -150,7 +190,8 @@ class S3Storage:
 
         Returns:
             Tuple of (is_new, md5_hash, version, sync_index)
-            The sync_index contains the full manifest after the write.
+            The sync_index holds only the written file's entry; clients
+            fetch other changes through get_sync_index(since=...).
 
         Raises:
             PreconditionFailedError: If conditional write fails
@@ -231,32 +272,161 @@ class S3Storage:
             )
 
             # Update sync index
-            self._update_sync_index(
-                namespace,
-                path,
-                FileMetadata(
-                    md5=new_md5,
-                    last_modified=datetime.now(timezone.utc),
-                    size=len(content),
-                    version=version,
-                    is_deleted=False,
-                ),
+            metadata = FileMetadata(
+                md5=new_md5,
+                last_modified=datetime.now(timezone.utc),
+                size=len(content),
+                version=version,
+                is_deleted=False,
             )
+            index_version = self._update_sync_index(namespace, path, metadata)
 
             logger.info(
                 f"{'Created' if is_new else 'Updated'} file: {namespace}/{path} "
                 f"(md5={new_md5}, version={version})"
             )
 
-            # Get sync index after write
-            sync_index = self.get_sync_index(namespace)
-
+            sync_index = self._entry_response(path, metadata, index_version)
             return is_new, new_md5, version, sync_index
 
         except Exception as e:
             logger.error(f"Error writing file {namespace}/{path}: {e}")
             raise StorageError(f"Failed to write file: {e}")
 
+    def append_file(
+        self,
+        namespace: str,
+        path: str,
+        segment: bytes,
+        offset: int,
+        prefix_md5: str,
+        expected_version: int | None = None,
+        content_md5: str | None = None,
+    ) -> Tuple[str, int, int, "SyncIndexResponse"]:
+        """
+        Append a segment to an existing file.
+
+        The append only applies if the stored file is exactly the prefix the
+        client built the segment on: ``offset`` bytes hashing to
+        ``prefix_md5``. Segments are numbered from the last full write. The
+        file is assembled here, so readers always see one object; gzip files
+        (one gzip member per segment) are recompressed as a single member
+        once they have ``MAX_GZIP_SEGMENTS`` segments.
+
+        Args:
+            namespace: Namespace identifier
+            path: File path
+            segment: Bytes to append
+            offset: Size of the file the segment follows
+            prefix_md5: MD5 of the file the segment follows
+            expected_version: Optional expected version of the file
+            content_md5: Optional MD5 of ``segment`` for integrity validation
+
+        Returns:
+            Tuple of (md5_hash, version, segment_number, sync_index)
+            The sync_index holds only the file's new entry.
+
+        Raises:
+            PreconditionFailedError: If the file is missing, deleted, or not
+                the expected prefix
+            StorageError: For other S3 errors
+        """
+        key = self._make_key(namespace, path)
+        provided = str(expected_version if expected_version is not None else "")
+
+        if content_md5 is not None and content_md5 != self._calculate_md5(segment):
+            raise StorageError(
+                f"Content-MD5 mismatch: provided={content_md5}, "
+                f"calculated={self._calculate_md5(segment)}"
+            )
+
+        try:
+            response = self.s3.get_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchKey":
+                raise PreconditionFailedError(
+                    "File does not exist (cannot append)",
+                    current_version="none",
+                    provided_version=provided,
+                )
+            raise StorageError(f"Failed to read file for append: {e}")
+
+        metadata = response.get("Metadata", {})
+        current_version = int(metadata.get("version", "0"))
+        if metadata.get("is-deleted") == "true":
+            raise PreconditionFailedError(
+                "File is deleted (cannot append)",
+                current_version=str(current_version),
+                provided_version=provided,
+            )
+        if expected_version is not None and current_version != expected_version:
+            raise PreconditionFailedError(
+                f"Version mismatch: current={current_version}, expected={expected_version}",
+                current_version=str(current_version),
+                provided_version=provided,
+            )
+
+        content = response["Body"].read()
+        current_md5 = metadata.get("content-md5", self._calculate_md5(content))
+        if len(content) != offset or current_md5 != prefix_md5:
+            raise PreconditionFailedError(
+                f"Prefix mismatch: file has {len(content)} bytes (md5={current_md5}), "
+                f"segment follows {offset} bytes (md5={prefix_md5})",
+                current_version=str(current_version),
+                provided_version=provided,
+            )
+
+        content_type = response.get("ContentType", "application/octet-stream")
+        segment_number = int(metadata.get("segments", "0")) + 1
+        content += segment
+        if (
+            content_type == "application/gzip"
+            and segment_number >= self.MAX_GZIP_SEGMENTS
+        ):
+            try:
+                content = gzip.compress(
+                    gzip.decompress(content), compresslevel=6, mtime=0
+                )
+                segment_number = 0
+            except (OSError, EOFError):
+                # Not valid gzip; keep the segments as they are
+                pass
+
+        new_md5 = self._calculate_md5(content)
+        version = self._get_version()
+        try:
+            self.s3.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=content,
+                ContentType=content_type,
+                Metadata={
+                    "content-md5": new_md5,
+                    "version": str(version),
+                    "is-deleted": "false",
+                    "segments": str(segment_number),
+                },
+            )
+        except Exception as e:
+            logger.error(f"Error appending to file {namespace}/{path}: {e}")
+            raise StorageError(f"Failed to append to file: {e}")
+
+        file_metadata = FileMetadata(
+            md5=new_md5,
+            last_modified=datetime.now(timezone.utc),
+            size=len(content),
+            version=version,
+            is_deleted=False,
+        )
+        index_version = self._update_sync_index(namespace, path, file_metadata)
+
+        logger.info(
+            f"Appended {len(segment)} bytes to {namespace}/{path} "
+            f"(segment={segment_number}, md5={new_md5}, version={version})"
+        )
+        sync_index = self._entry_response(path, file_metadata, index_version)
+        return new_md5, version, segment_number, sync_index
+
     def delete_file(
         self, namespace: str, path: str, expected_version: int | None = None
     ) -> Tuple[int, "SyncIndexResponse"]:
@@ -270,7 +440,7 @@ class S3Storage:
 
         Returns:
             Tuple of (version, sync_index)
-            The sync_index contains the full manifest after the delete.
+            The sync_index holds only the deleted file's tombstone entry.
 
         Raises:
             FileNotFoundError: If file doesn't exist
@@ -307,25 +477,20 @@ class S3Storage:
             )
 
             # Update sync index
-            self._update_sync_index(
-                namespace,
-                path,
-                FileMetadata(
-                    md5=current_md5,
-                    last_modified=datetime.now(timezone.utc),
-                    size=0,
-                    version=version,
-                    is_deleted=True,
-                ),
+            metadata = FileMetadata(
+                md5=current_md5,
+                last_modified=datetime.now(timezone.utc),
+                size=0,
+                version=version,
+                is_deleted=True,
             )
+            index_version = self._update_sync_index(namespace, path, metadata)
 
             logger.info(
                 f"Deleted (tombstoned) file: {namespace}/{path} (version={version})"
             )
 
-            # Get sync index after delete
-            sync_index = self.get_sync_index(namespace)
-
+            sync_index = self._entry_response(path, metadata, index_version)
             return version, sync_index
 
         except ClientError as e:
@@ -334,20 +499,26 @@ class S3Storage:
             logger.error(f"Error deleting file {namespace}/{path}: {e}")
             raise StorageError(f"Failed to delete file: {e}")
 
-    def get_sync_index(self, namespace: str) -> SyncIndexResponse:
+    def get_sync_index(
+        self, namespace: str, since: int | None = None
+    ) -> SyncIndexResponse:
         """
-        Get the sync index with all file metadata for a namespace.
+        Get the sync index with file metadata for a namespace.
 
         Args:
             namespace: Namespace identifier
+            since: Optional index_version from an earlier response. Only
+                entries changed after it are returned. If the index is older
+                than ``since`` (e.g. the namespace was reset), the full index
+                is returned instead.
 
         Returns:
-            SyncIndexResponse with file metadata
+            SyncIndexResponse with file metadata; ``since`` is set on it when
+            it only holds changes
 
         Raises:
             StorageError: For S3 errors
         """
-        f"{namespace}/.sync-index.json"
         key = self._make_key(namespace, ".sync-index.json")
 
         try:
@@ -355,14 +526,27 @@ class S3Storage:
             content = response["Body"].read()
             data = json.loads(content)
 
+            index_version = data.get("index_version", 0)
+            entries = data.get("files", {})
+            if since is not None and since <= index_version:
+                # Entries written before change tracking fall back to the
+                # file version, which is never later than its index update
+                entries = {
+                    path: metadata
+                    for path, metadata in entries.items()
+                    if metadata.get("index_version", metadata.get("version", 0)) > since
+                }
+            else:
+                since = None
+
             # Convert to Pydantic models
             files = {
-                path: FileMetadata(**metadata)
-                for path, metadata in data.get("files", {}).items()
+                path: FileMetadata(**metadata) for path, metadata in entries.items()
             }
 
             logger.debug(
-                f"Retrieved sync index for namespace: {namespace} ({len(files)} files)"
+                f"Retrieved sync index for namespace: {namespace} ({len(files)} files"
+                f"{f' changed since {since}' if since is not None else ''})"
             )
             return SyncIndexResponse(
                 files=files,
@@ -371,7 +555,8 @@ class S3Storage:
                         "index_last_modified", datetime.now(timezone.utc).isoformat()
                     )
                 ),
-                index_version=data.get("index_version", 0),
+                index_version=index_version,
+                since=since,
             )
 
         except ClientError as e:
@@ -389,19 +574,62 @@ class S3Storage:
             logger.error(f"Error reading sync index for namespace {namespace}: {e}")
             raise StorageError(f"Failed to read sync index: {e}")
 
+    def list_sync_tokens(self, prefix: str) -> dict[str, str]:
+        """
+        List a change token for every namespace under a prefix.
+
+        Only lists objects, without reading any sync index, so a client can
+        find out which of many namespaces changed in a few requests. The
+        token is the ETag of the namespace's sync index.
+
+        Args:
+            prefix: Namespace prefix (e.g. ``personas/default/history``)
+
+        Returns:
+            Dictionary mapping namespaces to change tokens
+
+        Raises:
+            StorageError: For S3 errors
+        """
+        key_prefix = self._make_key(prefix, "")
+        base = f"{self.prefix}/" if self.prefix else ""
+        suffix = "/.sync-index.json"
+        tokens = {}
+        try:
+            paginator = self.s3.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=key_prefix):
+                for item in page.get("Contents", []):
+                    key = item["Key"]
+                    if key.endswith(suffix):
+                        namespace = key[len(base) : -len(suffix)]
+                        tokens[namespace] = item["ETag"].strip('"')
+        except ClientError as e:
+            logger.error(f"Error listing sync tokens under {prefix}: {e}")
+            raise StorageError(f"Failed to list sync tokens: {e}")
+
+        logger.debug(f"Listed {len(tokens)} sync tokens under {prefix}")
+        return tokens
+
     def _update_sync_index(
         self, namespace: str, path: str, metadata: FileMetadata
-    ) -> None:
+    ) -> int | None:
         """
         Update the sync index with new file metadata.
 
         Note: This uses last-write-wins for index updates. Race conditions are acceptable
         as the individual blobs have strong consistency.
 
+        Each entry records the index_version at which it was written, which
+        is what get_sync_index(since=...) filters on. Index versions strictly
+        increase even if the clock does not.
+
         Args:
             namespace: Namespace identifier
             path: File path
             metadata: File metadata to store
+
+        Returns:
+            The new index_version, or None if the index could not be updated
         """
         key = self._make_key(namespace, ".sync-index.json")
 
@@ -418,14 +646,15 @@ class S3Storage:
                     raise
 
             # Update entry
+            index_version = max(self._get_version(), data.get("index_version", 0) + 1)
             data["files"][path] = {
                 "md5": metadata.md5,
                 "last_modified": metadata.last_modified.isoformat(),
                 "size": metadata.size,
                 "version": metadata.version,
                 "is_deleted": metadata.is_deleted,
+                "index_version": index_version,
             }
-            index_version = self._get_version()
             data["index_last_modified"] = datetime.now(timezone.utc).isoformat()
             data["index_version"] = index_version
 
@@ -433,14 +662,27 @@ class S3Storage:
             self.s3.put_object(
                 Bucket=self.bucket,
                 Key=key,
-                Body=json.dumps(data, indent=2).encode("utf-8"),
+                Body=json.dumps(data, separators=(",", ":")).encode("utf-8"),
                 ContentType="application/json",
             )
 
             logger.debug(
                 f"Updated sync index for: {namespace}/{path} (version={metadata.version})"
             )
+            return index_version
 
         except Exception as e:
             # Log but don't fail the operation - index can be eventually consistent
             logger.error(f"Error updating sync index for {namespace}/{path}: {e}")
+            return None
+
+    @staticmethod
+    def _entry_response(
+        path: str, metadata: FileMetadata, index_version: int | None
+    ) -> SyncIndexResponse:
+        """Build the response for a write or delete: just the changed entry."""
+        return SyncIndexResponse(
+            files={path: metadata},
+            index_last_modified=metadata.last_modified,
+            index_version=index_version or metadata.version,
+        )
@@ -1,9 +1,16 @@
 """Status command for silica."""
 
+import json
+import queue
 import subprocess
+import threading
+import time
 import cyclopts
-from typing import Annotated, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Annotated, Callable, Optional
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 from pathlib import Path
 from typing import List, Dict, Any
@@ -21,9 +28,20 @@ from silica.remote.config.multi_workspace import is_local_workspace_for_cleanup
 
 console = Console()
 
+# Defaults for concurrent status collection
+DEFAULT_STATUS_WORKERS = 16
+DEFAULT_STATUS_DEADLINE = 20.0  # seconds for the whole fan-out
+
+# Last-known status of each workspace, relative to the .silica directory
+STATUS_CACHE_FILE = "status_cache.json"
+
 
 def get_workspace_status(
-    workspace_name: str, git_root: Path, silica_dir: Path
+    workspace_name: str,
+    git_root: Path,
+    silica_dir: Path,
+    session: Optional[requests.Session] = None,
+    timeout: Optional[float] = None,
 ) -> Dict[str, Any]:
     """Get status information for a workspace via HTTP API.
 
@@ -31,6 +49,8 @@ def get_workspace_status(
         workspace_name: Name of the workspace to check
         git_root: Git root path
         silica_dir: .silica directory path
+        session: Optional shared HTTP session for connection reuse
+        timeout: Optional budget in seconds shared by the workspace's requests
 
     Returns:
         Dictionary with status information
@@ -43,12 +63,16 @@ def get_workspace_status(
         "error": None,
     }
 
+    started = time.monotonic()
     try:
         # Check if workspace is local (for cleanup purposes - we still use HTTP)
         is_local = is_local_workspace_for_cleanup(silica_dir, workspace_name)
 
         # Get HTTP client for this workspace
-        client = get_antennae_client(silica_dir, workspace_name)
+        client_kwargs = {"session": session}
+        if timeout is not None:
+            client_kwargs["timeout"] = timeout
+        client = get_antennae_client(silica_dir, workspace_name, **client_kwargs)
 
         # Try to get status via HTTP
         success, response = client.get_status()
@@ -56,23 +80,219 @@ def get_workspace_status(
         if success:
             status["accessible"] = True
             status["status_info"] = response
+
+            # Also try to get connection info, with whatever is left of the
+            # budget. Skipped for unreachable workspaces, which would
+            # otherwise pay a second timeout.
+            remaining = None
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - started)
+            if remaining is None or remaining > 0:
+                if remaining is not None:
+                    client.timeout = remaining
+                conn_success, conn_response = client.get_connection_info()
+                if conn_success:
+                    status["connection_info"] = conn_response
         else:
             status["error"] = response.get("error", "Failed to get status")
 
-        # Also try to get connection info
-        conn_success, conn_response = client.get_connection_info()
-        if conn_success:
-            status["connection_info"] = conn_response
-
         # Mark as local if needed
         status["is_local"] = is_local
 
     except Exception as e:
         status["error"] = f"Unexpected error: {str(e)}"
 
+    # A failure once the budget is spent says nothing about the workspace
+    if (
+        not status["accessible"]
+        and timeout is not None
+        and time.monotonic() - started >= timeout
+    ):
+        status["timed_out"] = True
+
     return status
 
 
+def create_status_session(
+    max_workers: int = DEFAULT_STATUS_WORKERS,
+) -> requests.Session:
+    """Create an HTTP session sized for concurrent status requests.
+
+    Workspaces usually live on a handful of piku hosts, so a shared
+    session lets concurrent requests reuse pooled keep-alive connections
+    instead of opening a new one per request.
+
+    Args:
+        max_workers: Number of concurrent requests the pool should support
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def collect_workspace_statuses(
+    workspace_names: List[str],
+    git_root: Path,
+    silica_dir: Path,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    max_workers: int = DEFAULT_STATUS_WORKERS,
+    deadline: float = DEFAULT_STATUS_DEADLINE,
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch status for many workspaces concurrently.
+
+    Requests share one pooled HTTP session. Each workspace's requests get
+    only what is left of the global deadline, and workspaces that have not
+    answered when it expires are reported with a timeout error instead of
+    holding up the others. The checks run on daemon threads, so a request
+    stuck past the deadline cannot keep the CLI from exiting.
+
+    Args:
+        workspace_names: Workspaces to check
+        git_root: Git root path
+        silica_dir: .silica directory path
+        on_result: Called with each status as soon as it arrives
+        max_workers: Maximum number of workspaces checked at once
+        deadline: Seconds allowed for the whole collection
+
+    Returns:
+        Dictionary mapping workspace name to status dictionary
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    if not workspace_names:
+        return results
+
+    workers = max(1, min(max_workers, len(workspace_names)))
+    session = create_status_session(workers)
+    expires = time.monotonic() + deadline
+    pending: "queue.Queue[str]" = queue.Queue()
+    for name in workspace_names:
+        pending.put(name)
+    finished: "queue.Queue[tuple[str, Dict[str, Any]]]" = queue.Queue()
+
+    def check_workspaces():
+        while True:
+            remaining = expires - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                name = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                status = get_workspace_status(
+                    name, git_root, silica_dir, session=session, timeout=remaining
+                )
+            except Exception as e:
+                status = {
+                    "workspace": name,
+                    "accessible": False,
+                    "status_info": None,
+                    "connection_info": None,
+                    "error": f"Unexpected error: {str(e)}",
+                }
+            finished.put((name, status))
+
+    for _ in range(workers):
+        threading.Thread(target=check_workspaces, daemon=True).start()
+
+    while len(results) < len(workspace_names):
+        remaining = expires - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            name, status = finished.get(timeout=remaining)
+        except queue.Empty:
+            break
+        results[name] = status
+        if on_result:
+            on_result(status)
+
+    for name in workspace_names:
+        if name in results:
+            continue
+        status = {
+            "workspace": name,
+            "accessible": False,
+            "status_info": None,
+            "connection_info": None,
+            "error": f"Timed out after {deadline:g}s",
+            "timed_out": True,
+            "is_local": is_local_workspace_for_cleanup(silica_dir, name),
+        }
+        results[name] = status
+        if on_result:
+            on_result(status)
+
+    return results
+
+
+def load_status_cache(silica_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Load the last-known status of each workspace.
+
+    Args:
+        silica_dir: .silica directory path
+
+    Returns:
+        Dictionary mapping workspace name to its cached status. Each status
+        carries a "checked_at" timestamp. Empty if there is no cache.
+    """
+    cache_path = silica_dir / STATUS_CACHE_FILE
+    if not cache_path.exists():
+        return {}
+    try:
+        with open(cache_path) as f:
+            data = json.load(f)
+        return data.get("workspaces", {})
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return {}
+
+
+def save_status_cache(silica_dir: Path, statuses: Dict[str, Dict[str, Any]]) -> None:
+    """Merge the latest status of each workspace into the status cache.
+
+    Statuses that ran out of time are skipped so they do not replace the
+    last completed result for their workspace.
+
+    Args:
+        silica_dir: .silica directory path
+        statuses: Dictionary mapping workspace name to status dictionary
+    """
+    now = time.time()
+    workspaces = load_status_cache(silica_dir)
+    for name, status in statuses.items():
+        if status.get("timed_out"):
+            continue
+        entry = {k: v for k, v in status.items() if k != "cached"}
+        entry.setdefault("checked_at", now)
+        workspaces[name] = entry
+
+    cache_path = silica_dir / STATUS_CACHE_FILE
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump({"workspaces": workspaces}, f, default=str)
+        tmp_path.replace(cache_path)
+    except OSError:
+        # The cache is an optimization; failing to write it is not an error
+        pass
+
+
+def _format_age(seconds: float) -> str:
+    """Format an age in seconds as a short human-readable string."""
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}h"
+    return f"{int(seconds // 86400)}d"
+
+
 def get_workspace_status_legacy(workspace_name: str, git_root: Path) -> Dict[str, Any]:
     """Get status information for a single workspace.
 
@@ -290,14 +510,19 @@ def print_single_workspace_status(status: Dict[str, Any], detailed: bool = False
         console.print(f"\n[red]{status['error']}[/red]")
 
 
-def print_all_workspaces_summary(statuses: List[Dict[str, Any]]):
-    """Print a summary of all workspaces.
+def build_workspaces_summary_table(statuses: List[Dict[str, Any]]) -> Table:
+    """Build the summary table for all workspaces.
+
+    Statuses may be placeholders for workspaces that are still being
+    checked ("pending": True) or last-known values from the status cache
+    ("cached": True with a "checked_at" timestamp).
 
     Args:
         statuses: List of status dictionaries for all workspaces
-    """
-    console.print("[bold]Status Summary for All Workspaces[/bold]")
 
+    Returns:
+        Rich Table with one row per workspace
+    """
     table = Table(title="Workspace Status")
     table.add_column("Workspace", style="cyan")
     table.add_column("Type", style="magenta")
@@ -349,6 +574,13 @@ def print_all_workspaces_summary(statuses: List[Dict[str, Any]]):
         elif not status["accessible"]:
             overall_status = "[yellow]Offline[/yellow]"
 
+        if status.get("pending"):
+            accessible = "[dim]…[/dim]"
+            overall_status = "[dim]Checking…[/dim]"
+        elif status.get("cached"):
+            age = _format_age(time.time() - status.get("checked_at", time.time()))
+            overall_status = f"{overall_status} [dim]({age} ago)[/dim]"
+
         table.add_row(
             workspace_name,
             workspace_type,
@@ -360,7 +592,80 @@ def print_all_workspaces_summary(statuses: List[Dict[str, Any]]):
             overall_status,
         )
 
-    console.print(table)
+    return table
+
+
+def print_all_workspaces_summary(statuses: List[Dict[str, Any]]):
+    """Print a summary of all workspaces.
+
+    Args:
+        statuses: List of status dictionaries for all workspaces
+    """
+    console.print("[bold]Status Summary for All Workspaces[/bold]")
+    console.print(build_workspaces_summary_table(statuses))
+    console.print(
+        "\n[cyan]For detailed status, run: [bold]silica remote status -w <workspace>[/bold][/cyan]"
+    )
+
+
+def _show_summary(
+    workspaces_info: List[Dict[str, Any]],
+    git_root: Path,
+    silica_dir: Path,
+    jobs: int,
+    deadline: float,
+    cached_only: bool,
+) -> None:
+    """Render the all-workspaces summary, refreshing rows as results arrive.
+
+    Last-known statuses from the local cache are shown immediately; each
+    row is replaced as soon as its workspace answers (or the deadline
+    expires), and the cache is updated with the completed results.
+    """
+    names = [info["name"] for info in workspaces_info]
+    cache = load_status_cache(silica_dir)
+
+    rows: Dict[str, Dict[str, Any]] = {}
+    for info in workspaces_info:
+        name = info["name"]
+        if name in cache:
+            rows[name] = {**cache[name], "workspace": name, "cached": True}
+        else:
+            rows[name] = {
+                "workspace": name,
+                "accessible": False,
+                "status_info": None,
+                "error": None,
+                "is_local": info.get("config", {}).get("is_local", False),
+                "pending": True,
+            }
+
+    if cached_only:
+        print_all_workspaces_summary([rows[name] for name in names])
+        return
+
+    console.print("[bold]Status Summary for All Workspaces[/bold]")
+
+    def render() -> Table:
+        return build_workspaces_summary_table([rows[name] for name in names])
+
+    with Live(render(), console=console, refresh_per_second=8) as live:
+
+        def on_result(status: Dict[str, Any]) -> None:
+            rows[status["workspace"]] = status
+            live.update(render())
+
+        fresh = collect_workspace_statuses(
+            names,
+            git_root,
+            silica_dir,
+            on_result=on_result,
+            max_workers=jobs,
+            deadline=deadline,
+        )
+        live.update(render())
+
+    save_status_cache(silica_dir, fresh)
     console.print(
         "\n[cyan]For detailed status, run: [bold]silica remote status -w <workspace>[/bold][/cyan]"
     )
@@ -380,11 +685,33 @@ def status(
             name=["--all", "-a"], help="Show detailed status for all workspaces"
         ),
     ] = False,
+    cached: Annotated[
+        bool,
+        cyclopts.Parameter(
+            name=["--cached"],
+            help="Show last-known status from the local cache without contacting workspaces",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int,
+        cyclopts.Parameter(
+            name=["--jobs", "-j"], help="Maximum workspaces to check concurrently"
+        ),
+    ] = DEFAULT_STATUS_WORKERS,
+    deadline: Annotated[
+        float,
+        cyclopts.Parameter(
+            name=["--deadline"],
+            help="Seconds to wait for all workspaces before reporting stragglers as timed out",
+        ),
+    ] = DEFAULT_STATUS_DEADLINE,
 ):
     """Fetch and visualize agent status across workspaces.
 
     If a specific workspace is provided with -w, shows detailed status for that workspace.
-    Otherwise, shows a summary of all workspaces.
+    Otherwise, shows a summary of all workspaces. Workspaces are checked
+    concurrently and the summary starts from the last-known status of each
+    workspace, updating rows as fresh results arrive.
     """
     git_root = find_git_root()
     if not git_root:
@@ -410,15 +737,7 @@ def status(
             )
             return
 
-        # Get status for all workspaces
-        all_statuses = []
-        for workspace_info in workspaces_info:
-            workspace_name = workspace_info["name"]
-            status = get_workspace_status(workspace_name, git_root, silica_dir)
-            all_statuses.append(status)
-
-        # Print summary of all workspaces
-        print_all_workspaces_summary(all_statuses)
+        _show_summary(workspaces_info, git_root, silica_dir, jobs, deadline, cached)
 
     elif workspace is None and show_all:
         # Show detailed status for all workspaces
@@ -430,15 +749,26 @@ def status(
             )
             return
 
-        for i, workspace_info in enumerate(workspaces_info):
-            workspace_name = workspace_info["name"]
-            status = get_workspace_status(workspace_name, git_root, silica_dir)
+        printed = 0
 
+        def print_detail(status: Dict[str, Any]) -> None:
+            nonlocal printed
             # Add a separator between workspaces
-            if i > 0:
+            if printed > 0:
                 console.print("\n" + "=" * 80 + "\n")
-
             print_single_workspace_status(status, detailed=True)
+            printed += 1
+
+        # Print each workspace as soon as its status arrives
+        fresh = collect_workspace_statuses(
+            [info["name"] for info in workspaces_info],
+            git_root,
+            silica_dir,
+            on_result=print_detail,
+            max_workers=jobs,
+            deadline=deadline,
+        )
+        save_status_cache(silica_dir, fresh)
 
     else:
         # Show detailed status for a specific workspace
@@ -15,7 +15,10 @@ from silica.remote.config.multi_workspace import get_workspace_config
 
 
 def get_antennae_client(
-    silica_dir: Path, workspace_name: Optional[str] = None, timeout: float = 30.0
+    silica_dir: Path,
+    workspace_name: Optional[str] = None,
+    timeout: float = 30.0,
+    session: Optional[requests.Session] = None,
 ):
     """Get an HTTP client configured for a specific workspace.
 
@@ -23,11 +26,12 @@ def get_antennae_client(
         silica_dir: Path to the .silica directory
         workspace_name: Name of the workspace to get client for
         timeout: Default timeout for HTTP requests
+        session: Optional shared requests.Session for connection reuse
 
     Returns:
         AntennaeClient instance configured for the workspace
     """
-    return AntennaeClient(silica_dir, workspace_name, timeout)
+    return AntennaeClient(silica_dir, workspace_name, timeout, session=session)
 
 
 class AntennaeClient:
@@ -38,6 +42,7 @@ class AntennaeClient:
         silica_dir: Path,
         workspace_name: Optional[str] = None,
         timeout: float = 30.0,
+        session: Optional[requests.Session] = None,
     ):
         """Initialize client for a specific workspace.
 
@@ -45,10 +50,14 @@ class AntennaeClient:
             silica_dir: Path to the .silica directory
             workspace_name: Name of the workspace to communicate with
             timeout: Default timeout for HTTP requests
+            session: Optional shared requests.Session. When several clients
+                share one session (e.g. status fan-out across workspaces),
+                connections to the same piku host are pooled and reused.
         """
         self.silica_dir = silica_dir
         self.workspace_name = workspace_name
         self.timeout = timeout
+        self.session = session
 
         # Get workspace configuration
         self.workspace_config = get_workspace_config(silica_dir, workspace_name)
@@ -84,15 +93,16 @@ class AntennaeClient:
         """
         url = f"{self.base_url}/{endpoint}"
         request_timeout = timeout or self.timeout
+        http = self.session if self.session is not None else requests
 
         for attempt in range(retries + 1):
             try:
                 if method.upper() == "GET":
-                    response = requests.get(
+                    response = http.get(
                         url, headers=self.headers, timeout=request_timeout
                     )
                 elif method.upper() == "POST":
-                    response = requests.post(
+                    response = http.post(
                         url, headers=self.headers, json=data, timeout=request_timeout
                     )
                 else:
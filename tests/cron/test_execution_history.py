@@ -0,0 +1,206 @@
+"""Tests for execution history storage, pagination and retention."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from silica.cron.models import (
+    Base,
+    JobExecution,
+    JobExecutionOutput,
+    upgrade_schema,
+)
+from silica.cron.retention import archive_old_executions, read_archive
+
+
+def add_executions(db_session, job_id, count, start=None, **kwargs):
+    start = start or datetime(2024, 1, 1, 12, 0, 0)
+    executions = []
+    for i in range(count):
+        execution = JobExecution(
+            scheduled_job_id=job_id,
+            status="completed",
+            started_at=start + timedelta(minutes=i),
+            **kwargs,
+        )
+        db_session.add(execution)
+        executions.append(execution)
+    db_session.commit()
+    return executions
+
+
+class TestOutputStorage:
+    def test_output_stored_in_separate_table(self, db_session, sample_job):
+        execution = JobExecution(
+            scheduled_job_id=sample_job.id, status="completed", output="x" * 1000
+        )
+        db_session.add(execution)
+        db_session.commit()
+
+        blob = db_session.get(JobExecutionOutput, execution.id)
+        assert blob.output == "x" * 1000
+        assert execution.output_size == 1000
+        assert len(execution.output_preview) == 200
+
+    def test_clearing_output_removes_blob(self, db_session, sample_execution):
+        sample_execution.output = None
+        db_session.commit()
+
+        assert db_session.get(JobExecutionOutput, sample_execution.id) is None
+        assert sample_execution.output_preview is None
+
+
+class TestKeysetPagination:
+    def test_pages_cover_all_executions_in_order(self, client, db_session, sample_job):
+        add_executions(db_session, sample_job.id, 7)
+
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            url = f"/api/jobs/{sample_job.id}/executions?limit=3"
+            if cursor:
+                url += f"&before={cursor}"
+            response = client.get(url)
+            assert response.status_code == 200
+            seen.extend(e["started_at"] for e in response.json())
+            pages += 1
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert pages == 3
+        assert len(seen) == 7
+        assert seen == sorted(seen, reverse=True)
+
+    def test_same_second_ties_are_not_skipped(self, client, db_session, sample_job):
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        for i in range(5):
+            db_session.add(
+                JobExecution(
+                    scheduled_job_id=sample_job.id,
+                    status="completed",
+                    started_at=start,
+                    session_id=f"s{i}",
+                )
+            )
+        db_session.commit()
+
+        first = client.get(f"/api/jobs/{sample_job.id}/executions?limit=2")
+        cursor = first.headers["X-Next-Cursor"]
+        rest = client.get(
+            f"/api/jobs/{sample_job.id}/executions?limit=10&before={cursor}"
+        )
+
+        sessions = [e["session_id"] for e in first.json() + rest.json()]
+        assert sessions == ["s0", "s1", "s2", "s3", "s4"]
+
+    def test_recent_executions_without_output(self, client, db_session, sample_job):
+        add_executions(db_session, sample_job.id, 2, output="full output text")
+
+        response = client.get("/api/recent-executions?include_output=false")
+
+        data = response.json()
+        assert len(data) == 2
+        assert data[0]["output"] is None
+        assert data[0]["output_preview"] == "full output text"
+        assert data[0]["job_name"] == sample_job.name
+        assert data[0]["prompt_name"] == "Test Prompt"
+
+    def test_execution_detail_includes_output(self, client, sample_execution):
+        response = client.get(f"/api/jobs/executions/{sample_execution.id}")
+
+        assert response.status_code == 200
+        assert response.json()["output"] == "Test execution output"
+
+    def test_invalid_cursor(self, client, sample_job):
+        response = client.get(f"/api/jobs/{sample_job.id}/executions?before=bogus")
+        assert response.status_code == 400
+
+
+class TestRetention:
+    def test_archives_old_finished_executions(self, db_session, sample_job, tmp_path):
+        now = datetime(2024, 6, 1)
+        old = add_executions(
+            db_session, sample_job.id, 3, start=datetime(2024, 1, 1), output="old"
+        )
+        running = JobExecution(
+            scheduled_job_id=sample_job.id,
+            status="running",
+            started_at=datetime(2024, 1, 2),
+        )
+        db_session.add(running)
+        db_session.commit()
+        add_executions(db_session, sample_job.id, 2, start=datetime(2024, 5, 30))
+        old_ids = {e.id for e in old}
+
+        result = archive_old_executions(
+            db_session, retention_days=30, archive_dir=tmp_path, now=now, batch_size=2
+        )
+
+        assert result.archived == 3
+        assert result.files == [tmp_path / "executions-2024-01.jsonl.gz"]
+        records = list(read_archive(result.files[0]))
+        assert {r["id"] for r in records} == old_ids
+        assert all(r["output"] == "old" for r in records)
+        assert records[0]["job_name"] == sample_job.name
+
+        remaining = db_session.query(JobExecution).all()
+        assert len(remaining) == 3  # Running one plus the two recent ones
+        assert db_session.query(JobExecutionOutput).count() == 0
+
+    def test_archive_appends_across_sweeps(self, db_session, sample_job, tmp_path):
+        now = datetime(2024, 6, 1)
+        add_executions(db_session, sample_job.id, 1, start=datetime(2024, 1, 1))
+        archive_old_executions(db_session, 30, tmp_path, now=now)
+        add_executions(db_session, sample_job.id, 1, start=datetime(2024, 1, 5))
+        archive_old_executions(db_session, 30, tmp_path, now=now)
+
+        records = list(read_archive(tmp_path / "executions-2024-01.jsonl.gz"))
+        assert len(records) == 2
+
+    def test_disabled_when_zero(self, db_session, sample_job, tmp_path):
+        add_executions(db_session, sample_job.id, 1, start=datetime(2000, 1, 1))
+
+        result = archive_old_executions(db_session, 0, tmp_path)
+
+        assert result.archived == 0
+        assert db_session.query(JobExecution).count() == 1
+
+
+class TestUpgradeSchema:
+    def test_moves_legacy_output_column(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE job_executions ("
+                    "id VARCHAR(64) PRIMARY KEY, scheduled_job_id VARCHAR(64), "
+                    "session_id VARCHAR(36), started_at DATETIME, "
+                    "completed_at DATETIME, status VARCHAR(50), output TEXT, "
+                    "error_message TEXT)"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO job_executions (id, status, output) "
+                    "VALUES ('exec_1', 'completed', 'legacy output')"
+                )
+            )
+
+        Base.metadata.create_all(bind=engine)
+        upgrade_schema(engine)
+        upgrade_schema(engine)  # Idempotent
+
+        inspector = inspect(engine)
+        columns = {c["name"] for c in inspector.get_columns("job_executions")}
+        assert {"output_preview", "output_size"} <= columns
+        indexes = {i["name"] for i in inspector.get_indexes("job_executions")}
+        assert "ix_job_executions_job_started" in indexes
+
+        db = sessionmaker(bind=engine)()
+        execution = db.get(JobExecution, "exec_1")
+        assert execution.output == "legacy output"
+        assert execution.output_preview == "legacy output"
+        db.close()
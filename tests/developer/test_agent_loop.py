@@ -259,3 +259,26 @@ async def test_initial_prompt_without_single_response(
 
     def handle_system_message(self, message: str, markdown=True, live=None) -> None:
         pass
+
+
+async def test_resources_released_when_loop_raises(mock_environment, agent_context):
+    from unittest.mock import AsyncMock
+
+    mcp_manager = Mock(disconnect_all=AsyncMock())
+    with (
+        patch("silica.developer.agent_loop.MCP_AVAILABLE", True),
+        patch(
+            "silica.developer.agent_loop._initialize_mcp",
+            AsyncMock(return_value=(mcp_manager, True)),
+        ),
+        patch("silica.developer.agent_loop.RequestResponseLogger") as logger_class,
+        patch(
+            "silica.developer.agent_loop._run",
+            AsyncMock(side_effect=RuntimeError("API error")),
+        ),
+    ):
+        with pytest.raises(RuntimeError):
+            await run(agent_context=agent_context, initial_prompt="Hello")
+
+    mcp_manager.disconnect_all.assert_awaited_once()
+    logger_class.return_value.close.assert_called_once()
@@ -1,13 +1,20 @@
 """Tests for browser session management."""
 
+import asyncio
 import json
+import signal
+import threading
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 
 from silica.developer.tools.browser_session import (
     BrowserSession,
     BrowserSessionManager,
+    SharedBrowser,
     get_browser_session_manager,
+    get_shared_browser,
+    parse_blocked_resources,
 )
 from silica.developer.tools.browser_session_tools import (
     browser_session_create,
@@ -40,6 +47,7 @@ async def cleanup_sessions():
         except Exception:
             pass
     manager.sessions.clear()
+    await get_shared_browser().close()
 
 
 @pytest.fixture
@@ -53,6 +61,7 @@ async def mock_playwright():
     mock_page.locator = Mock()
     mock_page.title = AsyncMock(return_value="Test Page")
     mock_page.url = AsyncMock(return_value="http://localhost:8000")
+    mock_page.set_viewport_size = AsyncMock()
 
     mock_context = AsyncMock()
     mock_context.new_page = AsyncMock(return_value=mock_page)
@@ -61,10 +70,12 @@ async def mock_playwright():
     mock_browser = AsyncMock()
     mock_browser.new_context = AsyncMock(return_value=mock_context)
     mock_browser.close = AsyncMock()
+    mock_browser.is_connected = Mock(return_value=True)
 
     mock_playwright = AsyncMock()
     mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
     mock_playwright.stop = AsyncMock()
+    mock_playwright.start = AsyncMock(return_value=mock_playwright)
 
     return mock_playwright
 
@@ -125,6 +136,152 @@ class TestBrowserSession:
         assert info["actions_count"] == 1
 
 
+class TestSharedBrowser:
+    """Tests for the browser shared by all sessions."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_share_one_browser(self, mock_playwright):
+        manager = get_browser_session_manager()
+        manager.sessions.clear()
+
+        with patch(
+            "playwright.async_api.async_playwright",
+            return_value=mock_playwright,
+        ) as start:
+            await manager.create_session("one")
+            await manager.create_session("two")
+
+        assert start.call_count == 1
+        assert mock_playwright.chromium.launch.await_count == 1
+        assert manager.get_session("one").browser is manager.get_session("two").browser
+
+    @pytest.mark.asyncio
+    async def test_closing_session_keeps_browser(self, mock_playwright):
+        shared = SharedBrowser(pool_size=0)
+        session = BrowserSession("test")
+
+        with patch(
+            "playwright.async_api.async_playwright",
+            return_value=mock_playwright,
+        ):
+            await session.initialize(shared)
+            await session.close()
+
+        browser = await shared.get_browser()
+        session.context.close.assert_awaited()
+        browser.close.assert_not_awaited()
+        await shared.close()
+        browser.close.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_pooled_context_is_reused(self, mock_playwright):
+        shared = SharedBrowser(pool_size=1)
+
+        with patch(
+            "playwright.async_api.async_playwright",
+            return_value=mock_playwright,
+        ):
+            await shared.fill_pool()
+            browser = await shared.get_browser()
+            assert browser.new_context.await_count == 1
+
+            context, page = await shared.new_context({"width": 800, "height": 600})
+
+        # The pooled context was handed out and resized, not created anew
+        assert browser.new_context.await_count == 1
+        page.set_viewport_size.assert_awaited_with({"width": 800, "height": 600})
+        await shared.close()
+
+    @pytest.mark.asyncio
+    async def test_relaunches_disconnected_browser(self, mock_playwright):
+        shared = SharedBrowser(pool_size=0)
+
+        with patch(
+            "playwright.async_api.async_playwright",
+            return_value=mock_playwright,
+        ):
+            browser = await shared.get_browser()
+            browser.is_connected.return_value = False
+            await shared.get_browser()
+
+        assert mock_playwright.chromium.launch.await_count == 2
+        await shared.close()
+
+    def test_browser_from_closed_loop_is_terminated(self, mock_playwright):
+        shared = SharedBrowser(pool_size=0)
+        proc = mock_playwright._impl_obj._connection._transport._proc
+        proc.pid = 4321
+        proc.returncode = None
+
+        with patch(
+            "playwright.async_api.async_playwright",
+            return_value=mock_playwright,
+        ):
+            asyncio.run(shared.get_browser())
+            with patch("silica.developer.tools.browser_session.os.kill") as kill:
+                asyncio.run(shared.get_browser())
+
+        kill.assert_called_once_with(4321, signal.SIGTERM)
+        asyncio.run(shared.close())
+
+    @pytest.mark.asyncio
+    async def test_browser_from_running_loop_is_closed_there(self, mock_playwright):
+        shared = SharedBrowser(pool_size=0)
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+        try:
+            with patch(
+                "playwright.async_api.async_playwright",
+                return_value=mock_playwright,
+            ):
+                asyncio.run_coroutine_threadsafe(shared.get_browser(), other).result(5)
+                browser = shared.browser
+                await shared.get_browser()
+
+            for _ in range(100):
+                if mock_playwright.stop.await_count:
+                    break
+                await asyncio.sleep(0.01)
+            browser.close.assert_awaited_once()
+            mock_playwright.stop.assert_awaited_once()
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join(5)
+            other.close()
+        await shared.close()
+
+    @pytest.mark.asyncio
+    async def test_blocked_resources_are_routed(self, mock_playwright):
+        shared = SharedBrowser(pool_size=0)
+
+        with patch(
+            "playwright.async_api.async_playwright",
+            return_value=mock_playwright,
+        ):
+            context, _ = await shared.new_context(blocked_resources=("image",))
+
+        pattern, handler = context.route.await_args.args
+        assert pattern == "**/*"
+
+        image = AsyncMock()
+        image.request.resource_type = "image"
+        await handler(image)
+        image.abort.assert_awaited_once()
+
+        document = AsyncMock()
+        document.request.resource_type = "document"
+        await handler(document)
+        document.continue_.assert_awaited_once()
+        await shared.close()
+
+    def test_parse_blocked_resources(self):
+        assert parse_blocked_resources(None) == ()
+        assert parse_blocked_resources("image, Font,image") == ("image", "font")
+        with pytest.raises(ValueError, match="script"):
+            parse_blocked_resources("script")
+
+
 class TestBrowserSessionManager:
     """Tests for BrowserSessionManager class."""
 
@@ -255,6 +412,29 @@ class TestBrowserSessionManager:
         assert success is False
         assert "not found" in message
 
+    @pytest.mark.asyncio
+    async def test_idle_sessions_are_reaped(self, mock_playwright):
+        """Sessions idle past the timeout are closed on the next create."""
+        from datetime import datetime, timedelta
+
+        manager = BrowserSessionManager()
+        manager.sessions.clear()
+
+        stale = BrowserSession("stale")
+        stale.close = AsyncMock()
+        stale.last_activity = datetime.now() - manager.idle_timeout - timedelta(1)
+        manager.sessions["stale"] = stale
+
+        with patch(
+            "playwright.async_api.async_playwright",
+            return_value=mock_playwright,
+        ):
+            success, _ = await manager.create_session("fresh")
+
+        assert success
+        stale.close.assert_awaited_once()
+        assert list(manager.sessions) == ["fresh"]
+
     def test_get_session(self):
         """Test getting a session."""
         manager = BrowserSessionManager()
@@ -307,6 +487,16 @@ class TestBrowserSessionTools:
 
         assert "not available" in result
 
+    @pytest.mark.asyncio
+    async def test_browser_session_create_invalid_block_resources(self, mock_context):
+        """Unknown resource types are rejected before launching anything."""
+        result = await browser_session_create(
+            mock_context, session_name="test", block_resources="script"
+        )
+
+        assert result.startswith("Error:")
+        assert "test" not in get_browser_session_manager().sessions
+
     @pytest.mark.asyncio
     async def test_browser_session_navigate(self, mock_context, mock_playwright):
         """Test browser_session_navigate tool."""
@@ -0,0 +1,180 @@
+"""Tests for cross-turn prompt-cache breakpoint placement."""
+
+import copy
+
+from silica.developer.cache_planner import VOLATILE_TURNS, CachePlanner
+from silica.developer.context import AgentContext
+
+
+def marked(blocks):
+    return [i for i, block in enumerate(blocks) if "cache_control" in block]
+
+
+def marked_messages(messages):
+    return [
+        (m, b)
+        for m, message in enumerate(messages)
+        if isinstance(message["content"], list)
+        for b, block in enumerate(message["content"])
+        if "cache_control" in block
+    ]
+
+
+def count_breakpoints(system, tools, messages):
+    return len(marked(system)) + len(marked(tools)) + len(marked_messages(messages))
+
+
+TOOLS = [{"name": "a"}, {"name": "b", "cache_control": {"type": "ephemeral"}}]
+
+
+def system(sandbox="listing"):
+    return [
+        {"type": "text", "text": "persona"},
+        {"type": "text", "text": "guidance"},
+        {"type": "text", "text": sandbox},
+    ]
+
+
+def tool_turn(i):
+    return [
+        {
+            "role": "assistant",
+            "content": [{"type": "tool_use", "id": f"t{i}", "name": "a", "input": {}}],
+        },
+        {
+            "role": "user",
+            "content": [
+                {"type": "tool_result", "tool_use_id": f"t{i}", "content": "ok"}
+            ],
+        },
+    ]
+
+
+class TestCachePlanner:
+    def test_first_request(self):
+        planner = CachePlanner()
+        messages = [{"role": "user", "content": "hello"}]
+
+        request_system, request_tools = planner.apply(system(), TOOLS, messages)
+
+        assert marked(request_tools) == [1]
+        assert marked(request_system) == [2]
+        assert marked_messages(messages) == [(0, 0)]
+        assert planner.last_plan == ["tools", "system", "latest"]
+        # The shared tool schemas are not modified
+        assert "cache_control" in TOOLS[1] and "cache_control" not in TOOLS[0]
+
+    def test_checkpoint_is_previous_latest(self):
+        planner = CachePlanner()
+        history = [{"role": "user", "content": "hello"}]
+        planner.apply(system(), TOOLS, copy.deepcopy(history))
+
+        # A long tool loop adds many blocks before the next request
+        history.append({"role": "assistant", "content": "working"})
+        for i in range(15):
+            history.extend(tool_turn(i))
+        messages = copy.deepcopy(history)
+        request_system, request_tools = planner.apply(system(), TOOLS, messages)
+
+        assert marked_messages(messages) == [(0, 0), (len(messages) - 1, 0)]
+        assert planner.last_plan == ["tools", "system", "checkpoint", "latest"]
+        assert count_breakpoints(request_system, request_tools, messages) == 4
+
+    def test_no_checkpoint_after_prefix_changes(self):
+        planner = CachePlanner()
+        history = [
+            {"role": "user", "content": "hello"},
+            {"role": "assistant", "content": "hi"},
+            {"role": "user", "content": "next"},
+        ]
+        planner.apply(system(), TOOLS, copy.deepcopy(history))
+
+        # Compaction rewrites the start of the history
+        history[0] = {"role": "user", "content": "summary of earlier work"}
+        history.extend(
+            [
+                {"role": "assistant", "content": "ok"},
+                {"role": "user", "content": "more"},
+            ]
+        )
+        messages = copy.deepcopy(history)
+        planner.apply(system(), TOOLS, messages)
+
+        assert marked_messages(messages) == [(4, 0)]
+        assert "checkpoint" not in planner.last_plan
+
+    def test_string_and_list_content_share_prefix(self):
+        planner = CachePlanner()
+        first = [{"role": "user", "content": [{"type": "text", "text": "hello"}]}]
+        planner.apply(system(), TOOLS, first)
+
+        messages = [
+            {"role": "user", "content": "hello"},
+            {"role": "assistant", "content": "hi"},
+            {"role": "user", "content": "again"},
+        ]
+        planner.apply(system(), TOOLS, messages)
+
+        assert marked_messages(messages) == [(0, 0), (2, 0)]
+
+    def test_volatile_system_block_is_left_uncached(self):
+        planner = CachePlanner()
+        messages = [{"role": "user", "content": "hello"}]
+        planner.apply(system("listing 1"), TOOLS, copy.deepcopy(messages))
+
+        request_system, _ = planner.apply(
+            system("listing 2"), TOOLS, copy.deepcopy(messages)
+        )
+        assert marked(request_system) == [1]
+
+        # Once the block stops changing it is cached again
+        for _ in range(VOLATILE_TURNS):
+            request_system, _ = planner.apply(
+                system("listing 2"), TOOLS, copy.deepcopy(messages)
+            )
+        assert marked(request_system) == [2]
+
+    def test_thinking_blocks_are_not_marked(self):
+        planner = CachePlanner()
+        messages = [
+            {"role": "user", "content": "hello"},
+            {
+                "role": "assistant",
+                "content": [
+                    {"type": "text", "text": "answer"},
+                    {"type": "thinking", "thinking": "...", "signature": "s"},
+                ],
+            },
+        ]
+        planner.apply(system(), TOOLS, messages)
+
+        assert marked_messages(messages) == [(1, 0)]
+
+
+def test_usage_summary_reports_cache_savings(persona_base_dir):
+    from unittest.mock import MagicMock
+
+    from silica.developer.models import get_model
+    from silica.developer.sandbox import SandboxMode
+
+    context = AgentContext.create(
+        model_spec=get_model("sonnet"),
+        sandbox_mode=SandboxMode.ALLOW_ALL,
+        sandbox_contents=[],
+        user_interface=MagicMock(),
+        persona_base_directory=persona_base_dir,
+    )
+    context.report_usage(
+        {
+            "input_tokens": 100,
+            "output_tokens": 10,
+            "cache_read_input_tokens": 1000,
+            "cache_creation_input_tokens": 100,
+        }
+    )
+
+    summary = context.usage_summary()
+
+    assert summary["cache_write_tokens"] == 100
+    # 1000 reads at 10% of the input price, 100 writes at 125%
+    assert summary["cache_saved_tokens"] == 875
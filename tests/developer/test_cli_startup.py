@@ -0,0 +1,121 @@
+"""Tests for lazy subcommand registration in the silica entry point."""
+
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from silica import cli
+from silica.developer.hdev import attach_tools
+
+# Cumulative import time budgets (seconds) for dispatching common entry
+# points. Generous enough for slow CI machines while still catching the
+# agent, cron app or Toolbox being pulled in eagerly (~3s before).
+IMPORT_BUDGETS = {
+    ("--version",): 1.0,
+    ("remote", "status"): 1.5,
+    ("cron", "status"): 1.5,
+}
+
+HEAVY_MODULES = {
+    "silica.developer.hdev",
+    "silica.developer.toolbox",
+    "silica.cron.app",
+    "anthropic",
+}
+
+
+def import_profile(argv):
+    """Return ({module: cumulative_us}, total_seconds) for building the app."""
+    code = f"import silica.cli as c; c.build_app({list(argv)!r})"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+
+    modules = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        modules[name.strip()] = int(cumulative)
+        if not name.startswith("  "):  # Top-level import
+            total_us += int(cumulative)
+    return modules, total_us / 1_000_000
+
+
+@pytest.mark.parametrize("argv", list(IMPORT_BUDGETS))
+def test_import_budget(argv):
+    modules, total = import_profile(argv)
+
+    assert not HEAVY_MODULES & modules.keys()
+    assert total < IMPORT_BUDGETS[argv], f"{argv}: imports took {total:.2f}s"
+
+
+def test_subcommand_registered_on_dispatch():
+    app = cli.build_app(["remote", "status"])
+
+    assert "remote" in app
+    assert "cron" not in app
+
+
+class TestToolCommandCache:
+    def test_roundtrip(self, tmp_path):
+        path = tmp_path / "cli_tool_commands.json"
+        cli.save_tool_commands(["help", "list"], cache_path=path)
+
+        assert cli.load_tool_commands(cache_path=path) == ["help", "list"]
+
+    def test_stale_key_ignored(self, tmp_path):
+        path = tmp_path / "cli_tool_commands.json"
+        cli.save_tool_commands(["help"], cache_path=path)
+
+        with patch.object(cli, "__version__", "0.0.0-other"):
+            assert cli.load_tool_commands(cache_path=path) is None
+
+    def test_changed_google_auth_tools_invalidate(self, tmp_path):
+        path = tmp_path / "cli_tool_commands.json"
+        cli.save_tool_commands(["help"], cache_path=path)
+
+        with patch.object(
+            cli, "_google_auth_cli_tool_names", return_value=["gmail-auth"]
+        ):
+            assert cli.load_tool_commands(cache_path=path) is None
+
+    def test_missing_or_corrupt(self, tmp_path):
+        path = tmp_path / "cli_tool_commands.json"
+        assert cli.load_tool_commands(cache_path=path) is None
+        path.write_text("{oops")
+        assert cli.load_tool_commands(cache_path=path) is None
+
+
+class TestAttachToolsLazily:
+    def test_known_commands_skip_toolbox(self):
+        app = MagicMock()
+        toolbox = MagicMock()
+
+        async def invoke(*args, **kwargs):
+            return "", False
+
+        toolbox.invoke_cli_tool.side_effect = invoke
+
+        with patch(
+            "silica.developer.hdev._build_cli_toolbox", return_value=toolbox
+        ) as build:
+            registered = attach_tools(app, commands=["help", "list"])
+            assert registered == ["help", "list"]
+            build.assert_not_called()
+
+            command = app.command.call_args_list[0].args[0]
+            command("arg")
+            command("arg")
+
+        build.assert_called_once()
+        assert toolbox.invoke_cli_tool.call_args.args[0] == "help"
@@ -375,7 +375,7 @@ class TestEmergencyCompactionInAgentLoop(unittest.TestCase):
         import inspect
         from silica.developer import agent_loop
 
-        source = inspect.getsource(agent_loop.run)
+        source = inspect.getsource(agent_loop._run)
 
         # The compaction check should appear after "handle_assistant_message"
         # and before the tool_use check, for non-tool-use responses
@@ -411,7 +411,7 @@ class TestEmergencyCompactionInAgentLoop(unittest.TestCase):
         import inspect
         from silica.developer import agent_loop
 
-        source = inspect.getsource(agent_loop.run)
+        source = inspect.getsource(agent_loop._run)
 
         # Find the "prompt is too long" error handler
         error_handler_idx = source.find('"prompt is too long"')
@@ -0,0 +1,243 @@
+"""Tests for the per-message token sizes used to plan compaction."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from silica.developer.compacter import ConversationCompacter
+from silica.developer.compaction_planner import (
+    CompactionPlanner,
+    estimate_message_tokens,
+    prompt_tokens,
+)
+from silica.developer.context import AgentContext, load_session_data
+from silica.developer.memory import MemoryManager
+from silica.developer.sandbox import Sandbox, SandboxMode
+from silica.developer.session_store import SessionStore
+from tests.developer.conftest import MockAnthropicClient, MockUserInterface
+
+MODEL_SPEC = {
+    "title": "claude-opus-4-6",
+    "pricing": {"input": 3.00, "output": 15.00},
+    "cache_pricing": {"write": 3.75, "read": 0.30},
+    "max_tokens": 8192,
+    "context_window": 200000,
+}
+
+
+def usage(tokens, cached=0):
+    return {
+        "input_tokens": tokens - cached,
+        "output_tokens": 10,
+        "cache_creation_input_tokens": 0,
+        "cache_read_input_tokens": cached,
+    }
+
+
+def conversation(turns, text="word " * 70):
+    """user/assistant pairs ending with a user message."""
+    messages = []
+    for n in range(turns):
+        messages.append({"role": "user", "content": f"{n} {text}"})
+        messages.append({"role": "assistant", "content": f"{n} {text}"})
+    messages.append({"role": "user", "content": "last"})
+    return messages
+
+
+@pytest.fixture
+def test_dir():
+    d = tempfile.mkdtemp()
+    yield d
+    shutil.rmtree(d)
+
+
+def make_context(test_dir, messages, session_id="planner-test"):
+    context = AgentContext(
+        parent_session_id=None,
+        session_id=session_id,
+        model_spec=MODEL_SPEC,
+        sandbox=Sandbox(test_dir, mode=SandboxMode.ALLOW_ALL),
+        user_interface=MockUserInterface(),
+        usage=[],
+        memory_manager=MemoryManager(),
+        history_base_dir=Path(test_dir) / ".silica" / "personas" / "default",
+    )
+    context._chat_history = messages
+    return context
+
+
+class TestCompactionPlanner:
+    def test_prompt_tokens_include_cached_prefix(self):
+        assert prompt_tokens(usage(1000, cached=900)) == 1000
+        assert prompt_tokens({}) == 0
+
+    def test_unanchored_planner_uses_estimates(self):
+        messages = conversation(2)
+        planner = CompactionPlanner()
+        planner.sync(messages)
+
+        assert not planner.anchored
+        assert planner.total_tokens() is None
+        assert planner.message_tokens == sum(
+            estimate_message_tokens(m) for m in messages
+        )
+
+    def test_anchors_rescale_messages_between_requests(self):
+        messages = conversation(3)
+        planner = CompactionPlanner()
+        planner.record_usage(usage(1000), messages[:1])
+        planner.record_usage(usage(5000), messages[:3])
+        planner.sync(messages)
+
+        # The two messages added between the requests account for the delta
+        assert planner.prefix[3] - planner.prefix[1] == 4000
+        assert planner.total_tokens() == 5000 + sum(
+            estimate_message_tokens(m) for m in messages[3:]
+        )
+
+    def test_new_messages_extend_prefix_without_rescaling(self):
+        messages = conversation(1)
+        planner = CompactionPlanner()
+        planner.record_usage(usage(2000), messages)
+        extra = {"role": "assistant", "content": "ok"}
+
+        planner.sync(messages + [extra])
+
+        assert planner.total_tokens() == 2000 + estimate_message_tokens(extra)
+
+    def test_split_points_skip_pending_tool_use(self):
+        messages = [
+            {"role": "user", "content": "go"},
+            {
+                "role": "assistant",
+                "content": [{"type": "tool_use", "id": "t1", "name": "x", "input": {}}],
+            },
+            {
+                "role": "user",
+                "content": [
+                    {"type": "tool_result", "tool_use_id": "t1", "content": "r"}
+                ],
+            },
+            {
+                "role": "assistant",
+                "content": [{"type": "tool_use", "id": "t2", "name": "x", "input": {}}],
+            },
+            # Missing result keeps t2 pending
+            {"role": "user", "content": "interrupted"},
+            {"role": "assistant", "content": "done"},
+            {"role": "user", "content": "next"},
+        ]
+        planner = CompactionPlanner()
+        planner.sync(messages)
+
+        assert planner.split_points == [1, 3]
+
+    def test_find_split_returns_smallest_covering_split(self):
+        messages = conversation(5)
+        planner = CompactionPlanner()
+        planner.sync(messages)
+        prefix = planner.prefix
+
+        assert planner.find_split(1) == 1
+        assert planner.find_split(prefix[1] + 1) == 3
+        assert planner.find_split(prefix[5]) == 5
+        assert planner.find_split(prefix[-1] + 1) is None
+
+    def test_rewritten_history_drops_anchors(self):
+        messages = conversation(2)
+        planner = CompactionPlanner()
+        planner.record_usage(usage(3000), messages)
+
+        compacted = [{"role": "user", "content": "summary"}] + messages[3:]
+        planner.sync(compacted)
+
+        assert not planner.anchored
+        assert planner.message_tokens == sum(
+            estimate_message_tokens(m) for m in compacted
+        )
+
+    def test_from_metadata_uses_last_increasing_run(self):
+        messages = conversation(2)
+        entries = [
+            {"usage": usage(90000), "context_messages": 40},
+            {"usage": usage(1000), "context_messages": 1},
+            {"usage": usage(3000), "context_messages": 3},
+            {"usage": usage(50)},
+        ]
+
+        planner = CompactionPlanner.from_metadata(entries, messages)
+
+        assert planner.prefix[3] - planner.prefix[1] == 2000
+        assert planner.total_tokens() == 3000 + sum(
+            estimate_message_tokens(m) for m in messages[3:]
+        )
+
+
+class TestCompacterUsesPlanner:
+    def test_should_compact_skips_token_count_api_when_anchored(self, test_dir):
+        client = MockAnthropicClient(token_count=10)
+        compacter = ConversationCompacter(client=client)
+        messages = conversation(2)
+        context = make_context(test_dir, messages)
+        context.compaction_planner = CompactionPlanner()
+        context.compaction_planner.record_usage(usage(190000), messages[:-1])
+
+        assert compacter.should_compact(context, "claude-opus-4-6")
+        assert not client.count_tokens_called
+
+    def test_should_compact_falls_back_to_count_tokens(self, test_dir):
+        client = MockAnthropicClient(token_count=10)
+        compacter = ConversationCompacter(client=client)
+        context = make_context(test_dir, conversation(2))
+
+        assert not compacter.should_compact(context, "claude-opus-4-6")
+        assert client.count_tokens_called
+
+    def test_turns_follow_recorded_sizes(self, test_dir):
+        compacter = ConversationCompacter(client=MockAnthropicClient())
+        messages = conversation(4)
+        context = make_context(test_dir, messages)
+        planner = CompactionPlanner()
+        # The first exchange is large; everything after it is small
+        planner.record_usage(usage(1000), messages[:1])
+        planner.record_usage(usage(60000), messages[:3])
+        planner.record_usage(usage(61000), messages[:5])
+        context.compaction_planner = planner
+
+        turns = compacter.calculate_turns_for_target_reduction(
+            context, "claude-opus-4-6", target_reduction_ratio=0.5
+        )
+
+        assert turns == 2
+
+
+class TestMetadataSeedsPlanner:
+    def test_resumed_session_is_anchored(self, test_dir):
+        messages = conversation(1)
+        context = make_context(test_dir, messages[:2])
+        context.usage.append((usage(1200), MODEL_SPEC))
+        context.flush(context.chat_history, compact=False)
+        context.chat_history.append(messages[2])
+        context.flush(context.chat_history, compact=False)
+
+        store = SessionStore(
+            Path(test_dir)
+            / ".silica"
+            / "personas"
+            / "default"
+            / "history"
+            / "planner-test"
+        )
+        assert store.read_metadata()[0]["context_messages"] == 1
+
+        loaded = load_session_data(
+            "planner-test",
+            make_context(test_dir, []),
+            history_base_dir=Path(test_dir) / ".silica" / "personas" / "default",
+        )
+
+        assert loaded.compaction_planner.total_tokens() == 1200 + sum(
+            estimate_message_tokens(m) for m in loaded.chat_history[1:]
+        )
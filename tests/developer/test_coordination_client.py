@@ -413,3 +413,80 @@ class TestPolling:
         # Third poll should be empty
         messages3 = worker_ctx.poll(include_room=False)
         assert len(messages3) == 0
+
+
+class TestWaitForMessages:
+    """Test the multiplexed receive path and local change detection."""
+
+    @pytest.fixture
+    def contexts(self, deaddrop, coordination_setup):
+        setup = coordination_setup
+
+        def make(identity):
+            return CoordinationContext(
+                deaddrop=deaddrop,
+                namespace_id=setup["namespace"]["ns"],
+                namespace_secret=setup["namespace"]["secret"],
+                identity_id=setup[identity]["id"],
+                identity_secret=setup[identity]["secret"],
+                room_id=setup["room"]["room_id"],
+            )
+
+        return make("coordinator"), make("worker")
+
+    def test_idle_wait_only_checks_for_changes(self, contexts):
+        coordinator_ctx, _ = contexts
+
+        assert coordinator_ctx.wait_for_messages(timeout=0.3) == []
+
+        metrics = coordinator_ctx.metrics
+        # One inbox and one room fetch up front, then only change checks
+        assert metrics.requests == 2
+        assert metrics.change_checks > 1
+        assert metrics.wakes == 0
+
+    def test_wakes_on_new_message(self, contexts):
+        import threading
+
+        coordinator_ctx, worker_ctx = contexts
+        threading.Timer(
+            0.1, lambda: worker_ctx.broadcast(Progress(task_id="t", message="hi"))
+        ).start()
+
+        messages = coordinator_ctx.wait_for_messages(timeout=5)
+
+        assert [m.message.message for m in messages] == ["hi"]
+        assert messages[0].is_room_message
+        assert coordinator_ctx.metrics.wakes == 1
+        assert coordinator_ctx.metrics.last_wake_latency is not None
+
+    def test_falls_back_to_polling_without_connection(self, contexts):
+        from unittest.mock import patch
+
+        coordinator_ctx, worker_ctx = contexts
+        worker_ctx.send_message(
+            coordinator_ctx.identity_id, TaskAssign(task_id="t", description="d")
+        )
+
+        with patch.object(coordinator_ctx, "_local_change_token", return_value=None):
+            messages = coordinator_ctx.wait_for_messages(timeout=1)
+
+        assert len(messages) == 1
+        assert not messages[0].is_room_message
+
+    def test_close_releases_fetch_thread(self, contexts):
+        from unittest.mock import patch
+
+        coordinator_ctx, _ = contexts
+        with patch.object(coordinator_ctx, "_is_local_backend", return_value=False):
+            coordinator_ctx.receive_messages()
+            executor = coordinator_ctx._fetch_executor
+            assert executor is not None
+
+            coordinator_ctx.close()
+            assert coordinator_ctx._fetch_executor is None
+            assert executor._shutdown
+
+            # Still usable after closing
+            assert coordinator_ctx.receive_messages() == []
+            coordinator_ctx.close()
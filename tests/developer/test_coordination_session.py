@@ -11,8 +11,10 @@ from silica.developer.coordination.session import (
     HumanParticipant,
     SessionState,
     CoordinationSession,
+    get_journal_file,
     get_session_file,
     list_sessions,
+    load_session_data,
     delete_session,
 )
 
@@ -388,6 +390,80 @@ class TestStatePersistence:
         assert reloaded2.state.agents["a1"].state == AgentState.WORKING
         assert reloaded2.state.agents["a1"].current_task_id == "task-1"
 
+    def test_changes_are_journaled_not_snapshotted(self, deaddrop, temp_sessions_dir):
+        session = CoordinationSession.create_session(deaddrop)
+        session_file = get_session_file(session.session_id)
+        snapshot = session_file.read_text()
+
+        session.register_agent("a1", "id1", "W1", "ws1")
+        session.update_agent_state("a1", AgentState.IDLE)
+
+        assert session_file.read_text() == snapshot
+        journal = get_journal_file(session_file).read_text().splitlines()
+        assert len(journal) == 2
+
+        session.save_state()
+        assert not get_journal_file(session_file).exists()
+        assert "a1" in load_session_data(session_file)["agents"]
+
+    def test_last_seen_updates_are_coalesced(self, deaddrop, temp_sessions_dir):
+        session = CoordinationSession.create_session(deaddrop)
+        session.register_agent("a1", "id1", "W1", "ws1")
+        journal_file = get_journal_file(get_session_file(session.session_id))
+        lines = len(journal_file.read_text().splitlines())
+
+        for _ in range(20):
+            session.update_agent_last_seen("a1")
+        assert len(journal_file.read_text().splitlines()) == lines
+
+        session.flush()
+        assert len(journal_file.read_text().splitlines()) == lines + 1
+        reloaded = CoordinationSession.resume_session(
+            deaddrop, session_id=session.session_id, sync_from_room=False
+        )
+        assert reloaded.state.agents["a1"].last_seen == (
+            session.state.agents["a1"].last_seen
+        )
+
+    def test_batch_defers_writes(self, deaddrop, temp_sessions_dir):
+        session = CoordinationSession.create_session(deaddrop)
+        journal_file = get_journal_file(get_session_file(session.session_id))
+
+        with session.batch():
+            session.register_agent("a1", "id1", "W1", "ws1")
+            session.register_agent("a2", "id2", "W2", "ws2")
+            session.remove_agent("a1")
+            assert not journal_file.exists()
+
+        records = journal_file.read_text().splitlines()
+        assert len(records) == 2
+        data = load_session_data(get_session_file(session.session_id))
+        assert list(data["agents"]) == ["a2"]
+
+    def test_journal_folded_into_snapshot(self, deaddrop, temp_sessions_dir):
+        session = CoordinationSession.create_session(deaddrop)
+        session_file = get_session_file(session.session_id)
+
+        with patch("silica.developer.coordination.session.SNAPSHOT_EVERY", 3):
+            for i in range(3):
+                session.register_agent(f"a{i}", f"id{i}", "W", "ws")
+
+        assert not get_journal_file(session_file).exists()
+        assert len(load_session_data(session_file)["agents"]) == 3
+
+    def test_torn_journal_line_is_ignored(self, deaddrop, temp_sessions_dir):
+        session = CoordinationSession.create_session(deaddrop)
+        session.register_agent("a1", "id1", "W1", "ws1")
+        session_file = get_session_file(session.session_id)
+        with open(get_journal_file(session_file), "a") as f:
+            f.write('{"kind": "agents", "key": "a2", "val')
+
+        sessions = list_sessions()
+        assert sessions[0]["agent_count"] == 1
+
+        assert delete_session(session.session_id)
+        assert not get_journal_file(session_file).exists()
+
 
 class TestSessionResumption:
     """Test session resumption and state sync from room history."""
@@ -540,6 +616,87 @@ class TestSessionResumption:
         assert pending.action == "shell"
 
 
+class TestIncrementalRoomSync:
+    """Test cursor-based sync from room history."""
+
+    @pytest.fixture
+    def room(self, deaddrop, temp_sessions_dir):
+        from silica.developer.coordination.client import CoordinationContext
+
+        session = CoordinationSession.create_session(deaddrop, "Test")
+        identity = deaddrop.create_identity(
+            ns=session.namespace_id,
+            display_name="Worker",
+            ns_secret=session.namespace_secret,
+        )
+        session.register_agent("agent-1", identity["id"], "Worker 1", "ws-1")
+        session.add_agent_to_room("agent-1")
+        worker = CoordinationContext(
+            deaddrop=deaddrop,
+            namespace_id=session.namespace_id,
+            namespace_secret=session.namespace_secret,
+            identity_id=identity["id"],
+            identity_secret=identity["secret"],
+            room_id=session.state.room_id,
+        )
+        return session, worker
+
+    def test_only_new_messages_are_replayed(self, deaddrop, room):
+        from silica.developer.coordination import Idle, Progress
+
+        session, worker = room
+        for i in range(5):
+            worker.broadcast(Progress(task_id="t", message=f"step {i}"))
+
+        with patch("silica.developer.coordination.session.ROOM_SYNC_PAGE_SIZE", 2):
+            results = session.sync_agent_states()
+        assert results["messages_processed"] == 5
+        assert session.state.room_cursor is not None
+        assert session.get_agent("agent-1").state == AgentState.WORKING
+
+        worker.broadcast(Idle(agent_id="agent-1"))
+        resumed = CoordinationSession.resume_session(deaddrop, session.session_id)
+        assert resumed.get_agent("agent-1").state == AgentState.IDLE
+        assert resumed.state.room_agent_states[worker.identity_id]["state"] == "idle"
+
+        assert resumed.sync_agent_states()["messages_processed"] == 0
+
+    def test_new_messages_do_not_reapply_old_states(self, deaddrop, room):
+        from silica.developer.coordination import Progress
+
+        session, worker = room
+        worker.broadcast(Progress(task_id="t", message="working"))
+        session.sync_agent_states()
+
+        # A state set by the coordinator since then is kept
+        session.update_agent_state("agent-1", AgentState.IDLE)
+        assert session.sync_agent_states()["agents_updated"] == 0
+        assert session.get_agent("agent-1").state == AgentState.IDLE
+
+        results = session.sync_agent_states(full_rebuild=True)
+        assert results["messages_processed"] == 1
+        assert session.get_agent("agent-1").state == AgentState.WORKING
+
+    def test_rejected_cursor_falls_back_to_full_rebuild(self, deaddrop, room):
+        from silica.developer.coordination import Progress
+
+        session, worker = room
+        worker.broadcast(Progress(task_id="t", message="working"))
+        session.state.room_cursor = "unknown"
+        get_room_messages = deaddrop.get_room_messages
+
+        def reject_cursor(**kwargs):
+            if kwargs.get("after_mid") == "unknown":
+                raise ValueError("unknown cursor")
+            return get_room_messages(**kwargs)
+
+        with patch.object(deaddrop, "get_room_messages", side_effect=reject_cursor):
+            results = session.sync_agent_states()
+
+        assert results["messages_processed"] == 1
+        assert session.get_agent("agent-1").state == AgentState.WORKING
+
+
 class TestPermissionQueue:
     """Test permission queue management."""
 
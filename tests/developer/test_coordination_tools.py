@@ -370,6 +370,133 @@ class TestSpawnAgent:
         assert len(agents) == 2
 
 
+class TestWarmWorkerPool:
+    """Test spawn_agent binding pre-launched workers from the pool."""
+
+    @pytest.fixture
+    def pool(self, session, deaddrop, tmp_path):
+        from silica.developer.coordination.worker_pool import WarmWorker, WorkerPool
+
+        def launch(cwd):
+            identity = deaddrop.create_identity(
+                ns=session.namespace_id,
+                display_name="Pooled",
+                ns_secret=session.namespace_secret,
+            )
+            deaddrop.add_room_member(
+                ns=session.namespace_id,
+                room_id=session.state.room_id,
+                identity_id=identity["id"],
+                secret=session.state.coordinator_secret,
+            )
+            worker = WarmWorker(
+                agent_id=f"agent-{identity['id'][:8]}",
+                identity_id=identity["id"],
+                tmux_session=f"worker-{identity['id'][:8]}",
+                cwd=cwd,
+            )
+            worker.secret = identity["secret"]
+            return worker
+
+        pool = WorkerPool(
+            launch=launch, stop=lambda worker: None, size=1, cwd=str(tmp_path)
+        )
+        pool.replenish()
+        with patch("silica.developer.tools.coordination._worker_pool", pool):
+            yield pool
+        pool.shutdown()
+
+    def test_spawn_binds_warm_worker(self, session, pool, tmp_path):
+        from silica.developer.tools.coordination import spawn_agent
+
+        warm = pool.workers[0]
+        pool.mark_ready(warm.identity_id)
+
+        result = spawn_agent(
+            workspace_name="fast", display_name="Fast", cwd=str(tmp_path)
+        )
+
+        assert "warm pool" in result
+        agent = session.get_agent(warm.agent_id)
+        assert agent.identity_id == warm.identity_id
+        assert agent.display_name == "Fast"
+        assert agent.state == AgentState.IDLE
+        assert agent.tmux_session == warm.tmux_session
+
+    def test_unready_worker_is_spawning(self, session, pool, tmp_path):
+        from silica.developer.tools.coordination import spawn_agent
+
+        warm = pool.workers[0]
+        spawn_agent(workspace_name="fast", cwd=str(tmp_path))
+
+        assert session.get_agent(warm.agent_id).state == AgentState.SPAWNING
+
+    def test_poll_hides_pool_readiness(self, session, pool, deaddrop):
+        from silica.developer.coordination import CoordinationContext, Idle
+
+        warm = pool.workers[0]
+        worker_context = CoordinationContext(
+            deaddrop=deaddrop,
+            namespace_id=session.namespace_id,
+            namespace_secret=session.namespace_secret,
+            identity_id=warm.identity_id,
+            identity_secret=warm.secret,
+            room_id=session.state.room_id,
+            coordinator_id=session.state.coordinator_id,
+        )
+        worker_context.send_to_coordinator(Idle(agent_id=warm.agent_id))
+
+        result = poll_messages()
+
+        assert result == "No new messages"
+        assert pool.workers[0].ready
+
+    def test_stopped_worker_leaves_room(self, session, pool, deaddrop):
+        from silica.developer.tools.coordination import _stop_pooled_worker
+
+        warm = pool.workers[0]
+        with patch("subprocess.run"):
+            _stop_pooled_worker(session, warm)
+
+        members = deaddrop.list_room_members(
+            ns=session.namespace_id,
+            room_id=session.state.room_id,
+            secret=session.state.coordinator_secret,
+        )
+        assert warm.identity_id not in [m["identity_id"] for m in members]
+
+    def test_pool_uses_its_own_local_client(self, temp_sessions_dir, tmp_path):
+        import threading
+
+        from silica.developer.tools.coordination import (
+            _launch_pooled_worker,
+            _open_pool_deaddrop,
+        )
+
+        local = Deaddrop.create_local(path=tmp_path / ".deaddrop")
+        session = CoordinationSession.create_session(local, "Local Session")
+        pool_client = _open_pool_deaddrop(session)
+        assert pool_client is not local
+
+        launched = []
+        with patch("silica.developer.tools.coordination._launch_tmux_worker"):
+            thread = threading.Thread(
+                target=lambda: launched.append(
+                    _launch_pooled_worker(session, str(tmp_path), pool_client)
+                )
+            )
+            thread.start()
+            thread.join()
+
+        members = local.list_room_members(
+            ns=session.namespace_id,
+            room_id=session.state.room_id,
+            secret=session.state.coordinator_secret,
+        )
+        assert launched[0].identity_id in [m["identity_id"] for m in members]
+        pool_client.close()
+
+
 class TestTerminateAgent:
     """Test terminate_agent tool."""
 
@@ -0,0 +1,209 @@
+"""Tests for the cached GitHub data layer, using a fake gh binary."""
+
+import json
+import os
+import stat
+import sys
+import textwrap
+
+import pytest
+
+from silica.developer.tools import github_data
+from silica.developer.tools.github_comments import github_list_pr_comments
+from silica.developer.tools.github_data import (
+    GitHubResponseCache,
+    api_get,
+    api_get_many,
+    resolve_endpoint,
+)
+
+FAKE_GH = textwrap.dedent(
+    """\
+    import json
+    import os
+    import sys
+
+    state_dir = os.environ["FAKE_GH_STATE"]
+    args = sys.argv[1:]
+    with open(os.path.join(state_dir, "calls.jsonl"), "a") as f:
+        f.write(json.dumps(args) + "\\n")
+    with open(os.path.join(state_dir, "responses.json")) as f:
+        responses = json.load(f)
+
+    if args[:2] == ["pr", "view"]:
+        print(json.dumps({"number": int(args[2])}))
+        sys.exit(0)
+
+    endpoint = next(a for a in args[1:] if not a.startswith("-"))
+    etag = None
+    if "-H" in args:
+        etag = args[args.index("-H") + 1].split(":", 1)[1].strip()
+
+    response = responses.get(endpoint)
+    if response is None:
+        print("HTTP/2.0 404 Not Found\\r\\n\\r\\n" + '{"message": "Not Found"}')
+        print("gh: Not Found (HTTP 404)", file=sys.stderr)
+        sys.exit(1)
+    if etag == response["etag"]:
+        print("HTTP/2.0 304 Not Modified\\r\\nEtag: " + etag + "\\r\\n\\r\\n")
+        print("gh: HTTP 304", file=sys.stderr)
+        sys.exit(1)
+    sys.stdout.write(
+        "HTTP/2.0 200 OK\\r\\nContent-Type: application/json\\r\\n"
+        "Etag: " + response["etag"] + "\\r\\n\\r\\n" + json.dumps(response["body"])
+    )
+    """
+)
+
+
+class FakeGitHub:
+    """A fake ``gh`` on PATH serving canned REST responses with ETags."""
+
+    def __init__(self, tmp_path):
+        self.state_dir = tmp_path / "gh-state"
+        self.state_dir.mkdir()
+        self.responses = {}
+        self._save()
+
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        script = bin_dir / "gh"
+        script.write_text(f"#!{sys.executable}\n{FAKE_GH}")
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        self.bin_dir = bin_dir
+
+    def set(self, endpoint, body, etag):
+        self.responses[endpoint] = {"body": body, "etag": etag}
+        self._save()
+
+    def calls(self):
+        path = self.state_dir / "calls.jsonl"
+        if not path.exists():
+            return []
+        return [json.loads(line) for line in path.read_text().splitlines()]
+
+    def _save(self):
+        (self.state_dir / "responses.json").write_text(json.dumps(self.responses))
+
+
+@pytest.fixture
+def fake_gh(tmp_path, monkeypatch):
+    gh = FakeGitHub(tmp_path)
+    monkeypatch.setenv("PATH", f"{gh.bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_GH_STATE", str(gh.state_dir))
+    return gh
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = GitHubResponseCache(tmp_path / "cache")
+    monkeypatch.setattr(github_data, "_cache", cache)
+    return cache
+
+
+class TestApiGet:
+    def test_revalidates_with_etag(self, fake_gh, cache):
+        fake_gh.set("repos/o/r/pulls/1/comments", [{"id": 1}], etag='"v1"')
+
+        first = api_get("repos/o/r/pulls/1/comments")
+        second = api_get("repos/o/r/pulls/1/comments")
+
+        assert json.loads(first["data"]) == [{"id": 1}]
+        assert not first["cached"]
+        assert second == {"success": True, "data": first["data"], "cached": True}
+        calls = fake_gh.calls()
+        assert "-H" not in calls[0]
+        assert calls[1][-2:] == ["-H", 'If-None-Match: "v1"']
+
+    def test_changed_resource_replaces_cache(self, fake_gh, cache):
+        fake_gh.set("repos/o/r/issues/1/comments", [], etag='"v1"')
+        api_get("repos/o/r/issues/1/comments")
+
+        fake_gh.set("repos/o/r/issues/1/comments", [{"id": 2}], etag='"v2"')
+        changed = api_get("repos/o/r/issues/1/comments")
+        again = api_get("repos/o/r/issues/1/comments")
+
+        assert json.loads(changed["data"]) == [{"id": 2}]
+        assert not changed["cached"]
+        assert again["cached"]
+        assert json.loads(again["data"]) == [{"id": 2}]
+
+    def test_error_is_not_cached(self, fake_gh, cache):
+        result = api_get("repos/o/r/pulls/404/comments")
+
+        assert not result["success"]
+        assert "404" in result["error"]
+        assert list(cache.cache_dir.glob("*.json")) == []
+
+    def test_output_without_headers_is_uncached_body(self, cache):
+        result = api_get(
+            "repos/o/r/pulls", run=lambda args: {"success": True, "data": "[]"}
+        )
+
+        assert result == {"success": True, "data": "[]", "cached": False}
+        assert list(cache.cache_dir.glob("*.json")) == []
+
+    def test_get_many_keeps_order(self, fake_gh, cache):
+        for n in range(3):
+            fake_gh.set(f"repos/o/r/issues/{n}", {"n": n}, etag=f'"{n}"')
+
+        results = api_get_many([f"repos/o/r/issues/{n}" for n in range(3)])
+
+        assert [json.loads(r["data"])["n"] for r in results] == [0, 1, 2]
+
+    def test_placeholder_endpoints_are_keyed_by_directory(
+        self, tmp_path, cache, monkeypatch
+    ):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        endpoint = "repos/:owner/:repo/pulls"
+        monkeypatch.chdir(tmp_path / "a")
+        key_a = cache.cache_key(endpoint)
+        monkeypatch.chdir(tmp_path / "b")
+        key_b = cache.cache_key(endpoint)
+
+        assert key_a != key_b
+        assert cache.cache_key("repos/o/r/pulls") == cache.cache_key("repos/o/r/pulls")
+
+
+class TestResolveEndpoint:
+    def test_without_repo(self):
+        assert resolve_endpoint("/repos/:owner/:repo/pulls") == (
+            "repos/:owner/:repo/pulls",
+            None,
+        )
+
+    def test_owner_and_repo(self):
+        assert resolve_endpoint("repos/:owner/:repo/pulls", "octo/hello") == (
+            "repos/octo/hello/pulls",
+            None,
+        )
+        assert resolve_endpoint("repos/{owner}/{repo}/issues", "octo/hello") == (
+            "repos/octo/hello/issues",
+            None,
+        )
+
+    def test_host(self):
+        assert resolve_endpoint(
+            "repos/:owner/:repo/pulls", "ghe.example.com/octo/hello"
+        ) == ("repos/octo/hello/pulls", "ghe.example.com")
+
+
+class TestCommentToolsUseCache:
+    def test_polling_pr_comments_is_served_from_cache(self, fake_gh, cache):
+        for path, body in [
+            ("pulls/7/comments", [{"user": {"login": "a"}, "body": "inline"}]),
+            ("issues/7/comments", [{"user": {"login": "b"}, "body": "chat"}]),
+            ("pulls/7/reviews", [{"user": {"login": "c"}, "body": "lgtm"}]),
+        ]:
+            fake_gh.set(f"repos/o/r/{path}", body, etag=f'"{path}"')
+
+        first = github_list_pr_comments(None, 7, repo="o/r")
+        second = github_list_pr_comments(None, 7, repo="o/r")
+
+        assert first == second
+        assert "Total comments: 3" in first
+        api_calls = [c for c in fake_gh.calls() if c[0] == "api"]
+        assert len(api_calls) == 6
+        # The second poll revalidated every endpoint
+        assert sum("-H" in c for c in api_calls) == 3
@@ -482,3 +482,85 @@ def test_sync_command_all_sessions_with_errors(mock_config, mock_persona, capsys
                         # Should mention errors
                         assert "Session errors" in captured.out
                         assert "Network error" in captured.out
+
+
+def test_sync_all_sessions_skips_unchanged(mock_config, mock_persona, capsys):
+    """Test sessions unchanged on both sides since their last sync are skipped."""
+    mock, persona_dir = mock_persona
+
+    for session_id in ["session-abc123", "session-def456"]:
+        session_dir = persona_dir / "history" / session_id
+        session_dir.mkdir(parents=True)
+        (session_dir / "conversation.json").write_text("{}")
+
+    mock_config.setup("https://memory.example.com", "test_token", enable=True)
+
+    tokens = {
+        "personas/default/history/session-abc123": "token-1",
+        "personas/default/history/session-def456": "token-2",
+    }
+
+    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test_key"}):
+        with patch("silica.developer.cli.history_sync.MemoryProxyClient") as MockClient:
+            MockClient.return_value.get_sync_tokens.return_value = tokens
+            with patch("silica.developer.cli.history_sync.SyncEngine"):
+                with patch("silica.developer.cli.history_sync.LLMConflictResolver"):
+                    with patch(
+                        "silica.developer.cli.history_sync.sync_with_retry"
+                    ) as mock_sync:
+                        # Both sessions are already in sync
+                        mock_result = Mock()
+                        mock_result.succeeded = []
+                        mock_result.failed = []
+                        mock_result.conflicts = []
+                        mock_result.skipped = []
+                        mock_result.duration = 0.1
+                        mock_sync.return_value = mock_result
+
+                        sync()
+                        assert mock_sync.call_count == 2
+
+                        # Nothing changed: no session is synced again
+                        sync()
+                        assert mock_sync.call_count == 2
+
+                        # A local change and a remote change are both noticed
+                        (
+                            persona_dir
+                            / "history"
+                            / "session-abc123"
+                            / "conversation.json"
+                        ).write_text('{"messages": []}')
+                        tokens["personas/default/history/session-def456"] = "token-3"
+                        sync()
+                        assert mock_sync.call_count == 4
+
+    captured = capsys.readouterr()
+    assert "Sessions synced: 2/2" in captured.out
+    assert "2 session(s) already in sync" in captured.out
+
+
+def test_session_executor_cancels_queued_sessions():
+    """Ctrl-C does not wait for every queued session to sync."""
+    import threading
+
+    from silica.developer.cli.history_sync import _session_executor
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def sync_session(n):
+        started.set()
+        release.wait(5)
+        return n
+
+    futures = []
+    with pytest.raises(KeyboardInterrupt):
+        with _session_executor(1) as executor:
+            futures = [executor.submit(sync_session, n) for n in range(100)]
+            started.wait(5)
+            release.set()
+            raise KeyboardInterrupt
+
+    assert futures[0].result() == 0
+    assert all(future.cancelled() for future in futures[2:])
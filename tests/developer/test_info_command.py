@@ -222,6 +222,31 @@ def test_info_command_contains_cost(mock_context):
     assert "$0.0010" in output or "$0.0011" in output
 
 
+def test_info_command_contains_prompt_caching(mock_context):
+    """Test that cache hit ratio, savings and breakpoints are shown."""
+    from silica.developer.cache_planner import CachePlanner
+
+    mock_context.usage_summary.return_value.update(
+        cache_write_tokens=80, cache_saved_tokens=-6
+    )
+    planner = CachePlanner()
+    planner.last_plan = ["tools", "system", "latest"]
+    mock_context.cache_planner = planner
+    toolbox = Toolbox(mock_context)
+
+    toolbox._info(
+        user_interface=mock_context.user_interface,
+        sandbox=mock_context.sandbox,
+        user_input="",
+    )
+
+    output = mock_context.user_interface.handle_system_message.call_args[0][0]
+    assert "Cache Hit Ratio:** 10.0% of 200 prompt tokens" in output
+    assert "Cache Writes:** 80" in output
+    assert "Tokens Saved:** -6" in output
+    assert "Cache Breakpoints:** tools, system, latest" in output
+
+
 def test_info_command_with_conversation_size(mock_context):
     """Test that conversation size and compaction info are displayed when available."""
     toolbox = Toolbox(mock_context)
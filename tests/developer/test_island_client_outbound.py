@@ -0,0 +1,162 @@
+"""Tests for batched, bounded Island notification delivery."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from silica.developer.hybrid_interface import HybridUserInterface
+from silica.developer.island_client import IslandClient, NotificationQueue
+
+
+def make_connected_client(**kwargs) -> IslandClient:
+    client = IslandClient(**kwargs)
+    client._connected = True
+    client._writer = MagicMock()
+    client._writer.drain = AsyncMock()
+    client._writer.close = MagicMock()
+    client._writer.wait_closed = AsyncMock()
+    return client
+
+
+def written_methods(writer) -> list:
+    methods = []
+    for call in writer.write.call_args_list:
+        for line in call.args[0].decode().splitlines():
+            methods.append(json.loads(line)["method"])
+    return methods
+
+
+class TestNotificationQueue:
+    def test_preserves_order(self):
+        queue = NotificationQueue()
+        queue.put("event.tool_use", {"tool_use_id": "1"})
+        queue.put("event.tool_result", {"tool_use_id": "1"})
+        queue.put("event.assistant_message", {"content": "hi"})
+
+        assert [n.method for n in queue.take_batch()] == [
+            "event.tool_use",
+            "event.tool_result",
+            "event.assistant_message",
+        ]
+        assert len(queue) == 0
+
+    def test_coalesces_superseded_updates(self):
+        queue = NotificationQueue()
+        queue.put("event.token_usage", {"prompt_tokens": 1})
+        queue.put("event.tool_use", {"tool_use_id": "1"})
+        queue.put("event.token_usage", {"prompt_tokens": 2})
+
+        batch = queue.take_batch()
+        assert [n.method for n in batch] == ["event.tool_use", "event.token_usage"]
+        assert batch[1].params == {"prompt_tokens": 2}
+        assert queue.stats.coalesced == 1
+
+    def test_bounded_drops_coalescable_first(self):
+        queue = NotificationQueue(max_pending=2)
+        queue.put("event.status", {"message": "working"})
+        queue.put("event.tool_use", {"tool_use_id": "1"})
+        queue.put("event.tool_use", {"tool_use_id": "2"})
+
+        batch = queue.take_batch()
+        assert [n.params["tool_use_id"] for n in batch] == ["1", "2"]
+        assert queue.stats.dropped == 1
+
+    def test_bounded_drops_oldest(self):
+        queue = NotificationQueue(max_pending=2)
+        for i in range(5):
+            queue.put("event.tool_use", {"tool_use_id": str(i)})
+
+        assert [n.params["tool_use_id"] for n in queue.take_batch()] == ["3", "4"]
+        stats = queue.stats
+        assert stats.dropped == 3
+        assert stats.high_water == 2
+
+
+class TestBatchedDelivery:
+    @pytest.mark.asyncio
+    async def test_burst_written_in_one_batch(self):
+        client = make_connected_client()
+
+        for i in range(50):
+            await client.notify_tool_use(str(i), "shell", {})
+        await client._flush_task
+
+        assert client._writer.write.call_count == 1
+        assert client._writer.drain.await_count == 1
+        assert len(written_methods(client._writer)) == 50
+        stats = client.notification_stats
+        assert stats.sent == 50
+        assert stats.batches == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_reader_does_not_block_sender(self):
+        client = make_connected_client(max_pending_notifications=10)
+        release = asyncio.Event()
+        client._writer.drain = AsyncMock(side_effect=release.wait)
+
+        await client.notify_tool_use("first", "shell", {})
+        await asyncio.sleep(0.02)  # First batch is now stuck in drain
+
+        for i in range(100):
+            await asyncio.wait_for(client.notify_tool_use(str(i), "shell", {}), 0.1)
+
+        assert client.notification_stats.pending == 10
+        assert client.notification_stats.dropped == 90
+
+        release.set()
+        await client._flush_task
+        assert client.notification_stats.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_disconnect_flushes_pending(self):
+        client = make_connected_client()
+        writer = client._writer
+
+        await client.notify_status("done")
+        await client.disconnect()
+
+        assert written_methods(writer) == ["event.status"]
+
+    @pytest.mark.asyncio
+    async def test_write_error_counted(self):
+        client = make_connected_client()
+        client._writer.write.side_effect = Exception("Write failed")
+
+        await client.notify_user_message("test")
+        await client._flush_task
+
+        stats = client.notification_stats
+        assert stats.write_errors == 1
+        assert stats.dropped == 1
+
+
+class TestHybridDispatch:
+    @pytest.mark.asyncio
+    async def test_notifications_dispatched_in_order_by_one_task(self, tmp_path):
+        cli = MagicMock()
+        hybrid = HybridUserInterface(cli, socket_path=tmp_path / "test.sock")
+        hybrid._island = make_connected_client()
+
+        created = []
+        original_create_task = asyncio.create_task
+
+        def tracking_create_task(coro, **kwargs):
+            created.append(coro)
+            return original_create_task(coro, **kwargs)
+
+        asyncio.create_task = tracking_create_task
+        try:
+            for i in range(20):
+                hybrid.handle_tool_use("shell", {"command": str(i)}, tool_use_id=str(i))
+                hybrid.display_token_count(i, i, 2 * i, 0.0)
+            await hybrid._island_dispatch_task
+            await hybrid._island._flush_task
+        finally:
+            asyncio.create_task = original_create_task
+
+        # One dispatch task plus one writer task, not one task per event
+        assert len(created) == 2
+        methods = written_methods(hybrid._island._writer)
+        assert methods == ["event.tool_use"] * 20 + ["event.token_usage"]
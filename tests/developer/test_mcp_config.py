@@ -140,6 +140,60 @@ class TestMCPServerConfig:
         cfg = MCPServerConfig(name="test", command="cmd", setup_command="setup")
         assert cfg.has_setup_command() is True
 
+    def test_result_cache_default_off(self):
+        """Test result caching is opt-in."""
+        cfg = MCPServerConfig.from_dict("test", {"command": "cmd"})
+        assert cfg.result_cache.enabled is False
+        assert cfg.result_cache.is_cacheable("search", read_only_hint=True) is False
+
+    def test_result_cache_from_dict(self):
+        """Test parsing result_cache settings."""
+        data = {
+            "command": "cmd",
+            "result_cache": {
+                "ttl": 60,
+                "max_size": 10,
+                "read_only_tools": ["search"],
+                "trust_annotations": False,
+            },
+        }
+        cfg = MCPServerConfig.from_dict("test", data)
+        assert cfg.result_cache.enabled is True
+        assert cfg.result_cache.ttl == 60.0
+        assert cfg.result_cache.max_size == 10
+        assert cfg.result_cache.is_cacheable("search") is True
+        assert cfg.result_cache.is_cacheable("fetch", read_only_hint=True) is False
+
+    def test_result_cache_bool_shorthand(self):
+        """Test result_cache: true enables defaults and trusts annotations."""
+        cfg = MCPServerConfig.from_dict(
+            "test", {"command": "cmd", "result_cache": True}
+        )
+        assert cfg.result_cache.enabled is True
+        assert cfg.result_cache.is_cacheable("fetch", read_only_hint=True) is True
+        assert cfg.result_cache.is_cacheable("write") is False
+
+    def test_result_cache_saved(self, tmp_path):
+        """Test result_cache settings survive a save/load roundtrip."""
+        from silica.developer.mcp.config import MCPResultCacheConfig, save_mcp_config
+
+        config = MCPConfig(
+            servers={
+                "search": MCPServerConfig(
+                    name="search",
+                    command="cmd",
+                    result_cache=MCPResultCacheConfig(
+                        enabled=True, ttl=30, read_only_tools=["search"]
+                    ),
+                )
+            }
+        )
+        path = save_mcp_config(config, silica_dir=tmp_path)
+        loaded = MCPConfig.from_file(path).servers["search"].result_cache
+        assert loaded.enabled is True
+        assert loaded.ttl == 30
+        assert loaded.read_only_tools == ["search"]
+
 
 class TestMCPConfig:
     """Tests for MCPConfig dataclass."""
@@ -0,0 +1,243 @@
+"""Tests for MCP tool result caching and request coalescing."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from silica.developer.mcp.client import MCPClient, MCPToolError, MCPToolInfo
+from silica.developer.mcp.config import (
+    MCPConfig,
+    MCPResultCacheConfig,
+    MCPServerConfig,
+)
+from silica.developer.mcp.manager import MCPToolManager
+from silica.developer.mcp.result_cache import ToolResultCache, make_cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestToolResultCache:
+    @pytest.mark.asyncio
+    async def test_hit_after_miss(self):
+        cache = ToolResultCache()
+        call = AsyncMock(return_value="result")
+
+        assert await cache.get_or_call("k", call) == "result"
+        assert await cache.get_or_call("k", call) == "result"
+
+        call.assert_awaited_once()
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = ToolResultCache(ttl=10, clock=clock)
+        call = AsyncMock(return_value="result")
+
+        await cache.get_or_call("k", call)
+        clock.now = 11
+        await cache.get_or_call("k", call)
+
+        assert call.await_count == 2
+        assert cache.stats.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = ToolResultCache(max_size=2)
+        for key in ("a", "b"):
+            await cache.get_or_call(key, AsyncMock(return_value=key))
+        # Touch "a" so "b" is least recently used
+        await cache.get_or_call("a", AsyncMock())
+        await cache.get_or_call("c", AsyncMock(return_value="c"))
+
+        call_b = AsyncMock(return_value="b")
+        await cache.get_or_call("b", call_b)
+        call_b.assert_awaited_once()
+        assert cache.stats.evictions >= 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_coalesced(self):
+        cache = ToolResultCache()
+        started = 0
+        release = asyncio.Event()
+
+        async def slow_call():
+            nonlocal started
+            started += 1
+            await release.wait()
+            return "result"
+
+        tasks = [
+            asyncio.create_task(cache.get_or_call("k", slow_call)) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == ["result"] * 5
+        assert started == 1
+        assert cache.stats.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_waiters_survive_leader_cancellation(self):
+        cache = ToolResultCache()
+        started = 0
+        release = asyncio.Event()
+
+        async def slow_call():
+            nonlocal started
+            started += 1
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(cache.get_or_call("k", slow_call))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(cache.get_or_call("k", slow_call)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert results == ["result"] * 3
+        assert started == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached_and_shared(self):
+        cache = ToolResultCache()
+        release = asyncio.Event()
+
+        async def failing_call():
+            await release.wait()
+            raise MCPToolError("boom")
+
+        tasks = [
+            asyncio.create_task(cache.get_or_call("k", failing_call)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, MCPToolError) for r in results)
+
+        call = AsyncMock(return_value="ok")
+        assert await cache.get_or_call("k", call) == "ok"
+        call.assert_awaited_once()
+
+    def test_cache_key_ignores_argument_order(self):
+        assert make_cache_key("search", {"a": 1, "b": 2}) == make_cache_key(
+            "search", {"b": 2, "a": 1}
+        )
+
+
+def make_tool(name: str, read_only: bool = False) -> MCPToolInfo:
+    return MCPToolInfo(
+        name=f"mcp_search_{name}",
+        description=name,
+        input_schema={"type": "object"},
+        server_name="search",
+        original_name=name,
+        read_only=read_only,
+    )
+
+
+@pytest.fixture
+def manager_with_tools():
+    def build(result_cache: MCPResultCacheConfig):
+        tools = {
+            "mcp_search_query": make_tool("query"),
+            "mcp_search_fetch": make_tool("fetch", read_only=True),
+            "mcp_search_write": make_tool("write"),
+        }
+        client = MagicMock(spec=MCPClient)
+        client.get_tool_by_prefixed_name.side_effect = tools.get
+        client.call_tool = AsyncMock(side_effect=lambda name, args: f"{name}:{args}")
+
+        manager = MCPToolManager()
+        manager._config = MCPConfig(
+            servers={
+                "search": MCPServerConfig(
+                    name="search", command="cmd", result_cache=result_cache
+                )
+            }
+        )
+        manager._clients = {"search": client}
+        manager._tool_to_server = {name: "search" for name in tools}
+        return manager, client
+
+    return build
+
+
+class TestManagerResultCaching:
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, manager_with_tools):
+        manager, client = manager_with_tools(MCPResultCacheConfig())
+
+        await manager.call_tool("mcp_search_fetch", {"url": "x"})
+        await manager.call_tool("mcp_search_fetch", {"url": "x"})
+
+        assert client.call_tool.await_count == 2
+        assert manager.get_server_status()[0].result_cache is None
+
+    @pytest.mark.asyncio
+    async def test_configured_and_annotated_tools_cached(self, manager_with_tools):
+        manager, client = manager_with_tools(
+            MCPResultCacheConfig(enabled=True, read_only_tools=["query"])
+        )
+
+        for _ in range(2):
+            await manager.call_tool("mcp_search_query", {"q": "a"})
+            await manager.call_tool("mcp_search_fetch", {"url": "x"})
+            await manager.call_tool("mcp_search_write", {"v": 1})
+
+        calls = [c.args[0] for c in client.call_tool.await_args_list]
+        assert calls.count("query") == 1
+        assert calls.count("fetch") == 1
+        assert calls.count("write") == 2
+
+        stats = manager.get_server_status()[0].result_cache
+        assert stats.hits == 2
+        assert stats.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_annotations_ignored_when_untrusted(self, manager_with_tools):
+        manager, client = manager_with_tools(
+            MCPResultCacheConfig(enabled=True, trust_annotations=False)
+        )
+
+        await manager.call_tool("mcp_search_fetch", {"url": "x"})
+        await manager.call_tool("mcp_search_fetch", {"url": "x"})
+
+        assert client.call_tool.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_parallel_identical_calls_share_round_trip(self, manager_with_tools):
+        manager, client = manager_with_tools(MCPResultCacheConfig(enabled=True))
+        release = asyncio.Event()
+
+        async def slow(name, args):
+            await release.wait()
+            return "page"
+
+        client.call_tool = AsyncMock(side_effect=slow)
+
+        tasks = [
+            asyncio.create_task(manager.call_tool("mcp_search_fetch", {"url": "x"}))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["page"] * 3
+        client.call_tool.assert_awaited_once()
+        assert manager.get_server_status()[0].result_cache.coalesced == 2
@@ -0,0 +1,231 @@
+"""Tests for the persistent MCP schema cache and lazy server start."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from silica.developer.mcp.client import MCPClient, MCPToolInfo
+from silica.developer.mcp.config import MCPConfig, MCPServerConfig
+from silica.developer.mcp.manager import MCPToolManager
+from silica.developer.mcp.schema_cache import MCPSchemaCache, tools_fingerprint
+
+
+def make_tool(name: str, server: str = "sqlite", description: str = "") -> MCPToolInfo:
+    return MCPToolInfo(
+        name=f"mcp_{server}_{name}",
+        description=description or f"Test {name}",
+        input_schema={"type": "object", "properties": {}},
+        server_name=server,
+        original_name=name,
+    )
+
+
+@pytest.fixture
+def server_config():
+    return MCPServerConfig(name="sqlite", command="uvx", args=["mcp-server-sqlite"])
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MCPSchemaCache(cache_dir=tmp_path / "mcp-schemas")
+
+
+class TestMCPSchemaCache:
+    def test_miss_returns_none(self, cache, server_config):
+        assert cache.get(server_config) is None
+
+    def test_roundtrip(self, cache, server_config):
+        tools = [make_tool("query"), make_tool("list_tables")]
+        assert cache.set(server_config, tools, server_version="1.0") is True
+
+        loaded = cache.get(server_config)
+        assert [t.name for t in loaded] == [
+            "mcp_sqlite_query",
+            "mcp_sqlite_list_tables",
+        ]
+        assert loaded[0].original_name == "query"
+        assert loaded[0].server_name == "sqlite"
+        assert cache.get_server_version(server_config) == "1.0"
+
+    def test_set_reports_unchanged(self, cache, server_config):
+        tools = [make_tool("query")]
+        assert cache.set(server_config, tools, server_version="1.0") is True
+        assert cache.set(server_config, tools, server_version="1.0") is False
+        # Version bump counts as a change
+        assert cache.set(server_config, tools, server_version="1.1") is True
+        # Tool change counts as a change
+        assert (
+            cache.set(
+                server_config,
+                [make_tool("query", description="new")],
+                server_version="1.1",
+            )
+            is True
+        )
+
+    def test_key_depends_on_launch_identity(self, cache, server_config):
+        cache.set(server_config, [make_tool("query")])
+        other = MCPServerConfig(
+            name="sqlite", command="uvx", args=["mcp-server-sqlite@2.0"]
+        )
+        assert cache.get(other) is None
+
+    def test_corrupt_entry_ignored(self, cache, server_config):
+        cache.set(server_config, [make_tool("query")])
+        path = cache.cache_dir / f"{cache.cache_key(server_config)}.json"
+        path.write_text("{not json")
+        assert cache.get(server_config) is None
+
+    def test_invalidate(self, cache, server_config):
+        cache.set(server_config, [make_tool("query")])
+        cache.invalidate(server_config)
+        assert cache.get(server_config) is None
+
+    def test_fingerprint_order_independent(self):
+        a = [make_tool("a"), make_tool("b")]
+        assert tools_fingerprint(a) == tools_fingerprint(list(reversed(a)))
+
+
+def make_mock_client(tools, server_config):
+    client = MagicMock(spec=MCPClient)
+    client.config = server_config
+    client.tools = tools
+    client.is_connected = False
+    client.server_version = "1.0"
+
+    def seed(seeded):
+        client.tools = list(seeded)
+
+    client.seed_tools.side_effect = seed
+
+    async def connect(timeout=30.0, fetch_tools=True):
+        client.is_connected = True
+
+    client.connect = AsyncMock(side_effect=connect)
+    client.call_tool = AsyncMock(return_value="ok")
+    client.live_tools = tools
+
+    async def list_tools(force_refresh=False, timeout=15.0):
+        client.tools = list(client.live_tools)
+        return client.tools
+
+    client.list_tools = AsyncMock(side_effect=list_tools)
+    client.get_tool_by_prefixed_name.side_effect = lambda name: next(
+        (t for t in client.tools if t.name == name), None
+    )
+    return client
+
+
+class TestLazyServerStart:
+    @pytest.mark.asyncio
+    async def test_cached_server_not_started(self, cache, server_config):
+        cache.set(server_config, [make_tool("query")])
+        config = MCPConfig(servers={"sqlite": server_config})
+        client = make_mock_client([], server_config)
+
+        manager = MCPToolManager(schema_cache=cache)
+        with patch("silica.developer.mcp.manager.MCPClient", return_value=client):
+            results = await manager.connect_servers(config, lazy=True)
+
+        assert results == {"sqlite": None}
+        client.connect.assert_not_called()
+        assert [t.name for t in manager.get_all_tools()] == ["mcp_sqlite_query"]
+        assert manager.is_mcp_tool("mcp_sqlite_query")
+
+        status = manager.get_server_status()[0]
+        assert status.pending is True
+        assert status.tool_count == 1
+
+    @pytest.mark.asyncio
+    async def test_uncached_server_connected_and_cached(self, cache, server_config):
+        config = MCPConfig(servers={"sqlite": server_config})
+        tools = [make_tool("query")]
+        client = make_mock_client(tools, server_config)
+
+        manager = MCPToolManager(schema_cache=cache)
+        with patch("silica.developer.mcp.manager.MCPClient", return_value=client):
+            await manager.connect_servers(config, lazy=True)
+
+        client.connect.assert_awaited_once()
+        assert [t.name for t in cache.get(server_config)] == ["mcp_sqlite_query"]
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_server_bypasses_schema_cache(
+        self, cache, server_config
+    ):
+        cache.set(server_config, [make_tool("old")])
+        server_config.cache = False
+        config = MCPConfig(servers={"sqlite": server_config})
+        client = make_mock_client([make_tool("query")], server_config)
+
+        manager = MCPToolManager(schema_cache=cache)
+        with patch("silica.developer.mcp.manager.MCPClient", return_value=client):
+            await manager.connect_servers(config, lazy=True)
+
+        client.connect.assert_awaited_once()
+        assert [t.name for t in manager.get_all_tools()] == ["mcp_sqlite_query"]
+        # The stored entry is neither used nor rewritten
+        assert [t.name for t in cache.get(server_config)] == ["mcp_sqlite_old"]
+
+    @pytest.mark.asyncio
+    async def test_first_call_starts_server_once(self, cache, server_config):
+        cache.set(server_config, [make_tool("query")])
+        config = MCPConfig(servers={"sqlite": server_config})
+        live_tools = [make_tool("query"), make_tool("describe")]
+        client = make_mock_client(live_tools, server_config)
+
+        manager = MCPToolManager(schema_cache=cache)
+        with patch("silica.developer.mcp.manager.MCPClient", return_value=client):
+            await manager.connect_servers(config, lazy=True)
+
+            results = await asyncio.gather(
+                manager.call_tool("mcp_sqlite_query", {}),
+                manager.call_tool("mcp_sqlite_query", {}),
+            )
+            # Let the background refresh complete
+            await asyncio.gather(*manager._background_tasks)
+
+        assert results == ["ok", "ok"]
+        client.connect.assert_awaited_once()
+        assert client.connect.await_args.kwargs["fetch_tools"] is False
+        assert manager.get_server_status()[0].pending is False
+
+        # Background refresh picked up the new tool and updated the cache
+        assert manager.is_mcp_tool("mcp_sqlite_describe")
+        assert {t.name for t in cache.get(server_config)} == {
+            "mcp_sqlite_query",
+            "mcp_sqlite_describe",
+        }
+
+    @pytest.mark.asyncio
+    async def test_refresh_drops_removed_tools(self, cache, server_config):
+        cache.set(server_config, [make_tool("query"), make_tool("old")])
+        config = MCPConfig(servers={"sqlite": server_config})
+        client = make_mock_client([make_tool("query")], server_config)
+
+        manager = MCPToolManager(schema_cache=cache)
+        with patch("silica.developer.mcp.manager.MCPClient", return_value=client):
+            await manager.connect_servers(config, lazy=True)
+            await manager.call_tool("mcp_sqlite_query", {})
+            await asyncio.gather(*manager._background_tasks)
+
+        assert not manager.is_mcp_tool("mcp_sqlite_old")
+        assert [t.name for t in cache.get(server_config)] == ["mcp_sqlite_query"]
+
+    @pytest.mark.asyncio
+    async def test_tools_changed_notification_schedules_refresh(
+        self, cache, server_config
+    ):
+        config = MCPConfig(servers={"sqlite": server_config})
+        client = make_mock_client([make_tool("query")], server_config)
+
+        manager = MCPToolManager(schema_cache=cache)
+        with patch("silica.developer.mcp.manager.MCPClient", return_value=client):
+            await manager.connect_servers(config, lazy=True)
+
+            client.live_tools = [make_tool("query"), make_tool("new")]
+            manager._on_tools_changed("sqlite")
+            await asyncio.gather(*manager._background_tasks)
+
+        assert manager.is_mcp_tool("mcp_sqlite_new")
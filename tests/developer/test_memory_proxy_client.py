@@ -6,6 +6,8 @@ from unittest.mock import Mock, patch, MagicMock
 import httpx
 
 from silica.developer.memory.proxy_client import (
+    AdaptiveBackoff,
+    BackoffTransport,
     MemoryProxyClient,
     VersionConflictError,
     NotFoundError,
@@ -473,3 +475,102 @@ def test_close(proxy_client, mock_httpx_client):
     """Test client close method."""
     proxy_client.close()
     mock_httpx_client.close.assert_called_once()
+
+
+def test_get_sync_tokens(proxy_client, mock_httpx_client):
+    """Test listing change tokens for the namespaces under a prefix."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"tokens": {"personas/p/history/s1": "abc"}}
+    mock_httpx_client.get.return_value = mock_response
+
+    tokens = proxy_client.get_sync_tokens("personas/p/history")
+
+    assert tokens == {"personas/p/history/s1": "abc"}
+    mock_httpx_client.get.assert_called_once_with(
+        "https://memory-proxy.example.com/sync-tokens/personas/p/history"
+    )
+
+
+def test_get_sync_tokens_unsupported(proxy_client, mock_httpx_client):
+    """Test a proxy without the sync tokens endpoint raises NotFoundError."""
+    mock_response = Mock()
+    mock_response.status_code = 404
+    mock_httpx_client.get.return_value = mock_response
+
+    with pytest.raises(NotFoundError):
+        proxy_client.get_sync_tokens("personas/p/history")
+
+
+class TestBackoffTransport:
+    def make_transport(self, statuses, backoff):
+        responses = iter(statuses)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            status_code, headers = next(responses)
+            return httpx.Response(status_code, headers=headers)
+
+        transport = BackoffTransport(backoff, max_attempts=3)
+        transport._transport = httpx.MockTransport(handler)
+        return transport, requests
+
+    def test_retries_throttled_responses(self):
+        backoff = AdaptiveBackoff(initial=0.01)
+        transport, requests = self.make_transport(
+            [(429, {"Retry-After": "0"}), (503, {}), (200, {})], backoff
+        )
+
+        with httpx.Client(transport=transport) as client:
+            response = client.get("https://proxy.example.com/sync/default")
+
+        assert response.status_code == 200
+        assert len(requests) == 3
+        # Success halves the shared delay again
+        assert backoff.delay == 0.01
+
+    def test_gives_up_after_max_attempts(self):
+        backoff = AdaptiveBackoff(initial=0.01)
+        transport, requests = self.make_transport([(500, {})] * 3, backoff)
+
+        with httpx.Client(transport=transport) as client:
+            response = client.get("https://proxy.example.com/sync/default")
+
+        assert response.status_code == 500
+        assert len(requests) == 3
+
+    def test_client_errors_are_not_retried(self):
+        backoff = AdaptiveBackoff(initial=0.01)
+        transport, requests = self.make_transport([(412, {})], backoff)
+
+        with httpx.Client(transport=transport) as client:
+            response = client.get("https://proxy.example.com/sync/default")
+
+        assert response.status_code == 412
+        assert len(requests) == 1
+        assert backoff.delay == 0.0
+
+    def test_unconditional_writes_are_not_retried_on_server_errors(self):
+        backoff = AdaptiveBackoff(initial=0.01)
+        transport, requests = self.make_transport([(503, {}), (200, {})], backoff)
+
+        with httpx.Client(transport=transport) as client:
+            response = client.patch("https://proxy.example.com/a/blob/b", content=b"x")
+
+        assert response.status_code == 503
+        assert len(requests) == 1
+
+    def test_conditional_writes_are_retried(self):
+        backoff = AdaptiveBackoff(initial=0.01)
+        transport, requests = self.make_transport([(503, {}), (200, {})], backoff)
+
+        with httpx.Client(transport=transport) as client:
+            response = client.patch(
+                "https://proxy.example.com/a/blob/b",
+                content=b"x",
+                headers={"X-Append-Offset": "0", "X-Prefix-MD5": "d41d8"},
+            )
+
+        assert response.status_code == 200
+        assert len(requests) == 2
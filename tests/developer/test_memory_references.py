@@ -187,6 +187,15 @@ class TestRenderContent:
         assert "# Persona" in result
         assert "# End" in result
 
+    def test_dependencies_collected(self, memory_dir):
+        """Every referenced path, nested or missing, is reported."""
+        _write_entry(memory_dir, "a", "A\n@b")
+        _write_entry(memory_dir, "b", "B")
+        mgr = MemoryManager(base_dir=memory_dir)
+        dependencies = set()
+        mgr.render_content("@a\n@missing", dependencies=dependencies)
+        assert dependencies == {"a", "b", "missing"}
+
 
 class TestRenderEntry:
     """Tests for MemoryManager.render_entry()."""
@@ -293,3 +302,31 @@ class TestPersonaIntegration:
 
         result = _load_persona_from_disk(mock_context)
         assert "<!-- @missing/entry: not found -->" in result["text"]
+
+    def test_persona_rerendered_when_reference_changes(self, tmp_path):
+        """The cached persona section follows persona.md and its references."""
+        from silica.developer.prompt import _load_persona_from_disk
+
+        persona_dir = tmp_path / "test_persona"
+        persona_dir.mkdir()
+        persona_file = persona_dir / "persona.md"
+        persona_file.write_text("# Persona\n@notes")
+        memory_dir = persona_dir / "memory"
+        memory_dir.mkdir()
+        _write_entry(memory_dir, "notes", "first")
+
+        mock_context = Mock()
+        mock_context.history_base_dir = persona_dir
+        mock_context.memory_manager = MemoryManager(base_dir=memory_dir)
+
+        first = _load_persona_from_disk(mock_context)
+        assert "first" in first["text"]
+        # Callers may mark the section; the cached copy stays clean
+        first["cache_control"] = {"type": "ephemeral"}
+        assert "cache_control" not in _load_persona_from_disk(mock_context)
+
+        _write_entry(memory_dir, "notes", "second entry")
+        assert "second entry" in _load_persona_from_disk(mock_context)["text"]
+
+        persona_file.write_text("# Renamed Persona\n@notes")
+        assert "Renamed Persona" in _load_persona_from_disk(mock_context)["text"]
@@ -40,6 +40,16 @@ def make_sync_index_response(files_list):
     )
 
 
+def make_metadata(md5, version=1000, is_deleted=False):
+    return FileMetadata(
+        md5=md5,
+        last_modified=datetime.now(timezone.utc),
+        size=10,
+        version=version,
+        is_deleted=is_deleted,
+    )
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for testing."""
@@ -198,6 +208,76 @@ class TestLocalIndex:
         assert entry.md5 == "persist"
         assert entry.version == 1000
 
+    def test_save_appends_to_journal(self, local_index):
+        """Test saving a few changes appends them instead of rewriting."""
+        for i in range(10):
+            local_index.update_entry(f"file{i}.md", make_metadata(f"md5-{i}"))
+        local_index.save()
+        snapshot = local_index.index_file.read_bytes()
+        assert not local_index.journal_file.exists()
+
+        local_index.update_entry("file3.md", make_metadata("changed"))
+        local_index.remove_entry("file4.md")
+        local_index.save()
+
+        # Snapshot untouched; the journal holds just the changes
+        assert local_index.index_file.read_bytes() == snapshot
+        journal = local_index.journal_file.read_text().splitlines()
+        assert len(journal) == 3
+
+        entries = LocalIndex(local_index.index_file).load()
+        assert len(entries) == 9
+        assert entries["file3.md"].md5 == "changed"
+        assert "file4.md" not in entries
+
+    def test_save_without_changes_writes_nothing(self, local_index):
+        """Test saving an unchanged index does not touch disk."""
+        local_index.update_entry("file.md", make_metadata("abc"))
+        local_index.save()
+        local_index.save()
+
+        assert not local_index.journal_file.exists()
+
+    def test_direct_index_changes_are_saved(self, local_index):
+        """Test entries removed or replaced in the index dict are saved."""
+        local_index.update_entry("kept.md", make_metadata("abc"))
+        local_index.update_entry("dropped.md", make_metadata("def"))
+        local_index.save()
+
+        local_index._index.pop("dropped.md")
+        local_index._index["kept.md"] = make_metadata("changed")
+        local_index.save()
+
+        entries = LocalIndex(local_index.index_file).load()
+        assert set(entries) == {"kept.md"}
+        assert entries["kept.md"].md5 == "changed"
+
+    def test_journal_is_compacted(self, local_index, monkeypatch):
+        """Test the journal is folded into the snapshot once it grows."""
+        monkeypatch.setattr(LocalIndex, "MIN_COMPACT_RECORDS", 4)
+        local_index.update_entry("file.md", make_metadata("v0"))
+        local_index.save()
+
+        for i in range(1, 4):
+            local_index.update_entry("file.md", make_metadata(f"v{i}"))
+            local_index.save()
+
+        assert not local_index.journal_file.exists()
+        assert LocalIndex(local_index.index_file).load()["file.md"].md5 == "v3"
+
+    def test_torn_journal_line_is_ignored(self, local_index):
+        """Test a partially written journal record does not break loading."""
+        local_index.update_entry("file.md", make_metadata("abc"))
+        local_index.save()
+        local_index.update_entry("other.md", make_metadata("def"))
+        local_index.save()
+        with open(local_index.journal_file, "a") as f:
+            f.write('{"path": "broken.md", "ent')
+
+        entries = LocalIndex(local_index.index_file).load()
+
+        assert set(entries) == {"file.md", "other.md"}
+
 
 class TestSyncEngine:
     """Tests for SyncEngine class."""
@@ -751,3 +831,91 @@ class TestDataModels:
         # Empty result should return 100%
         empty_result = SyncResult()
         assert empty_result.success_rate == 100.0
+
+
+class TestRemoteIndexDelta:
+    """Tests for fetching only remote index changes."""
+
+    @pytest.fixture
+    def sync_engine(self, temp_dir):
+        from unittest.mock import MagicMock
+
+        from silica.developer.memory.sync_config import SyncConfig
+
+        config = SyncConfig(
+            namespace="test-persona",
+            scan_paths=[temp_dir / "memory"],
+            index_file=temp_dir / ".sync-index.json",
+            base_dir=temp_dir,
+        )
+        return SyncEngine(client=MagicMock(spec=MemoryProxyClient), config=config)
+
+    def test_delta_is_merged_into_cached_manifest(self, sync_engine):
+        client = sync_engine.client
+        client.get_sync_index.return_value = SyncIndexResponse(
+            files={"a.md": make_metadata("a"), "b.md": make_metadata("b")},
+            index_last_modified=datetime.now(timezone.utc),
+            index_version=100,
+        )
+        plan = sync_engine.analyze_sync_operations()
+        assert client.get_sync_index.call_args.kwargs["since"] is None
+        assert len(plan.download) == 2
+
+        client.get_sync_index.return_value = SyncIndexResponse(
+            files={"b.md": make_metadata("b", version=2000, is_deleted=True)},
+            index_last_modified=datetime.now(timezone.utc),
+            index_version=200,
+            since=100,
+        )
+        plan = sync_engine.analyze_sync_operations()
+
+        assert client.get_sync_index.call_args.kwargs["since"] == 100
+        # a.md comes from the cached manifest even though the delta omits it
+        assert [op.path for op in plan.download] == ["a.md"]
+        assert sync_engine.remote_index.remote_index_version == 200
+
+    def test_full_response_replaces_cache(self, sync_engine):
+        client = sync_engine.client
+        client.get_sync_index.return_value = SyncIndexResponse(
+            files={"a.md": make_metadata("a")},
+            index_last_modified=datetime.now(timezone.utc),
+            index_version=100,
+        )
+        sync_engine.analyze_sync_operations()
+
+        client.get_sync_index.return_value = SyncIndexResponse(
+            files={"b.md": make_metadata("b")},
+            index_last_modified=datetime.now(timezone.utc),
+            index_version=5,
+        )
+        plan = sync_engine.analyze_sync_operations()
+
+        assert [op.path for op in plan.download] == ["b.md"]
+
+    def test_upload_records_only_its_entry(self, sync_engine, temp_dir):
+        memory_dir = temp_dir / "memory"
+        memory_dir.mkdir()
+        (memory_dir / "new.md").write_text("content")
+        sync_engine.client.get_sync_index.return_value = SyncIndexResponse(
+            files={},
+            index_last_modified=datetime.now(timezone.utc),
+            index_version=0,
+        )
+        sync_engine.analyze_sync_operations()
+        sync_engine.client.write_blob.return_value = (
+            True,
+            "md5-new",
+            3000,
+            SyncIndexResponse(
+                files={"new.md": make_metadata("md5-new", version=3000)},
+                index_last_modified=datetime.now(timezone.utc),
+                index_version=3000,
+            ),
+        )
+
+        assert sync_engine.upload_file("new.md", 0)
+
+        assert set(sync_engine.local_index.get_all_entries()) == {"new.md"}
+        assert sync_engine.remote_index.get_entry("new.md").version == 3000
+        # Our own write does not advance the change-feed cursor
+        assert sync_engine.remote_index.remote_index_version == 0
@@ -9,6 +9,7 @@ These tests:
 6. Verify end-to-end sync workflows
 """
 
+import gzip
 import os
 import sys
 import tempfile
@@ -511,3 +512,122 @@ class TestEndToEndSync:
         assert index_entry is not None
         assert index_entry.md5 is not None
         assert index_entry.size > 0
+
+
+class TestAppendSync:
+    """Tests for syncing append-only files by segment."""
+
+    @pytest.fixture
+    def history_config(self, temp_persona_dir):
+        from silica.developer.memory.sync_config import SyncConfig
+
+        def make(name):
+            return SyncConfig(
+                namespace="test-persona/history",
+                scan_paths=[temp_persona_dir / name],
+                index_file=temp_persona_dir / name / ".sync-index-history.json",
+                base_dir=temp_persona_dir,
+                compress=True,
+            )
+
+        return make
+
+    @staticmethod
+    def sync(engine):
+        plan = engine.analyze_sync_operations()
+        result = engine.execute_sync(plan, show_progress=False)
+        assert not result.failed
+        return plan
+
+    def test_appended_history_is_uploaded_as_segment(
+        self, proxy_client, temp_persona_dir, history_config
+    ):
+        from silica.developer.memory.sync import SyncEngine
+
+        writer_dir = temp_persona_dir / "writer"
+        writer_dir.mkdir()
+        history = writer_dir / "root.history.jsonl"
+        lines = [f'{{"role": "user", "content": "message {i}"}}\n' for i in range(500)]
+        history.write_text("".join(lines))
+        writer = SyncEngine(client=proxy_client, config=history_config("writer"))
+        self.sync(writer)
+
+        # Append a few lines; only they are sent
+        with open(history, "a") as f:
+            f.write('{"role": "assistant", "content": "new"}\n')
+        sent = []
+        original_append = proxy_client.append_blob
+
+        def recording_append(**kwargs):
+            sent.append(kwargs["segment"])
+            return original_append(**kwargs)
+
+        proxy_client.append_blob = recording_append
+        proxy_client.write_blob = None  # A full upload would fail the test
+        plan = self.sync(writer)
+
+        assert [op.path for op in plan.upload] == ["root.history.jsonl"]
+        assert len(sent) == 1
+        assert gzip.decompress(sent[0]) == b'{"role": "assistant", "content": "new"}\n'
+        # Unchanged afterwards
+        assert writer.analyze_sync_operations().total_operations == 0
+
+        content, *_ = proxy_client.read_blob(
+            "test-persona/history", "root.history.jsonl.gz"
+        )
+        assert gzip.decompress(content) == history.read_bytes()
+
+    def test_reader_fetches_only_missing_tail(
+        self, proxy_client, temp_persona_dir, history_config
+    ):
+        from silica.developer.memory.sync import SyncEngine
+
+        for name in ("writer", "reader"):
+            (temp_persona_dir / name).mkdir()
+        history = temp_persona_dir / "writer" / "root.metadata.jsonl"
+        history.write_text("".join(f'{{"turn": {i}}}\n' for i in range(200)))
+        writer = SyncEngine(client=proxy_client, config=history_config("writer"))
+        reader = SyncEngine(client=proxy_client, config=history_config("reader"))
+        self.sync(writer)
+        self.sync(reader)
+
+        with open(history, "a") as f:
+            f.write('{"turn": 200}\n')
+        self.sync(writer)
+
+        fetched = []
+        original_read_after = proxy_client.read_blob_after
+
+        def recording_read_after(**kwargs):
+            result = original_read_after(**kwargs)
+            fetched.append((result[0], result[5]))
+            return result
+
+        proxy_client.read_blob_after = recording_read_after
+        self.sync(reader)
+
+        assert len(fetched) == 1
+        tail, offset = fetched[0]
+        assert offset > 0
+        assert gzip.decompress(tail) == b'{"turn": 200}\n'
+        mirrored = temp_persona_dir / "reader" / "root.metadata.jsonl"
+        assert mirrored.read_bytes() == history.read_bytes()
+        assert reader.analyze_sync_operations().total_operations == 0
+
+    def test_rewritten_file_is_uploaded_whole(
+        self, proxy_client, temp_persona_dir, history_config
+    ):
+        from silica.developer.memory.sync import SyncEngine
+
+        (temp_persona_dir / "writer").mkdir()
+        session = temp_persona_dir / "writer" / "session.json"
+        session.write_text('{"title": "first"}' * 50)
+        writer = SyncEngine(client=proxy_client, config=history_config("writer"))
+        self.sync(writer)
+
+        session.write_text('{"title": "second"}' * 60)
+        proxy_client.append_blob = None  # Must not be used
+        self.sync(writer)
+
+        content, *_ = proxy_client.read_blob("test-persona/history", "session.json.gz")
+        assert gzip.decompress(content) == session.read_bytes()
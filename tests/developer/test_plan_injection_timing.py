@@ -139,7 +139,7 @@ class TestPlanContinuationLoop:
         import inspect
         from silica.developer import agent_loop
 
-        source = inspect.getsource(agent_loop.run)
+        source = inspect.getsource(agent_loop._run)
 
         # Check that skip_user_input is defined and used
         assert "skip_user_input = False" in source
@@ -151,7 +151,7 @@ class TestPlanContinuationLoop:
         import inspect
         from silica.developer import agent_loop
 
-        source = inspect.getsource(agent_loop.run)
+        source = inspect.getsource(agent_loop._run)
 
         # Find the plan reminder injection section
         assert "_should_inject_plan_reminder" in source
@@ -175,7 +175,7 @@ class TestPlanContinuationLoop:
         import inspect
         from silica.developer import agent_loop
 
-        source = inspect.getsource(agent_loop.run)
+        source = inspect.getsource(agent_loop._run)
 
         # Verify that skip_user_input is reset in the elif branch
         # that handles existing user messages
@@ -121,6 +121,40 @@ file1.txt
             sandbox_section,
         )
 
+    def test_sandbox_section_is_last_and_stable(self):
+        import tempfile
+        from pathlib import Path
+
+        from silica.developer.memory import MemoryManager
+        from silica.developer.sandbox import Sandbox, SandboxMode
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "project").mkdir()
+            (root / "project" / "main.py").write_text("print()")
+            memory_dir = root / "memory"
+            memory_dir.mkdir()
+
+            mock_agent_context = MagicMock()
+            mock_agent_context.history_base_dir = None
+            mock_agent_context.sandbox = Sandbox(
+                str(root / "project"), SandboxMode.ALLOW_ALL
+            )
+            mock_agent_context.memory_manager = MemoryManager(base_dir=memory_dir)
+
+            first = create_system_message(mock_agent_context)
+            second = create_system_message(mock_agent_context)
+
+            self.assertIn("<sandbox_contents>", first[-1]["text"])
+            self.assertEqual(first, second)
+            # cache_control is set on a copy, not on the memoized section
+            self.assertNotIn("cache_control", first[-2])
+
+            mock_agent_context.sandbox.create_file("new.py")
+            third = create_system_message(mock_agent_context)
+            self.assertIn("new.py", third[-1]["text"])
+            self.assertEqual(first[:-1], third[:-1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,32 @@
+import asyncio
+import signal
+import subprocess
+import sys
+import time
 import unittest
 from unittest.mock import MagicMock
-from silica.developer.tools.repl import python_repl
+from silica.developer.tools.repl import python_repl as _python_repl
+from silica.developer.tools.python_worker import (
+    PythonWorker,
+    get_python_worker_manager,
+    release_python_worker,
+)
+from silica.developer.tools.repl import python_repl_reset
+
+
+def python_repl(context, code, **kwargs):
+    return asyncio.run(_python_repl(context, code, **kwargs))
 
 
 class TestPythonREPL(unittest.TestCase):
     def setUp(self):
         # Create a mock context that can be passed to the tool
         self.mock_context = MagicMock()
+        self.mock_context.session_id = f"repl-test-{id(self)}"
+        self.mock_context.parent_session_id = None
+
+    def tearDown(self):
+        python_repl_reset(self.mock_context)
 
     def test_basic_execution(self):
         """Test simple Python code execution"""
@@ -93,6 +113,143 @@ print(re.match(r'\\d+', '123abc').group())
         result = python_repl(self.mock_context, code)
         self.assertIn("restricted for security reasons", result)
 
+    def test_state_persists_between_calls(self):
+        """Variables and functions survive across calls until reset"""
+        python_repl(self.mock_context, "import statistics\ndata = [3, 1, 2]")
+        result = python_repl(self.mock_context, "print(statistics.median(data))")
+        self.assertIn("2", result)
+
+        python_repl_reset(self.mock_context)
+        result = python_repl(self.mock_context, "print(data)")
+        self.assertIn("NameError", result)
+
+    def test_timeout_interrupts_but_keeps_state(self):
+        """A wall-clock timeout interrupts the code without losing variables"""
+        python_repl(self.mock_context, "x = 42")
+        result = python_repl(self.mock_context, "while True: pass", timeout=1)
+        self.assertIn("timed out", result)
+        self.assertNotIn("restarted", result)
+        self.assertIn("42", python_repl(self.mock_context, "print(x)"))
+
+    def test_output_before_error_is_kept(self):
+        """Output printed before an exception is still returned"""
+        result = python_repl(self.mock_context, "print('partial')\n1/0")
+        self.assertIn("partial", result)
+        self.assertIn("ZeroDivisionError", result)
+
+    def test_disallowed_import_at_runtime(self):
+        """Imports outside the allow list fail inside the worker"""
+        result = python_repl(self.mock_context, "import pathlib")
+        self.assertIn("not allowed", result)
+
+    def test_memory_limit(self):
+        """Allocations beyond the worker's memory limit fail"""
+        result = python_repl(self.mock_context, "x = bytearray(4 * 1024 ** 3)")
+        self.assertIn("MemoryError", result)
+
+
+class TestPythonWorker(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.worker = PythonWorker()
+
+    async def asyncTearDown(self):
+        self.worker.shutdown()
+
+    async def test_output_is_streamed(self):
+        """Printed lines arrive while the code is still running"""
+        chunks = []
+        code = "import time\nfor i in range(3):\n    print(i)\n    time.sleep(0.3)"
+        result = await self.worker.execute(
+            code, on_output=lambda name, text: chunks.append(text)
+        )
+        self.assertTrue(result.ok)
+        self.assertEqual(chunks, ["0\n", "1\n", "2\n"])
+
+    async def test_cancel_interrupts_and_keeps_state(self):
+        """Cancelling a call interrupts the code; the namespace survives"""
+        await self.worker.execute("x = 1")
+        task = asyncio.create_task(self.worker.execute("while True: pass"))
+        await asyncio.sleep(0.3)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        chunks = []
+        result = await self.worker.execute(
+            "print(x)", on_output=lambda name, text: chunks.append(text)
+        )
+        self.assertTrue(result.ok)
+        self.assertFalse(result.state_lost)
+        self.assertEqual(chunks, ["1\n"])
+
+    async def test_cpu_limit(self):
+        """Code exceeding its CPU budget is stopped"""
+        self.worker.cpu_seconds = 1
+        result = await self.worker.execute("while True: pass", timeout=10)
+        self.assertIn("CPUTimeExceeded", result.error)
+
+    async def test_calls_are_serialized(self):
+        """A second call waits for the first instead of interleaving"""
+        chunks = []
+        record = lambda name, text: chunks.append(text)  # noqa: E731
+        first = asyncio.create_task(
+            self.worker.execute(
+                "import time\nprint('a')\ntime.sleep(0.3)\nprint('b')",
+                on_output=record,
+            )
+        )
+        await asyncio.sleep(0)
+        second = asyncio.create_task(
+            self.worker.execute("print('c')", on_output=record)
+        )
+        await asyncio.sleep(0.1)
+        self.assertTrue(self.worker.busy)
+        await asyncio.gather(first, second)
+        self.assertFalse(self.worker.busy)
+        self.assertEqual(chunks, ["a\n", "b\n", "c\n"])
+
+    async def test_shutdown_does_not_block(self):
+        """shutdown returns at once; a worker ignoring SIGTERM is killed"""
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import signal, time\n"
+                "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+                "print('ready', flush=True)\n"
+                "time.sleep(60)",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        self.assertEqual(process.stdout.readline(), "ready\n")
+        self.worker._process = process
+
+        started = time.monotonic()
+        self.worker.shutdown()
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertFalse(self.worker.alive)
+        self.assertIsNone(process.poll())  # Still ignoring SIGTERM
+
+        returncode = await asyncio.to_thread(process.wait, 5)
+        self.assertEqual(returncode, -signal.SIGKILL)
+        process.stdout.close()
+
+
+class TestSubagentWorkers(unittest.TestCase):
+    def test_release_stops_the_session_worker(self):
+        context = MagicMock()
+        context.session_id = f"subagent-{id(self)}"
+        context.parent_session_id = "parent"
+        python_repl(context, "x = 1")
+        worker = get_python_worker_manager().workers[context.session_id]
+
+        release_python_worker(context.session_id)
+
+        self.assertNotIn(context.session_id, get_python_worker_manager().workers)
+        self.assertFalse(worker.alive)
+
 
 if __name__ == "__main__":
     unittest.main()
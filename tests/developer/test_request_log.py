@@ -0,0 +1,153 @@
+"""Tests for the compressed, content-addressed request log."""
+
+import gzip
+import json
+
+from silica.developer.request_log import (
+    ContentAddressedLogWriter,
+    log_files,
+    main,
+    read_log,
+    read_log_file,
+    rotated_path,
+)
+from silica.developer.request_logger import RequestResponseLogger
+
+SYSTEM = [{"type": "text", "text": "You are a helpful assistant"}]
+TOOLS = [{"name": "read_file", "input_schema": {"type": "object"}}]
+
+
+def conversation(turns):
+    messages = []
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"question {i} " + "x" * 500})
+        messages.append(
+            {"role": "assistant", "content": [{"type": "text", "text": f"answer {i}"}]}
+        )
+    return messages
+
+
+def log_conversation(logger, turns):
+    requests = []
+    for turn in range(1, turns + 1):
+        messages = conversation(turn)
+        logger.log_request(
+            messages=messages,
+            system_message=SYSTEM,
+            model="claude-sonnet-4",
+            max_tokens=1024,
+            tools=TOOLS,
+        )
+        requests.append(messages)
+    return requests
+
+
+def raw_records(path):
+    with gzip.open(path, "rt") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestContentAddressedLog:
+    def test_roundtrip_reconstructs_requests(self, tmp_path):
+        path = tmp_path / "requests.jsonl.gz"
+        logger = RequestResponseLogger(str(path))
+        requests = log_conversation(logger, 3)
+        logger.log_error("TestError", "boom", {"attempt": 1})
+        logger.close()
+
+        entries = list(read_log(path))
+
+        assert [e["type"] for e in entries] == ["request"] * 3 + ["error"]
+        for entry, messages in zip(entries, requests):
+            assert entry["messages"] == messages
+            assert entry["system"] == SYSTEM
+            assert entry["tools"] == TOOLS
+        assert entries[-1]["error_message"] == "boom"
+
+    def test_blocks_stored_once(self, tmp_path):
+        path = tmp_path / "requests.jsonl.gz"
+        logger = RequestResponseLogger(str(path))
+        log_conversation(logger, 10)
+        logger.close()
+
+        blocks = [r for r in raw_records(path) if r["type"] == "block"]
+        # 10 user messages, 10 assistant blocks, one system block, one tool
+        assert len(blocks) == 22
+        assert len({b["hash"] for b in blocks}) == len(blocks)
+
+    def test_readable_without_close(self, tmp_path):
+        path = tmp_path / "requests.jsonl.gz"
+        logger = RequestResponseLogger(str(path))
+        log_conversation(logger, 2)
+
+        # Sync-flushed but unterminated gzip member, as after a crash
+        assert len(list(read_log(path))) == 2
+
+    def test_appends_across_writers(self, tmp_path):
+        path = tmp_path / "requests.jsonl.gz"
+        for _ in range(2):
+            logger = RequestResponseLogger(str(path))
+            log_conversation(logger, 1)
+            logger.close()
+
+        entries = list(read_log(path))
+        assert len(entries) == 2
+        assert entries[1]["messages"] == conversation(1)
+
+    def test_appends_after_unterminated_member(self, tmp_path):
+        path = tmp_path / "requests.jsonl.gz"
+        logger = RequestResponseLogger(str(path))
+        log_conversation(logger, 2)
+        torn = path.read_bytes()
+        logger.close()
+        # A run that died without closing, followed by a new run
+        path.write_bytes(torn)
+        logger = RequestResponseLogger(str(path))
+        log_conversation(logger, 1)
+        logger.close()
+
+        entries = list(read_log(path))
+
+        assert [e["messages"] for e in entries] == [
+            conversation(1),
+            conversation(2),
+            conversation(1),
+        ]
+
+    def test_rotation_keeps_files_self_contained(self, tmp_path):
+        path = tmp_path / "requests.jsonl.gz"
+        writer = ContentAddressedLogWriter(path, max_bytes=1, backup_count=2)
+        for i in range(4):
+            writer.write(
+                {"type": "request", "messages": conversation(1), "system": SYSTEM}
+            )
+        writer.close()
+
+        assert log_files(path, backup_count=2) == [
+            rotated_path(path, 2),
+            rotated_path(path, 1),
+        ]
+        assert rotated_path(path, 1).name == "requests.1.jsonl.gz"
+        for log_file in log_files(path, backup_count=2):
+            [entry] = read_log_file(log_file)
+            assert entry["messages"] == conversation(1)
+
+    def test_reads_plain_logs(self, tmp_path):
+        path = tmp_path / "requests.jsonl"
+        logger = RequestResponseLogger(str(path))
+        requests = log_conversation(logger, 2)
+        logger.close()
+
+        assert [e["messages"] for e in read_log(path)] == requests
+
+
+def test_cli_prints_selected_entry(tmp_path, capsys):
+    path = tmp_path / "requests.jsonl.gz"
+    logger = RequestResponseLogger(str(path))
+    requests = log_conversation(logger, 3)
+    logger.close()
+
+    assert main([str(path), "--type", "request", "--index", "-1"]) == 0
+
+    [line] = capsys.readouterr().out.splitlines()
+    assert json.loads(line)["messages"] == requests[-1]
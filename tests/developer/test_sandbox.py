@@ -173,3 +173,32 @@ def test_get_directory_listing_follows_symlinks(temp_dir):
         import shutil
 
         shutil.rmtree(external_dir)
+
+
+def test_get_directory_listing_cache(temp_dir):
+    from unittest import mock
+
+    sandbox = Sandbox(temp_dir, SandboxMode.ALLOW_ALL)
+    os.makedirs(os.path.join(temp_dir, "sub"))
+    with open(os.path.join(temp_dir, "sub/a.py"), "w") as f:
+        f.write("a")
+    # Recently modified directories are never trusted from the cache
+    for directory in (temp_dir, os.path.join(temp_dir, "sub")):
+        os.utime(directory, ns=(1_000_000_000, 1_000_000_000))
+
+    with mock.patch.object(
+        sandbox, "_walk_directory", wraps=sandbox._walk_directory
+    ) as walk:
+        assert sandbox.get_directory_listing() == ["sub/a.py"]
+        assert sandbox.get_directory_listing() == ["sub/a.py"]
+        assert walk.call_count == 1
+
+        # A file added outside the sandbox API changes the directory mtime
+        with open(os.path.join(temp_dir, "sub/b.py"), "w") as f:
+            f.write("b")
+        assert sorted(sandbox.get_directory_listing()) == ["sub/a.py", "sub/b.py"]
+        assert walk.call_count == 2
+
+        sandbox.create_file("c.py")
+        assert "c.py" in sandbox.get_directory_listing()
+        assert walk.call_count == 3
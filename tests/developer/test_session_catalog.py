@@ -0,0 +1,141 @@
+"""Tests for the persona-level session catalog."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from silica.developer.context import AgentContext
+from silica.developer.sandbox import SandboxMode
+from silica.developer.session_catalog import (
+    CATALOG_FILENAME,
+    COMPACT_SLACK,
+    SessionCatalog,
+)
+from silica.developer.session_store import SessionStore
+from silica.developer.tools.sessions import list_sessions
+
+MODEL_SPEC = {
+    "title": "claude-sonnet-4-20250514",
+    "pricing": {"input": 3.0, "output": 15.0},
+    "cache_pricing": {"write": 3.75, "read": 0.30},
+    "max_tokens": 8192,
+}
+
+
+def write_session(history_dir, session_id, root_dir="/project", messages=None):
+    store = SessionStore(history_dir / session_id)
+    store.write_session_meta(
+        {"session_id": session_id, "root_dir": root_dir, "model_spec": MODEL_SPEC}
+    )
+    store.write_context(messages or [{"role": "user", "content": "Hello"}])
+
+
+def make_context(persona_dir, session_id="s1"):
+    return AgentContext.create(
+        model_spec=MODEL_SPEC,
+        sandbox_mode=SandboxMode.ALLOW_ALL,
+        sandbox_contents=[],
+        user_interface=MagicMock(),
+        session_id=session_id,
+        persona_base_directory=persona_dir,
+    )
+
+
+class TestSessionCatalog:
+    def test_rebuilds_when_missing(self, tmp_path):
+        write_session(tmp_path, "a")
+        write_session(tmp_path, "b", root_dir="/other")
+
+        sessions = SessionCatalog(tmp_path).sessions()
+
+        assert sorted(s["session_id"] for s in sessions) == ["a", "b"]
+        assert (tmp_path / CATALOG_FILENAME).exists()
+        assert sessions[0]["first_message"] == "Hello"
+        assert sessions[0]["model"] == MODEL_SPEC["title"]
+
+    def test_reads_only_the_catalog_when_fresh(self, tmp_path):
+        for i in range(3):
+            write_session(tmp_path, f"s{i}")
+        catalog = SessionCatalog(tmp_path)
+        catalog.sessions()
+
+        with patch(
+            "silica.developer.session_catalog.read_session_summary"
+        ) as read_summary:
+            assert len(catalog.sessions()) == 3
+            read_summary.assert_not_called()
+
+    def test_stale_session_is_reread(self, tmp_path):
+        write_session(tmp_path, "a")
+        catalog = SessionCatalog(tmp_path)
+        catalog.sessions()
+
+        # Written behind the catalog's back (e.g. by history sync)
+        write_session(
+            tmp_path,
+            "a",
+            messages=[
+                {"role": "user", "content": "Changed"},
+                {"role": "assistant", "content": "Ok"},
+            ],
+        )
+
+        [session] = catalog.sessions()
+        assert session["first_message"] == "Changed"
+        assert session["message_count"] == 2
+
+    def test_deleted_sessions_are_dropped(self, tmp_path):
+        write_session(tmp_path, "a")
+        write_session(tmp_path, "b")
+        catalog = SessionCatalog(tmp_path)
+        catalog.sessions()
+
+        (tmp_path / "b" / "session.json").unlink()
+
+        assert [s["session_id"] for s in catalog.sessions()] == ["a"]
+
+    def test_compacts_superseded_records(self, tmp_path):
+        write_session(tmp_path, "a")
+        catalog = SessionCatalog(tmp_path)
+        summary = catalog.sessions()[0]
+        for _ in range(COMPACT_SLACK + 1):
+            catalog.record(tmp_path / "a", summary)
+
+        catalog.sessions()
+
+        assert len(catalog.path.read_text().splitlines()) == 1
+
+    def test_corrupt_catalog_is_repaired(self, tmp_path):
+        write_session(tmp_path, "a")
+        (tmp_path / CATALOG_FILENAME).write_text('{"dir": "a", "sig\n')
+
+        assert [s["session_id"] for s in SessionCatalog(tmp_path).sessions()] == ["a"]
+
+
+class TestFlushUpdatesCatalog:
+    def test_flush_records_summary(self, tmp_path):
+        context = make_context(tmp_path)
+        context.flush([{"role": "user", "content": "Fix the build"}])
+
+        history_dir = tmp_path / "history"
+        records = [
+            json.loads(line)
+            for line in (history_dir / CATALOG_FILENAME).read_text().splitlines()
+        ]
+        assert records[-1]["session_id"] == "s1"
+        assert records[-1]["first_message"] == "Fix the build"
+        assert records[-1]["message_count"] == 1
+
+        with patch(
+            "silica.developer.session_catalog.read_session_summary"
+        ) as read_summary:
+            [session] = list_sessions(history_base_dir=tmp_path)
+            read_summary.assert_not_called()
+        assert session["session_id"] == "s1"
+
+    def test_list_sessions_filters_by_root_dir(self, tmp_path):
+        write_session(tmp_path / "history", "a", root_dir="/project")
+        write_session(tmp_path / "history", "b", root_dir="/other")
+
+        sessions = list_sessions(workdir="/project/", history_base_dir=tmp_path)
+
+        assert [s["session_id"] for s in sessions] == ["a"]
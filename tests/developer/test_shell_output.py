@@ -0,0 +1,152 @@
+"""Tests for bounded shell output capture and spilled-output paging."""
+
+import asyncio
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from silica.developer.context import AgentContext
+from silica.developer.sandbox import SandboxMode
+from silica.developer.tools.shell import (
+    _run_shell_command_with_interactive_timeout,
+    shell_output_read,
+)
+from silica.developer.tools.shell_output import (
+    OutputCapture,
+    output_dir,
+    prune_outputs,
+    read_spilled_output,
+)
+
+
+@pytest.fixture
+def context(tmp_path):
+    return AgentContext.create(
+        model_spec={},
+        sandbox_mode=SandboxMode.ALLOW_ALL,
+        sandbox_contents=[],
+        user_interface=MagicMock(),
+        persona_base_directory=tmp_path,
+    )
+
+
+def handle_of(result):
+    return re.search(r"Output handle: (sh-[0-9a-f]{8})", result).group(1)
+
+
+class TestOutputCapture:
+    def test_small_output_stays_in_memory(self, tmp_path):
+        capture = OutputCapture(tmp_path / "out", head_chars=10, tail_chars=10)
+        capture.write("hello\n")
+
+        assert capture.text("sh-00000000", "stdout") == "hello\n"
+        assert not capture.spilled
+        assert not (tmp_path / "out").exists()
+
+    def test_large_output_keeps_head_and_tail(self, tmp_path):
+        capture = OutputCapture(tmp_path / "out", head_chars=20, tail_chars=20)
+        lines = [f"line {i}\n" for i in range(1000)]
+        for line in lines:
+            capture.write(line)
+        capture.close()
+
+        text = capture.text("sh-00000000", "stdout")
+        assert text.startswith("line 0\nline 1\n")
+        assert text.endswith("line 998\nline 999\n")
+        assert 'shell_output_read(handle="sh-00000000"' in text
+        assert "1,000 lines" in text
+        assert (tmp_path / "out").read_text() == "".join(lines)
+
+    def test_chunk_larger_than_tail(self, tmp_path):
+        capture = OutputCapture(tmp_path / "out", head_chars=4, tail_chars=4)
+        capture.write("a" * 4 + "b" * 100 + "c" * 4)
+
+        assert capture.tail(4) == "cccc"
+        assert capture._tail_len == 4
+
+
+class TestReadSpilledOutput:
+    @pytest.fixture
+    def spilled(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("tempfile.gettempdir", lambda: str(tmp_path))
+        path = output_dir("session") / "sh-0123abcd.stdout"
+        path.parent.mkdir(parents=True)
+        path.write_text("".join(f"line {i}\n" for i in range(1, 101)))
+        return path
+
+    def test_pages_from_start_and_end(self, spilled):
+        page = read_spilled_output("session", "sh-0123abcd", start_line=10, lines=2)
+        assert page.splitlines() == [
+            "sh-0123abcd stdout: lines 10-11 of 100",
+            "10: line 10",
+            "11: line 11",
+        ]
+
+        last = read_spilled_output("session", "sh-0123abcd", start_line=-2)
+        assert last.splitlines()[1:] == ["99: line 99", "100: line 100"]
+
+    def test_grep(self, spilled):
+        result = read_spilled_output(
+            "session", "sh-0123abcd", pattern=r"line 5\d$", lines=3
+        )
+        assert "10 line(s) matching" in result
+        assert result.splitlines()[1:] == ["50: line 50", "51: line 51", "52: line 52"]
+
+    def test_rejects_bad_handles(self, spilled):
+        assert "Invalid output handle" in read_spilled_output("session", "../etc")
+        assert "No spilled output" in read_spilled_output("session", "sh-ffffffff")
+        assert "No stderr" in read_spilled_output(
+            "session", "sh-0123abcd", stream="stderr"
+        )
+
+    def test_prune_keeps_latest(self, spilled):
+        directory = spilled.parent
+        for i in range(5):
+            (directory / f"sh-0000000{i}.stdout").write_text("x")
+
+        prune_outputs(directory, keep=2)
+
+        assert len(list(directory.iterdir())) == 2
+
+
+class TestShellExecuteSpill:
+    async def test_large_output_is_spilled_and_readable(self, context):
+        result = await _run_shell_command_with_interactive_timeout(
+            context, "seq 1 200000", initial_timeout=30
+        )
+
+        assert "Exit code: 0" in result
+        assert len(result) < 100_000
+        handle = handle_of(result)
+
+        page = shell_output_read(context, handle, start_line=150000, lines=1)
+        assert page.splitlines()[1] == "150000: 150000"
+        matches = shell_output_read(context, handle, pattern="^19999[0-9]$")
+        assert "10 line(s) matching" in matches
+
+    async def test_small_output_has_no_handle(self, context):
+        result = await _run_shell_command_with_interactive_timeout(
+            context, "echo out; echo err >&2", initial_timeout=30
+        )
+
+        assert result == "Exit code: 0\nSTDOUT:\nout\n\nSTDERR:\nerr\n\n"
+
+    async def test_background_child_keeps_its_pipes(self, context, tmp_path):
+        marker = tmp_path / "alive"
+        command = (
+            f"(sleep 1.5; echo late; echo late >&2; touch {marker}) & echo started"
+        )
+
+        result = await _run_shell_command_with_interactive_timeout(
+            context, command, initial_timeout=30
+        )
+
+        assert result.startswith("Exit code: 0\nSTDOUT:\nstarted\n")
+        # The child writes to the inherited pipes after the shell returned;
+        # it would die of SIGPIPE if they had been closed
+        for _ in range(60):
+            if marker.exists():
+                break
+            await asyncio.sleep(0.05)
+        assert marker.exists()
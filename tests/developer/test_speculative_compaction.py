@@ -0,0 +1,201 @@
+"""Tests for compaction summarized in the background ahead of the threshold."""
+
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from silica.developer.compacter import (
+    CompactionSummary,
+    ConversationCompacter,
+    SpeculativeCompaction,
+)
+from silica.developer.context import AgentContext
+from silica.developer.memory import MemoryManager
+from silica.developer.sandbox import Sandbox, SandboxMode
+from tests.developer.conftest import MockAnthropicClient, MockUserInterface
+
+MODEL = "claude-opus-4-6"
+MODEL_SPEC = {
+    "title": MODEL,
+    "pricing": {"input": 3.00, "output": 15.00},
+    "cache_pricing": {"write": 3.75, "read": 0.30},
+    "max_tokens": 8192,
+    "context_window": 200000,
+}
+
+
+@pytest.fixture
+def test_dir():
+    d = tempfile.mkdtemp()
+    with mock.patch("pathlib.Path.home", return_value=Path(d)):
+        yield d
+    shutil.rmtree(d)
+
+
+def make_context(test_dir, turns=4):
+    context = AgentContext(
+        parent_session_id=None,
+        session_id="speculative-test",
+        model_spec=MODEL_SPEC,
+        sandbox=Sandbox(test_dir, mode=SandboxMode.ALLOW_ALL),
+        user_interface=MockUserInterface(),
+        usage=[],
+        memory_manager=MemoryManager(),
+        history_base_dir=Path(test_dir) / ".silica" / "personas" / "default",
+    )
+    for n in range(turns):
+        context.chat_history.append({"role": "user", "content": f"Q{n} " * 200})
+        context.chat_history.append({"role": "assistant", "content": f"A{n} " * 200})
+    context.chat_history.append({"role": "user", "content": "Next"})
+    return context
+
+
+def make_compacter(token_count, **kwargs):
+    client = MockAnthropicClient(
+        token_count=token_count, responses=["Guidance", "Background summary"]
+    )
+    compacter = ConversationCompacter(
+        client=client,
+        threshold_ratio=0.8,
+        speculative_threshold_ratio=0.6,
+        **kwargs,
+    )
+    compacter.model_context_windows = {MODEL: 100000}
+    return compacter
+
+
+def check(compacter, context, ui=None, **kwargs):
+    return compacter.check_and_apply_compaction(
+        context, MODEL, ui or MockUserInterface(), enable_compaction=True, **kwargs
+    )
+
+
+def summary(text="Prepared summary"):
+    return CompactionSummary(
+        original_message_count=3,
+        original_token_count=1000,
+        summary_token_count=10,
+        compaction_ratio=0.01,
+        summary=text,
+    )
+
+
+class TestSpeculativeCompaction:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("SILICA_COMPACTION_SPECULATIVE_THRESHOLD", raising=False)
+        compacter = ConversationCompacter(client=MockAnthropicClient())
+
+        assert compacter.speculative_threshold_ratio is None
+
+    def test_threshold_from_environment(self, monkeypatch):
+        monkeypatch.setenv("SILICA_COMPACTION_SPECULATIVE_THRESHOLD", "0.5")
+        compacter = ConversationCompacter(client=MockAnthropicClient())
+
+        assert compacter.speculative_threshold_ratio == 0.5
+
+    def test_threshold_above_compaction_threshold_is_disabled(self, monkeypatch):
+        monkeypatch.setenv("SILICA_COMPACTION_SPECULATIVE_THRESHOLD", "0.9")
+        compacter = ConversationCompacter(client=MockAnthropicClient())
+
+        assert compacter.speculative_threshold_ratio is None
+
+    def test_watermark_starts_background_summary_without_blocking(self, test_dir):
+        compacter = make_compacter(token_count=70000)
+        context = make_context(test_dir)
+        history = list(context.chat_history)
+
+        _, applied = check(compacter, context)
+
+        assert not applied
+        assert context.chat_history == history
+        speculative = context.speculative_compaction
+        assert speculative is not None
+        assert speculative.wait(5)
+        assert speculative.summary.summary == "Background summary"
+
+    def test_summary_is_swapped_in_at_next_turn_boundary(self, test_dir):
+        compacter = make_compacter(token_count=70000)
+        context = make_context(test_dir)
+        check(compacter, context)
+        context.speculative_compaction.wait(5)
+        prefix_len = len(context.speculative_compaction.prefix)
+
+        # The turn continued while the summary was being generated
+        context.chat_history.append({"role": "assistant", "content": "More"})
+        context.chat_history.append({"role": "user", "content": "Go on"})
+        kept = context.chat_history[prefix_len:]
+        ui = MockUserInterface()
+
+        _, applied = check(compacter, context, ui)
+
+        assert applied
+        assert context.speculative_compaction is None
+        assert "Background summary" in context.chat_history[0]["content"]
+        assert context.chat_history[1:] == kept
+        assert any("Compacted" in m for m in ui.system_messages)
+
+    def test_changed_prefix_is_discarded(self, test_dir):
+        compacter = make_compacter(token_count=10000)
+        context = make_context(test_dir)
+        speculative = SpeculativeCompaction(context.chat_history[:3], 2)
+        speculative.start(summary)
+        context.speculative_compaction = speculative
+        context.chat_history[1] = {"role": "assistant", "content": "edited"}
+        history = list(context.chat_history)
+
+        _, applied = check(compacter, context)
+
+        assert not applied
+        assert context.chat_history == history
+        assert context.speculative_compaction is None
+
+    def test_failed_summary_is_discarded(self, test_dir):
+        compacter = make_compacter(token_count=10000)
+        context = make_context(test_dir)
+
+        def fail():
+            raise RuntimeError("overloaded")
+
+        speculative = SpeculativeCompaction(context.chat_history[:3], 2)
+        speculative.start(fail)
+        context.speculative_compaction = speculative
+
+        _, applied = check(compacter, context)
+
+        assert not applied
+        assert isinstance(speculative.error, RuntimeError)
+        assert context.speculative_compaction is None
+
+    def test_running_summary_is_left_running_below_threshold(self, test_dir):
+        compacter = make_compacter(token_count=70000)
+        context = make_context(test_dir)
+        release = threading.Event()
+        speculative = SpeculativeCompaction(context.chat_history[:3], 2)
+        speculative.start(lambda: release.wait(5) and summary())
+        context.speculative_compaction = speculative
+
+        _, applied = check(compacter, context)
+        release.set()
+
+        assert not applied
+        assert context.speculative_compaction is speculative
+
+    def test_running_summary_is_awaited_over_threshold(self, test_dir):
+        compacter = make_compacter(token_count=90000)
+        context = make_context(test_dir)
+        release = threading.Event()
+        speculative = SpeculativeCompaction(context.chat_history[:3], 2)
+        speculative.start(lambda: release.wait(5) and summary())
+        context.speculative_compaction = speculative
+        threading.Timer(0.05, release.set).start()
+
+        _, applied = check(compacter, context)
+
+        assert applied
+        assert "Prepared summary" in context.chat_history[0]["content"]
+        # Applied without a blocking summarization of its own
+        assert compacter.client.messages_create_called is False
@@ -0,0 +1,169 @@
+"""Tests for streamed tmux pane output and sentinel-based completion."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from silica.developer.tools.tmux_session import (
+    SENTINEL_COMMAND,
+    PaneOutputStream,
+    SentinelWaiter,
+    TmuxSessionManager,
+    clean_terminal_output,
+)
+from silica.developer.tools.tmux_tool import _check_tmux_available
+
+
+class TestOutputStream:
+    def test_read_new_is_incremental(self, tmp_path):
+        path = tmp_path / "pane.log"
+        stream = PaneOutputStream(path)
+        assert not stream.is_live()
+
+        path.write_bytes(b"first\r\n")
+        assert stream.read_new() == "first\n"
+        with open(path, "ab") as f:
+            f.write(b"second\r\n")
+        assert stream.read_new() == "second\n"
+        assert stream.read_new() == ""
+
+    async def test_wait_live_does_not_block_loop(self, tmp_path):
+        path = tmp_path / "pane.log"
+        stream = PaneOutputStream(path)
+        asyncio.get_running_loop().call_later(0.1, path.touch)
+
+        assert await stream.wait_live(wait=10)
+        assert stream.is_live()
+
+    def test_split_utf8_is_decoded(self, tmp_path):
+        path = tmp_path / "pane.log"
+        stream = PaneOutputStream(path)
+        encoded = "✓ done\n".encode()
+
+        path.write_bytes(encoded[:2])
+        first = stream.read_new()
+        with open(path, "ab") as f:
+            f.write(encoded[2:])
+
+        assert first + stream.read_new() == "✓ done\n"
+
+    def test_sentinel_split_across_reads(self, tmp_path):
+        path = tmp_path / "pane.log"
+        path.write_bytes(b"output\r\n__SILICA_DONE_abcd")
+        waiter = SentinelWaiter(PaneOutputStream(path), "abcd1234", 0)
+
+        assert waiter.poll() is None
+        with open(path, "ab") as f:
+            f.write(b"1234:3__\r\n")
+        assert waiter.poll() == 3
+
+    def test_clean_strips_escapes_and_sentinels(self):
+        sentinel = SENTINEL_COMMAND.format(token="abcd1234")
+        raw = (
+            f"\x1b[?2004h$ make; {sentinel}\r\n\x1b[?2004l\r"
+            "10%\r100%\r\n\r\n__SILICA_DONE_abcd1234:0__\r\n$ "
+        )
+
+        assert clean_terminal_output(raw) == "$ make\n100%\n$ "
+
+
+def test_supports_sentinel():
+    assert TmuxSessionManager._supports_sentinel("make test")
+    assert TmuxSessionManager._supports_sentinel("server &")
+    assert not TmuxSessionManager._supports_sentinel("cat <<EOF\nx\nEOF")
+    assert not TmuxSessionManager._supports_sentinel("echo hi  # note")
+
+
+@pytest.mark.parametrize(
+    "pane_command,expected",
+    [("bash\n", True), ("-zsh\n", True), ("fish\n", False), ("python3\n", False)],
+)
+def test_sentinel_depends_on_pane_program(pane_command, expected):
+    manager = TmuxSessionManager(session_prefix="test_stream")
+    with (
+        patch.dict("os.environ", {"SHELL": "/bin/bash"}),
+        patch.object(
+            manager, "_run_tmux_command", return_value=(0, pane_command, "")
+        ) as run,
+    ):
+        assert manager._pane_runs_sentinel_shell("pane") is expected
+    assert "#{pane_current_command}" in run.call_args[0][0]
+
+
+def wait_for_prompt(stream: PaneOutputStream, timeout: float = 10) -> None:
+    """Wait until the pane's shell has printed its first prompt.
+
+    Keys sent before the shell reads the terminal are echoed twice.
+    """
+    deadline = time.monotonic() + timeout
+    while not stream.tail().strip():
+        assert time.monotonic() < deadline, "The pane's shell printed no prompt"
+        time.sleep(0.01)
+
+
+@pytest.mark.slow
+class TestStreamingIntegration:
+    @pytest.fixture(autouse=True)
+    def check_tmux_available(self):
+        if not _check_tmux_available():
+            pytest.skip("tmux not available")
+
+    @pytest.fixture
+    def manager(self):
+        manager = TmuxSessionManager(session_prefix="test_stream")
+        yield manager
+        manager.cleanup_all_sessions()
+
+    def test_sentinel_completion_without_capture_pane(self, manager):
+        assert manager.create_session("stream")[0]
+        wait_for_prompt(manager.get_session("stream").output_stream)
+        calls = []
+        original = manager._run_tmux_command
+
+        def recording(command):
+            calls.append(command)
+            return original(command)
+
+        with patch.object(manager, "_run_tmux_command", side_effect=recording):
+            success, message = manager.execute_command(
+                "stream", "echo streamed-output; false", timeout=30
+            )
+
+        assert success
+        assert "exit status 1" in message
+        assert not any("capture-pane" in command for command in calls)
+        assert manager.get_session("stream").last_exit_status == 1
+
+        output = manager.capture_session_output("stream")[1]
+        assert "streamed-output" in output
+        assert "__SILICA_DONE_" not in output
+        # Already-consumed output is not appended to the buffer again
+        manager.capture_session_output("stream")
+        assert (
+            manager.get_session("stream").get_recent_output(0).count("streamed-output")
+            == 2  # Echoed command line plus its output
+        )
+
+    async def test_async_wait_does_not_block_loop(self, manager):
+        assert manager.create_session("stream_async")[0]
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        try:
+            success, message = await manager.execute_command_async(
+                "stream_async", "sleep 0.5; echo slept", timeout=30
+            )
+        finally:
+            task.cancel()
+
+        assert success
+        assert "timeout: 30s" in message
+        assert ticks >= 20
@@ -0,0 +1,162 @@
+"""Tests for offloading stale tool results and rehydrating them."""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from silica.developer.session_store import SessionStore
+from silica.developer.tool_result_offload import (
+    is_offloaded,
+    offload_stale_tool_results,
+)
+from silica.developer.tools.tool_results import rehydrate_tool_result
+
+BIG = "line of file content\n" * 2000
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(tmp_path / "session")
+
+
+def tool_turn(n, output=BIG):
+    return [
+        {
+            "role": "assistant",
+            "content": [
+                {
+                    "type": "tool_use",
+                    "id": f"toolu_{n}",
+                    "name": "read_file",
+                    "input": {"path": f"f{n}.py"},
+                }
+            ],
+        },
+        {
+            "role": "user",
+            "content": [
+                {"type": "tool_result", "tool_use_id": f"toolu_{n}", "content": output}
+            ],
+        },
+    ]
+
+
+def conversation(turns, output=BIG):
+    messages = [{"role": "user", "content": "start"}]
+    for n in range(turns):
+        messages.extend(tool_turn(n, output))
+    return messages
+
+
+def offload(messages, store, **kwargs):
+    kwargs.setdefault("after_turns", 3)
+    kwargs.setdefault("min_tokens", 1000)
+    kwargs.setdefault("batch_tokens", 1)
+    return offload_stale_tool_results(messages, store, **kwargs)
+
+
+def content_hash(block):
+    return re.search(r'content_hash="([0-9a-f]{64})"', block["content"]).group(1)
+
+
+class TestToolResultStore:
+    def test_round_trip_is_content_addressed(self, store):
+        first = store.write_tool_result([{"type": "text", "text": "x"}])
+        second = store.write_tool_result([{"type": "text", "text": "x"}])
+
+        assert first == second
+        assert store.read_tool_result(first) == [{"type": "text", "text": "x"}]
+        assert len(list(store.tool_results_dir.iterdir())) == 1
+
+    def test_unknown_or_malformed_hash(self, store):
+        assert store.read_tool_result("0" * 64) is None
+        assert store.read_tool_result("../root.history") is None
+
+
+class TestOffloadStaleToolResults:
+    def test_offloads_only_results_older_than_turns(self, store):
+        messages = conversation(5)
+
+        result = offload(messages, store)
+
+        offloaded = [
+            is_offloaded(m["content"][0])
+            for m in messages
+            if m["role"] == "user" and isinstance(m["content"], list)
+        ]
+        # Results followed by at least 3 assistant responses
+        assert offloaded == [True, True, False, False, False]
+        assert result.results == 2
+        assert result.tokens > 0
+
+    def test_stub_names_tool_and_keeps_block_fields(self, store):
+        messages = conversation(4)
+        offload(messages, store)
+        block = messages[2]["content"][0]
+
+        assert block["type"] == "tool_result"
+        assert block["tool_use_id"] == "toolu_0"
+        assert "'read_file'" in block["content"]
+        assert store.read_tool_result(content_hash(block)) == BIG
+
+    def test_original_message_is_not_mutated(self, store):
+        messages = conversation(4)
+        original = messages[2]
+
+        offload(messages, store)
+
+        assert messages[2] is not original
+        assert original["content"][0]["content"] == BIG
+
+    def test_small_results_are_kept(self, store):
+        messages = conversation(5, output="ok")
+
+        assert offload(messages, store).results == 0
+
+    def test_waits_for_a_full_batch(self, store):
+        messages = conversation(5)
+
+        assert offload(messages, store, batch_tokens=10**9).results == 0
+        assert not any(
+            is_offloaded(m["content"][0])
+            for m in messages
+            if isinstance(m["content"], list)
+        )
+
+    def test_already_offloaded_results_are_skipped(self, store):
+        messages = conversation(5)
+        offload(messages, store)
+
+        assert offload(messages, store).results == 0
+
+    def test_disabled_with_zero_turns(self, store):
+        assert offload(conversation(5), store, after_turns=0).results == 0
+
+    def test_sdk_tool_use_blocks(self, store):
+        messages = conversation(4)
+        messages[1]["content"] = [
+            SimpleNamespace(type="tool_use", id="toolu_0", name="shell_execute")
+        ]
+
+        offload(messages, store)
+
+        assert "'shell_execute'" in messages[2]["content"][0]["content"]
+
+
+class TestRehydrateToolResult:
+    def test_returns_offloaded_content(self, store):
+        messages = conversation(4)
+        offload(messages, store)
+        context = SimpleNamespace(session_store=store)
+
+        content = rehydrate_tool_result(
+            context, content_hash=content_hash(messages[2]["content"][0])
+        )
+
+        assert content == BIG
+
+    def test_unknown_hash(self, store):
+        context = SimpleNamespace(session_store=store)
+
+        assert rehydrate_tool_result(context, content_hash="abc").startswith("Error")
@@ -0,0 +1,169 @@
+"""Tests for the warm worker pool."""
+
+import itertools
+import threading
+import time
+
+import pytest
+
+from silica.developer.coordination.worker_pool import WarmWorker, WorkerPool
+
+
+class FakeLauncher:
+    """Records launched and stopped workers instead of starting tmux."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.launched = []
+        self.stopped = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def launch(self, cwd: str) -> WarmWorker:
+        if self.fail:
+            raise RuntimeError("tmux not found")
+        with self._lock:
+            n = next(self._ids)
+        worker = WarmWorker(
+            agent_id=f"agent-{n}",
+            identity_id=f"identity-{n}",
+            tmux_session=f"worker-agent-{n}",
+            cwd=cwd,
+        )
+        self.launched.append(worker)
+        return worker
+
+    def stop(self, worker: WarmWorker) -> None:
+        self.stopped.append(worker)
+
+
+@pytest.fixture
+def launcher():
+    return FakeLauncher()
+
+
+def make_pool(launcher, tmp_path, size=2, idle_ttl=60.0):
+    return WorkerPool(
+        launch=launcher.launch,
+        stop=launcher.stop,
+        size=size,
+        idle_ttl=idle_ttl,
+        cwd=str(tmp_path),
+    )
+
+
+class TestWorkerPool:
+    def test_disabled_by_default(self, launcher, tmp_path, monkeypatch):
+        monkeypatch.delenv("SILICA_WORKER_POOL_SIZE", raising=False)
+        pool = WorkerPool(launch=launcher.launch, stop=launcher.stop)
+
+        assert pool.size == 0
+        assert pool.replenish() == 0
+        assert pool.acquire() is None
+        assert launcher.launched == []
+
+    def test_size_and_ttl_from_environment(self, launcher, monkeypatch):
+        monkeypatch.setenv("SILICA_WORKER_POOL_SIZE", "3")
+        monkeypatch.setenv("SILICA_WORKER_POOL_IDLE_TTL", "90")
+        pool = WorkerPool(launch=launcher.launch, stop=launcher.stop)
+
+        assert pool.size == 3
+        assert pool.idle_ttl == 90.0
+
+    def test_replenish_fills_to_size(self, launcher, tmp_path):
+        pool = make_pool(launcher, tmp_path, size=2)
+
+        assert pool.replenish() == 2
+        assert pool.replenish() == 0
+        assert len(pool.workers) == 2
+
+    def test_acquire_prefers_ready_workers(self, launcher, tmp_path):
+        pool = make_pool(launcher, tmp_path, size=2)
+        pool.replenish()
+        first, second = pool.workers
+
+        assert pool.mark_ready(second.identity_id)
+        acquired = pool.acquire(str(tmp_path))
+        pool.shutdown()
+
+        assert acquired is second
+        assert acquired.ready
+
+    def test_acquire_matches_working_directory(self, launcher, tmp_path):
+        pool = make_pool(launcher, tmp_path, size=1)
+        pool.replenish()
+
+        assert pool.acquire(str(tmp_path / "elsewhere")) is None
+        assert len(pool.workers) == 1
+        pool.shutdown()
+
+    def test_acquired_worker_leaves_pool(self, launcher, tmp_path):
+        pool = make_pool(launcher, tmp_path, size=1)
+        pool.replenish()
+        worker = pool.acquire()
+        pool.shutdown()
+
+        assert not pool.is_pooled(worker.identity_id)
+        assert not pool.mark_ready(worker.identity_id)
+        # Acquired workers are the caller's; shutdown leaves them running
+        assert worker not in launcher.stopped
+
+    def test_acquire_replenishes_in_background(self, launcher, tmp_path):
+        pool = make_pool(launcher, tmp_path, size=1)
+        pool.replenish()
+        pool.acquire()
+
+        for _ in range(100):
+            if len(pool.workers) == 1:
+                break
+            time.sleep(0.01)
+        pool.shutdown()
+
+        assert len(launcher.launched) == 2
+
+    def test_idle_workers_expire(self, launcher, tmp_path):
+        pool = make_pool(launcher, tmp_path, size=1, idle_ttl=0.0)
+        pool.replenish()
+        stale = launcher.launched[0]
+
+        pool._expire()
+
+        assert launcher.stopped == [stale]
+        assert pool.workers == []
+
+    def test_launch_failure_is_not_raised(self, tmp_path):
+        launcher = FakeLauncher(fail=True)
+        pool = make_pool(launcher, tmp_path, size=2)
+
+        assert pool.replenish() == 0
+        assert pool.acquire() is None
+        pool.shutdown()
+
+    def test_failed_launch_is_retried_soon(self, tmp_path):
+        launcher = FakeLauncher(fail=True)
+        pool = WorkerPool(
+            launch=launcher.launch,
+            stop=launcher.stop,
+            size=1,
+            cwd=str(tmp_path),
+            retry_delay=0.05,
+        )
+
+        pool.replenish_async()
+        time.sleep(0.2)
+        launcher.fail = False
+        deadline = time.monotonic() + 2
+        while not pool.workers and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert len(pool.workers) == 1
+        pool.shutdown()
+
+    def test_shutdown_stops_warm_workers(self, launcher, tmp_path):
+        pool = make_pool(launcher, tmp_path, size=2)
+        pool.replenish()
+
+        pool.shutdown()
+
+        assert len(launcher.stopped) == 2
+        assert pool.replenish() == 0
@@ -6,6 +6,9 @@ Verifies that:
 3. Subscribe cursors use context cursors (not stale session attributes)
 """
 
+import asyncio
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 
@@ -195,3 +198,51 @@ class TestSubscribeCursors:
         # Inside _subscribe_for_messages, topics should be refreshed
         # Look for the pattern of updating topics from ctx cursors in the while loop
         assert "topics[inbox_topic] = ctx._last_inbox_mid" in source
+
+
+class TestWaitWithCoordination:
+    """Test racing user input against worker messages."""
+
+    @pytest.fixture
+    def coordination_session(self):
+        deaddrop = MagicMock()
+        deaddrop.subscribe.return_value = {"events": [{"mid": "1"}]}
+        context = MagicMock(
+            identity_id="coordinator",
+            room_id="room",
+            _last_inbox_mid=None,
+            _last_room_mid=None,
+            deaddrop=deaddrop,
+        )
+        return MagicMock(context=context)
+
+    async def test_pool_readiness_keeps_input_prompt(self, coordination_session):
+        from silica.developer import agent_loop
+
+        prompts = []
+
+        async def get_user_input(prompt):
+            prompts.append(prompt)
+            await asyncio.Event().wait()
+
+        user_interface = MagicMock(get_user_input=get_user_input)
+        message = MagicMock()
+
+        with (
+            patch(
+                "silica.developer.tools.coordination.receive_agent_messages",
+                side_effect=[[], [], [message]],
+            ),
+            patch(
+                "silica.developer.tools.coordination.format_agent_messages",
+                return_value="formatted",
+            ) as format_messages,
+        ):
+            result = await agent_loop._wait_with_coordination(
+                user_interface, "> ", coordination_session
+            )
+
+        assert result == "[Worker Messages]\n\nformatted"
+        format_messages.assert_called_once_with([message])
+        # Readiness pings do not restart the input prompt
+        assert prompts == ["> "]
@@ -266,6 +266,86 @@ def test_get_sync_index_with_files(test_client, auth_headers):
     assert "version" in file1_meta
 
 
+def test_get_sync_index_since(test_client, auth_headers):
+    """Test the since parameter returns only changed entries."""
+    test_client.put(
+        "/default/blob/file1.txt",
+        content=b"Content 1",
+        headers={**auth_headers, "If-Match-Version": "0"},
+    )
+    cursor = test_client.get("/sync/default", headers=auth_headers).json()[
+        "index_version"
+    ]
+    response = test_client.put(
+        "/default/blob/file2.txt",
+        content=b"Content 2",
+        headers={**auth_headers, "If-Match-Version": "0"},
+    )
+    # The write response only carries its own entry
+    assert list(response.json()["files"]) == ["file2.txt"]
+
+    response = test_client.get(
+        "/sync/default", params={"since": cursor}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert list(data["files"]) == ["file2.txt"]
+    assert data["since"] == cursor
+
+
+def test_get_sync_tokens(test_client, auth_headers):
+    """Test listing change tokens for the namespaces under a prefix."""
+    for session in ("s1", "s2"):
+        test_client.put(
+            f"/personas%2Fp%2Fhistory%2F{session}/blob/file.txt",
+            content=b"Content",
+            headers={**auth_headers, "If-Match-Version": "0"},
+        )
+
+    response = test_client.get("/sync-tokens/personas/p/history", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert set(response.json()["tokens"]) == {
+        "personas/p/history/s1",
+        "personas/p/history/s2",
+    }
+
+
+def test_append_and_read_tail(test_client, auth_headers):
+    """Test appending a segment and reading only the new bytes."""
+    response = test_client.put(
+        "/default/blob/log.jsonl",
+        content=b"line 1\n",
+        headers={**auth_headers, "If-Match-Version": "0"},
+    )
+    md5 = response.headers["ETag"].strip('"')
+
+    response = test_client.patch(
+        "/default/blob/log.jsonl",
+        content=b"line 2\n",
+        headers={**auth_headers, "X-Append-Offset": "7", "X-Prefix-MD5": md5},
+    )
+    assert response.status_code == 200
+    assert response.headers["X-Segment"] == "1"
+    assert response.json()["files"]["log.jsonl"]["size"] == 14
+
+    response = test_client.get(
+        "/default/blob/log.jsonl",
+        headers={**auth_headers, "X-Prefix-Length": "7", "X-Prefix-MD5": md5},
+    )
+    assert response.content == b"line 2\n"
+    assert response.headers["X-Content-Offset"] == "7"
+
+    # Stale prefix is refused
+    response = test_client.patch(
+        "/default/blob/log.jsonl",
+        content=b"line 3\n",
+        headers={**auth_headers, "X-Append-Offset": "7", "X-Prefix-MD5": md5},
+    )
+    assert response.status_code == 412
+
+
 def test_get_sync_index_includes_tombstones(test_client, auth_headers):
     """Test sync index includes tombstoned files."""
     # Write and delete file
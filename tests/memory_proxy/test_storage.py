@@ -347,6 +347,187 @@ def test_sync_index_updates_after_operations(mock_s3):
     assert index3.index_last_modified > index2.index_last_modified
 
 
+def test_write_returns_only_written_entry(mock_s3):
+    """Test write and delete responses carry just their own entry."""
+    storage = S3Storage()
+    storage.write_file("default", "a.txt", b"A")
+
+    _, md5, version, sync_index = storage.write_file("default", "b.txt", b"B")
+    assert list(sync_index.files) == ["b.txt"]
+    assert sync_index.files["b.txt"].md5 == md5
+    assert sync_index.files["b.txt"].version == version
+
+    _, delete_index = storage.delete_file("default", "a.txt")
+    assert list(delete_index.files) == ["a.txt"]
+    assert delete_index.files["a.txt"].is_deleted is True
+    assert delete_index.index_version == storage.get_sync_index("default").index_version
+
+
+def test_get_sync_index_since(mock_s3):
+    """Test the change feed returns only entries changed after a version."""
+    storage = S3Storage()
+    storage.write_file("default", "a.txt", b"A")
+    storage.write_file("default", "b.txt", b"B")
+    cursor = storage.get_sync_index("default").index_version
+
+    # Nothing changed yet
+    empty = storage.get_sync_index("default", since=cursor)
+    assert empty.files == {}
+    assert empty.since == cursor
+    assert empty.index_version == cursor
+
+    storage.write_file("default", "b.txt", b"B2")
+    storage.delete_file("default", "a.txt")
+    storage.write_file("default", "c.txt", b"C")
+
+    delta = storage.get_sync_index("default", since=cursor)
+    assert set(delta.files) == {"a.txt", "b.txt", "c.txt"}
+    assert delta.files["a.txt"].is_deleted is True
+    assert delta.index_version > cursor
+
+    # Full index still has everything, and does not set since
+    full = storage.get_sync_index("default")
+    assert len(full.files) == 3
+    assert full.since is None
+
+
+def test_get_sync_index_since_newer_than_index(mock_s3):
+    """Test a cursor from a newer (e.g. reset) index gets the full index."""
+    storage = S3Storage()
+    storage.write_file("default", "a.txt", b"A")
+    index_version = storage.get_sync_index("default").index_version
+
+    response = storage.get_sync_index("default", since=index_version + 1000)
+
+    assert response.since is None
+    assert list(response.files) == ["a.txt"]
+
+
+def test_index_versions_strictly_increase(mock_s3, monkeypatch):
+    """Test index versions increase even if the clock does not."""
+    storage = S3Storage()
+    monkeypatch.setattr(storage, "_get_version", lambda: 1000)
+
+    storage.write_file("default", "a.txt", b"A")
+    first = storage.get_sync_index("default").index_version
+    storage.write_file("default", "b.txt", b"B")
+    delta = storage.get_sync_index("default", since=first)
+
+    assert delta.index_version == first + 1
+    assert list(delta.files) == ["b.txt"]
+
+
+def test_list_sync_tokens(mock_s3):
+    """Test sync tokens change only for namespaces whose index changed."""
+    storage = S3Storage()
+    storage.write_file("personas/p/history/s1", "a.txt", b"A")
+    storage.write_file("personas/p/history/s2", "b.txt", b"B")
+    storage.write_file("personas/p/history2/s3", "c.txt", b"C")
+
+    tokens = storage.list_sync_tokens("personas/p/history")
+    assert set(tokens) == {"personas/p/history/s1", "personas/p/history/s2"}
+
+    storage.write_file("personas/p/history/s2", "b.txt", b"B2")
+    updated = storage.list_sync_tokens("personas/p/history")
+
+    assert updated["personas/p/history/s1"] == tokens["personas/p/history/s1"]
+    assert updated["personas/p/history/s2"] != tokens["personas/p/history/s2"]
+
+
+def test_append_file(mock_s3):
+    """Test appending a segment on top of the expected prefix."""
+    storage = S3Storage()
+    _, md5, version, _ = storage.write_file("default", "log.jsonl", b"line 1\n")
+
+    new_md5, new_version, segment, sync_index = storage.append_file(
+        "default", "log.jsonl", b"line 2\n", offset=7, prefix_md5=md5
+    )
+
+    content, read_md5, _, _, read_version = storage.read_file("default", "log.jsonl")
+    assert content == b"line 1\nline 2\n"
+    assert read_md5 == new_md5
+    assert read_version == new_version > version
+    assert segment == 1
+    assert sync_index.files["log.jsonl"].size == 14
+
+
+def test_append_file_requires_matching_prefix(mock_s3):
+    """Test appends are refused unless the file is exactly the prefix."""
+    storage = S3Storage()
+    _, md5, version, _ = storage.write_file("default", "log.jsonl", b"line 1\n")
+
+    with pytest.raises(PreconditionFailedError):
+        storage.append_file("default", "log.jsonl", b"x", offset=7, prefix_md5="bad")
+    with pytest.raises(PreconditionFailedError):
+        storage.append_file("default", "log.jsonl", b"x", offset=3, prefix_md5=md5)
+    with pytest.raises(PreconditionFailedError):
+        storage.append_file(
+            "default",
+            "log.jsonl",
+            b"x",
+            offset=7,
+            prefix_md5=md5,
+            expected_version=version + 1,
+        )
+    with pytest.raises(PreconditionFailedError):
+        storage.append_file("default", "missing", b"x", offset=0, prefix_md5=md5)
+
+    content, _, _, _, _ = storage.read_file("default", "log.jsonl")
+    assert content == b"line 1\n"
+
+
+def test_append_gzip_segments_are_compacted(mock_s3):
+    """Test gzip files are recompressed once they collect enough segments."""
+    import gzip
+    import zlib
+
+    storage = S3Storage()
+    storage.MAX_GZIP_SEGMENTS = 3
+    body = gzip.compress(b"line 0\n")
+    _, md5, _, _ = storage.write_file(
+        "default", "log.gz", body, content_type="application/gzip"
+    )
+
+    segments = []
+    for i in range(1, 4):
+        segment = gzip.compress(f"line {i}\n".encode())
+        md5, _, number, _ = storage.append_file(
+            "default", "log.gz", segment, offset=len(body), prefix_md5=md5
+        )
+        body += segment
+        segments.append(number)
+        if number == 0:
+            body, _, _, _, _ = storage.read_file("default", "log.gz")
+
+    assert segments == [1, 2, 0]
+    content, _, _, _, _ = storage.read_file("default", "log.gz")
+    assert gzip.decompress(content) == b"line 0\nline 1\nline 2\nline 3\n"
+    # A single gzip member again, recompressed deterministically
+    member = zlib.decompressobj(31)
+    member.decompress(content)
+    assert member.eof and member.unused_data == b""
+    assert content == gzip.compress(gzip.decompress(content), compresslevel=6, mtime=0)
+
+
+def test_read_file_after(mock_s3):
+    """Test reading only the bytes after a known prefix."""
+    storage = S3Storage()
+    storage.write_file("default", "log.jsonl", b"line 1\nline 2\n")
+    prefix_md5 = storage._calculate_md5(b"line 1\n")
+
+    tail, md5, _, _, _, offset = storage.read_file_after(
+        "default", "log.jsonl", 7, prefix_md5
+    )
+    assert (tail, offset) == (b"line 2\n", 7)
+    assert md5 == storage._calculate_md5(b"line 1\nline 2\n")
+
+    # A different prefix gets the whole file
+    content, _, _, _, _, offset = storage.read_file_after(
+        "default", "log.jsonl", 7, "other"
+    )
+    assert (content, offset) == (b"line 1\nline 2\n", 0)
+
+
 def test_make_key_with_prefix(mock_s3):
     """Test key generation with prefix."""
     storage = S3Storage()
@@ -0,0 +1,263 @@
+"""Tests for concurrent workspace status collection and the status cache."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from silica.remote.cli.commands.status import (
+    build_workspaces_summary_table,
+    collect_workspace_statuses,
+    get_workspace_status,
+    load_status_cache,
+    save_status_cache,
+)
+
+
+@pytest.fixture
+def silica_dir(tmp_path):
+    silica_dir = tmp_path / ".silica"
+    silica_dir.mkdir()
+    (silica_dir / "config.yaml").write_text("""
+default_workspace: ws-0
+workspaces:
+  ws-0:
+    url: "http://ws0.example.com"
+    app_name: "ws-0"
+    is_local: false
+  ws-1:
+    url: "http://ws1.example.com"
+    app_name: "ws-1"
+    is_local: true
+""")
+    return silica_dir
+
+
+def fake_status(name, accessible=True):
+    return {
+        "workspace": name,
+        "accessible": accessible,
+        "status_info": {"version": "1.0"} if accessible else None,
+        "connection_info": None,
+        "error": None if accessible else "Connection failed",
+    }
+
+
+class TestCollectWorkspaceStatuses:
+    def test_checks_run_concurrently(self, silica_dir, tmp_path):
+        names = [f"ws-{i}" for i in range(8)]
+
+        def slow_status(name, git_root, silica_dir, session=None, timeout=None):
+            time.sleep(0.2)
+            return fake_status(name)
+
+        with patch(
+            "silica.remote.cli.commands.status.get_workspace_status",
+            side_effect=slow_status,
+        ):
+            start = time.monotonic()
+            results = collect_workspace_statuses(
+                names, tmp_path, silica_dir, max_workers=8
+            )
+            elapsed = time.monotonic() - start
+
+        assert set(results) == set(names)
+        assert elapsed < 1.0  # Sequential would take 1.6s
+
+    def test_results_reported_progressively(self, silica_dir, tmp_path):
+        seen = []
+
+        with patch(
+            "silica.remote.cli.commands.status.get_workspace_status",
+            side_effect=lambda name, *a, **kw: fake_status(name),
+        ):
+            collect_workspace_statuses(
+                ["ws-0", "ws-1"],
+                tmp_path,
+                silica_dir,
+                on_result=lambda status: seen.append(status["workspace"]),
+            )
+
+        assert sorted(seen) == ["ws-0", "ws-1"]
+
+    def test_deadline_reports_stragglers(self, silica_dir, tmp_path):
+        release = threading.Event()
+
+        def status_fn(name, *args, **kwargs):
+            if name == "ws-1":
+                release.wait(5)
+            return fake_status(name)
+
+        with patch(
+            "silica.remote.cli.commands.status.get_workspace_status",
+            side_effect=status_fn,
+        ):
+            start = time.monotonic()
+            results = collect_workspace_statuses(
+                ["ws-0", "ws-1"], tmp_path, silica_dir, deadline=0.3
+            )
+            elapsed = time.monotonic() - start
+        release.set()
+
+        assert elapsed < 2.0
+        assert results["ws-0"]["accessible"] is True
+        assert results["ws-1"]["accessible"] is False
+        assert "Timed out" in results["ws-1"]["error"]
+        assert results["ws-1"]["is_local"] is True
+        assert results["ws-1"]["timed_out"] is True
+
+    def test_shared_session_passed_to_each_check(self, silica_dir, tmp_path):
+        sessions = []
+
+        def status_fn(name, git_root, silica_dir, session=None, timeout=None):
+            sessions.append(session)
+            return fake_status(name)
+
+        with patch(
+            "silica.remote.cli.commands.status.get_workspace_status",
+            side_effect=status_fn,
+        ):
+            collect_workspace_statuses(["ws-0", "ws-1"], tmp_path, silica_dir)
+
+        assert len(sessions) == 2
+        assert sessions[0] is not None
+        assert sessions[0] is sessions[1]
+
+    def test_checks_get_remaining_budget(self, silica_dir, tmp_path):
+        timeouts = {}
+        daemon = []
+
+        def status_fn(name, git_root, silica_dir, session=None, timeout=None):
+            timeouts[name] = timeout
+            daemon.append(threading.current_thread().daemon)
+            time.sleep(0.2)
+            return fake_status(name)
+
+        with patch(
+            "silica.remote.cli.commands.status.get_workspace_status",
+            side_effect=status_fn,
+        ):
+            collect_workspace_statuses(
+                ["ws-0", "ws-1"], tmp_path, silica_dir, max_workers=1, deadline=5
+            )
+
+        assert timeouts["ws-0"] <= 5
+        assert timeouts["ws-1"] <= 4.8
+        # Stragglers must not hold up interpreter exit
+        assert daemon == [True, True]
+
+
+class TestGetWorkspaceStatus:
+    def test_unreachable_workspace_skips_connection_info(self, silica_dir, tmp_path):
+        client = Mock()
+        client.get_status.return_value = (False, {"error": "Connection failed"})
+
+        with patch(
+            "silica.remote.cli.commands.status.get_antennae_client",
+            return_value=client,
+        ):
+            status = get_workspace_status("ws-0", tmp_path, silica_dir)
+
+        assert status["accessible"] is False
+        client.get_connection_info.assert_not_called()
+
+    def test_connection_info_skipped_when_budget_spent(self, silica_dir, tmp_path):
+        client = Mock()
+
+        def slow_status():
+            time.sleep(0.2)
+            return True, {"version": "1.0"}
+
+        client.get_status.side_effect = slow_status
+
+        with patch(
+            "silica.remote.cli.commands.status.get_antennae_client",
+            return_value=client,
+        ):
+            status = get_workspace_status("ws-0", tmp_path, silica_dir, timeout=0.1)
+
+        assert status["accessible"] is True
+        client.get_connection_info.assert_not_called()
+
+    def test_failure_after_budget_spent_marked_timed_out(self, silica_dir, tmp_path):
+        client = Mock()
+
+        def slow_status():
+            time.sleep(0.2)
+            return False, {"error": "Read timed out"}
+
+        client.get_status.side_effect = slow_status
+
+        with patch(
+            "silica.remote.cli.commands.status.get_antennae_client",
+            return_value=client,
+        ):
+            status = get_workspace_status("ws-0", tmp_path, silica_dir, timeout=0.1)
+
+        assert status["timed_out"] is True
+
+    def test_session_used_for_requests(self, silica_dir, tmp_path):
+        session = Mock()
+        response = Mock(status_code=200)
+        response.json.return_value = {"version": "1.0"}
+        session.get.return_value = response
+
+        status = get_workspace_status("ws-0", tmp_path, silica_dir, session=session)
+
+        assert status["accessible"] is True
+        urls = [call.args[0] for call in session.get.call_args_list]
+        assert urls == [
+            "http://ws0.example.com/status",
+            "http://ws0.example.com/connect",
+        ]
+
+
+class TestStatusCache:
+    def test_roundtrip(self, silica_dir):
+        save_status_cache(silica_dir, {"ws-0": fake_status("ws-0")})
+
+        cache = load_status_cache(silica_dir)
+        assert cache["ws-0"]["accessible"] is True
+        assert "checked_at" in cache["ws-0"]
+
+    def test_timed_out_status_keeps_cached_entry(self, silica_dir):
+        save_status_cache(silica_dir, {"ws-0": fake_status("ws-0")})
+        save_status_cache(
+            silica_dir,
+            {
+                "ws-0": {**fake_status("ws-0", accessible=False), "timed_out": True},
+                "ws-1": fake_status("ws-1", accessible=False),
+            },
+        )
+
+        cache = load_status_cache(silica_dir)
+        assert cache["ws-0"]["accessible"] is True
+        assert cache["ws-1"]["accessible"] is False
+
+    def test_missing_or_corrupt_cache(self, silica_dir):
+        assert load_status_cache(silica_dir) == {}
+        (silica_dir / "status_cache.json").write_text("{broken")
+        assert load_status_cache(silica_dir) == {}
+
+    def test_cached_and_pending_rows_rendered(self):
+        table = build_workspaces_summary_table(
+            [
+                {
+                    **fake_status("ws-0"),
+                    "cached": True,
+                    "checked_at": time.time() - 120,
+                },
+                {
+                    "workspace": "ws-1",
+                    "accessible": False,
+                    "status_info": None,
+                    "error": None,
+                    "pending": True,
+                },
+            ]
+        )
+
+        status_cells = list(table.columns[-1].cells)
+        assert "2m ago" in status_cells[0]
+        assert "Checking" in status_cells[1]